@@ -0,0 +1,21 @@
+"""
+Benchmark ponta a ponta contra o mock da API (mock_api/).
+
+Mede os caminhos que mais pesam no app e nos notificadores:
+build_status_map (CamaraService e DataProvider), escanear_eventos,
+varreduras dos notificadores, monitorar_apensados, integração com o
+Senado e os PDFs - por tamanho de carteira e número de eventos.
+
+Uso:
+    python -m benchmarks --carteira 50,300,1000 --eventos 20,100 --repeticoes 3
+    python -m benchmarks --comparar benchmarks/baseline.json --tolerancia 0.25
+
+Os resultados vão para .cache/benchmarks/<data>.json (ou --saida). Com
+--comparar, o processo sai com código 1 se algum cenário regredir
+(ver benchmarks/comparar.py). Cenários cujas dependências não estão
+instaladas (streamlit, pandas, fpdf) saem como "pulado".
+
+Micro-benchmarks (sem mock HTTP):
+    python -m benchmarks.relator      extração de relator das tramitações
+    python -m benchmarks.palavras     busca de palavras-chave nas pautas
+"""
@@ -0,0 +1,287 @@
+"""
+Runner do benchmark: python -m benchmarks [opções]
+
+Sobe o mock (mock_api) numa porta livre, aponta o core para ele e mede
+cada cenário de benchmarks/cenarios.py para cada tamanho de carteira e
+número de eventos pedidos.
+
+Exemplos:
+    python -m benchmarks
+    python -m benchmarks --carteira 50,300,1000 --eventos 20,100 --repeticoes 3
+    python -m benchmarks --cenario camara --cenario pdf --saida /tmp/depois.json
+    python -m benchmarks --comparar benchmarks/baseline.json --tolerancia 0.25
+    python -m benchmarks --salvar-baseline
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import platform
+import statistics
+import subprocess
+import tempfile
+import contextlib
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+RAIZ = Path(__file__).resolve().parent.parent
+BASELINE_PADRAO = Path(__file__).resolve().parent / "baseline.json"
+
+# Sem credenciais os notificadores não enviam nada
+VARIAVEIS_ENVIO = [
+    "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID",
+    "TELEGRAM_BOT_TOKEN_PALAVRAS", "TELEGRAM_CHAT_ID_PALAVRAS",
+    "EMAIL_SENDER", "EMAIL_PASSWORD", "EMAIL_RECIPIENTS", "EMAIL_RECIPIENTS_PALAVRAS",
+]
+
+HOSTS_REAIS = ["dadosabertos.camara.leg.br", "legis.senado.leg.br"]
+
+
+def _lista_int(valor: str) -> List[int]:
+    try:
+        return [int(x) for x in valor.split(",") if x.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"lista de inteiros inválida: {valor!r}")
+
+
+def _commit_git() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _chave(nome: str, cenario, carteira: int, eventos: int) -> str:
+    params = {"carteira": carteira, "eventos": eventos}
+    partes = ",".join(f"{d}={params[d]}" for d in cenario.dimensoes)
+    return f"{nome}[{partes}]" if partes else nome
+
+
+# ============================================================
+# LIMPEZA ENTRE REPETIÇÕES
+# ============================================================
+
+def _limpar_caches(cenario) -> None:
+    """Zera métricas, breakers e caches em memória para a repetição partir do frio."""
+    from core.services import (
+        get_deputados_index, get_pauta_archive, get_proposicao_store, reset_circuit_breakers,
+        reset_concurrency, reset_http_metrics,
+    )
+
+    reset_http_metrics()
+    reset_circuit_breakers()
+    reset_concurrency()
+    get_proposicao_store().limpar()
+    get_deputados_index().limpar()
+    get_pauta_archive().limpar()
+
+    if "streamlit" in sys.modules:
+        try:
+            sys.modules["streamlit"].cache_data.clear()
+        except Exception:
+            pass
+
+    for nome in cenario.modulos_cache:
+        mod = sys.modules.get(nome)
+        if mod is None:
+            continue
+        for obj in vars(mod).values():
+            if callable(getattr(obj, "cache_clear", None)):
+                obj.cache_clear()
+
+
+@contextlib.contextmanager
+def _pasta_temporaria(ativa: bool):
+    """Diretório corrente descartável (arquivos de estado dos notificadores)."""
+    if not ativa:
+        yield
+        return
+    anterior = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as pasta:
+        os.chdir(pasta)
+        try:
+            yield
+        finally:
+            os.chdir(anterior)
+
+
+# ============================================================
+# EXECUÇÃO
+# ============================================================
+
+def medir(cenario, ctx, repeticoes: int, verbose: bool) -> Dict[str, Any]:
+    """Prepara e executa um cenário; devolve o registro de resultado."""
+    from core.services import get_http_metrics
+
+    try:
+        with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+            estado = cenario.preparar(ctx)
+    except ImportError as e:
+        return {"status": "pulado", "motivo": f"{type(e).__name__}: {e}"}
+
+    tempos, saida, http, concorrencia, mock_req = [], None, {}, {}, 0
+    for _ in range(repeticoes):
+        _limpar_caches(cenario)
+        antes = ctx.mock.stats()["requisicoes"]
+        try:
+            with _pasta_temporaria(cenario.pasta_temporaria), \
+                    contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+                t0 = time.perf_counter()
+                saida = cenario.executar(estado)
+                tempos.append(time.perf_counter() - t0)
+        except Exception as e:
+            return {"status": "erro", "motivo": f"{type(e).__name__}: {e}"}
+        snap = get_http_metrics()
+        http, concorrencia = snap["total"], snap.get("concorrencia", {})
+        mock_req = ctx.mock.stats()["requisicoes"] - antes
+
+    return {
+        "status": "ok",
+        "repeticoes": repeticoes,
+        "tempo_s": {
+            "min": round(min(tempos), 4),
+            "mediana": round(statistics.median(tempos), 4),
+            "max": round(max(tempos), 4),
+        },
+        # Métricas da última repetição (todas partem do frio)
+        "http": {
+            "requisicoes": http.get("requisicoes", 0),
+            "retries": http.get("retries", 0),
+            "erros": http.get("erros", 0),
+            "bytes": http.get("bytes", 0),
+        },
+        "mock_requisicoes": mock_req,
+        "concorrencia": concorrencia,
+        "saida": saida if isinstance(saida, (int, float, str, type(None))) else str(type(saida).__name__),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark contra o mock da API")
+    parser.add_argument("--carteira", type=_lista_int, default=[50, 300, 1000], help="tamanhos da carteira (ex: 50,300,1000)")
+    parser.add_argument("--eventos", type=_lista_int, default=[40], help="número de eventos (ex: 20,100)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--cenario", action="append", default=[], help="filtra cenários pelo trecho do nome (repetível)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--hoje", help="data de referência do dataset AAAA-MM-DD (padrão: hoje)")
+    parser.add_argument("--latencia", default="lognormal:40,0.5", help="latência do mock (ver mock_api/faults.py)")
+    parser.add_argument("--rate-limit-real", action="store_true", help="manter os limites de requisição dos hosts reais")
+    parser.add_argument("--cache-http", action="store_true", help="ligar o cache HTTP em disco (desligado por padrão)")
+    parser.add_argument("--saida", help="arquivo JSON de resultados (padrão: .cache/benchmarks/<data>.json)")
+    parser.add_argument("--comparar", help="JSON de referência; sai com código 1 se houver regressão")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="folga relativa de tempo na comparação")
+    parser.add_argument("--salvar-baseline", action="store_true", help=f"gravar também em {BASELINE_PADRAO.relative_to(RAIZ)}")
+    parser.add_argument("--verbose", action="store_true", help="mostrar a saída dos alvos")
+    args = parser.parse_args(argv)
+
+    for var in VARIAVEIS_ENVIO:
+        os.environ.pop(var, None)
+    tmp = tempfile.mkdtemp(prefix="bench-http-")
+    if args.cache_http:
+        os.environ["MONITOR_HTTP_CACHE_PATH"] = str(Path(tmp) / "cache.sqlite")
+    else:
+        os.environ["MONITOR_HTTP_CACHE"] = "0"
+    os.environ["MONITOR_HTTP_METRICS_DIR"] = tmp
+
+    if str(RAIZ) not in sys.path:
+        sys.path.insert(0, str(RAIZ))
+
+    from mock_api import InjetorFalhas, MockApiServer, MockDataset
+
+    # Os notificadores comparam datas com o relógio real; o dataset precisa
+    # ter "hoje" igual a hoje para gerar tramitações recentes
+    hoje = datetime.date.fromisoformat(args.hoje) if args.hoje else datetime.date.today()
+    mock = MockApiServer(
+        MockDataset(carteira=args.carteira[0], eventos=args.eventos[0], seed=args.seed, hoje=hoje),
+        falhas=InjetorFalhas(latencia=args.latencia, seed=args.seed),
+        fixtures=None,
+    ).start()
+    # O core lê as URLs base na importação: env antes de qualquer import
+    os.environ.update(mock.env())
+
+    from core.services import configurar_rate_limit
+    from benchmarks.cenarios import CENARIOS, Contexto
+
+    if not args.rate_limit_real:
+        for host in HOSTS_REAIS:
+            configurar_rate_limit(host, 10000.0, 10000)
+
+    cenarios = [c for c in CENARIOS if not args.cenario or any(f in c.nome for f in args.cenario)]
+    resultados: Dict[str, Any] = {}
+    feitos = set()
+
+    try:
+        for carteira in args.carteira:
+            for eventos in args.eventos:
+                dataset = MockDataset(carteira=carteira, eventos=eventos, seed=args.seed, hoje=hoje)
+                mock.usar_dataset(dataset)
+                ctx = Contexto(dataset=dataset, mock=mock, carteira=carteira, eventos=eventos)
+                for cenario in cenarios:
+                    chave = _chave(cenario.nome, cenario, carteira, eventos)
+                    if chave in feitos:
+                        continue
+                    feitos.add(chave)
+                    r = medir(cenario, ctx, args.repeticoes, args.verbose)
+                    resultados[chave] = r
+                    if r["status"] == "ok":
+                        print(f"⏱️  {chave:<70} {r['tempo_s']['mediana']:8.3f}s  {r['http']['requisicoes']:6d} req")
+                    else:
+                        print(f"⏭️  {chave:<70} {r['status']}: {r['motivo']}")
+                    sys.stdout.flush()
+    finally:
+        mock.stop()
+
+    relatorio = {
+        "meta": {
+            "data": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "commit": _commit_git(),
+            "opcoes": {
+                "carteira": args.carteira,
+                "eventos": args.eventos,
+                "repeticoes": args.repeticoes,
+                "seed": args.seed,
+                "hoje": hoje.isoformat(),
+                "latencia": args.latencia,
+                "rate_limit_real": args.rate_limit_real,
+                "cache_http": args.cache_http,
+            },
+            "pacotes": {
+                nome: importlib.util.find_spec(nome) is not None
+                for nome in ("streamlit", "pandas", "fpdf")
+            },
+        },
+        "resultados": resultados,
+    }
+
+    saida = Path(args.saida) if args.saida else RAIZ / ".cache" / "benchmarks" / f"{datetime.datetime.now():%Y%m%d_%H%M%S}.json"
+    destinos = [saida] + ([BASELINE_PADRAO] if args.salvar_baseline else [])
+    for destino in destinos:
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        with open(destino, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        print(f"💾 {destino}")
+
+    if args.comparar:
+        from benchmarks.comparar import carregar, comparar, formatar_tabela
+
+        linhas, regressao = comparar(carregar(args.comparar), relatorio, args.tolerancia)
+        print(formatar_tabela(linhas))
+        if regressao:
+            print("❌ Regressão em relação a", args.comparar)
+            return 1
+        print("✅ Sem regressão")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
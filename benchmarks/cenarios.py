@@ -0,0 +1,388 @@
+"""
+Cenários do benchmark.
+
+Cada cenário tem duas partes:
+    preparar(ctx)    - importa o alvo e monta as entradas (fora do tempo)
+    executar(estado) - a chamada medida; devolve um número que resume a
+                       saída (tamanho do mapa, linhas do DataFrame, bytes
+                       do PDF), gravado junto do tempo para conferir que a
+                       versão nova faz o mesmo trabalho da antiga
+
+REGRAS:
+- Importações do código do monitor só dentro de preparar(): o core lê as
+  URLs base na importação, e o runner só aponta para o mock antes disso
+- ImportError em preparar() marca o cenário como "pulado" (streamlit,
+  pandas e fpdf não estão instalados nos workflows dos notificadores)
+- dimensoes diz de quais parâmetros o cenário depende; os demais não
+  multiplicam execuções
+"""
+
+import datetime
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mock_api import MockApiServer, MockDataset
+
+
+@dataclass
+class Contexto:
+    """Entradas de um cenário: dataset servido e parâmetros da rodada."""
+    dataset: MockDataset
+    mock: MockApiServer
+    carteira: int
+    eventos: int
+
+
+@dataclass
+class Cenario:
+    nome: str
+    preparar: Callable[[Contexto], Any]
+    executar: Callable[[Any], Any]
+    dimensoes: Tuple[str, ...] = ("carteira",)
+    # Notificadores gravam estado_*.json no diretório corrente
+    pasta_temporaria: bool = False
+    # Módulos com funções @lru_cache a limpar entre repetições
+    modulos_cache: List[str] = field(default_factory=list)
+
+
+# ============================================================
+# AUXILIARES
+# ============================================================
+
+def _ids_carteira(ds: MockDataset) -> List[str]:
+    return [str(i) for i in ds.ids_carteira]
+
+
+def _fmt_data(iso: str) -> str:
+    try:
+        return datetime.datetime.fromisoformat(iso).strftime("%d/%m/%Y")
+    except (TypeError, ValueError):
+        return ""
+
+
+def _identificacao(p: Dict[str, Any]) -> str:
+    return f"{p['siglaTipo']} {p['numero']}/{p['ano']}"
+
+
+def _relator_fmt(ds: MockDataset, pid: int) -> str:
+    rel = (ds.relatores.get(pid) or [None])[0]
+    if not rel:
+        return ""
+    return f"{rel['nome']} ({rel['siglaPartido']}-{rel['siglaUf']})"
+
+
+def _df_carteira(ds: MockDataset):
+    """Carteira no formato das tabelas das abas 5/6 (entrada de to_pdf_bytes)."""
+    import pandas as pd
+
+    hoje = datetime.datetime.combine(ds.hoje, datetime.time())
+    linhas = []
+    for pid in ds.ids_carteira:
+        p = ds.proposicoes[pid]
+        st_ = p["statusProposicao"]
+        try:
+            parado = (hoje - datetime.datetime.fromisoformat(st_["dataHora"])).days
+        except (TypeError, ValueError):
+            parado = None
+        linhas.append({
+            "id": str(pid),
+            "Proposição": _identificacao(p),
+            "Ementa": p["ementa"],
+            "Situação atual": st_.get("descricaoSituacao") or "",
+            "Órgão (sigla)": st_.get("siglaOrgao") or "",
+            "Data do status": _fmt_data(st_.get("dataHora")),
+            "Relator(a)": _relator_fmt(ds, pid),
+            "Parado há (dias)": parado,
+            "Andamento": st_.get("descricaoTramitacao") or "",
+            "despacho": st_.get("despacho") or "",
+            "LinkTramitacao": f"https://www.camara.leg.br/proposicoesWeb/fichadetramitacao?idProposicao={pid}",
+        })
+    return pd.DataFrame(linhas)
+
+
+def _df_rics(ds: MockDataset):
+    """RICs da carteira com as colunas RIC_* da aba 7."""
+    df = _df_carteira(ds)
+    df = df[df["Proposição"].str.startswith("RIC ")].copy()
+    status = ["Aguardando resposta", "Respondido", "Fora do prazo", "Em tramitação na Câmara"]
+    df["RIC_StatusResposta"] = [status[i % len(status)] for i in range(len(df))]
+    df["RIC_Ministerio"] = "Ministério da Saúde"
+    df["RIC_PrazoStr"] = ""
+    df["RIC_DiasRestantes"] = None
+    return df
+
+
+def _linha_do_tempo(ds: MockDataset):
+    """Maior histórico de tramitações da carteira (pior caso da linha do tempo)."""
+    import pandas as pd
+
+    pid = max(ds.ids_carteira, key=lambda i: len(ds.tramitacoes.get(i, [])))
+    p = ds.proposicoes[pid]
+    linhas = []
+    for t in reversed(ds.tramitacoes.get(pid, [])):
+        dt = datetime.datetime.fromisoformat(t["dataHora"])
+        linhas.append({
+            "Data": dt.strftime("%d/%m/%Y"),
+            "Hora": dt.strftime("%H:%M"),
+            "Órgão": t.get("siglaOrgao") or "",
+            "Tramitação": t.get("descricaoTramitacao") or "",
+        })
+    st_ = p["statusProposicao"]
+    info = {
+        "proposicao": _identificacao(p),
+        "situacao": st_.get("descricaoSituacao") or "",
+        "orgao": st_.get("siglaOrgao") or "",
+        "regime": st_.get("regime") or "",
+        "id": str(pid),
+    }
+    return pd.DataFrame(linhas), info
+
+
+def _df_eventos(ds: MockDataset):
+    """
+    Resultado de escanear_eventos sintetizado do dataset (mesmas colunas),
+    para os PDFs de pauta não dependerem da rede.
+    """
+    import pandas as pd
+    from core.config import COMISSOES_ESTRATEGICAS_PADRAO, PALAVRAS_CHAVE_PADRAO, DEPUTADA_ID_PADRAO
+
+    carteira = set(ds.ids_carteira)
+    linhas = []
+    for ev in ds.eventos:
+        orgao = (ev.get("orgaos") or [{}])[0]
+        sigla = orgao.get("sigla") or ""
+        ini = datetime.datetime.fromisoformat(ev["dataHoraInicio"])
+        rel, aut, kw, palavras = [], [], [], set()
+        for i, item in enumerate(ds.pautas.get(ev["id"], [])):
+            prop = item.get("proposicao_") or {}
+            pid = prop.get("id")
+            ident = f"{prop.get('siglaTipo')} {prop.get('numero')}/{prop.get('ano')}"
+            relator = item.get("relator") or {}
+            if relator.get("id") == DEPUTADA_ID_PADRAO:
+                rel.append((ident, pid))
+            if pid in carteira:
+                aut.append((ident, pid))
+            ementa = (prop.get("ementa") or "").lower()
+            achadas = [p for p in PALAVRAS_CHAVE_PADRAO if p.lower() in ementa]
+            if achadas:
+                palavras.update(achadas)
+                kw.append(f"{ident} ({', '.join(achadas)})")
+        linhas.append({
+            "data": ini.strftime("%d/%m/%Y"),
+            "hora": ini.strftime("%H:%M"),
+            "orgao_id": orgao.get("id"),
+            "orgao_sigla": sigla,
+            "orgao_nome": orgao.get("nome") or "",
+            "id_evento": ev["id"],
+            "tipo_evento": ev.get("descricaoTipo") or "",
+            "descricao_evento": ev.get("descricao") or "",
+            "tem_relatoria_deputada": bool(rel),
+            "proposicoes_relatoria": "; ".join(r[0] for r in rel),
+            "ids_proposicoes_relatoria": ";".join(str(r[1]) for r in rel),
+            "tem_autoria_deputada": bool(aut),
+            "proposicoes_autoria": "; ".join(a[0] for a in aut),
+            "ids_proposicoes_autoria": ";".join(str(a[1]) for a in aut),
+            "tem_palavras_chave": bool(kw),
+            "palavras_chave_encontradas": "; ".join(sorted(palavras)),
+            "comissao_estrategica": sigla in COMISSOES_ESTRATEGICAS_PADRAO,
+        })
+    return pd.DataFrame(linhas)
+
+
+def _df_ocorrencias(ds: MockDataset):
+    """Ocorrências de palavras-chave (VarreduraPautas.ocorrencias) sintetizadas do dataset."""
+    import pandas as pd
+    from core.config import PALAVRAS_CHAVE_PADRAO
+    from core.services.pauta_service import COLUNAS_OCORRENCIAS
+
+    linhas = []
+    for ev in ds.eventos:
+        orgao = (ev.get("orgaos") or [{}])[0]
+        for item in ds.pautas.get(ev["id"], []):
+            prop = item.get("proposicao_") or {}
+            ementa = prop.get("ementa") or ""
+            achadas = sorted(p for p in PALAVRAS_CHAVE_PADRAO if p.lower() in ementa.lower())
+            if not achadas:
+                continue
+            relator = item.get("relator") or {}
+            linhas.append((
+                str(ev["id"]),
+                ev["dataHoraInicio"][:10],
+                orgao.get("sigla") or "",
+                orgao.get("nome") or "",
+                str(prop.get("id") or ""),
+                f"{prop.get('siglaTipo')} {prop.get('numero')}/{prop.get('ano')}",
+                achadas,
+                ementa,
+                f"https://www.camara.leg.br/proposicoesWeb/fichadetramitacao?idProposicao={prop.get('id')}",
+                (
+                    f"{relator['nome']} ({relator.get('siglaPartido') or ''}-{relator.get('siglaUf') or ''})"
+                    if relator.get("nome") else "Sem relator designado"
+                ),
+            ))
+    return pd.DataFrame(linhas, columns=COLUNAS_OCORRENCIAS)
+
+
+def _janela_eventos(ds: MockDataset) -> Tuple[str, str]:
+    ini = ds.hoje - datetime.timedelta(days=7)
+    fim = ds.hoje + datetime.timedelta(days=7)
+    return ini.isoformat(), fim.isoformat()
+
+
+def _tamanho_pdf(resultado: Optional[Tuple[bytes, str, str]]) -> int:
+    return len(resultado[0]) if resultado else 0
+
+
+# ============================================================
+# CENÁRIOS - SERVIÇOS
+# ============================================================
+
+def _prep_camara_status_map(ctx: Contexto):
+    from core.services.camara_service import CamaraService
+    return CamaraService(), _ids_carteira(ctx.dataset)
+
+
+def _prep_provider_status_map(ctx: Contexto):
+    from core.data_provider import DataProvider
+    return DataProvider(), _ids_carteira(ctx.dataset)
+
+
+def _prep_escanear_eventos(ctx: Contexto):
+    from core.config import (
+        COMISSOES_ESTRATEGICAS_PADRAO, DEPUTADA_NOME_PADRAO, DEPUTADA_PARTIDO_PADRAO,
+        DEPUTADA_UF_PADRAO, PALAVRAS_CHAVE_PADRAO,
+    )
+    from core.services import pauta_service
+    from core.services.camara_service import CamaraService
+
+    eventos = CamaraService().listar_eventos(*_janela_eventos(ctx.dataset))
+    kwargs = {
+        "alvo_nome": DEPUTADA_NOME_PADRAO,
+        "alvo_partido": DEPUTADA_PARTIDO_PADRAO,
+        "alvo_uf": DEPUTADA_UF_PADRAO,
+        "comissoes_estrategicas": COMISSOES_ESTRATEGICAS_PADRAO,
+        "palavras_chave": PALAVRAS_CHAVE_PADRAO,
+        "ids_autoria_deputada": set(_ids_carteira(ctx.dataset)),
+    }
+    return pauta_service.escanear_eventos, eventos, kwargs
+
+
+def _prep_processar_senado(ctx: Contexto):
+    import streamlit as st
+    from core.services.senado_integration import processar_lista_com_senado
+
+    st.session_state["aba_atual_senado"] = 5
+    df = _df_carteira(ctx.dataset)[["id", "Proposição", "Situação atual", "despacho"]]
+    return processar_lista_com_senado, df
+
+
+def _exec_processar_senado(estado) -> int:
+    fn, df = estado
+    saida = fn(df.copy(), mostrar_progresso=False)
+    return int(saida["no_senado"].fillna(False).astype(bool).sum()) if "no_senado" in saida else len(saida)
+
+
+# ============================================================
+# CENÁRIOS - NOTIFICADORES
+# ============================================================
+
+def _prep_modulo(nome: str) -> Callable[[Contexto], Any]:
+    def preparar(ctx: Contexto):
+        import importlib
+        return importlib.import_module(nome)
+    return preparar
+
+
+# ============================================================
+# CENÁRIOS - PDFs
+# ============================================================
+
+def _prep_pdf(funcao: str, montar: Callable[[MockDataset], Tuple[tuple, dict]]) -> Callable[[Contexto], Any]:
+    def preparar(ctx: Contexto):
+        from core.utils import pdf_generator
+        args, kwargs = montar(ctx.dataset)
+        return getattr(pdf_generator, funcao), args, kwargs
+    return preparar
+
+
+def _exec_pdf(estado) -> int:
+    fn, args, kwargs = estado
+    return _tamanho_pdf(fn(*args, **kwargs))
+
+
+CENARIOS: List[Cenario] = [
+    Cenario(
+        "camara.build_status_map",
+        _prep_camara_status_map,
+        lambda e: len(e[0].build_status_map(e[1])),
+    ),
+    Cenario(
+        "data_provider.iter_proposicoes_status_map",
+        _prep_provider_status_map,
+        lambda e: len(dict(e[0].iter_proposicoes_status_map(e[1]))),
+    ),
+    Cenario(
+        "pauta_service.escanear_eventos",
+        _prep_escanear_eventos,
+        lambda e: len(e[0](e[1], **e[2])),
+        dimensoes=("carteira", "eventos"),
+        modulos_cache=["core.services.pauta_service"],
+    ),
+    Cenario(
+        "senado_integration.processar_lista_com_senado",
+        _prep_processar_senado,
+        _exec_processar_senado,
+    ),
+    Cenario(
+        "notificar_tramitacoes.executar_varredura",
+        _prep_modulo("notificar_tramitacoes"),
+        lambda mod: mod.executar_varredura(),
+        pasta_temporaria=True,
+    ),
+    Cenario(
+        "notificar_palavras_chave.executar_varredura",
+        _prep_modulo("notificar_palavras_chave"),
+        lambda mod: mod.executar_varredura(),
+        dimensoes=("carteira", "eventos"),
+        pasta_temporaria=True,
+    ),
+    Cenario(
+        "monitorar_apensados.main",
+        _prep_modulo("monitorar_apensados"),
+        lambda mod: mod.main(),
+        pasta_temporaria=True,
+    ),
+    Cenario(
+        "pdf.to_pdf_bytes",
+        _prep_pdf("to_pdf_bytes", lambda ds: ((_df_carteira(ds), "Benchmark"), {})),
+        _exec_pdf,
+    ),
+    Cenario(
+        "pdf.to_pdf_linha_do_tempo",
+        _prep_pdf("to_pdf_linha_do_tempo", lambda ds: (_linha_do_tempo(ds), {})),
+        _exec_pdf,
+    ),
+    Cenario(
+        "pdf.to_pdf_autoria_relatoria",
+        _prep_pdf("to_pdf_autoria_relatoria", lambda ds: ((_df_eventos(ds),), {})),
+        _exec_pdf,
+        dimensoes=("carteira", "eventos"),
+    ),
+    Cenario(
+        "pdf.to_pdf_comissoes_estrategicas",
+        _prep_pdf("to_pdf_comissoes_estrategicas", lambda ds: ((_df_eventos(ds),), {})),
+        _exec_pdf,
+        dimensoes=("carteira", "eventos"),
+    ),
+    Cenario(
+        "pdf.to_pdf_palavras_chave",
+        _prep_pdf("to_pdf_palavras_chave", lambda ds: ((_df_ocorrencias(ds),), {})),
+        _exec_pdf,
+        dimensoes=("carteira", "eventos"),
+    ),
+    Cenario(
+        "pdf.to_pdf_rics_por_status",
+        _prep_pdf("to_pdf_rics_por_status", lambda ds: ((_df_rics(ds),), {})),
+        _exec_pdf,
+    ),
+]
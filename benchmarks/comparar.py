@@ -0,0 +1,85 @@
+"""
+Comparação de dois arquivos de resultado do benchmark.
+
+REGRAS:
+- Regressão de tempo: mediana atual > base * (1 + tolerância) E a
+  diferença absoluta passa de FOLGA_ABSOLUTA_S (cenários de milissegundos
+  oscilam mais que isso por ruído)
+- Regressão de rede: requisições HTTP atuais > base * (1 + TOLERANCIA_REQUISICOES)
+- Cenário novo ou pulado em um dos lados não conta como regressão
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+FOLGA_ABSOLUTA_S = 0.05
+TOLERANCIA_REQUISICOES = 0.10
+
+
+def carregar(caminho) -> Dict[str, Any]:
+    with open(Path(caminho), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def comparar(
+    base: Dict[str, Any],
+    atual: Dict[str, Any],
+    tolerancia: float = 0.25
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Compara cenário a cenário.
+
+    Returns:
+        (linhas, houve_regressao) - uma linha por cenário do resultado atual
+    """
+    res_base = base.get("resultados", {})
+    linhas = []
+    regressao = False
+
+    for chave, cur in atual.get("resultados", {}).items():
+        ant = res_base.get(chave)
+        linha = {"cenario": chave, "status": "🆕", "motivos": []}
+        if cur.get("status") == "erro" and ant and ant.get("status") == "ok":
+            linha["status"] = "❌"
+            linha["motivos"].append(cur.get("motivo", "erro"))
+            regressao = True
+            linhas.append(linha)
+            continue
+        if cur.get("status") != "ok" or not ant or ant.get("status") != "ok":
+            linha["status"] = "⏭️" if cur.get("status") != "ok" else "🆕"
+            linhas.append(linha)
+            continue
+
+        t_base = ant["tempo_s"]["mediana"]
+        t_cur = cur["tempo_s"]["mediana"]
+        linha["tempo_base"] = t_base
+        linha["tempo_atual"] = t_cur
+        linha["variacao"] = (t_cur / t_base - 1) if t_base else 0.0
+
+        if t_cur > t_base * (1 + tolerancia) and t_cur - t_base > FOLGA_ABSOLUTA_S:
+            linha["motivos"].append(f"tempo {t_base:.3f}s → {t_cur:.3f}s")
+
+        r_base = ant.get("http", {}).get("requisicoes", 0)
+        r_cur = cur.get("http", {}).get("requisicoes", 0)
+        if r_cur > r_base * (1 + TOLERANCIA_REQUISICOES):
+            linha["motivos"].append(f"requisições {r_base} → {r_cur}")
+
+        linha["status"] = "❌" if linha["motivos"] else "✅"
+        regressao = regressao or bool(linha["motivos"])
+        linhas.append(linha)
+
+    return linhas, regressao
+
+
+def formatar_tabela(linhas: List[Dict[str, Any]]) -> str:
+    """Tabela em texto para o terminal / log do workflow."""
+    saida = []
+    for l in linhas:
+        if "tempo_atual" in l:
+            detalhe = f"{l['tempo_base']:.3f}s → {l['tempo_atual']:.3f}s ({l['variacao']:+.0%})"
+        else:
+            detalhe = "sem base" if l["status"] == "🆕" else "pulado"
+        extra = f"  [{'; '.join(l['motivos'])}]" if l["motivos"] else ""
+        saida.append(f"{l['status']} {l['cenario']:<70} {detalhe}{extra}")
+    return "\n".join(saida)
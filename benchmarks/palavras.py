@@ -0,0 +1,116 @@
+"""
+Micro-benchmark da busca de palavras-chave: python -m benchmarks.palavras
+
+Compara a rotina antiga das abas (um re.search com \\b por palavra-chave
+por texto) com core.services.keyword_matcher (Aho-Corasick, uma
+passada), confere que as duas acham as mesmas palavras e mostra como
+cada uma escala com o número de palavras-chave.
+
+Corpus: ementas do dataset sintético do mock (--carteira). Palavras:
+as do notificador e, para as listas maiores, palavras sorteadas das
+próprias ementas (como se cada categoria crescesse para centenas).
+
+Exemplos:
+    python -m benchmarks.palavras
+    python -m benchmarks.palavras --palavras 50,200 --carteira 1000 --repeticoes 5
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+import datetime
+import statistics
+from pathlib import Path
+from typing import List, Set
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+from core.services.keyword_matcher import MatcherPalavrasChave, normalizar  # noqa: E402
+
+
+# ============================================================
+# REFERÊNCIA (rotina anterior)
+# ============================================================
+
+def buscar_antigo(texto: str, palavras: List[str]) -> Set[str]:
+    texto_norm = normalizar(texto)
+    encontradas = set()
+    for kw in palavras:
+        kw_norm = normalizar(kw)
+        if kw_norm and re.search(r'\b' + re.escape(kw_norm) + r'\b', texto_norm):
+            encontradas.add(kw)
+    return encontradas
+
+
+# ============================================================
+# CORPUS
+# ============================================================
+
+def corpus_mock(carteira: int, seed: int) -> List[str]:
+    from mock_api import MockDataset
+
+    ds = MockDataset(carteira=carteira, eventos=0, seed=seed, hoje=datetime.date.today())
+    return [p.get("ementa") or "" for p in ds.proposicoes.values()]
+
+
+def palavras_chave(textos: List[str], quantidade: int, seed: int) -> List[str]:
+    """Palavras do notificador completadas com termos das ementas."""
+    from notificar_palavras_chave import PALAVRAS_CHAVE
+
+    base = [p for lista in PALAVRAS_CHAVE.values() for p in lista]
+    vocab = sorted({w for t in textos for w in re.findall(r"\w{4,}", t.lower())} - set(base))
+    rnd = random.Random(seed)
+    extra = rnd.sample(vocab, min(len(vocab), max(0, quantidade - len(base))))
+    return (base + extra)[:quantidade]
+
+
+# ============================================================
+# MEDIÇÃO
+# ============================================================
+
+def _medir(fn, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fn()
+        tempos.append(time.perf_counter() - t0)
+    return statistics.median(tempos)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.palavras", description=__doc__.splitlines()[1])
+    parser.add_argument("--carteira", type=int, default=300, help="tamanho do dataset sintético")
+    parser.add_argument("--palavras", default="56,200,400", help="tamanhos da lista de palavras-chave")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    textos = corpus_mock(args.carteira, args.seed)
+    print(f"📚 {len(textos)} ementas (dataset sintético do mock)")
+
+    for n in [int(x) for x in args.palavras.split(",") if x.strip()]:
+        palavras = palavras_chave(textos, n, args.seed)
+        matcher = MatcherPalavrasChave(palavras)
+
+        divergencias = [t for t in textos if buscar_antigo(t, palavras) != matcher.palavras(t)]
+        if divergencias:
+            print(f"❌ {len(palavras)} palavras: {len(divergencias)} divergência(s), ex.: {divergencias[0][:80]!r}")
+            return 1
+
+        t_antigo = _medir(lambda: [buscar_antigo(t, palavras) for t in textos], args.repeticoes)
+        t_novo = _medir(lambda: [matcher.palavras(t) for t in textos], args.repeticoes)
+        por_texto = 1e6 / len(textos)
+        print(
+            f"⏱️  {len(palavras):4d} palavras: antigo {t_antigo * por_texto:8.1f} µs/texto, "
+            f"novo {t_novo * por_texto:7.1f} µs/texto ({t_antigo / t_novo:.1f}x)"
+        )
+    print("✅ Mesmas palavras nas duas rotinas")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Micro-benchmark da extração de relator: python -m benchmarks.relator
+
+Compara a rotina antiga (três re.search por tramitação, padrões em
+string) com core.services.relator_extractor, por proposição e em lote,
+e confere que as duas dão o mesmo relator.
+
+Corpus:
+- tramitações gravadas da API real em mock_api/fixtures/*.json
+  (python -m mock_api --gravar), quando existirem
+- senão, as do dataset sintético do mock (--carteira)
+
+Exemplos:
+    python -m benchmarks.relator
+    python -m benchmarks.relator --fixtures 'mock_api/fixtures/gravado_*.json' --repeticoes 20
+"""
+
+import re
+import sys
+import glob
+import json
+import time
+import argparse
+import datetime
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+from core.services.parsers import normalizar_partido  # noqa: E402
+from core.services.relator_extractor import extrair_relator, extrair_relatores_em_lote  # noqa: E402
+
+Corpus = Dict[str, Tuple[List[Dict[str, Any]], str]]
+
+
+# ============================================================
+# REFERÊNCIA (rotina anterior)
+# ============================================================
+
+PADROES_ANTIGOS = [
+    r'Designad[oa]\s+Relator[a]?,?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
+    r'Relator[a]?:?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
+    r'Parecer\s+(?:do|da)\s+Relator[a]?,?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
+]
+
+
+def extrair_relator_antigo(tramitacoes: List[Dict[str, Any]], orgao_atual: str = "") -> Dict[str, Any]:
+    if not tramitacoes:
+        return {}
+    relator_orgao_atual = None
+    relator_qualquer = None
+    for t in sorted(tramitacoes, key=lambda x: x.get("dataHora") or x.get("data") or "", reverse=True):
+        texto = f"{t.get('despacho') or ''} {t.get('descricaoTramitacao') or ''}"
+        orgao_tram = t.get("siglaOrgao") or ""
+        for pattern in PADROES_ANTIGOS:
+            match = re.search(pattern, texto, re.IGNORECASE)
+            if match:
+                nome = match.group(1).strip()
+                partido = normalizar_partido(match.group(2))
+                uf = match.group(3).strip() if match.lastindex >= 3 and match.group(3) else ""
+                if nome and len(nome) > 3:
+                    candidato = {"nome": nome, "partido": partido, "uf": uf}
+                    if orgao_tram and orgao_atual and orgao_tram.upper() == orgao_atual.upper():
+                        if not relator_orgao_atual:
+                            relator_orgao_atual = candidato
+                            break
+                    if not relator_qualquer:
+                        relator_qualquer = candidato
+                    break
+        if relator_orgao_atual:
+            break
+    return relator_orgao_atual or relator_qualquer or {}
+
+
+# ============================================================
+# CORPUS
+# ============================================================
+
+# Textos em que a ordem dos padrões importa (várias menções, nome curto)
+CASOS_LIMITE = [
+    "Parecer do Relator, Dep. Ana Souza (PL-SC). Designado Relator, Dep. Bruno Lima (PT-SP)",
+    "Relator: Dep. Carla Dias (PSOL-RJ); Designada Relatora, Dep. Diana Reis (MDB-MG)",
+    "Designado Relator, Dep. Zé (PL-SC). Relator: Dep. Eduardo Paes (PSD-RJ)",
+    "Relatora: Dep. Ivo (PP-AL) Parecer da Relatora, Dep. Fernanda Melo (PCdoB-BA)",
+    "Designado Relator, Dep. Zé (PL-SC)",
+]
+
+
+def corpus_casos_limite() -> Corpus:
+    """Uma proposição por caso, com a tramitação no órgão atual."""
+    return {
+        f"caso{i}": ([{"dataHora": "2024-01-01T10:00", "siglaOrgao": "CCJC", "despacho": texto}], "CCJC")
+        for i, texto in enumerate(CASOS_LIMITE)
+    }
+
+def corpus_fixtures(padrao: str) -> Corpus:
+    """Tramitações gravadas; órgão atual = siglaOrgao da mais recente."""
+    corpus: Corpus = {}
+    for arquivo in sorted(glob.glob(padrao)):
+        with open(arquivo, encoding="utf-8") as f:
+            respostas = json.load(f).get("respostas", [])
+        for r in respostas:
+            m = re.search(r"/proposicoes/(\d+)/tramitacoes$", r.get("path", ""))
+            trams = (r.get("body") or {}).get("dados") if m else None
+            if not trams:
+                continue
+            ultima = max(trams, key=lambda t: t.get("dataHora") or "")
+            corpus[m.group(1)] = (trams, ultima.get("siglaOrgao") or "")
+    return corpus
+
+
+def corpus_mock(carteira: int, seed: int) -> Corpus:
+    from mock_api import MockDataset
+
+    ds = MockDataset(carteira=carteira, eventos=0, seed=seed, hoje=datetime.date.today())
+    return {
+        str(pid): (trams, ds.proposicoes[pid]["statusProposicao"].get("siglaOrgao") or "")
+        for pid, trams in ds.tramitacoes.items()
+    }
+
+
+# ============================================================
+# MEDIÇÃO
+# ============================================================
+
+def _medir(fn, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fn()
+        tempos.append(time.perf_counter() - t0)
+    return statistics.median(tempos)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.relator", description=__doc__.splitlines()[1])
+    parser.add_argument("--fixtures", default=str(RAIZ / "mock_api" / "fixtures" / "*.json"))
+    parser.add_argument("--carteira", type=int, default=1000, help="tamanho do dataset sintético (sem fixtures)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeticoes", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    corpus = corpus_fixtures(args.fixtures)
+    origem = "fixtures gravadas"
+    if not corpus:
+        corpus = corpus_mock(args.carteira, args.seed)
+        origem = "dataset sintético do mock"
+    corpus.update(corpus_casos_limite())
+    n_trams = sum(len(t) for t, _ in corpus.values())
+    print(f"📚 {len(corpus)} proposições, {n_trams} tramitações ({origem})")
+
+    divergencias = [
+        pid for pid, (trams, orgao) in corpus.items()
+        if extrair_relator_antigo(trams, orgao) != extrair_relator(trams, orgao)
+    ]
+    if divergencias:
+        print(f"❌ {len(divergencias)} divergência(s), ex.: {divergencias[:5]}")
+        return 1
+    print("✅ Mesmo relator nas duas rotinas")
+
+    t_antigo = _medir(lambda: [extrair_relator_antigo(t, o) for t, o in corpus.values()], args.repeticoes)
+    t_novo = _medir(lambda: [extrair_relator(t, o) for t, o in corpus.values()], args.repeticoes)
+    t_lote = _medir(lambda: extrair_relatores_em_lote(corpus), args.repeticoes)
+
+    por_prop = 1e6 / len(corpus)
+    print(f"⏱️  antigo  {t_antigo * por_prop:8.1f} µs/proposição")
+    print(f"⏱️  novo    {t_novo * por_prop:8.1f} µs/proposição  ({t_antigo / t_novo:.1f}x)")
+    print(f"⏱️  lote    {t_lote * por_prop:8.1f} µs/proposição  ({t_antigo / t_lote:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
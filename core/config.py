@@ -7,11 +7,21 @@ NOTA: Constantes relacionadas a lógica de utils (MINISTERIOS_CANONICOS,
       TZ_BRASILIA, PARTIDOS_*) estão em core/utils/ para evitar duplicação.
 """
 
+import os
+
 # ============================================================
 # CONFIGURAÇÕES DE API
 # ============================================================
 
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
+# As URLs base podem ser trocadas por variável de ambiente para apontar
+# o app e os notificadores para o servidor local de mock (mock_api/):
+#   MONITOR_CAMARA_BASE_URL=http://127.0.0.1:8765/api/v2
+#   MONITOR_SENADO_BASE_URL=http://127.0.0.1:8765/dadosabertos
+BASE_URL_CAMARA_PADRAO = "https://dadosabertos.camara.leg.br/api/v2"
+BASE_URL_SENADO_PADRAO = "https://legis.senado.leg.br/dadosabertos"
+
+BASE_URL = (os.getenv("MONITOR_CAMARA_BASE_URL") or BASE_URL_CAMARA_PADRAO).rstrip("/")
+SENADO_BASE_URL = (os.getenv("MONITOR_SENADO_BASE_URL") or BASE_URL_SENADO_PADRAO).rstrip("/")
 
 HEADERS = {"User-Agent": "MonitorZanatta/22.0 (gabinete-julia-zanatta)"}
 
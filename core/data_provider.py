@@ -7,7 +7,7 @@ Camada central de dados do app.
 """
 from __future__ import annotations
 
-import concurrent.futures
+import copy
 import datetime
 import re
 from dataclasses import dataclass
@@ -18,7 +18,12 @@ import streamlit as st
 
 from core.services.camara_service import CamaraService
 from core.services.senado_service import SenadoService
-from core.utils.formatters import format_sigla_num_ano
+from core.services.response_cache import clear_response_cache
+from core.services.proposicao_store import get_proposicao_store
+from core.services.deputados_index import get_deputados_index
+from core.services.concorrencia import get_controlador_concorrencia
+from core.services.single_flight import SingleFlight
+from core.utils.formatters import format_sigla_num_ano, is_comissao_estrategica
 from core.utils.text_utils import canonical_situacao, normalize_ministerio
 from core.utils.links import camara_link_tramitacao, camara_link_deputado
 from core.utils.date_utils import (
@@ -30,11 +35,44 @@ from core.utils.date_utils import (
 
 # Imports para Tab 2 - Pauta
 from core.services.pauta_service import (
+    VarreduraPautas,
     escanear_eventos,
     fetch_proposicao_info_cached,
 )
 
 
+# Single-flight no nível do DataProvider: st.cache_data não deduplica
+# trabalho em andamento, então Tab 2/3/4 pedindo get_eventos no mesmo
+# rerun (ou duas sessões ao mesmo tempo) disparariam a mesma busca.
+_provider_flight = SingleFlight(copiar=copy.deepcopy)
+
+
+class FluxoStatus:
+    """
+    Mapa de status entregue aos poucos: iterar dá (id, status).
+
+    Primeiro saem, na hora, as proposições que o store já tem em dia;
+    depois as demais, na ordem em que a rede responde (mesmo controlador
+    de concorrência dos build_*_status_map). em_cache diz quantas chegam
+    sem ir à rede, para a tela desenhar esse lote antes de esperar.
+    """
+
+    def __init__(self, ids: List[str], montar):
+        self.ids = [str(x) for x in (ids or []) if str(x).strip()]
+        self._montar = montar
+        store = get_proposicao_store()
+        prontos = {pid for pid in self.ids if store.completa_em_cache(pid)}
+        self._prontos = [pid for pid in self.ids if pid in prontos]
+        self._faltam = [pid for pid in self.ids if pid not in prontos]
+        self.em_cache = len(self._prontos)
+        self.total = len(self.ids)
+
+    def __iter__(self):
+        for pid in self._prontos:
+            yield self._montar(pid)
+        yield from get_controlador_concorrencia().mapear_iter(self._montar, self._faltam)
+
+
 @dataclass(frozen=True)
 class ProviderConfig:
     ttl_seconds: int = 900  # 15 min
@@ -53,6 +91,10 @@ class DataProvider:
     def _ttl(self) -> int:
         return int(self.cfg.ttl_seconds)
 
+    def _single_flight(self, nome: str, fn, *args) -> Any:
+        """Coalesce chamadas simultâneas de fn(*args) com os mesmos argumentos."""
+        return _provider_flight.do((nome,) + args, fn, *args)
+
     # ---------------------------------------------------------------------
     # PERFIL
     # ---------------------------------------------------------------------
@@ -77,7 +119,7 @@ class DataProvider:
         return _self.camara.get_proposicoes_autoria(id_deputada)
 
     def get_proposicoes_autoria(self, id_deputada: int) -> List[Dict[str, Any]]:
-        return self._cached_get_proposicoes_autoria(id_deputada)
+        return self._single_flight("proposicoes_autoria", self._cached_get_proposicoes_autoria, id_deputada)
 
     # ---------------------------------------------------------------------
     # UTIL: contar tipos
@@ -99,26 +141,16 @@ class DataProvider:
         return tipos_count
 
     # ---------------------------------------------------------------------
-    # TRAMITAÇÕES
+    # TRAMITAÇÕES / PROPOSIÇÃO COMPLETA
     # ---------------------------------------------------------------------
-
-    @st.cache_data(ttl=900, show_spinner=False)
-    def _cached_get_tramitacoes(_self, id_proposicao: str) -> List[Dict[str, Any]]:
-        return _self.camara.get_tramitacoes(id_proposicao)
+    # Sem st.cache_data: o ProposicaoStore já guarda cada faceta com TTL
+    # próprio e coalesce buscas simultâneas.
 
     def get_tramitacoes(self, id_proposicao: str) -> List[Dict[str, Any]]:
-        return self._cached_get_tramitacoes(id_proposicao)
-
-    # ---------------------------------------------------------------------
-    # PROPOSIÇÃO COMPLETA
-    # ---------------------------------------------------------------------
-
-    @st.cache_data(ttl=900, show_spinner=False)
-    def _cached_get_proposicao_completa(_self, id_proposicao: str) -> Dict[str, Any]:
-        return _self.camara.get_proposicao_completa(id_proposicao)
+        return get_proposicao_store().get_tramitacoes(id_proposicao) or []
 
     def get_proposicao_completa(self, id_proposicao: str) -> Dict[str, Any]:
-        return self._cached_get_proposicao_completa(id_proposicao)
+        return get_proposicao_store().get_proposicao_completa(id_proposicao)
 
     # ---------------------------------------------------------------------
     # RICs - BUSCA BÁSICA
@@ -129,7 +161,7 @@ class DataProvider:
         return _self.camara.listar_rics_autoria(id_deputada)
 
     def get_rics_autoria(self, id_deputada: int) -> List[Dict[str, Any]]:
-        return self._cached_get_rics_autoria(id_deputada)
+        return self._single_flight("rics_autoria", self._cached_get_rics_autoria, id_deputada)
 
     # ---------------------------------------------------------------------
     # RICs - FETCH COM DATAFRAME (para Aba 7)
@@ -159,16 +191,74 @@ class DataProvider:
         return pd.DataFrame(rows)
 
     def fetch_rics_por_autor(self, id_deputada: int) -> pd.DataFrame:
-        return self._cached_fetch_rics_por_autor(id_deputada)
+        return self._single_flight("rics_por_autor", self._cached_fetch_rics_por_autor, id_deputada)
 
     # ---------------------------------------------------------------------
     # RICs - BUILD STATUS MAP (com lógica específica de RIC)
     # ---------------------------------------------------------------------
 
+    def _status_ric(self, pid: str):
+        """(id, status) de um RIC/proposição com dados de prazo (sem cache Streamlit)."""
+        dados_completos = self.camara.get_proposicao_completa(pid)
+        
+        situacao = canonical_situacao(dados_completos.get("status_descricaoSituacao", ""))
+        andamento = dados_completos.get("status_descricaoTramitacao", "")
+        relator_info = dados_completos.get("relator", {})
+        tramitacoes = dados_completos.get("tramitacoes", [])
+        sigla_tipo = dados_completos.get("sigla", "")
+        ementa = dados_completos.get("ementa", "")
+        
+        # Formatar relator
+        relator_txt = ""
+        relator_id = ""
+        if relator_info and relator_info.get("nome"):
+            nome = relator_info.get("nome", "")
+            partido = relator_info.get("partido", "")
+            uf = relator_info.get("uf", "")
+            relator_id = str(relator_info.get("id_deputado", ""))
+            if partido or uf:
+                relator_txt = f"{nome} ({partido}/{uf})".replace("//", "/").replace("(/", "(").replace("/)", ")")
+            else:
+                relator_txt = nome
+        
+        resultado = {
+            "situacao": situacao,
+            "andamento": andamento,
+            "status_dataHora": dados_completos.get("status_dataHora", ""),
+            "siglaOrgao": dados_completos.get("status_siglaOrgao", ""),
+            "relator": relator_txt,
+            "relator_id": relator_id,
+            "sigla_tipo": sigla_tipo,
+            "ementa": ementa,
+        }
+        
+        # Lógica específica de RIC
+        if sigla_tipo == "RIC":
+            prazo_info = parse_prazo_resposta_ric(tramitacoes, situacao)
+            resultado.update({
+                "ric_data_remessa": prazo_info.get("data_remessa"),
+                "ric_inicio_contagem": prazo_info.get("inicio_contagem"),
+                "ric_prazo_inicio": prazo_info.get("prazo_inicio"),
+                "ric_prazo_fim": prazo_info.get("prazo_fim"),
+                "ric_prazo_str": prazo_info.get("prazo_str", ""),
+                "ric_dias_restantes": prazo_info.get("dias_restantes"),
+                "ric_fonte_prazo": prazo_info.get("fonte_prazo", ""),
+                "ric_status_resposta": prazo_info.get("status_resposta"),
+                "ric_data_resposta": prazo_info.get("data_resposta"),
+                "ric_respondido": prazo_info.get("respondido", False),
+                "ric_ministerio": self._extrair_ministerio_ric(ementa, tramitacoes),
+                "ric_assunto": self._extrair_assunto_ric(ementa),
+            })
+        
+        return pid, resultado
+
     @st.cache_data(ttl=900, show_spinner=False)
     def _cached_build_status_map_rics(_self, ids: tuple) -> Dict[str, Dict[str, Any]]:
         """
         Constrói mapa de status para RICs com informações de prazo.
+        
+        RICs parados (status sem mudança) custam só o GET do cabeçalho:
+        o store revalida tramitações e relator pelo statusProposicao.
         """
         out: Dict[str, Dict[str, Any]] = {}
         ids_list = [str(x) for x in (ids or []) if str(x).strip()]
@@ -176,70 +266,18 @@ class DataProvider:
         if not ids_list:
             return out
 
-        def _one(pid: str):
-            dados_completos = _self.camara.get_proposicao_completa(pid)
-            
-            situacao = canonical_situacao(dados_completos.get("status_descricaoSituacao", ""))
-            andamento = dados_completos.get("status_descricaoTramitacao", "")
-            relator_info = dados_completos.get("relator", {})
-            tramitacoes = dados_completos.get("tramitacoes", [])
-            sigla_tipo = dados_completos.get("sigla", "")
-            ementa = dados_completos.get("ementa", "")
-            
-            # Formatar relator
-            relator_txt = ""
-            relator_id = ""
-            if relator_info and relator_info.get("nome"):
-                nome = relator_info.get("nome", "")
-                partido = relator_info.get("partido", "")
-                uf = relator_info.get("uf", "")
-                relator_id = str(relator_info.get("id_deputado", ""))
-                if partido or uf:
-                    relator_txt = f"{nome} ({partido}/{uf})".replace("//", "/").replace("(/", "(").replace("/)", ")")
-                else:
-                    relator_txt = nome
-            
-            resultado = {
-                "situacao": situacao,
-                "andamento": andamento,
-                "status_dataHora": dados_completos.get("status_dataHora", ""),
-                "siglaOrgao": dados_completos.get("status_siglaOrgao", ""),
-                "relator": relator_txt,
-                "relator_id": relator_id,
-                "sigla_tipo": sigla_tipo,
-                "ementa": ementa,
-            }
-            
-            # Lógica específica de RIC
-            if sigla_tipo == "RIC":
-                prazo_info = parse_prazo_resposta_ric(tramitacoes, situacao)
-                resultado.update({
-                    "ric_data_remessa": prazo_info.get("data_remessa"),
-                    "ric_inicio_contagem": prazo_info.get("inicio_contagem"),
-                    "ric_prazo_inicio": prazo_info.get("prazo_inicio"),
-                    "ric_prazo_fim": prazo_info.get("prazo_fim"),
-                    "ric_prazo_str": prazo_info.get("prazo_str", ""),
-                    "ric_dias_restantes": prazo_info.get("dias_restantes"),
-                    "ric_fonte_prazo": prazo_info.get("fonte_prazo", ""),
-                    "ric_status_resposta": prazo_info.get("status_resposta"),
-                    "ric_data_resposta": prazo_info.get("data_resposta"),
-                    "ric_respondido": prazo_info.get("respondido", False),
-                    "ric_ministerio": _self._extrair_ministerio_ric(ementa, tramitacoes),
-                    "ric_assunto": _self._extrair_assunto_ric(ementa),
-                })
-            
-            return pid, resultado
-
-        max_workers = 10 if len(ids_list) >= 40 else 6
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-            for pid, payload in ex.map(_one, ids_list):
-                out[str(pid)] = payload
+        for pid, payload in get_controlador_concorrencia().mapear(_self._status_ric, ids_list):
+            out[str(pid)] = payload
 
         return out
 
     def build_status_map_rics(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
         # Converter para tuple para ser hashable no cache
-        return self._cached_build_status_map_rics(tuple(ids))
+        return self._single_flight("status_map_rics", self._cached_build_status_map_rics, tuple(ids))
+
+    def iter_status_map_rics(self, ids: List[str]) -> "FluxoStatus":
+        """build_status_map_rics progressivo: (id, status) à medida que ficam prontos."""
+        return FluxoStatus(ids, self._status_ric)
 
     # ---------------------------------------------------------------------
     # RICs - ENRIQUECER DATAFRAME COM STATUS
@@ -276,9 +314,9 @@ class DataProvider:
         # Link do relator
         def _link_relator(row):
             relator_id = row.get("Relator_ID", "")
-            if relator_id and str(relator_id).strip() not in ('', 'nan', 'None'):
-                return camara_link_deputado(relator_id)
-            return ""
+            if not relator_id or str(relator_id).strip() in ('', 'nan', 'None'):
+                relator_id = get_deputados_index().buscar_id_por_rotulo(str(row.get("Relator(a)") or ""))
+            return camara_link_deputado(relator_id) if relator_id else ""
         df["LinkRelator"] = df.apply(_link_relator, axis=1)
 
         # Datas
@@ -412,44 +450,10 @@ class DataProvider:
         Busca eventos da Câmara no período especificado.
         Cache: 1 hora (eventos podem mudar ao longo do dia).
         """
-        import requests
-        
-        eventos = []
-        pagina = 1
-        base_url = "https://dadosabertos.camara.leg.br/api/v2"
-        
-        while True:
-            params = {
-                "dataInicio": start_date.strftime("%Y-%m-%d"),
-                "dataFim": end_date.strftime("%Y-%m-%d"),
-                "pagina": pagina,
-                "itens": 100,
-                "ordem": "ASC",
-                "ordenarPor": "dataHoraInicio",
-            }
-            
-            try:
-                response = requests.get(f"{base_url}/eventos", params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-            except Exception as e:
-                print(f"[ERRO] get_eventos: {e}")
-                break
-            
-            dados = data.get("dados", [])
-            if not dados:
-                break
-            
-            eventos.extend(dados)
-            
-            # Verificar se há próxima página
-            links = data.get("links", [])
-            if not any(link.get("rel") == "next" for link in links):
-                break
-            
-            pagina += 1
-        
-        return eventos
+        return _self.camara.listar_eventos(
+            start_date.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d"),
+        )
 
     def get_eventos(self, start_date: datetime.date, end_date: datetime.date) -> List[Dict[str, Any]]:
         """
@@ -462,7 +466,7 @@ class DataProvider:
         Returns:
             Lista de eventos (cada evento é um dict)
         """
-        return self._cached_get_eventos(start_date, end_date)
+        return self._single_flight("eventos", self._cached_get_eventos, start_date, end_date)
 
     @st.cache_data(ttl=3600, show_spinner=False)
     def _cached_get_ids_autoria_deputada(_self, id_deputada: int) -> Set[str]:
@@ -470,46 +474,7 @@ class DataProvider:
         Busca IDs de todas as proposições de autoria da deputada.
         Cache: 1 hora.
         """
-        import requests
-        
-        ids = set()
-        base_url = "https://dadosabertos.camara.leg.br/api/v2"
-        url = f"{base_url}/proposicoes"
-        
-        params = {
-            "idDeputadoAutor": id_deputada,
-            "itens": 100,
-            "ordem": "ASC",
-            "ordenarPor": "id"
-        }
-        
-        while True:
-            try:
-                response = requests.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-            except Exception as e:
-                print(f"[ERRO] get_ids_autoria_deputada: {e}")
-                break
-            
-            for d in data.get("dados", []):
-                if d.get("id"):
-                    ids.add(str(d["id"]))
-            
-            # Verificar próxima página
-            next_link = None
-            for link in data.get("links", []):
-                if link.get("rel") == "next":
-                    next_link = link.get("href")
-                    break
-            
-            if not next_link:
-                break
-            
-            url = next_link
-            params = {}  # Próxima URL já tem todos os parâmetros
-        
-        return ids
+        return _self.camara.listar_ids_autoria(id_deputada)
 
     def get_ids_autoria_deputada(self, id_deputada: int) -> Set[str]:
         """
@@ -521,110 +486,108 @@ class DataProvider:
         Returns:
             Set de IDs (strings)
         """
-        return self._cached_get_ids_autoria_deputada(id_deputada)
+        return self._single_flight("ids_autoria", self._cached_get_ids_autoria_deputada, id_deputada)
 
-    def escanear_eventos_pauta(
-        self,
-        eventos: List[Dict[str, Any]],
+    @st.cache_data(ttl=900, show_spinner=False)
+    def _cached_escanear_pautas(
+        _self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        id_deputada: int,
         nome_deputada: str,
         partido_deputada: str,
         uf_deputada: str,
-        ids_autoria_deputada: Optional[Set[str]] = None,
-    ) -> pd.DataFrame:
+        palavras_chave: tuple,
+    ) -> VarreduraPautas:
         """
-        Escaneia eventos buscando proposições de autoria ou relatoria da deputada.
-        
-        Args:
-            eventos: Lista de eventos (retorno de get_eventos)
-            nome_deputada: Nome da deputada
-            partido_deputada: Sigla do partido
-            uf_deputada: UF
-            ids_autoria_deputada: Set de IDs de proposições de autoria (opcional)
-            
-        Returns:
-            DataFrame com eventos filtrados
+        Varredura única da janela: autoria, relatoria e palavras-chave de
+        cada evento em uma passada pelas pautas.
+        Cache: 15 min por janela/deputada/palavras-chave.
         """
         # Importar aqui para evitar circular import
         from core.config import COMISSOES_ESTRATEGICAS_PADRAO
         
         return escanear_eventos(
-            eventos=eventos,
+            eventos=_self.get_eventos(start_date, end_date),
             alvo_nome=nome_deputada,
             alvo_partido=partido_deputada,
             alvo_uf=uf_deputada,
-            palavras_chave=[],  # Sem palavras-chave (Tab 2)
+            palavras_chave=list(palavras_chave),
             comissoes_estrategicas=COMISSOES_ESTRATEGICAS_PADRAO,
-            ids_autoria_deputada=ids_autoria_deputada or set(),
+            ids_autoria_deputada=_self.get_ids_autoria_deputada(id_deputada),
         )
 
-    def escanear_eventos_palavras_chave(
+    def escanear_pautas(
         self,
-        eventos: List[Dict[str, Any]],
+        start_date: datetime.date,
+        end_date: datetime.date,
+        id_deputada: int,
         nome_deputada: str,
         partido_deputada: str,
         uf_deputada: str,
-        palavras_chave: List[str],
-        ids_autoria_deputada: Optional[Set[str]] = None,
-    ) -> pd.DataFrame:
+        palavras_chave: Optional[List[str]] = None,
+    ) -> VarreduraPautas:
         """
-        Escaneia eventos buscando proposições com palavras-chave específicas.
+        Eventos da janela com todas as marcações (Abas 2, 3 e 4).
+        
+        Uma varredura só, compartilhada: as Abas 2 e 4 filtram os eventos
+        (filtrar_autoria_relatoria / filtrar_comissoes_estrategicas) e a
+        Aba 3 lê as ocorrências de palavras-chave. Trocar de aba ou voltar
+        a uma janela já vista não varre de novo.
         
         Args:
-            eventos: Lista de eventos (retorno de get_eventos)
-            nome_deputada: Nome da deputada
+            start_date: Data inicial (inclusive)
+            end_date: Data final (inclusive)
+            id_deputada: ID da deputada (autoria)
+            nome_deputada: Nome da deputada (relatoria)
             partido_deputada: Sigla do partido
             uf_deputada: UF
-            palavras_chave: Lista de palavras-chave a buscar
-            ids_autoria_deputada: Set de IDs de proposições de autoria (opcional)
+            palavras_chave: Palavras-chave (None = PALAVRAS_CHAVE_PADRAO,
+                o mesmo conjunto para as três abas)
             
         Returns:
-            DataFrame com eventos contendo as palavras-chave
+            VarreduraPautas de escanear_eventos (eventos com autoria,
+            relatoria, palavras-chave e comissao_estrategica com
+            COMISSOES_ESTRATEGICAS_PADRAO; ocorrências de palavras-chave)
         """
-        # Importar aqui para evitar circular import
-        from core.config import COMISSOES_ESTRATEGICAS_PADRAO
-        
-        return escanear_eventos(
-            eventos=eventos,
-            alvo_nome=nome_deputada,
-            alvo_partido=partido_deputada,
-            alvo_uf=uf_deputada,
-            palavras_chave=palavras_chave,
-            comissoes_estrategicas=COMISSOES_ESTRATEGICAS_PADRAO,
-            ids_autoria_deputada=ids_autoria_deputada or set(),
+        from core.config import PALAVRAS_CHAVE_PADRAO
+        
+        if palavras_chave is None:
+            palavras_chave = PALAVRAS_CHAVE_PADRAO
+        # Ordem e repetição não mudam o resultado: mesma chave de cache
+        palavras = tuple(sorted({p.strip() for p in palavras_chave if p and p.strip()}))
+        return self._single_flight(
+            "escanear_pautas", self._cached_escanear_pautas,
+            start_date, end_date, int(id_deputada),
+            nome_deputada, partido_deputada, uf_deputada, palavras,
         )
 
-    def escanear_eventos_comissoes(
-        self,
-        eventos: List[Dict[str, Any]],
-        nome_deputada: str,
-        partido_deputada: str,
-        uf_deputada: str,
-        comissoes_estrategicas: List[str],
-        ids_autoria_deputada: Optional[Set[str]] = None,
-    ) -> pd.DataFrame:
+    @staticmethod
+    def filtrar_autoria_relatoria(df: pd.DataFrame) -> pd.DataFrame:
+        """Eventos com proposição de autoria ou relatoria da deputada (Aba 2)."""
+        if df.empty:
+            return df.copy()
+        return df[df["tem_autoria_deputada"] | df["tem_relatoria_deputada"]].copy()
+
+    @staticmethod
+    def filtrar_comissoes_estrategicas(df: pd.DataFrame, comissoes_estrategicas: List[str]) -> pd.DataFrame:
         """
-        Escaneia eventos buscando eventos em comissões estratégicas específicas.
-        
-        Args:
-            eventos: Lista de eventos (retorno de get_eventos)
-            nome_deputada: Nome da deputada
-            partido_deputada: Sigla do partido
-            uf_deputada: UF
-            comissoes_estrategicas: Lista de siglas de comissões estratégicas
-            ids_autoria_deputada: Set de IDs de proposições de autoria (opcional)
-            
-        Returns:
-            DataFrame com eventos das comissões estratégicas
+        Eventos com autoria ou relatoria da deputada nas comissões
+        informadas (Aba 4), com comissao_estrategica recalculada para a
+        lista da aba (a varredura usa a lista padrão).
+
+        Mesma saída da varredura antiga da Aba 4, que rodava sem
+        palavras-chave: eventos só com palavra-chave ficam de fora e a
+        coluna de palavras-chave fica vazia.
         """
-        return escanear_eventos(
-            eventos=eventos,
-            alvo_nome=nome_deputada,
-            alvo_partido=partido_deputada,
-            alvo_uf=uf_deputada,
-            palavras_chave=[],  # Sem palavras-chave (Tab 4)
-            comissoes_estrategicas=comissoes_estrategicas,
-            ids_autoria_deputada=ids_autoria_deputada or set(),
-        )
+        if df.empty:
+            return df.copy()
+        marcados = df["orgao_sigla"].map(lambda s: is_comissao_estrategica(s, comissoes_estrategicas))
+        deputada = df["tem_autoria_deputada"] | df["tem_relatoria_deputada"]
+        df_com = df[marcados & deputada].copy()
+        df_com["comissao_estrategica"] = True
+        df_com["palavras_chave_encontradas"] = ""
+        return df_com
 
     def get_proposicao_info(self, id_proposicao: str) -> Dict[str, Any]:
         """
@@ -738,100 +701,85 @@ class DataProvider:
         
         return df[cols]
 
-    @st.cache_data(show_spinner=False, ttl=900)
-    def build_proposicoes_status_map(_self, ids: List[str]) -> Dict:
-        """
-        Constrói mapa de status para proposições.
-        
-        Busca status, andamento, relator, órgão para cada proposição.
-        Para RICs, busca também informações de prazo.
-        
-        Args:
-            ids: Lista de IDs de proposições
-            
-        Returns:
-            Dict mapeando ID → dados de status
-        """
-        # Importar funções necessárias
+    def _status_proposicao(self, pid: str):
+        """(id, status) de uma proposição (sem cache Streamlit)."""
+        # Lazy import — RIC helpers ainda no monólito
         from monitor_sistema_jz import (
-            fetch_proposicao_completa,
             canonical_situacao,
             parse_prazo_resposta_ric,
             extrair_ministerio_ric,
             extrair_assunto_ric
         )
-        import concurrent.futures
         
-        out: Dict = {}
-        ids = [str(x) for x in (ids or []) if str(x).strip()]
-        if not ids:
-            return out
+        dados_completos = get_proposicao_store().get_proposicao_completa(pid)
         
-        def _one(pid: str):
-            dados_completos = fetch_proposicao_completa(pid)
-            
-            situacao = canonical_situacao(
-                dados_completos.get("status_descricaoSituacao", "")
-            )
-            andamento = dados_completos.get("status_descricaoTramitacao", "")
-            relator_info = dados_completos.get("relator", {})
-            tramitacoes = dados_completos.get("tramitacoes", [])
-            sigla_tipo = dados_completos.get("sigla", "")
-            ementa = dados_completos.get("ementa", "")
-            
-            # Formatar relator
-            relator_txt = ""
-            relator_id = ""
-            if relator_info and relator_info.get("nome"):
-                nome = relator_info.get("nome", "")
-                partido = relator_info.get("partido", "")
-                uf = relator_info.get("uf", "")
-                relator_id = str(relator_info.get("id_deputado", ""))
-                if partido or uf:
-                    relator_txt = f"{nome} ({partido}/{uf})".replace(
-                        "//", "/"
-                    ).replace("(/", "(").replace("/)", ")")
-                else:
-                    relator_txt = nome
-            
-            # Resultado base
-            resultado = {
-                "situacao": situacao,
-                "andamento": andamento,
-                "status_dataHora": dados_completos.get("status_dataHora", ""),
-                "siglaOrgao": dados_completos.get("status_siglaOrgao", ""),
-                "relator": relator_txt,
-                "relator_id": relator_id,
-                "sigla_tipo": sigla_tipo,
-                "ementa": ementa,
-            }
-            
-            # Se for RIC, extrair informações adicionais
-            if sigla_tipo == "RIC":
-                prazo_info = parse_prazo_resposta_ric(tramitacoes, situacao)
-                resultado.update({
-                    "ric_data_remessa": prazo_info.get("data_remessa"),
-                    "ric_inicio_contagem": prazo_info.get("inicio_contagem"),
-                    "ric_prazo_inicio": prazo_info.get("prazo_inicio"),
-                    "ric_prazo_fim": prazo_info.get("prazo_fim"),
-                    "ric_prazo_str": prazo_info.get("prazo_str", ""),
-                    "ric_dias_restantes": prazo_info.get("dias_restantes"),
-                    "ric_fonte_prazo": prazo_info.get("fonte_prazo", ""),
-                    "ric_status_resposta": prazo_info.get("status_resposta"),
-                    "ric_data_resposta": prazo_info.get("data_resposta"),
-                    "ric_respondido": prazo_info.get("respondido", False),
-                    "ric_ministerio": extrair_ministerio_ric(ementa, tramitacoes),
-                    "ric_assunto": extrair_assunto_ric(ementa),
-                })
-            
-            return pid, resultado
+        situacao = canonical_situacao(
+            dados_completos.get("status_descricaoSituacao", "")
+        )
+        andamento = dados_completos.get("status_descricaoTramitacao", "")
+        relator_info = dados_completos.get("relator", {})
+        tramitacoes = dados_completos.get("tramitacoes", [])
+        sigla_tipo = dados_completos.get("sigla", "")
+        ementa = dados_completos.get("ementa", "")
+        
+        # Formatar relator
+        relator_txt = ""
+        relator_id = ""
+        if relator_info and relator_info.get("nome"):
+            nome = relator_info.get("nome", "")
+            partido = relator_info.get("partido", "")
+            uf = relator_info.get("uf", "")
+            relator_id = str(relator_info.get("id_deputado", ""))
+            if partido or uf:
+                relator_txt = f"{nome} ({partido}/{uf})".replace(
+                    "//", "/"
+                ).replace("(/", "(").replace("/)", ")")
+            else:
+                relator_txt = nome
+        
+        # Resultado base
+        resultado = {
+            "situacao": situacao,
+            "andamento": andamento,
+            "status_dataHora": dados_completos.get("status_dataHora", ""),
+            "siglaOrgao": dados_completos.get("status_siglaOrgao", ""),
+            "relator": relator_txt,
+            "relator_id": relator_id,
+            "sigla_tipo": sigla_tipo,
+            "ementa": ementa,
+        }
         
-        max_workers = 10 if len(ids) >= 40 else 6
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-            for pid, payload in ex.map(_one, ids):
-                out[str(pid)] = payload
+        # Se for RIC, extrair informações adicionais
+        if sigla_tipo == "RIC":
+            prazo_info = parse_prazo_resposta_ric(tramitacoes, situacao)
+            resultado.update({
+                "ric_data_remessa": prazo_info.get("data_remessa"),
+                "ric_inicio_contagem": prazo_info.get("inicio_contagem"),
+                "ric_prazo_inicio": prazo_info.get("prazo_inicio"),
+                "ric_prazo_fim": prazo_info.get("prazo_fim"),
+                "ric_prazo_str": prazo_info.get("prazo_str", ""),
+                "ric_dias_restantes": prazo_info.get("dias_restantes"),
+                "ric_fonte_prazo": prazo_info.get("fonte_prazo", ""),
+                "ric_status_resposta": prazo_info.get("status_resposta"),
+                "ric_data_resposta": prazo_info.get("data_resposta"),
+                "ric_respondido": prazo_info.get("respondido", False),
+                "ric_ministerio": extrair_ministerio_ric(ementa, tramitacoes),
+                "ric_assunto": extrair_assunto_ric(ementa),
+            })
         
-        return out
+        return pid, resultado
+
+    def iter_proposicoes_status_map(self, ids: List[str]) -> "FluxoStatus":
+        """
+        Mapa de status das proposições, entregue aos poucos: (id, status)
+        à medida que ficam prontos.
+
+        Busca status, andamento, relator e órgão de cada proposição; para
+        RICs, também as informações de prazo. Sem cache Streamlit: as abas
+        guardam o mapa pronto no session_state (status_map_sessao) e o
+        ProposicaoStore evita refazer buscas.
+        """
+        return FluxoStatus(ids, self._status_proposicao)
 
     def enrich_proposicoes_with_status(
         self,
@@ -843,7 +791,7 @@ class DataProvider:
         
         Args:
             df_base: DataFrame base com proposições
-            status_map: Mapa de status (retorno de build_proposicoes_status_map)
+            status_map: Mapa de status (iter_proposicoes_status_map)
             
         Returns:
             DataFrame enriquecido com colunas de status
@@ -853,7 +801,6 @@ class DataProvider:
             canonical_situacao,
             camara_link_deputado,
             get_proposicao_principal_id,
-            fetch_proposicao_completa,
             format_relator_text
         )
         import datetime
@@ -938,8 +885,7 @@ class DataProvider:
                 principal_id = get_proposicao_principal_id(pid)
                 if not principal_id or str(principal_id) == pid:
                     return row.get("Relator(a)", "—")
-                dados_principal = fetch_proposicao_completa(str(principal_id))
-                rel_txt, _ = format_relator_text(dados_principal.get("relator", {}) or {})
+                rel_txt, _ = format_relator_text(get_proposicao_store().get_relator(principal_id))
                 return rel_txt if rel_txt else row.get("Relator(a)", "—")
             
             df.loc[mask_conjunto, "Relator(a)"] = df.loc[mask_conjunto].apply(
@@ -949,9 +895,9 @@ class DataProvider:
         # Link do relator
         def _link_relator(row):
             relator_id = row.get("Relator_ID", "")
-            if relator_id and str(relator_id).strip() not in ('', 'nan', 'None'):
-                return camara_link_deputado(relator_id)
-            return ""
+            if not relator_id or str(relator_id).strip() in ('', 'nan', 'None'):
+                relator_id = get_deputados_index().buscar_id_por_rotulo(str(row.get("Relator(a)") or ""))
+            return camara_link_deputado(relator_id) if relator_id else ""
         
         df["LinkRelator"] = df.apply(_link_relator, axis=1)
         
@@ -1013,7 +959,7 @@ class DataProvider:
         Limpa cache de proposições.
         
         Limpa os caches de:
-        - fetch_proposicao_completa
+        - ProposicaoStore (dados, tramitações, relator, autores)
         - fetch_lista_proposicoes_autoria_geral
         - fetch_rics_por_autor
         - fetch_lista_proposicoes_autoria
@@ -1021,7 +967,6 @@ class DataProvider:
         """
         # Importar funções
         from monitor_sistema_jz import (
-            fetch_proposicao_completa,
             fetch_lista_proposicoes_autoria_geral,
             fetch_rics_por_autor,
             fetch_lista_proposicoes_autoria,
@@ -1029,7 +974,7 @@ class DataProvider:
         )
         
         # Limpar caches
-        fetch_proposicao_completa.clear()
+        get_proposicao_store().limpar()
         fetch_lista_proposicoes_autoria_geral.clear()
         fetch_rics_por_autor.clear()
         fetch_lista_proposicoes_autoria.clear()
@@ -1067,13 +1012,12 @@ class DataProvider:
         Limpa TODOS os caches relacionados a proposições.
         
         Versão estendida de clear_proposicoes_cache que também
-        limpa o cache do build_proposicoes_status_map.
+        limpa o cache HTTP em disco.
         """
         self.clear_proposicoes_cache()
-        
-        # Limpar também o cache do status map
-        if hasattr(self.build_proposicoes_status_map, 'clear'):
-            self.build_proposicoes_status_map.clear()
+
+        # Cache HTTP em disco (mantém eventos/pautas de datas passadas)
+        clear_response_cache()
 
     # ---------------------------------------------------------------------
     # SENADO (placeholder)
@@ -24,18 +24,44 @@ from .http_client import (
     HttpNotFoundError,
     HttpRateLimitError,
     HttpServerError,
+    HttpCircuitOpenError,
     
     # Funções HTTP
     safe_get,
     safe_get_strict,
     safe_get_raw,
+    safe_get_response,
     safe_post,
     safe_get_all_pages,
     validar_resposta_api,
     
-    # Sessões
+    # Funções HTTP async
+    safe_get_async,
+    safe_get_raw_async,
+    safe_get_all_pages_async,
+    run_async,
+    
+    # Single-flight (coalescência de GETs simultâneos)
+    get_single_flight_stats,
+    
+    # Rate limit por host
+    aguardar_rate_limit,
+    configurar_rate_limit,
+    
+    # Latência por endpoint (timeout adaptativo / hedging)
+    get_latency_stats,
+    
+    # Circuit breaker por host
+    host_disponivel,
+    get_circuit_breaker_state,
+    reset_circuit_breakers,
+    
+    # Sessões (pool de conexões)
+    create_session,
     get_camara_session,
     get_senado_session,
+    get_default_session,
+    get_session_for,
     
     # Configuração
     CAMARA_HEADERS,
@@ -45,11 +71,54 @@ from .http_client import (
 
 from .camara_service import CamaraService
 from .senado_service import SenadoService
+from .async_services import AsyncCamaraService, AsyncSenadoService
+from .response_cache import clear_response_cache, get_cache_stats
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .proposicao_store import ProposicaoStore, get_proposicao_store
+from .deputados_index import DeputadosIndex, get_deputados_index
+from .pauta_archive import PautaArchive, get_pauta_archive
+from .keyword_matcher import MatcherPalavrasChave, compilar_palavras_chave
+from .concorrencia import (
+    ControladorAIMD,
+    get_controlador_concorrencia,
+    get_concurrency_stats,
+    reset_concurrency,
+)
+from .http_metrics import (
+    get_http_metrics,
+    reset_http_metrics,
+    resumo_metricas_http,
+    salvar_metricas_http,
+)
 
 __all__ = [
     # Classes de serviço
     "CamaraService",
     "SenadoService",
+    "AsyncCamaraService",
+    "AsyncSenadoService",
+    
+    # Store de proposições (cache por faceta)
+    "ProposicaoStore",
+    "get_proposicao_store",
+    
+    # Índice de deputados (nome/partido/UF -> id)
+    "DeputadosIndex",
+    "get_deputados_index",
+    
+    # Arquivo permanente de pautas de eventos passados
+    "PautaArchive",
+    "get_pauta_archive",
+    
+    # Palavras-chave (Aho-Corasick, palavra inteira)
+    "MatcherPalavrasChave",
+    "compilar_palavras_chave",
+    
+    # Concorrência adaptativa (AIMD) dos mapas de status
+    "ControladorAIMD",
+    "get_controlador_concorrencia",
+    "get_concurrency_stats",
+    "reset_concurrency",
     
     # Exceções
     "HttpClientError",
@@ -58,12 +127,47 @@ __all__ = [
     "HttpNotFoundError",
     "HttpRateLimitError",
     "HttpServerError",
+    "HttpCircuitOpenError",
     
     # Funções HTTP (para uso avançado)
     "safe_get",
     "safe_get_strict",
     "safe_get_raw",
+    "safe_get_response",
     "safe_post",
     "safe_get_all_pages",
     "validar_resposta_api",
+    
+    # Funções HTTP async
+    "safe_get_async",
+    "safe_get_raw_async",
+    "safe_get_all_pages_async",
+    "run_async",
+    
+    # Cache HTTP em disco
+    "get_cache_stats",
+    "clear_response_cache",
+    
+    # Single-flight
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "get_single_flight_stats",
+    
+    # Rate limit por host
+    "aguardar_rate_limit",
+    "configurar_rate_limit",
+    
+    # Latência por endpoint
+    "get_latency_stats",
+    
+    # Métricas HTTP por endpoint
+    "get_http_metrics",
+    "reset_http_metrics",
+    "resumo_metricas_http",
+    "salvar_metricas_http",
+    
+    # Circuit breaker por host
+    "host_disponivel",
+    "get_circuit_breaker_state",
+    "reset_circuit_breakers",
 ]
@@ -22,15 +22,17 @@ import datetime
 from datetime import timezone
 
 import streamlit as st
-import requests
 import pandas as pd
 
+from core.config import BASE_URL
+from core.services.http_client import safe_get_response
+from core.services.proposicao_store import get_proposicao_store
+
 from core.utils.links import extract_id_from_uri
 
 # ============================================================
 # CONFIGURAÇÃO
 # ============================================================
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
 HEADERS = {"User-Agent": "MonitorZanatta/22.0 (gabinete-julia-zanatta)"}
 
 try:
@@ -279,7 +281,7 @@ def buscar_id_proposicao(sigla_tipo: str, numero: str, ano: str) -> str:
             "ano": ano,
             "itens": 1
         }
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=10, verify=_REQUESTS_VERIFY)
+        resp = safe_get_response(url, params=params, headers=HEADERS, timeout=10)
         
         if resp.status_code == 200:
             dados = resp.json().get("dados", [])
@@ -307,8 +309,7 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
     """
     import time
     tempo_inicio = time.time()
-    # Lazy imports para evitar dependência circular com o monólito
-    from monitor_sistema_jz import fetch_proposicao_completa, fetch_relator_atual
+    store = get_proposicao_store()
     
     print(f"[APENSADOS] Buscando projetos apensados (v35.1 - mapeamento completo)...")
     
@@ -331,14 +332,12 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
             }
             
             try:
-                resp = requests.get(url, params=params, headers=HEADERS, timeout=15, verify=_REQUESTS_VERIFY)
+                resp = safe_get_response(url, params=params, headers=HEADERS, timeout=15)
                 if resp.status_code == 200:
                     dados = resp.json().get("dados", [])
                     todas_props.extend(dados)
             except Exception as e:
                 print(f"[APENSADOS] Erro ao buscar {tipo}: {e}")
-            
-            time.sleep(0.2)
         
         # Adicionar proposições faltantes
         id_str = str(id_deputado)
@@ -394,10 +393,8 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
                 if id_raiz:
                     try:
                         # Dados básicos do RAIZ
-                        url_raiz = f"{BASE_URL}/proposicoes/{id_raiz}"
-                        resp_raiz = requests.get(url_raiz, headers=HEADERS, timeout=10, verify=_REQUESTS_VERIFY)
-                        if resp_raiz.status_code == 200:
-                            dados_raiz = resp_raiz.json().get("dados", {})
+                        dados_raiz = store.get_dados(id_raiz)
+                        if dados_raiz:
                             status_raiz = dados_raiz.get("statusProposicao", {})
                             situacao_raiz = status_raiz.get("descricaoSituacao", "—")
                             orgao_raiz = status_raiz.get("siglaOrgao", "—")
@@ -405,10 +402,10 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
                             relator_raiz = status_raiz.get("nomeRelator") or status_raiz.get("relator") or "—"
                             print(f"[APENSADOS]    Status RAIZ: situação={situacao_raiz[:40]}, órgão={orgao_raiz}, relator={relator_raiz[:30] if relator_raiz != '—' else '(vazio)'}")
                             
-                            # Fallback: se relator vazio, buscar via fetch_relator_atual
+                            # Fallback: se relator vazio, buscar no store
                             if relator_raiz == "—" and id_raiz:
                                 try:
-                                    rel_dict = fetch_relator_atual(id_raiz)
+                                    rel_dict = store.get_relator(id_raiz)
                                     if rel_dict and rel_dict.get("nome"):
                                         nome = rel_dict.get("nome", "")
                                         partido = rel_dict.get("partido", "")
@@ -420,11 +417,10 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
                                 except:
                                     pass
                         
-                        # Última tramitação do RAIZ - usando fetch_proposicao_completa
+                        # Última tramitação do RAIZ - usando o store
                         # v38: CORRIGIDO - Ordenar por data e filtrar "Apresentação"
                         try:
-                            dados_raiz = fetch_proposicao_completa(id_raiz)
-                            trams = dados_raiz.get("tramitacoes", [])
+                            trams = store.get_tramitacoes(id_raiz) or []
                             if trams:
                                 # ============================================================
                                 # v38: CORREÇÃO CRÍTICA - Encontrar a tramitação MAIS RECENTE
@@ -526,22 +522,17 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
                 
                 if id_principal:
                     try:
-                        url_autores = f"{BASE_URL}/proposicoes/{id_principal}/autores"
-                        resp_autores = requests.get(url_autores, headers=HEADERS, timeout=10, verify=_REQUESTS_VERIFY)
-                        if resp_autores.status_code == 200:
-                            autores = resp_autores.json().get("dados", [])
-                            if autores:
-                                autor_principal = autores[0].get("nome", "—")
-                                uri_autor = autores[0].get("uri", "")
-                                if "/deputados/" in uri_autor:
-                                    id_autor_principal = uri_autor.split("/deputados/")[-1].split("?")[0]
-                                    if id_autor_principal:
-                                        foto_autor = f"https://www.camara.leg.br/internet/deputado/bandep/{id_autor_principal}.jpg"
+                        autores = store.get_autores(id_principal)
+                        if autores:
+                            autor_principal = autores[0].get("nome", "—")
+                            uri_autor = autores[0].get("uri", "")
+                            if "/deputados/" in uri_autor:
+                                id_autor_principal = uri_autor.split("/deputados/")[-1].split("?")[0]
+                                if id_autor_principal:
+                                    foto_autor = f"https://www.camara.leg.br/internet/deputado/bandep/{id_autor_principal}.jpg"
                         
-                        url_det = f"{BASE_URL}/proposicoes/{id_principal}"
-                        resp_det = requests.get(url_det, headers=HEADERS, timeout=10, verify=_REQUESTS_VERIFY)
-                        if resp_det.status_code == 200:
-                            dados_det = resp_det.json().get("dados", {})
+                        dados_det = store.get_dados(id_principal)
+                        if dados_det:
                             ementa_principal = dados_det.get("ementa", "—")
                     except:
                         pass
@@ -549,10 +540,7 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
                 # Buscar ementa da proposição Zanatta
                 if not ementa:
                     try:
-                        url_zanatta = f"{BASE_URL}/proposicoes/{prop_id}"
-                        resp_zanatta = requests.get(url_zanatta, headers=HEADERS, timeout=10, verify=_REQUESTS_VERIFY)
-                        if resp_zanatta.status_code == 200:
-                            ementa = resp_zanatta.json().get("dados", {}).get("ementa", "")
+                        ementa = store.get_info(prop_id).get("ementa", "")
                     except:
                         pass
                 
@@ -582,11 +570,9 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
             else:
                 # Verificar se está apensado mas não está no mapeamento
                 try:
-                    url_detalhe = f"{BASE_URL}/proposicoes/{prop_id}"
-                    resp_det = requests.get(url_detalhe, headers=HEADERS, timeout=15, verify=_REQUESTS_VERIFY)
+                    dados_prop = store.get_dados(prop_id)
                     
-                    if resp_det.status_code == 200:
-                        dados_prop = resp_det.json().get("dados", {})
+                    if dados_prop:
                         status = dados_prop.get("statusProposicao", {})
                         situacao = status.get("descricaoSituacao", "")
                         
@@ -595,8 +581,6 @@ def buscar_projetos_apensados_completo(id_deputado: int) -> list:
                             print(f"[APENSADOS] ⚠️ {prop_nome} NÃO ESTÁ NO MAPEAMENTO!")
                 except:
                     pass
-            
-            time.sleep(0.1)
         
         print(f"[APENSADOS] ✅ Total: {len(projetos_apensados)}")
         tempo_total = time.time() - tempo_inicio
@@ -631,7 +615,7 @@ def fetch_proposicao_relacionadas(id_proposicao: str) -> list:
         return []
     url = f"{BASE_URL}/proposicoes/{id_proposicao}/relacionadas"
     try:
-        r = requests.get(url, headers=HEADERS, timeout=20)
+        r = safe_get_response(url, headers=HEADERS, timeout=20)
         if r.status_code == 200:
             return r.json().get("dados", []) or []
         return []
@@ -0,0 +1,233 @@
+"""
+Fachada async para os serviços da Câmara e do Senado.
+
+REGRAS:
+- SEM Streamlit
+- Sem cache próprio: proposição completa, relator e status map leem do
+  ProposicaoStore; as respostas passam pelo cache HTTP do http_client
+- Usa o transporte async do http_client (semáforo por host)
+- Mesmo formato de retorno de CamaraService / SenadoService
+
+Uso:
+    from core.services import AsyncCamaraService, run_async
+
+    camara = AsyncCamaraService()
+    status = run_async(camara.build_status_map(ids))
+"""
+
+import asyncio
+from typing import Optional, Dict, List, Any
+
+from .http_client import (
+    safe_get_async,
+    safe_get_all_pages_async,
+    get_camara_session,
+    _host_semaphore,
+    _run_blocking,
+)
+from .camara_service import BASE_URL, CamaraService, montar_status_payload
+from .senado_service import SENADO_BASE_URL, SenadoService
+from .parsers import parse_proposicao_dados, parse_relatores, parse_pauta
+from .proposicao_store import get_proposicao_store
+
+
+def _erro_ou_vazio(data: Any) -> bool:
+    """True se a resposta for None ou dict de erro do http_client."""
+    return data is None or (isinstance(data, dict) and "__error__" in data)
+
+
+# ============================================================
+# CÂMARA
+# ============================================================
+
+class AsyncCamaraService:
+    """
+    Versão async de CamaraService para fan-outs grandes.
+
+    Proposição, tramitações e pauta usam safe_get_async diretamente;
+    relator, proposição completa e status map leem do ProposicaoStore
+    no pool async; as demais delegam ao CamaraService síncrono.
+    """
+
+    def __init__(self):
+        self._session = get_camara_session()
+        self._sync = CamaraService()
+
+    async def get_proposicao(self, id_proposicao: str) -> Optional[Dict[str, Any]]:
+        """Versão async de CamaraService.get_proposicao()."""
+        if not id_proposicao:
+            return None
+
+        data = await safe_get_async(
+            f"{BASE_URL}/proposicoes/{id_proposicao}", session=self._session, hedge=True
+        )
+        if _erro_ou_vazio(data):
+            return None
+
+        return parse_proposicao_dados(data)
+
+    async def get_tramitacoes(self, id_proposicao: str) -> List[Dict[str, Any]]:
+        """Versão async de CamaraService.get_tramitacoes()."""
+        if not id_proposicao:
+            return []
+
+        data = await safe_get_async(
+            f"{BASE_URL}/proposicoes/{id_proposicao}/tramitacoes", session=self._session, hedge=True
+        )
+        if _erro_ou_vazio(data):
+            return []
+
+        return data.get("dados", [])
+
+    async def get_relatores(self, id_proposicao: str) -> List[Dict[str, Any]]:
+        """Versão async de CamaraService.get_relatores()."""
+        if not id_proposicao:
+            return []
+
+        data = await safe_get_async(
+            f"{BASE_URL}/proposicoes/{id_proposicao}/relatores", session=self._session, hedge=True
+        )
+        if _erro_ou_vazio(data):
+            return []
+
+        return parse_relatores(data)
+
+    async def get_relator_atual(self, id_proposicao: str) -> Dict[str, Any]:
+        """Versão async de CamaraService.get_relator_atual() (ProposicaoStore)."""
+        if not id_proposicao:
+            return {}
+
+        async with _host_semaphore(BASE_URL):
+            return await _run_blocking(get_proposicao_store().get_relator, id_proposicao)
+
+    async def get_proposicao_completa(self, id_proposicao: str) -> Dict[str, Any]:
+        """
+        Versão async de CamaraService.get_proposicao_completa().
+
+        Lê do mesmo ProposicaoStore (facetas, carimbos de status e
+        relator com id_deputado) no pool async.
+        """
+        if not str(id_proposicao or "").strip():
+            return {}
+
+        async with _host_semaphore(BASE_URL):
+            return await _run_blocking(get_proposicao_store().get_proposicao_completa, id_proposicao)
+
+    async def build_status_map(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Versão async de CamaraService.build_status_map().
+
+        Uma tarefa por proposição no event loop, todas lendo do
+        ProposicaoStore no pool async; quantas ficam em voo é o semáforo
+        do host da Câmara. Cada proposição busca suas facetas em
+        sequência (o paralelismo é entre proposições).
+        """
+        ids = [str(x) for x in (ids or []) if str(x).strip()]
+        if not ids:
+            return {}
+
+        store = get_proposicao_store()
+        semaforo = _host_semaphore(BASE_URL)
+
+        async def _one(pid: str) -> Dict[str, Any]:
+            async with semaforo:
+                dados = await _run_blocking(store.get_proposicao_completa, pid, paralelo=False)
+            return montar_status_payload(dados)
+
+        resultados = await asyncio.gather(*(_one(pid) for pid in ids))
+        return dict(zip(ids, resultados))
+
+    async def listar_eventos(
+        self,
+        data_inicio: str,
+        data_fim: str,
+        itens: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Versão async de CamaraService.listar_eventos()."""
+        params = {
+            "dataInicio": data_inicio,
+            "dataFim": data_fim,
+            "itens": itens,
+            "ordem": "ASC",
+            "ordenarPor": "dataHoraInicio"
+        }
+        return await safe_get_all_pages_async(
+            f"{BASE_URL}/eventos", params=params, session=self._session, paralelo=True
+        )
+
+    async def get_pauta_evento(self, event_id: int) -> List[Dict[str, Any]]:
+        """Versão async de CamaraService.get_pauta_evento()."""
+        data = await safe_get_async(
+            f"{BASE_URL}/eventos/{event_id}/pauta", session=self._session, hedge=True
+        )
+        if _erro_ou_vazio(data):
+            return []
+
+        return parse_pauta(data)
+
+    async def get_pautas_eventos(self, event_ids: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+        """Busca a pauta de vários eventos em paralelo."""
+        pautas = await asyncio.gather(*(self.get_pauta_evento(eid) for eid in event_ids))
+        return {str(eid): pauta for eid, pauta in zip(event_ids, pautas)}
+
+    def __getattr__(self, name: str):
+        """Demais métodos: delega ao CamaraService síncrono no pool async."""
+        metodo = getattr(self._sync, name)
+        if not callable(metodo):
+            return metodo
+
+        async def _delegado(*args, **kwargs):
+            async with _host_semaphore(BASE_URL):
+                return await _run_blocking(metodo, *args, **kwargs)
+
+        return _delegado
+
+
+# ============================================================
+# SENADO
+# ============================================================
+
+class AsyncSenadoService:
+    """
+    Versão async de SenadoService.
+
+    Cada método do SenadoService roda no pool async, limitado pelo
+    semáforo do host do Senado. A API do Senado responde JSON ou XML
+    e os parsers já vivem no serviço síncrono, por isso a delegação.
+    """
+
+    def __init__(self):
+        self._sync = SenadoService()
+
+    def __getattr__(self, name: str):
+        metodo = getattr(self._sync, name)
+        if not callable(metodo):
+            return metodo
+
+        async def _delegado(*args, **kwargs):
+            async with _host_semaphore(SENADO_BASE_URL):
+                return await _run_blocking(metodo, *args, **kwargs)
+
+        return _delegado
+
+    async def enriquecer_lista(
+        self,
+        itens: List[Dict[str, str]],
+        debug: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Roda enriquecer_com_dados_senado() para vários itens em paralelo.
+
+        Args:
+            itens: Lista de dicts com tipo, numero, ano
+            debug: Modo debug
+
+        Returns:
+            Lista de resultados na mesma ordem dos itens
+        """
+        return await asyncio.gather(*(
+            self.enriquecer_com_dados_senado(
+                it.get("tipo", ""), it.get("numero", ""), it.get("ano", ""), debug=debug
+            )
+            for it in itens
+        ))
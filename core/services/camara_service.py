@@ -3,15 +3,17 @@ Serviço de acesso à API da Câmara dos Deputados.
 
 REGRAS:
 - SEM Streamlit
-- SEM cache (cache fica no DataProvider)
+- SEM cache (cache fica no DataProvider); exceção: get_proposicao_completa
+  lê do ProposicaoStore
 - Usa http_client para requisições
 - Usa parsers para extração de dados
 """
 
 import time
-import concurrent.futures
 from typing import Optional, Dict, List, Any
 
+from core.config import BASE_URL
+
 from .http_client import (
     safe_get,
     safe_get_all_pages,
@@ -29,19 +31,16 @@ from .parsers import (
     parse_deputados,
     has_next_page,
     get_next_page_url,
-    extrair_relator_de_tramitacoes,
-    extrair_relator_de_relatores,
     extract_id_from_uri,
     get_proposicao_id_from_item,
 )
+from .concorrencia import get_controlador_concorrencia
 
 
 # ============================================================
 # CONFIGURAÇÃO
 # ============================================================
 
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
-
 # Workaround: Proposições faltantes na API da Câmara
 # A API não retorna algumas proposições quando consultamos por idDeputadoAutor
 PROPOSICOES_FALTANTES_API = {
@@ -76,6 +75,43 @@ PROPOSICOES_FALTANTES_API = {
 }
 
 
+def montar_status_payload(dados: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converte o resultado de get_proposicao_completa() na linha do mapa de status.
+    
+    Args:
+        dados: Dict retornado por get_proposicao_completa()
+        
+    Returns:
+        Dict com situacao, andamento, relator, etc.
+    """
+    relator_info = dados.get("relator", {}) or {}
+    relator_txt = ""
+    relator_id = ""
+    
+    if relator_info and relator_info.get("nome"):
+        nome = relator_info.get("nome", "")
+        partido = relator_info.get("partido", "")
+        uf = relator_info.get("uf", "")
+        relator_id = str(relator_info.get("id_deputado", ""))
+        
+        if partido or uf:
+            relator_txt = f"{nome} ({partido}/{uf})".replace("//", "/").replace("(/", "(").replace("/)", ")")
+        else:
+            relator_txt = nome
+    
+    return {
+        "situacao": dados.get("status_descricaoSituacao", ""),
+        "andamento": dados.get("status_descricaoTramitacao", ""),
+        "status_dataHora": dados.get("status_dataHora", ""),
+        "siglaOrgao": dados.get("status_siglaOrgao", ""),
+        "relator": relator_txt,
+        "relator_id": relator_id,
+        "sigla_tipo": dados.get("sigla", ""),
+        "ementa": dados.get("ementa", ""),
+    }
+
+
 class CamaraService:
     """
     Serviço para acesso à API da Câmara dos Deputados.
@@ -105,7 +141,7 @@ class CamaraService:
             return None
         
         url = f"{BASE_URL}/proposicoes/{id_proposicao}"
-        data = safe_get(url, session=self._session)
+        data = safe_get(url, session=self._session, hedge=True)
         
         if data is None or (isinstance(data, dict) and "__error__" in data):
             return None
@@ -241,7 +277,7 @@ class CamaraService:
         url = f"{BASE_URL}/proposicoes/{id_proposicao}/tramitacoes"
         
         # Primeira tentativa sem paginação
-        data = safe_get(url, session=self._session)
+        data = safe_get(url, session=self._session, hedge=True)
         
         if data is None or (isinstance(data, dict) and "__error__" in data):
             return []
@@ -293,7 +329,7 @@ class CamaraService:
             return []
         
         url = f"{BASE_URL}/proposicoes/{id_proposicao}/relatores"
-        data = safe_get(url, session=self._session)
+        data = safe_get(url, session=self._session, hedge=True)
         
         if data is None or (isinstance(data, dict) and "__error__" in data):
             return []
@@ -304,32 +340,20 @@ class CamaraService:
         """
         Busca relator atual de uma proposição.
         
-        Tenta primeiro a API de relatores, depois extrai das tramitações.
+        Lê do ProposicaoStore: tramitações primeiro, /relatores como
+        fallback e id_deputado pelo índice de deputados.
         
         Args:
             id_proposicao: ID da proposição
             
         Returns:
-            Dict com nome, partido, uf ou {}
+            Dict com nome, partido, uf, id_deputado ou {}
         """
         if not id_proposicao:
             return {}
         
-        # 1. Tentar API de relatores
-        relatores = self.get_relatores(id_proposicao)
-        if relatores:
-            relator = extrair_relator_de_relatores(relatores)
-            if relator and relator.get("nome"):
-                return relator
-        
-        # 2. Fallback: extrair das tramitações
-        prop = self.get_proposicao(id_proposicao)
-        orgao_atual = prop.get("status_siglaOrgao", "") if prop else ""
-        
-        tramitacoes = self.get_tramitacoes(id_proposicao)
-        relator = extrair_relator_de_tramitacoes(tramitacoes, orgao_atual)
-        
-        return relator or {}
+        from .proposicao_store import get_proposicao_store
+        return get_proposicao_store().get_relator(id_proposicao)
     
     # ============================================================
     # AUTORES
@@ -349,7 +373,7 @@ class CamaraService:
             return []
         
         url = f"{BASE_URL}/proposicoes/{id_proposicao}/autores"
-        data = safe_get(url, session=self._session)
+        data = safe_get(url, session=self._session, hedge=True)
         
         if data is None or (isinstance(data, dict) and "__error__" in data):
             return []
@@ -409,7 +433,7 @@ class CamaraService:
             "ordenarPor": "ano"
         }
         
-        items = safe_get_all_pages(url, params=params, session=self._session)
+        items = safe_get_all_pages(url, params=params, session=self._session, paralelo=True)
         
         # Workaround: adicionar proposições faltantes
         if incluir_faltantes:
@@ -464,7 +488,7 @@ class CamaraService:
             "ordenarPor": "ano"
         }
         
-        items = safe_get_all_pages(url, params=params, session=self._session)
+        items = safe_get_all_pages(url, params=params, session=self._session, paralelo=True)
         return [parse_proposicao_item(d) for d in items]
     
     def listar_ids_autoria(self, id_deputado: int) -> set:
@@ -485,7 +509,7 @@ class CamaraService:
             "ordenarPor": "id"
         }
         
-        items = safe_get_all_pages(url, params=params, session=self._session)
+        items = safe_get_all_pages(url, params=params, session=self._session, paralelo=True)
         return {str(d.get("id")) for d in items if d.get("id")}
     
     def listar_proposicoes_por_tipo(
@@ -515,7 +539,7 @@ class CamaraService:
             "ordenarPor": "dataApresentacao"
         }
         
-        items = safe_get_all_pages(url, params=params, session=self._session)
+        items = safe_get_all_pages(url, params=params, session=self._session, paralelo=True)
         return [parse_proposicao_item(d) for d in items]
     
     # ============================================================
@@ -548,7 +572,7 @@ class CamaraService:
             "ordenarPor": "dataHoraInicio"
         }
         
-        return safe_get_all_pages(url, params=params, session=self._session)
+        return safe_get_all_pages(url, params=params, session=self._session, paralelo=True)
     
     def get_pauta_evento(self, event_id: int) -> List[Dict[str, Any]]:
         """
@@ -561,7 +585,7 @@ class CamaraService:
             Lista de itens da pauta
         """
         url = f"{BASE_URL}/eventos/{event_id}/pauta"
-        data = safe_get(url, session=self._session)
+        data = safe_get(url, session=self._session, hedge=True)
         
         if data is None or (isinstance(data, dict) and "__error__" in data):
             return []
@@ -576,7 +600,9 @@ class CamaraService:
         """
         Busca TODAS as informações de uma proposição.
         
-        Agrega: dados básicos, status, tramitações, relator.
+        Agrega: dados básicos, status, tramitações, relator. Lê do
+        ProposicaoStore (cache por faceta compartilhado com abas, PDFs
+        e notificadores), então não refaz buscas já feitas no processo.
         
         Args:
             id_proposicao: ID da proposição
@@ -584,52 +610,25 @@ class CamaraService:
         Returns:
             Dict completo com todos os dados
         """
-        pid = str(id_proposicao).strip()
-        if not pid:
-            return {}
-        
-        resultado = {
-            "id": pid,
-            "sigla": "",
-            "numero": "",
-            "ano": "",
-            "ementa": "",
-            "urlInteiroTeor": "",
-            "status_dataHora": "",
-            "status_siglaOrgao": "",
-            "status_descricaoTramitacao": "",
-            "status_descricaoSituacao": "",
-            "status_despacho": "",
-            "tramitacoes": [],
-            "relator": {},
-        }
-        
-        # 1. Dados básicos + Status
-        prop = self.get_proposicao(pid)
-        if prop:
-            resultado.update(prop)
-        
-        # 2. Tramitações
-        tramitacoes = self.get_tramitacoes(pid)
-        resultado["tramitacoes"] = tramitacoes
-        
-        # 3. Relator (extraído das tramitações + API)
-        relator = self.get_relator_atual(pid)
-        resultado["relator"] = relator
-        
-        return resultado
+        from .proposicao_store import get_proposicao_store
+        return get_proposicao_store().get_proposicao_completa(id_proposicao)
     
     def build_status_map(
         self,
         ids: List[str],
-        max_workers: int = 10
+        max_workers: Optional[int] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         Constrói mapa de status para múltiplas proposições.
         
+        Proposições cujo statusProposicao não mudou desde a última busca
+        custam só o GET do cabeçalho (o store revalida tramitações e
+        relator pelo status).
+        
         Args:
             ids: Lista de IDs
-            max_workers: Threads para processamento paralelo
+            max_workers: Teto de threads (None = o controlador AIMD
+                compartilhado decide)
             
         Returns:
             Dict mapeando ID -> status
@@ -641,37 +640,9 @@ class CamaraService:
             return out
         
         def _one(pid: str):
-            dados = self.get_proposicao_completa(pid)
-            
-            relator_info = dados.get("relator", {}) or {}
-            relator_txt = ""
-            relator_id = ""
-            
-            if relator_info and relator_info.get("nome"):
-                nome = relator_info.get("nome", "")
-                partido = relator_info.get("partido", "")
-                uf = relator_info.get("uf", "")
-                relator_id = str(relator_info.get("id_deputado", ""))
-                
-                if partido or uf:
-                    relator_txt = f"{nome} ({partido}/{uf})".replace("//", "/").replace("(/", "(").replace("/)", ")")
-                else:
-                    relator_txt = nome
-            
-            return pid, {
-                "situacao": dados.get("status_descricaoSituacao", ""),
-                "andamento": dados.get("status_descricaoTramitacao", ""),
-                "status_dataHora": dados.get("status_dataHora", ""),
-                "siglaOrgao": dados.get("status_siglaOrgao", ""),
-                "relator": relator_txt,
-                "relator_id": relator_id,
-                "sigla_tipo": dados.get("sigla", ""),
-                "ementa": dados.get("ementa", ""),
-            }
+            return pid, montar_status_payload(self.get_proposicao_completa(pid))
         
-        workers = 10 if len(ids) >= 40 else 6
-        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
-            for pid, payload in ex.map(_one, ids):
-                out[str(pid)] = payload
+        for pid, payload in get_controlador_concorrencia().mapear(_one, ids, maximo=max_workers):
+            out[str(pid)] = payload
         
         return out
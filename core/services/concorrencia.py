@@ -0,0 +1,305 @@
+"""
+Controle adaptativo de concorrência (AIMD) para os mapas de status.
+
+Antes cada construtor de mapa de status fixava os workers em
+"10 if len(ids) >= 40 else 6": com a API folgada sobrava vazão, e sob
+429 mais threads só pioravam. O controlador observa as requisições à
+Câmara (latência e erros, via http_metrics) e ajusta um limite único,
+compartilhado por todos os construtores:
+
+- aumento aditivo (+1) a cada janela saudável em que o limite foi usado
+- redução multiplicativa (x0.5) quando a latência média da janela passa
+  de TOLERANCIA_LATENCIA x a linha de base, quando a taxa de erros passa
+  de TAXA_ERRO_MAX, ou na hora em caso de 429
+
+Uso:
+    from core.services.concorrencia import get_controlador_concorrencia
+
+    resultados = get_controlador_concorrencia().mapear(_one, ids)
+
+REGRAS:
+- SEM Streamlit e SEM pandas
+- Um controlador por processo (get_controlador_concorrencia); thread-safe
+- mapear() tem o contrato de ThreadPoolExecutor.map: resultados na ordem
+  da entrada, exceção da tarefa propagada; mapear_iter() entrega na ordem
+  de conclusão (telas progressivas)
+- Limite escolhido aparece em get_http_metrics()["concorrencia"]
+"""
+
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.config import BASE_URL
+
+from .http_metrics import ERRO_CONEXAO, ERRO_HTTP_429, ERRO_HTTP_5XX, ERRO_TIMEOUT, get_metrics_collector
+
+
+# ============================================================
+# CONFIGURAÇÃO
+# ============================================================
+
+CONCORRENCIA_MINIMA = 2
+CONCORRENCIA_MAXIMA = 24
+CONCORRENCIA_INICIAL = 8
+
+JANELA_REQUISICOES = 20       # requisições por decisão
+FATOR_REDUCAO = 0.5
+TOLERANCIA_LATENCIA = 1.5     # média da janela / linha de base
+TAXA_ERRO_MAX = 0.05
+ALFA_BASE = 0.1               # EWMA lenta da linha de base
+INTERVALO_MIN_REDUCAO_S = 1.0 # uma rajada de 429 conta como uma redução
+
+# Erros que indicam API sobrecarregada (404/4xx não contam)
+ERROS_SOBRECARGA = {ERRO_HTTP_429, ERRO_HTTP_5XX, ERRO_TIMEOUT, ERRO_CONEXAO}
+
+
+# Marca as threads que executam tarefas de mapear()/mapear_iter()
+_tarefa = threading.local()
+
+
+def em_tarefa_mapeada() -> bool:
+    """
+    True dentro de uma tarefa de mapear()/mapear_iter(): a vaga já
+    conta no limite, então a tarefa não deve abrir paralelismo próprio.
+    """
+    return getattr(_tarefa, "ativa", False)
+
+
+# ============================================================
+# CONTROLADOR
+# ============================================================
+
+class ControladorAIMD:
+    """Limite de tarefas simultâneas ajustado por latência e erros."""
+
+    def __init__(
+        self,
+        nome: str,
+        prefixos: Iterable[str] = (),
+        minimo: int = CONCORRENCIA_MINIMA,
+        maximo: int = CONCORRENCIA_MAXIMA,
+        inicial: int = CONCORRENCIA_INICIAL,
+    ):
+        self.nome = nome
+        self.prefixos = tuple(prefixos)
+        self.minimo = minimo
+        self.maximo = maximo
+        self._lock = threading.Lock()
+        self._limite = max(minimo, min(maximo, inicial))
+        self._base_ms: Optional[float] = None
+        self._janela = self._janela_nova()
+        self._ultima_reducao = 0.0
+        self._em_voo = 0
+        self._contagem = {"aumentos": 0, "reducoes": 0, "tarefas": 0}
+        self._menor = self._maior = self._limite
+
+    @property
+    def limite(self) -> int:
+        with self._lock:
+            return self._limite
+
+    # --------------------------------------------------------
+    # Sinais (observador do http_metrics)
+    # --------------------------------------------------------
+
+    def observar(self, url: str, segundos: Optional[float], classe: Optional[str]) -> None:
+        if self.prefixos and not url.startswith(self.prefixos):
+            return
+        sobrecarga = classe in ERROS_SOBRECARGA
+        with self._lock:
+            if classe == ERRO_HTTP_429:
+                self._reduzir()
+                return
+            if segundos is None and not sobrecarga:
+                return
+            # Timeout/erro de conexão chega sem duração, mas conta na
+            # janela: uma enxurrada deles precisa fechar janela e reduzir
+            j = self._janela
+            j["n"] += 1
+            if segundos is not None:
+                j["medidas"] += 1
+                j["soma_ms"] += segundos * 1000
+            if sobrecarga:
+                j["erros"] += 1
+            if j["n"] >= JANELA_REQUISICOES:
+                self._decidir()
+
+    def _decidir(self) -> None:
+        """Fecha a janela (chamado com o lock)."""
+        j = self._janela
+        media = j["soma_ms"] / j["medidas"] if j["medidas"] else None
+        taxa_erro = j["erros"] / j["n"]
+        base = self._base_ms if self._base_ms is not None else media
+        lenta = media is not None and media > base * TOLERANCIA_LATENCIA
+
+        if taxa_erro > TAXA_ERRO_MAX or lenta:
+            self._reduzir()
+        elif j["saturada"] and self._limite < self.maximo:
+            self._limite += 1
+            self._contagem["aumentos"] += 1
+            self._maior = max(self._maior, self._limite)
+
+        # Linha de base lenta: acompanha mudança duradoura da API sem
+        # engolir picos de uma janela
+        if media is not None:
+            self._base_ms = media if self._base_ms is None else (1 - ALFA_BASE) * self._base_ms + ALFA_BASE * media
+        self._janela = self._janela_nova(self._em_voo >= self._limite)
+
+    @staticmethod
+    def _janela_nova(saturada: bool = False) -> Dict[str, Any]:
+        return {"n": 0, "medidas": 0, "soma_ms": 0.0, "erros": 0, "saturada": saturada}
+
+    def _reduzir(self) -> None:
+        agora = time.monotonic()
+        if agora - self._ultima_reducao < INTERVALO_MIN_REDUCAO_S:
+            return
+        self._ultima_reducao = agora
+        novo = max(self.minimo, int(self._limite * FATOR_REDUCAO))
+        if novo < self._limite:
+            self._limite = novo
+            self._contagem["reducoes"] += 1
+            self._menor = min(self._menor, novo)
+        self._janela = self._janela_nova()
+
+    # --------------------------------------------------------
+    # Execução
+    # --------------------------------------------------------
+
+    def mapear(self, fn: Callable[[Any], Any], itens: Iterable[Any], maximo: Optional[int] = None) -> List[Any]:
+        """
+        fn sobre cada item, com no máximo `limite` tarefas em voo (relido a
+        cada conclusão).
+
+        Args:
+            fn: Função de um argumento
+            itens: Entradas
+            maximo: Teto adicional para esta chamada
+
+        Returns:
+            Resultados na ordem de itens
+        """
+        itens = list(itens)
+        resultados: List[Any] = [None] * len(itens)
+        for indice, fut in self._concluidos(fn, itens, maximo):
+            resultados[indice] = fut
+        return [f.result() for f in resultados]
+
+    def mapear_iter(self, fn: Callable[[Any], Any], itens: Iterable[Any], maximo: Optional[int] = None) -> Iterator[Any]:
+        """
+        Como mapear, mas entrega cada resultado assim que fica pronto
+        (ordem de conclusão). Exceção de uma tarefa é propagada quando o
+        resultado dela seria entregue.
+        """
+        for _, fut in self._concluidos(fn, list(itens), maximo):
+            yield fut.result()
+
+    def _concluidos(
+        self,
+        fn: Callable[[Any], Any],
+        itens: List[Any],
+        maximo: Optional[int]
+    ) -> Iterator[Tuple[int, concurrent.futures.Future]]:
+        """(índice, futuro concluído) na ordem de conclusão."""
+        if not itens:
+            return
+        teto = min(self.maximo, maximo or self.maximo, len(itens))
+
+        indices: Dict[concurrent.futures.Future, int] = {}
+        pendentes = set()
+        proximo = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=teto) as ex:
+            while proximo < len(itens) or pendentes:
+                with self._lock:
+                    vagas = min(self._limite, teto) - len(pendentes)
+                while vagas > 0 and proximo < len(itens):
+                    fut = ex.submit(self._executar, fn, itens[proximo])
+                    indices[fut] = proximo
+                    pendentes.add(fut)
+                    proximo += 1
+                    vagas -= 1
+                prontos, pendentes = concurrent.futures.wait(
+                    pendentes, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for fut in prontos:
+                    yield indices.pop(fut), fut
+
+    def _executar(self, fn: Callable[[Any], Any], item: Any) -> Any:
+        with self._lock:
+            self._em_voo += 1
+            if self._em_voo >= self._limite:
+                self._janela["saturada"] = True
+        _tarefa.ativa = True
+        try:
+            return fn(item)
+        finally:
+            _tarefa.ativa = False
+            with self._lock:
+                self._em_voo -= 1
+                self._contagem["tarefas"] += 1
+
+    # --------------------------------------------------------
+    # Instrumentação
+    # --------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limite": self._limite,
+                "menor": self._menor,
+                "maior": self._maior,
+                "em_voo": self._em_voo,
+                "latencia_base_ms": round(self._base_ms, 1) if self._base_ms is not None else None,
+                **self._contagem,
+            }
+
+    def reset(self, inicial: int = CONCORRENCIA_INICIAL) -> None:
+        with self._lock:
+            self._limite = max(self.minimo, min(self.maximo, inicial))
+            self._menor = self._maior = self._limite
+            self._base_ms = None
+            self._ultima_reducao = 0.0
+            self._janela = self._janela_nova()
+            for k in self._contagem:
+                self._contagem[k] = 0
+
+
+# ============================================================
+# SINGLETON
+# ============================================================
+
+_controladores: Dict[str, ControladorAIMD] = {}
+_controladores_lock = threading.Lock()
+
+
+def get_controlador_concorrencia(nome: str = "camara") -> ControladorAIMD:
+    """
+    Controlador compartilhado do processo. "camara" observa as
+    requisições a BASE_URL.
+    """
+    with _controladores_lock:
+        ctrl = _controladores.get(nome)
+        if ctrl is None:
+            prefixos = (BASE_URL,) if nome == "camara" else ()
+            ctrl = ControladorAIMD(nome, prefixos=prefixos)
+            _controladores[nome] = ctrl
+            coletor = get_metrics_collector()
+            coletor.observar(ctrl.observar)
+            coletor.registrar_secao("concorrencia", get_concurrency_stats)
+        return ctrl
+
+
+def get_concurrency_stats() -> Dict[str, Dict[str, Any]]:
+    """Estado de cada controlador (seção "concorrencia" das métricas HTTP)."""
+    with _controladores_lock:
+        ctrls = list(_controladores.values())
+    return {c.nome: c.stats() for c in ctrls}
+
+
+def reset_concurrency() -> None:
+    """Volta todos os controladores ao limite inicial (benchmarks)."""
+    with _controladores_lock:
+        ctrls = list(_controladores.values())
+    for c in ctrls:
+        c.reset()
@@ -0,0 +1,234 @@
+"""
+Índice em memória dos deputados em exercício (nome/partido/UF -> id).
+
+Antes, cada relator extraído das tramitações sem id custava um
+/deputados?nome=... por proposição, repetido em todo mapa de status. Os
+~513 deputados mudam pouco: o índice carrega /deputados em lote uma vez
+e responde localmente.
+
+Uso:
+    from core.services.deputados_index import get_deputados_index
+
+    indice = get_deputados_index()
+    indice.buscar_id("Júlia Zanatta", "PL", "SC")   # "220559"
+    indice.buscar_id_por_rotulo("Júlia Zanatta (PL/SC)")
+
+REGRAS:
+- SEM Streamlit e SEM pandas (os notificadores também usam)
+- Um índice por processo (get_deputados_index); thread-safe
+- Carga preguiçosa no primeiro uso; recarrega após TTL_INDICE
+- Falha na carga não derruba quem consulta: buscar_id devolve None e a
+  próxima tentativa só acontece depois de TTL_FALHA
+- Nome não encontrado no índice (ex.: licenciado, fora da legislatura
+  atual) cai no /deputados?nome= de sempre
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from core.config import BASE_URL
+
+from .http_client import get_camara_session, safe_get, safe_get_all_pages
+from .parsers import normalizar_nome, normalizar_partido, parse_deputados
+from .single_flight import SingleFlight
+
+
+# ============================================================
+# CONFIGURAÇÃO
+# ============================================================
+
+TTL_INDICE = 86400      # composição da Câmara muda raramente
+TTL_FALHA = 300         # espera antes de tentar carregar de novo
+
+# "Nome (PART/UF)", "Nome (PART)", "Nome"
+_ROTULO = re.compile(r"^\s*(.+?)\s*(?:\(\s*([^/()]*?)\s*(?:/\s*([A-Za-z]{2}))?\s*\))?\s*$")
+
+
+def _entrada(d: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "id": str(d.get("id") or ""),
+        "nome": (d.get("nome") or "").strip(),
+        "partido": normalizar_partido(d.get("siglaPartido") or ""),
+        "uf": (d.get("siglaUf") or "").strip().upper(),
+    }
+
+
+def _filtrar(candidatos: List[Dict[str, str]], partido: str, uf: str) -> List[Dict[str, str]]:
+    """Restringe por partido/UF quando informados; sem sobra, mantém todos."""
+    partido = normalizar_partido(partido)
+    uf = (uf or "").strip().upper()
+    filtrados = [
+        c for c in candidatos
+        if (not partido or c["partido"] == partido) and (not uf or c["uf"] == uf)
+    ]
+    return filtrados or candidatos
+
+
+# ============================================================
+# ÍNDICE
+# ============================================================
+
+class DeputadosIndex:
+    """Diretório dos deputados em exercício, indexado por nome normalizado."""
+
+    def __init__(self, ttl: float = TTL_INDICE):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._session = get_camara_session()
+        self._por_nome: Dict[str, List[Dict[str, str]]] = {}
+        self._por_id: Dict[str, Dict[str, str]] = {}
+        self._carregado_em: Optional[float] = None
+        self._falhou_em: Optional[float] = None
+        self._contagem = {"cargas": 0, "hits": 0, "misses": 0, "fallbacks": 0}
+
+    # --------------------------------------------------------
+    # Carga
+    # --------------------------------------------------------
+
+    def _carregar(self) -> bool:
+        itens = safe_get_all_pages(
+            f"{BASE_URL}/deputados",
+            params={"ordem": "ASC", "ordenarPor": "nome"},
+            session=self._session,
+            paralelo=True,
+        )
+        with self._lock:
+            self._contagem["cargas"] += 1
+            if not itens:
+                self._falhou_em = time.monotonic()
+                return False
+            por_nome: Dict[str, List[Dict[str, str]]] = {}
+            por_id: Dict[str, Dict[str, str]] = {}
+            for d in itens:
+                e = _entrada(d)
+                if not e["id"] or not e["nome"]:
+                    continue
+                por_id[e["id"]] = e
+                por_nome.setdefault(normalizar_nome(e["nome"]), []).append(e)
+            self._por_nome, self._por_id = por_nome, por_id
+            self._carregado_em = time.monotonic()
+            self._falhou_em = None
+            return True
+
+    def _garantir(self) -> bool:
+        """Carrega/recarrega se preciso. True se há índice utilizável."""
+        agora = time.monotonic()
+        with self._lock:
+            carregado = self._carregado_em is not None
+            em_dia = carregado and agora - self._carregado_em < self.ttl
+            em_espera = self._falhou_em is not None and agora - self._falhou_em < TTL_FALHA
+        if em_dia or em_espera:
+            return carregado
+        self._flight.do("carga", self._carregar)
+        with self._lock:
+            return self._carregado_em is not None
+
+    # --------------------------------------------------------
+    # Consulta
+    # --------------------------------------------------------
+
+    def buscar(self, nome: str, partido: str = "", uf: str = "") -> Optional[Dict[str, str]]:
+        """
+        Deputado pelo nome parlamentar (sem acento/caixa), desempatando
+        por partido e UF.
+
+        Returns:
+            {id, nome, partido, uf} ou None (não achado ou índice indisponível)
+        """
+        chave = normalizar_nome(nome)
+        if not chave or not self._garantir():
+            return None
+
+        with self._lock:
+            candidatos = list(self._por_nome.get(chave, ()))
+            if not candidatos:
+                # Nome parcial ("Zanatta" -> "Júlia Zanatta"): só se for único
+                candidatos = [
+                    e for n, lista in self._por_nome.items()
+                    if chave in n for e in lista
+                ]
+            candidatos = _filtrar(candidatos, partido, uf) if candidatos else []
+            achado = candidatos[0] if len(candidatos) == 1 else None
+            self._contagem["hits" if achado else "misses"] += 1
+        return dict(achado) if achado else None
+
+    def buscar_id(self, nome: str, partido: str = "", uf: str = "") -> Optional[str]:
+        """Id do deputado ou None."""
+        achado = self.buscar(nome, partido, uf)
+        return achado["id"] if achado else None
+
+    def buscar_id_por_rotulo(self, rotulo: str) -> Optional[str]:
+        """Id a partir do texto exibido nas tabelas: "Nome (PART/UF)"."""
+        m = _ROTULO.match(rotulo or "")
+        if not m or (rotulo or "").strip() in ("", "—", "-"):
+            return None
+        return self.buscar_id(m.group(1), m.group(2) or "", m.group(3) or "")
+
+    def resolver_id(self, nome: str, partido: str = "", uf: str = "") -> Optional[str]:
+        """
+        Como buscar_id, mas consulta /deputados?nome= quando o índice não
+        acha (ex.: deputado que saiu da legislatura atual).
+        """
+        encontrado = self.buscar_id(nome, partido, uf)
+        if encontrado or not (nome or "").strip():
+            return encontrado
+
+        with self._lock:
+            self._contagem["fallbacks"] += 1
+        data = safe_get(
+            f"{BASE_URL}/deputados",
+            params={"nome": nome, "itens": 5},
+            session=self._session,
+        )
+        if isinstance(data, dict) and "__error__" in data:
+            return None
+        deps = [_entrada(d) for d in parse_deputados(data)]
+        deps = _filtrar(deps, partido, uf) if deps else []
+        return deps[0]["id"] if deps and deps[0]["id"] else None
+
+    def get(self, id_deputado: Any) -> Optional[Dict[str, str]]:
+        """{id, nome, partido, uf} do deputado em exercício, ou None."""
+        if not self._garantir():
+            return None
+        with self._lock:
+            e = self._por_id.get(str(id_deputado or "").strip())
+        return dict(e) if e else None
+
+    # --------------------------------------------------------
+    # Manutenção
+    # --------------------------------------------------------
+
+    def limpar(self) -> None:
+        """Descarta o índice (recarrega no próximo uso)."""
+        with self._lock:
+            self._por_nome, self._por_id = {}, {}
+            self._carregado_em = None
+            self._falhou_em = None
+            for k in self._contagem:
+                self._contagem[k] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            idade = None if self._carregado_em is None else round(time.monotonic() - self._carregado_em, 1)
+            return {"deputados": len(self._por_id), "idade_s": idade, **self._contagem}
+
+
+# ============================================================
+# SINGLETON
+# ============================================================
+
+_indice: Optional[DeputadosIndex] = None
+_indice_lock = threading.Lock()
+
+
+def get_deputados_index() -> DeputadosIndex:
+    """Índice compartilhado do processo."""
+    global _indice
+    if _indice is None:
+        with _indice_lock:
+            if _indice is None:
+                _indice = DeputadosIndex()
+    return _indice
@@ -3,14 +3,42 @@ HTTP Client robusto para APIs da Câmara e Senado.
 
 REGRAS:
 - SEM Streamlit
-- SEM cache (cache fica no DataProvider)
+- Cache de sessão fica no DataProvider; aqui só o cache HTTP em disco
+  (response_cache, compartilhado com os scripts de notificação)
 - Exceções próprias com contexto
 - Retry com backoff exponencial
 """
 
+import copy
 import time
+import asyncio
+import threading
+import functools
+import inspect
+import weakref
+import concurrent.futures
+from collections import deque
+from urllib.parse import urlsplit, urlunsplit, parse_qs, urlencode
+
+from email.utils import parsedate_to_datetime
+
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Callable
+
+from core.config import BASE_URL, SENADO_BASE_URL
+
+from .response_cache import get_response_cache, normalizar_chave
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .http_metrics import (
+    endpoint_template,
+    get_metrics_collector,
+    ERRO_TIMEOUT,
+    ERRO_CONEXAO,
+    ERRO_JSON,
+    ERRO_CIRCUITO,
+)
 
 
 # ============================================================
@@ -68,6 +96,11 @@ class HttpServerError(HttpClientError):
     pass
 
 
+class HttpCircuitOpenError(HttpClientError):
+    """Circuit breaker do host aberto (host fora do ar, falha rápida)."""
+    pass
+
+
 # ============================================================
 # CONFIGURAÇÕES
 # ============================================================
@@ -88,6 +121,24 @@ SENADO_HEADERS = {
     "Accept": "application/json",
 }
 
+# Pool de conexões (keep-alive). pool_maxsize precisa cobrir o maior
+# número de workers que usa a mesma sessão (ASYNC_MAX_WORKERS = 64),
+# senão o urllib3 descarta conexões e refaz o handshake TLS.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 64
+
+# Retry no nível do adapter: só falhas de conexão (DNS, reset, TLS).
+# Status 429/5xx continuam tratados pelo retry com backoff de safe_get().
+ADAPTER_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    status=0,
+    backoff_factor=0.3,
+    allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+    raise_on_status=False,
+)
+
 # SSL verification
 try:
     import certifi
@@ -100,9 +151,21 @@ except ImportError:
 # SESSÃO HTTP REUTILIZÁVEL
 # ============================================================
 
-def _create_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
-    """Cria uma sessão HTTP configurada."""
+def create_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Cria uma sessão HTTP com pool de conexões e retry de conexão.
+    
+    Use no lugar de requests.Session() / requests.get() soltos: a
+    sessão reaproveita conexões TCP+TLS entre requisições.
+    """
     session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=ADAPTER_RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     if headers:
         session.headers.update(headers)
     return session
@@ -111,13 +174,17 @@ def _create_session(headers: Optional[Dict[str, str]] = None) -> requests.Sessio
 # Sessões pré-configuradas
 _camara_session: Optional[requests.Session] = None
 _senado_session: Optional[requests.Session] = None
+_default_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
 
 
 def get_camara_session() -> requests.Session:
     """Retorna sessão configurada para a Câmara."""
     global _camara_session
     if _camara_session is None:
-        _camara_session = _create_session(CAMARA_HEADERS)
+        with _session_lock:
+            if _camara_session is None:
+                _camara_session = create_session(CAMARA_HEADERS)
     return _camara_session
 
 
@@ -125,14 +192,716 @@ def get_senado_session() -> requests.Session:
     """Retorna sessão configurada para o Senado."""
     global _senado_session
     if _senado_session is None:
-        _senado_session = _create_session(SENADO_HEADERS)
+        with _session_lock:
+            if _senado_session is None:
+                _senado_session = create_session(SENADO_HEADERS)
     return _senado_session
 
 
+def get_default_session() -> requests.Session:
+    """Retorna sessão genérica (Telegram, GitHub e outros hosts)."""
+    global _default_session
+    if _default_session is None:
+        with _session_lock:
+            if _default_session is None:
+                _default_session = create_session()
+    return _default_session
+
+
+# Base URL -> host real. Quando MONITOR_CAMARA_BASE_URL /
+# MONITOR_SENADO_BASE_URL apontam para o mock local (mock_api/), as
+# requisições continuam usando sessão, rate limit, circuit breaker e
+# semáforo do host real.
+HOST_ALIASES: Dict[str, str] = {
+    BASE_URL: "dadosabertos.camara.leg.br",
+    SENADO_BASE_URL: "legis.senado.leg.br",
+}
+
+
+def _host_of(url: str) -> str:
+    """Host (sem porta) de uma URL, resolvendo os aliases de base URL."""
+    for prefixo, host in HOST_ALIASES.items():
+        if url.startswith(prefixo):
+            return host
+    return (urlsplit(url).hostname or "").lower()
+
+
+def get_session_for(url: str) -> requests.Session:
+    """Sessão pré-configurada conforme o host da URL."""
+    host = _host_of(url)
+    if host.endswith("camara.leg.br"):
+        return get_camara_session()
+    if host.endswith("senado.leg.br"):
+        return get_senado_session()
+    return get_default_session()
+
+
+# ============================================================
+# RATE LIMIT (token bucket por host)
+# ============================================================
+# Substitui os time.sleep() espalhados pelos scripts: todo GET/POST
+# do http_client reserva um token do host antes de sair. O bucket é
+# compartilhado entre threads (e entre corrotinas), então os caminhos
+# com ThreadPool respeitam o mesmo limite.
+
+# host -> (requisições por segundo, rajada)
+RATE_LIMITS: Dict[str, tuple] = {
+    "dadosabertos.camara.leg.br": (10.0, 20),
+    "legis.senado.leg.br": (5.0, 10),
+    "api.telegram.org": (1.0, 1),   # ~1 msg/s por chat
+}
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe.
+    
+    Cada requisição reserva um token; se o bucket estiver vazio, o
+    saldo fica negativo e o chamador espera o tempo de reposição.
+    Assim a espera é calculada sem segurar o lock.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reservar(self) -> float:
+        """Reserva um token. Retorna quantos segundos esperar antes de usar."""
+        with self._lock:
+            agora = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (agora - self._updated) * self.rate)
+            self._updated = agora
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self) -> None:
+        """Bloqueia até o token reservado estar disponível."""
+        espera = self.reservar()
+        if espera > 0:
+            time.sleep(espera)
+    
+    async def acquire_async(self) -> None:
+        """Versão async de acquire()."""
+        espera = self.reservar()
+        if espera > 0:
+            await asyncio.sleep(espera)
+    
+    def tentar(self) -> bool:
+        """Pega um token só se houver um disponível agora (sem esperar)."""
+        with self._lock:
+            agora = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (agora - self._updated) * self.rate)
+            self._updated = agora
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+    
+    def pausar(self, segundos: float) -> None:
+        """Esvazia o bucket para que ninguém saia nos próximos `segundos` (Retry-After)."""
+        with self._lock:
+            agora = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (agora - self._updated) * self.rate)
+            self._updated = agora
+            self._tokens = min(self._tokens, -float(segundos) * self.rate)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def configurar_rate_limit(host: str, rate: float, burst: int) -> None:
+    """
+    Define (ou altera) o limite de um host.
+    
+    Args:
+        host: Host (ex: "dadosabertos.camara.leg.br")
+        rate: Requisições por segundo
+        burst: Rajada máxima
+    """
+    host = host.lower()
+    with _buckets_lock:
+        RATE_LIMITS[host] = (rate, burst)
+        _buckets.pop(host, None)
+
+
+def _bucket_for(url: str) -> Optional[TokenBucket]:
+    """Bucket do host da URL (None se o host não tiver limite)."""
+    host = _host_of(url)
+    bucket = _buckets.get(host)
+    if bucket is None and host in RATE_LIMITS:
+        with _buckets_lock:
+            bucket = _buckets.get(host)
+            if bucket is None:
+                rate, burst = RATE_LIMITS[host]
+                bucket = TokenBucket(rate, burst)
+                _buckets[host] = bucket
+    return bucket
+
+
+def aguardar_rate_limit(url: str) -> None:
+    """
+    Espera a vez do host da URL no rate limiter.
+    
+    Para chamadas que não passam pelas funções deste módulo
+    (sessões próprias, POST do Telegram etc.).
+    """
+    bucket = _bucket_for(url)
+    if bucket is not None:
+        bucket.acquire()
+
+
+async def aguardar_rate_limit_async(url: str) -> None:
+    """Versão async de aguardar_rate_limit()."""
+    bucket = _bucket_for(url)
+    if bucket is not None:
+        await bucket.acquire_async()
+
+
+# ============================================================
+# CIRCUIT BREAKER (por host)
+# ============================================================
+# Quando a Câmara ou o Senado caem, cada proposição de uma varredura
+# gastaria todas as tentativas + backoff antes de falhar. Depois de
+# CIRCUIT_FALHAS_LIMIAR falhas seguidas o circuito do host abre e as
+# chamadas falham na hora ("circuit_open") até o tempo de abertura
+# passar; aí uma requisição de sonda decide se fecha ou reabre.
+#
+# Retry-After: até RETRY_AFTER_MAX_ESPERA segundos, o bucket do host é
+# pausado e a tentativa espera; acima disso o circuito abre pelo tempo
+# pedido pelo servidor.
+
+CIRCUIT_FALHAS_LIMIAR = 5
+CIRCUIT_TEMPO_ABERTO = 30.0        # segundos (dobra a cada reabertura)
+CIRCUIT_TEMPO_ABERTO_MAX = 300.0
+CIRCUIT_INTERVALO_SONDA = 10.0     # meio-aberto: uma sonda por intervalo
+RETRY_AFTER_MAX_ESPERA = 10.0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker thread-safe de um host (fechado/aberto/meio-aberto).
+    """
+    
+    FECHADO = "fechado"
+    ABERTO = "aberto"
+    MEIO_ABERTO = "meio_aberto"
+    
+    def __init__(
+        self,
+        host: str,
+        limiar_falhas: int = CIRCUIT_FALHAS_LIMIAR,
+        tempo_aberto: float = CIRCUIT_TEMPO_ABERTO,
+        tempo_aberto_max: float = CIRCUIT_TEMPO_ABERTO_MAX,
+    ):
+        self.host = host
+        self.limiar_falhas = limiar_falhas
+        self.tempo_aberto = tempo_aberto
+        self.tempo_aberto_max = tempo_aberto_max
+        self._estado = self.FECHADO
+        self._falhas_seguidas = 0
+        self._aberturas = 0
+        self._aberto_ate = 0.0
+        self._proxima_sonda = 0.0
+        self._rejeitadas = 0
+        self._lock = threading.Lock()
+    
+    def permitir(self) -> bool:
+        """True se a requisição pode sair (fechado, ou sonda do meio-aberto)."""
+        with self._lock:
+            if self._estado == self.FECHADO:
+                return True
+            agora = time.monotonic()
+            if self._estado == self.ABERTO and agora >= self._aberto_ate:
+                self._estado = self.MEIO_ABERTO
+                self._proxima_sonda = agora
+            if self._estado == self.MEIO_ABERTO and agora >= self._proxima_sonda:
+                self._proxima_sonda = agora + CIRCUIT_INTERVALO_SONDA
+                return True
+            self._rejeitadas += 1
+            return False
+    
+    def registrar_sucesso(self) -> None:
+        """Resposta do host (qualquer status que não seja 429/5xx)."""
+        with self._lock:
+            self._estado = self.FECHADO
+            self._falhas_seguidas = 0
+            self._aberturas = 0
+    
+    def registrar_falha(self) -> None:
+        """Timeout, erro de conexão ou 5xx."""
+        with self._lock:
+            self._falhas_seguidas += 1
+            if self._estado == self.MEIO_ABERTO or self._falhas_seguidas >= self.limiar_falhas:
+                duracao = min(self.tempo_aberto * (2 ** min(self._aberturas, 4)), self.tempo_aberto_max)
+                self._abrir(duracao)
+    
+    def abrir_por(self, segundos: float) -> None:
+        """Abre o circuito por um tempo pedido pelo servidor (Retry-After)."""
+        with self._lock:
+            self._abrir(min(float(segundos), self.tempo_aberto_max))
+    
+    def _abrir(self, segundos: float) -> None:
+        self._estado = self.ABERTO
+        self._aberto_ate = max(self._aberto_ate, time.monotonic() + segundos)
+        self._aberturas += 1
+    
+    @property
+    def estado(self) -> str:
+        with self._lock:
+            if self._estado == self.ABERTO and time.monotonic() >= self._aberto_ate:
+                return self.MEIO_ABERTO
+            return self._estado
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado atual para exibição/diagnóstico."""
+        estado = self.estado
+        with self._lock:
+            return {
+                "estado": estado,
+                "falhas_seguidas": self._falhas_seguidas,
+                "aberturas": self._aberturas,
+                "rejeitadas": self._rejeitadas,
+                "reabre_em": max(0.0, round(self._aberto_ate - time.monotonic(), 1))
+                if estado == self.ABERTO else 0.0,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _breaker_for(url: str) -> CircuitBreaker:
+    """Circuit breaker do host da URL (criado sob demanda)."""
+    host = _host_of(url)
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(host, CircuitBreaker(host))
+    return breaker
+
+
+def host_disponivel(url: str) -> bool:
+    """False se o circuito do host da URL estiver aberto (sem consumir sonda)."""
+    return _breaker_for(url).estado != CircuitBreaker.ABERTO
+
+
+def get_circuit_breaker_state() -> Dict[str, Dict[str, Any]]:
+    """Estado dos circuit breakers por host."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.host: b.snapshot() for b in breakers}
+
+
+def reset_circuit_breakers() -> None:
+    """Fecha todos os circuitos (ex: botão "Atualizar tudo")."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    """Segundos pedidos no header Retry-After (segundos ou data HTTP)."""
+    valor = (resp.headers.get("Retry-After") or "").strip()
+    if not valor:
+        return None
+    try:
+        return max(0.0, float(valor))
+    except ValueError:
+        pass
+    try:
+        alvo = parsedate_to_datetime(valor)
+        return max(0.0, alvo.timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _espera_apos_falha(
+    url: str,
+    resp: Optional[requests.Response],
+    backoffs: List[float],
+    attempt: int
+) -> Optional[float]:
+    """
+    Registra a falha (5xx/timeout/conexão) no circuit breaker e devolve
+    quantos segundos esperar antes da próxima tentativa. 429 é só rate
+    limit: espera (Retry-After ou backoff) sem contar como falha do host.
+    
+    Returns:
+        Segundos de espera, ou None para desistir na hora
+    """
+    breaker = _breaker_for(url)
+    retry_after = _retry_after(resp) if resp is not None else None
+    
+    if retry_after is not None:
+        if retry_after > RETRY_AFTER_MAX_ESPERA:
+            breaker.abrir_por(retry_after)
+            return None
+        bucket = _bucket_for(url)
+        if bucket is not None:
+            bucket.pausar(retry_after)
+        if resp.status_code != 429:
+            breaker.registrar_falha()
+        return retry_after
+    
+    if resp is None or resp.status_code != 429:
+        breaker.registrar_falha()
+    return backoffs[min(attempt, len(backoffs) - 1)]
+
+
+def _erro_circuito(url: str) -> Dict[str, Any]:
+    """Dict de erro padrão para circuito aberto."""
+    host = _host_of(url)
+    return {"__error__": f"circuit_open: {host}", "__url__": url, "__status__": None}
+
+
+# ============================================================
+# LATÊNCIA POR ENDPOINT (timeout adaptativo e hedging)
+# ============================================================
+# Cada GET registra sua duração numa janela por endpoint (IDs
+# numéricos do path viram {id}, ver http_metrics). Com amostras suficientes:
+# - o timeout vira p99 × TIMEOUT_FATOR_P99, limitado ao timeout
+#   pedido pelo chamador (que continua sendo o teto);
+# - com hedge=True, se a resposta passar do p95 dispara uma cópia do
+#   GET e fica com a que chegar primeiro (só GETs, que são idempotentes).
+# A cópia respeita o rate limit (só sai se houver token livre), o
+# circuit breaker e um teto de cópias simultâneas.
+
+LATENCIA_JANELA = 200
+LATENCIA_MIN_AMOSTRAS = 20
+TIMEOUT_FATOR_P99 = 3.0
+TIMEOUT_MINIMO = 5.0
+HEDGE_PADRAO = False
+HEDGE_ATRASO_MINIMO = 0.2          # segundos
+HEDGE_MAX_EM_ANDAMENTO = 8
+
+
+class LatencyTracker:
+    """Janela deslizante de latências por endpoint (thread-safe)."""
+    
+    def __init__(self, janela: int = LATENCIA_JANELA):
+        self.janela = janela
+        self._amostras: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+    
+    def registrar(self, endpoint: str, segundos: float) -> None:
+        with self._lock:
+            amostras = self._amostras.get(endpoint)
+            if amostras is None:
+                amostras = deque(maxlen=self.janela)
+                self._amostras[endpoint] = amostras
+            amostras.append(segundos)
+    
+    def percentil(self, endpoint: str, p: float) -> Optional[float]:
+        """Percentil p (0-100) do endpoint, ou None sem amostras suficientes."""
+        with self._lock:
+            amostras = self._amostras.get(endpoint)
+            if amostras is None or len(amostras) < LATENCIA_MIN_AMOSTRAS:
+                return None
+            ordenadas = sorted(amostras)
+        idx = min(len(ordenadas) - 1, int(round(p / 100.0 * (len(ordenadas) - 1))))
+        return ordenadas[idx]
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Amostras e p50/p95/p99 (ms) por endpoint."""
+        with self._lock:
+            copia = {ep: sorted(a) for ep, a in self._amostras.items()}
+        out: Dict[str, Dict[str, Any]] = {}
+        for ep, ordenadas in copia.items():
+            n = len(ordenadas)
+            if not n:
+                continue
+            def _p(p: float) -> float:
+                return round(ordenadas[min(n - 1, int(round(p / 100.0 * (n - 1))))] * 1000, 1)
+            out[ep] = {"amostras": n, "p50_ms": _p(50), "p95_ms": _p(95), "p99_ms": _p(99)}
+        return out
+
+
+_latencias = LatencyTracker()
+_metricas = get_metrics_collector()
+_hedge_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_hedge_lock = threading.Lock()
+_hedge_stats = {"disparados": 0, "vencedores": 0, "em_andamento": 0}
+
+
+def timeout_adaptativo(url: str, timeout_padrao: Any) -> Any:
+    """
+    Timeout derivado do p99 do endpoint (p99 × fator), entre
+    TIMEOUT_MINIMO e o timeout pedido pelo chamador.
+    """
+    if isinstance(timeout_padrao, tuple) or timeout_padrao is None:
+        return timeout_padrao
+    p99 = _latencias.percentil(endpoint_template(url), 99)
+    if p99 is None:
+        return timeout_padrao
+    return max(TIMEOUT_MINIMO, min(float(timeout_padrao), p99 * TIMEOUT_FATOR_P99))
+
+
+def _get_hedge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Pool de threads dos GETs com hedge (primário + cópia)."""
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_lock:
+            if _hedge_executor is None:
+                _hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=POOL_MAXSIZE,
+                    thread_name_prefix="http-hedge",
+                )
+    return _hedge_executor
+
+
+def _reservar_hedge(url: str) -> bool:
+    """True se uma cópia pode sair agora (teto, circuito e rate limit)."""
+    if _breaker_for(url).estado != CircuitBreaker.FECHADO:
+        return False
+    with _hedge_lock:
+        if _hedge_stats["em_andamento"] >= HEDGE_MAX_EM_ANDAMENTO:
+            return False
+        bucket = _bucket_for(url)
+        if bucket is not None and not bucket.tentar():
+            return False
+        _hedge_stats["em_andamento"] += 1
+        _hedge_stats["disparados"] += 1
+    return True
+
+
+def _get_medido(session: requests.Session, url: str, **kwargs) -> requests.Response:
+    """
+    session.get() registrando latência, status e bytes do endpoint.
+
+    Tentativas sem resposta (timeout, conexão) também entram com a
+    duração gasta: são as que mais consomem tempo de execução.
+    """
+    endpoint = endpoint_template(url)
+    inicio = time.monotonic()
+    try:
+        resp = session.get(url, **kwargs)
+    except requests.exceptions.Timeout:
+        _metricas.registrar_requisicao(url, time.monotonic() - inicio, erro=ERRO_TIMEOUT)
+        raise
+    except requests.exceptions.ConnectionError:
+        _metricas.registrar_requisicao(url, time.monotonic() - inicio, erro=ERRO_CONEXAO)
+        raise
+    finally:
+        duracao = time.monotonic() - inicio
+        _latencias.registrar(endpoint, duracao)
+    _metricas.registrar_requisicao(url, duracao, resp.status_code, len(resp.content or b""))
+    return resp
+
+
+def _enviar_get(
+    session: requests.Session,
+    url: str,
+    hedge: Optional[bool] = None,
+    **kwargs
+) -> requests.Response:
+    """
+    GET com timeout adaptativo e, opcionalmente, hedging.
+    
+    Mesmos kwargs de session.get(). Exceções do GET (timeout,
+    conexão) sobem para o retry do chamador.
+    """
+    kwargs["timeout"] = timeout_adaptativo(url, kwargs.get("timeout", DEFAULT_TIMEOUT))
+    if hedge is None:
+        hedge = HEDGE_PADRAO
+    
+    atraso = _latencias.percentil(endpoint_template(url), 95) if hedge else None
+    if atraso is None:
+        return _get_medido(session, url, **kwargs)
+    
+    executor = _get_hedge_executor()
+    primario = executor.submit(_get_medido, session, url, **kwargs)
+    try:
+        return primario.result(timeout=max(atraso, HEDGE_ATRASO_MINIMO))
+    except concurrent.futures.TimeoutError:
+        pass
+    
+    if not _reservar_hedge(url):
+        return primario.result()
+    
+    try:
+        copia = executor.submit(_get_medido, session, url, **kwargs)
+    except RuntimeError:
+        _liberar_hedge()
+        return primario.result()
+    # A vaga do hedge só é liberada quando as duas terminam: a perdedora
+    # continua ocupando um worker (e uma conexão) depois da resposta
+    _liberar_quando_terminar(primario, copia)
+    
+    pendentes = {primario, copia}
+    while pendentes:
+        feitos, pendentes = concurrent.futures.wait(
+            pendentes, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for fut in feitos:
+            if fut.exception() is None:
+                if fut is copia:
+                    with _hedge_lock:
+                        _hedge_stats["vencedores"] += 1
+                return fut.result()
+    # As duas falharam: propaga o erro do primário
+    return primario.result()
+
+
+def _liberar_hedge() -> None:
+    with _hedge_lock:
+        _hedge_stats["em_andamento"] -= 1
+
+
+def _liberar_quando_terminar(*futuros: concurrent.futures.Future) -> None:
+    """Libera a vaga do hedge quando todos os futuros terminarem."""
+    restantes = [len(futuros)]
+    lock = threading.Lock()
+    
+    def _terminou(_fut: concurrent.futures.Future) -> None:
+        with lock:
+            restantes[0] -= 1
+            ultimo = restantes[0] == 0
+        if ultimo:
+            _liberar_hedge()
+    
+    for fut in futuros:
+        fut.add_done_callback(_terminou)
+
+
+def get_latency_stats() -> Dict[str, Any]:
+    """Percentis de latência por endpoint e contadores de hedge."""
+    with _hedge_lock:
+        hedges = dict(_hedge_stats)
+    return {"endpoints": _latencias.stats(), "hedge": hedges}
+
+
+# ============================================================
+# CACHE HTTP (ver response_cache)
+# ============================================================
+
+def _cache_lookup(cache, url: str, params: Optional[Dict[str, Any]]):
+    """Entrada do cache para a URL (mesmo expirada) ou None."""
+    if cache is None:
+        return None
+    return cache.lookup(url, params)
+
+
+def _entry_json(entry) -> Optional[Dict[str, Any]]:
+    """JSON da entrada do cache ou None (sem entrada/corrompida)."""
+    if entry is None:
+        return None
+    try:
+        return entry.json()
+    except ValueError:
+        return None
+
+
+def _headers_condicionais(entry, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """
+    Acrescenta If-None-Match / If-Modified-Since de uma entrada
+    expirada aos headers da requisição.
+    """
+    if entry is None:
+        return headers
+    merged = dict(headers or {})
+    merged.update(entry.headers_condicionais())
+    return merged or None
+
+
+# ============================================================
+# SINGLE-FLIGHT (coalescência de GETs idênticos em andamento)
+# ============================================================
+# Se duas threads pedem o mesmo GET ao mesmo tempo (build_status_map
+# e escanear_eventos, abas diferentes no mesmo rerun), só uma vai à
+# rede; a outra espera e recebe o mesmo resultado. JSON é copiado
+# para os seguidores; Response é compartilhado (somente leitura).
+
+SINGLE_FLIGHT_ENABLED = True
+
+_json_flight = SingleFlight(copiar=copy.deepcopy)
+_raw_flight = SingleFlight()
+_json_flight_async = AsyncSingleFlight(copiar=copy.deepcopy)
+_raw_flight_async = AsyncSingleFlight()
+
+
+def _valor_chave(valor: Any) -> Any:
+    """Valor de argumento em forma hashable para a chave do single-flight."""
+    if isinstance(valor, requests.Session):
+        return ("session", id(valor))
+    if isinstance(valor, (list, tuple)):
+        return tuple(_valor_chave(v) for v in valor)
+    return valor
+
+
+def _flight_key(
+    fn: Callable,
+    assinatura: inspect.Signature,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    args: tuple,
+    kwargs: Dict[str, Any]
+) -> tuple:
+    """
+    Chave do single-flight: função + URL normalizada + headers + demais
+    argumentos (use_cache, session, timeout, cache_ttl...). Quem pede
+    use_cache=False ou outro timeout não herda o resultado de outra chamada.
+    """
+    ligados = assinatura.bind(url, params, headers, *args, **kwargs)
+    ligados.apply_defaults()
+    demais = tuple(sorted(
+        (nome, _valor_chave(valor))
+        for nome, valor in ligados.arguments.items()
+        if nome not in ("url", "params", "headers")
+    ))
+    return (fn.__name__, normalizar_chave(url, params), tuple(sorted((headers or {}).items())), demais)
+
+
+def _coalescer(grupo: SingleFlight):
+    """Decorator: coalesce chamadas síncronas com os mesmos argumentos."""
+    def decorator(fn):
+        assinatura = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(url, params=None, headers=None, *args, **kwargs):
+            if not SINGLE_FLIGHT_ENABLED:
+                return fn(url, params, headers, *args, **kwargs)
+            chave = _flight_key(fn, assinatura, url, params, headers, args, kwargs)
+            return grupo.do(chave, fn, url, params, headers, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _coalescer_async(grupo: AsyncSingleFlight):
+    """Decorator: versão async de _coalescer()."""
+    def decorator(fn):
+        assinatura = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(url, params=None, headers=None, *args, **kwargs):
+            if not SINGLE_FLIGHT_ENABLED:
+                return await fn(url, params, headers, *args, **kwargs)
+            chave = _flight_key(fn, assinatura, url, params, headers, args, kwargs)
+            return await grupo.do(chave, fn, url, params, headers, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """Contadores de chamadas executadas/coalescidas por grupo."""
+    return {
+        "safe_get": _json_flight.stats(),
+        "safe_get_raw": _raw_flight.stats(),
+        "safe_get_async": _json_flight_async.stats(),
+        "safe_get_raw_async": _raw_flight_async.stats(),
+    }
+
+
 # ============================================================
 # FUNÇÕES DE REQUISIÇÃO
 # ============================================================
 
+@_coalescer(_json_flight)
 def safe_get(
     url: str,
     params: Optional[Dict[str, Any]] = None,
@@ -141,11 +910,20 @@ def safe_get(
     max_retries: int = DEFAULT_MAX_RETRIES,
     backoffs: Optional[List[float]] = None,
     session: Optional[requests.Session] = None,
-    verify: bool = True
+    verify: bool = True,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    hedge: Optional[bool] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Executa GET com retry e backoff exponencial.
     
+    Consulta antes o cache HTTP em disco (response_cache) e grava
+    nele as respostas 200 dos endpoints cacheáveis. Entrada expirada
+    vira GET condicional (If-None-Match / If-Modified-Since); um 304
+    renova a entrada sem baixar o corpo de novo. Chamadas idênticas
+    simultâneas são coalescidas (single-flight).
+    
     Args:
         url: URL para requisição
         params: Query parameters
@@ -155,6 +933,9 @@ def safe_get(
         backoffs: Lista de delays entre tentativas
         session: Sessão HTTP (usa padrão se não fornecida)
         verify: Verificar SSL
+        use_cache: Usar o cache HTTP em disco
+        cache_ttl: Sobrescreve o TTL da classe do endpoint
+        hedge: Duplica o GET se passar do p95 do endpoint (None = HEDGE_PADRAO)
         
     Returns:
         Dict com dados JSON ou None se 404
@@ -165,65 +946,94 @@ def safe_get(
     params = params or {}
     backoffs = backoffs or DEFAULT_BACKOFFS
     
-    # Usar sessão fornecida ou criar uma nova
+    cache = get_response_cache() if use_cache else None
+    entry = _cache_lookup(cache, url, params)
+    if entry is not None and not entry.expirada:
+        _metricas.registrar_cache(url, "hit")
+        cached = _entry_json(entry)
+        if cached is not None:
+            return cached
+    
+    # Usar sessão fornecida ou a sessão compartilhada do host
     if session is None:
-        session = requests.Session()
-        if headers:
-            session.headers.update(headers)
-    elif headers:
+        session = get_session_for(url)
+    if headers:
         # Merge headers temporariamente
         merged_headers = dict(session.headers)
         merged_headers.update(headers)
         headers = merged_headers
     
+    # Entrada expirada: GET condicional (304 = renova o cache)
+    request_headers = _headers_condicionais(entry, headers)
+    
     last_error: Optional[Exception] = None
     last_status: Optional[int] = None
     last_response_text: str = ""
     
+    breaker = _breaker_for(url)
+    
     for attempt in range(max_retries):
+        if attempt > 0:
+            _metricas.registrar_retry(url)
+        # Circuito aberto: falha rápida (ou entrada vencida do cache)
+        if not breaker.permitir():
+            _metricas.registrar_erro(url, ERRO_CIRCUITO)
+            stale = _entry_json(entry)
+            if stale is not None:
+                _metricas.registrar_cache(url, "stale")
+                return stale
+            return _erro_circuito(url)
+        
         try:
-            resp = session.get(
+            aguardar_rate_limit(url)
+            resp = _enviar_get(
+                session,
                 url,
+                hedge=hedge,
                 params=params,
                 timeout=timeout,
                 verify=verify if verify else SSL_VERIFY,
-                headers=headers if headers and session is None else None
+                headers=request_headers
             )
             
             last_status = resp.status_code
             last_response_text = resp.text[:1000] if resp.text else ""
             
+            # 429 - Rate limit / 5xx - Erro do servidor (retry)
+            if resp.status_code == 429 or 500 <= resp.status_code <= 599:
+                delay = _espera_apos_falha(url, resp, backoffs, attempt)
+                if delay is None:
+                    break
+                if attempt < max_retries - 1:
+                    time.sleep(delay)
+                continue
+            
+            breaker.registrar_sucesso()
+            
+            # 304 - Não modificado desde a versão em cache
+            if resp.status_code == 304 and entry is not None:
+                _metricas.registrar_cache(url, "revalidado")
+                cache.revalidar(entry, url, params, resp, ttl=cache_ttl)
+                return _entry_json(entry)
+            
             # 404 - Não encontrado (válido, retorna None)
             if resp.status_code == 404:
                 return None
             
-            # 429 - Rate limit (retry)
-            if resp.status_code == 429:
-                delay = backoffs[min(attempt, len(backoffs) - 1)]
-                time.sleep(delay)
-                continue
-            
-            # 5xx - Erro do servidor (retry)
-            if 500 <= resp.status_code <= 599:
-                delay = backoffs[min(attempt, len(backoffs) - 1)]
-                time.sleep(delay)
-                continue
-            
             # Outros erros HTTP
             resp.raise_for_status()
             
             # Sucesso - parse JSON
-            return resp.json()
+            data = resp.json()
+            if cache is not None:
+                cache.put(url, params, resp, ttl=cache_ttl)
+            return data
             
-        except requests.exceptions.Timeout as e:
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
             last_error = e
-            delay = backoffs[min(attempt, len(backoffs) - 1)]
-            time.sleep(delay)
-            
-        except requests.exceptions.ConnectionError as e:
-            last_error = e
-            delay = backoffs[min(attempt, len(backoffs) - 1)]
-            time.sleep(delay)
+            delay = _espera_apos_falha(url, None, backoffs, attempt)
+            if attempt < max_retries - 1:
+                time.sleep(delay)
             
         except requests.exceptions.HTTPError as e:
             last_error = e
@@ -233,6 +1043,7 @@ def safe_get(
         except ValueError as e:
             # Erro ao parsear JSON
             last_error = e
+            _metricas.registrar_erro(url, ERRO_JSON)
             break
             
         except Exception as e:
@@ -241,7 +1052,10 @@ def safe_get(
     
     # Todas as tentativas falharam
     # Retorna dict com erro ao invés de lançar exceção (compatibilidade)
-    error_msg = str(last_error) if last_error else "unknown_error"
+    if last_error:
+        error_msg = str(last_error)
+    else:
+        error_msg = f"http_{last_status}" if last_status else "unknown_error"
     return {"__error__": error_msg, "__url__": url, "__status__": last_status}
 
 
@@ -266,6 +1080,7 @@ def safe_get_strict(
         HttpConnectionError: Se erro de conexão
         HttpRateLimitError: Se rate limit (429)
         HttpServerError: Se erro do servidor (5xx)
+        HttpCircuitOpenError: Se o circuito do host estiver aberto
         HttpClientError: Outros erros
     """
     result = safe_get(
@@ -286,7 +1101,12 @@ def safe_get_strict(
         error_msg = result.get("__error__", "unknown")
         status = result.get("__status__")
         
-        if status == 404:
+        if error_msg.startswith("circuit_open"):
+            raise HttpCircuitOpenError(
+                f"Circuito aberto: {error_msg}",
+                url=url
+            )
+        elif status == 404:
             raise HttpNotFoundError(
                 f"Recurso não encontrado",
                 url=url,
@@ -324,17 +1144,23 @@ def safe_get_strict(
     return result
 
 
+@_coalescer(_raw_flight)
 def safe_get_raw(
     url: str,
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
     timeout: int = DEFAULT_TIMEOUT,
     max_retries: int = DEFAULT_MAX_RETRIES,
-    verify: bool = True
+    verify: bool = True,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    hedge: Optional[bool] = None
 ) -> Optional[requests.Response]:
     """
     Retorna o Response completo (para quando precisa de XML ou content).
     
+    Respostas 200 passam pelo cache HTTP em disco, como em safe_get().
+    
     Args:
         url: URL para requisição
         params: Query parameters
@@ -342,6 +1168,9 @@ def safe_get_raw(
         timeout: Timeout em segundos
         max_retries: Número máximo de tentativas
         verify: Verificar SSL
+        use_cache: Usar o cache HTTP em disco
+        cache_ttl: Sobrescreve o TTL da classe do endpoint
+        hedge: Duplica o GET se passar do p95 do endpoint (None = HEDGE_PADRAO)
         
     Returns:
         Response object ou None em caso de erro
@@ -351,31 +1180,66 @@ def safe_get_raw(
     if headers:
         merged_headers.update(headers)
     
+    cache = get_response_cache() if use_cache else None
+    entry = _cache_lookup(cache, url, params)
+    if entry is not None and not entry.expirada:
+        _metricas.registrar_cache(url, "hit")
+        return entry.to_response(url)
+    request_headers = _headers_condicionais(entry, merged_headers)
+    breaker = _breaker_for(url)
+    
     for attempt in range(max_retries):
+        if attempt > 0:
+            _metricas.registrar_retry(url)
+        # Circuito aberto: falha rápida (ou entrada vencida do cache)
+        if not breaker.permitir():
+            _metricas.registrar_erro(url, ERRO_CIRCUITO)
+            if entry is None:
+                return None
+            _metricas.registrar_cache(url, "stale")
+            return entry.to_response(url)
+        
         try:
-            resp = requests.get(
+            aguardar_rate_limit(url)
+            resp = _enviar_get(
+                get_session_for(url),
                 url,
+                hedge=hedge,
                 params=params,
-                headers=merged_headers,
+                headers=request_headers,
                 timeout=timeout,
                 verify=SSL_VERIFY if verify else verify
             )
             
-            # 404 - Não encontrado
-            if resp.status_code == 404:
-                return None
-            
             # 429 ou 5xx - retry
             if resp.status_code == 429 or (500 <= resp.status_code <= 599):
-                delay = backoffs[min(attempt, len(backoffs) - 1)]
-                time.sleep(delay)
+                delay = _espera_apos_falha(url, resp, backoffs, attempt)
+                if delay is None:
+                    break
+                if attempt < max_retries - 1:
+                    time.sleep(delay)
                 continue
             
+            breaker.registrar_sucesso()
+            
+            # 304 - Não modificado desde a versão em cache
+            if resp.status_code == 304 and entry is not None:
+                _metricas.registrar_cache(url, "revalidado")
+                cache.revalidar(entry, url, params, resp, ttl=cache_ttl)
+                return entry.to_response(url)
+            
+            # 404 - Não encontrado
+            if resp.status_code == 404:
+                return None
+            
+            if cache is not None:
+                cache.put(url, params, resp, ttl=cache_ttl)
             return resp
             
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-            delay = backoffs[min(attempt, len(backoffs) - 1)]
-            time.sleep(delay)
+            delay = _espera_apos_falha(url, None, backoffs, attempt)
+            if attempt < max_retries - 1:
+                time.sleep(delay)
             
         except Exception:
             break
@@ -383,6 +1247,38 @@ def safe_get_raw(
     return None
 
 
+def safe_get_response(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    use_cache: bool = True
+) -> requests.Response:
+    """
+    Como safe_get_raw(), mas nunca retorna None.
+    
+    Usado pelos scripts de notificação, que tratam o Response direto
+    (status_code / raise_for_status). 404 e falhas após todas as
+    tentativas viram um Response 404 vazio.
+    
+    Returns:
+        Response object
+    """
+    resp = safe_get_raw(
+        url,
+        params=params,
+        headers=headers,
+        timeout=timeout,
+        use_cache=use_cache
+    )
+    if resp is None:
+        resp = requests.Response()
+        resp.status_code = 404
+        resp._content = b""
+        resp.url = url
+    return resp
+
+
 def safe_post(
     url: str,
     json_data: Optional[Dict[str, Any]] = None,
@@ -402,6 +1298,7 @@ def safe_post(
         Dict com resposta JSON ou None em caso de erro
     """
     try:
+        aguardar_rate_limit(url)
         resp = requests.post(
             url,
             json=json_data,
@@ -419,18 +1316,72 @@ def safe_post(
 # PAGINAÇÃO
 # ============================================================
 
+def _get_link(data: Dict[str, Any], rel: str) -> Optional[str]:
+    """Retorna o href do link com o rel informado (ou None)."""
+    for link in data.get("links", []) or []:
+        if link.get("rel") == rel:
+            return link.get("href")
+    return None
+
+
+def _page_urls_from_last(last_href: str, max_pages: int) -> List[str]:
+    """
+    Monta as URLs das páginas 2..N a partir do link rel="last".
+    
+    Retorna [] se o link não tiver o parâmetro "pagina".
+    """
+    parts = urlsplit(last_href)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    try:
+        total = int(query.get("pagina", [""])[0])
+    except ValueError:
+        return []
+    
+    total = min(total, max_pages)
+    urls = []
+    for pagina in range(2, total + 1):
+        query["pagina"] = [str(pagina)]
+        urls.append(urlunsplit(parts._replace(query=urlencode(query, doseq=True))))
+    return urls
+
+
+def _merge_pages(first: Dict[str, Any], pages: List[Optional[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Junta as páginas em ordem, parando onde o caminho serial pararia
+    (página com erro ou vazia).
+    """
+    all_items: List[Dict[str, Any]] = list(first.get("dados", []))
+    for data in pages:
+        if data is None or "__error__" in data:
+            break
+        items = data.get("dados", [])
+        if not items:
+            break
+        all_items.extend(items)
+    return all_items
+
+
+PARALLEL_PAGES_WORKERS = 6
+
+
 def safe_get_all_pages(
     base_url: str,
     params: Optional[Dict[str, Any]] = None,
     session: Optional[requests.Session] = None,
     max_pages: int = 100,
     items_per_page: int = 100,
-    timeout: int = DEFAULT_TIMEOUT
+    timeout: int = DEFAULT_TIMEOUT,
+    paralelo: bool = False,
+    max_workers: int = PARALLEL_PAGES_WORKERS
 ) -> List[Dict[str, Any]]:
     """
     Busca todos os dados paginados da API da Câmara.
     
-    A API da Câmara usa links rel="next" para paginação.
+    A API da Câmara usa links rel="next" para paginação. Com
+    paralelo=True, lê o total de páginas do link rel="last" da
+    primeira resposta e busca as páginas 2..N em paralelo; o
+    resultado é idêntico ao do caminho serial. Sem rel="last",
+    cai no caminho serial.
     
     Args:
         base_url: URL base (ex: /proposicoes)
@@ -439,6 +1390,8 @@ def safe_get_all_pages(
         max_pages: Número máximo de páginas
         items_per_page: Itens por página
         timeout: Timeout por requisição
+        paralelo: Buscar páginas 2..N em paralelo via rel="last"
+        max_workers: Threads para o modo paralelo
         
     Returns:
         Lista com todos os itens de todas as páginas
@@ -470,15 +1423,23 @@ def safe_get_all_pages(
         if not items:
             break
         
+        # Modo paralelo: páginas 2..N de uma vez a partir do rel="last"
+        if paralelo and page == 0 and _get_link(data, "next"):
+            urls = _page_urls_from_last(_get_link(data, "last") or "", max_pages)
+            if urls:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(urls))
+                ) as ex:
+                    pages = list(ex.map(
+                        lambda u: safe_get(u, session=session, timeout=timeout),
+                        urls
+                    ))
+                return _merge_pages(data, pages)
+        
         all_items.extend(items)
         
         # Verificar se tem próxima página
-        links = data.get("links", [])
-        next_link = None
-        for link in links:
-            if link.get("rel") == "next":
-                next_link = link.get("href")
-                break
+        next_link = _get_link(data, "next")
         
         if not next_link:
             break
@@ -491,6 +1452,355 @@ def safe_get_all_pages(
     return all_items
 
 
+# ============================================================
+# ASYNC (asyncio + pool de threads dedicado)
+# ============================================================
+# As versões async mantêm o mesmo contrato das síncronas (JSON, None
+# em 404, dict {"__error__": ...} após esgotar as tentativas). O I/O
+# continua sendo feito pelo requests, mas cada requisição ocupa uma
+# thread só enquanto está em voo: os backoffs usam asyncio.sleep e o
+# número de requisições simultâneas por host é limitado por semáforo.
+
+ASYNC_MAX_WORKERS = 64
+
+# Requisições simultâneas por host (demais hosts usam o default)
+ASYNC_HOST_LIMITS: Dict[str, int] = {
+    "dadosabertos.camara.leg.br": 40,
+    "legis.senado.leg.br": 10,
+}
+ASYNC_DEFAULT_HOST_LIMIT = 20
+
+_async_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+# Semáforos são presos ao event loop: um dict de hosts por loop
+_host_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_async_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Retorna o pool de threads usado pelo transporte async."""
+    global _async_executor
+    if _async_executor is None:
+        _async_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=ASYNC_MAX_WORKERS,
+            thread_name_prefix="http-async",
+        )
+    return _async_executor
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    """Semáforo do host da URL no event loop corrente."""
+    loop = asyncio.get_running_loop()
+    por_host = _host_semaphores.get(loop)
+    if por_host is None:
+        por_host = {}
+        _host_semaphores[loop] = por_host
+    host = _host_of(url)
+    sem = por_host.get(host)
+    if sem is None:
+        sem = asyncio.Semaphore(ASYNC_HOST_LIMITS.get(host, ASYNC_DEFAULT_HOST_LIMIT))
+        por_host[host] = sem
+    return sem
+
+
+async def _run_blocking(fn, *args, **kwargs):
+    """Executa uma chamada bloqueante no pool do transporte async."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_async_executor(), functools.partial(fn, *args, **kwargs)
+    )
+
+
+@_coalescer_async(_json_flight_async)
+async def safe_get_async(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoffs: Optional[List[float]] = None,
+    session: Optional[requests.Session] = None,
+    verify: bool = True,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    hedge: Optional[bool] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Versão async de safe_get() (mesmo retry/backoff e contrato de erro).
+    
+    Mesmos parâmetros de safe_get(). Se a sessão não for fornecida,
+    usa a sessão da Câmara/Senado conforme o host da URL.
+    
+    Returns:
+        Dict com dados JSON, None se 404 ou dict com "__error__"
+    """
+    params = params or {}
+    backoffs = backoffs or DEFAULT_BACKOFFS
+    if session is None:
+        session = get_session_for(url)
+    
+    cache = get_response_cache() if use_cache else None
+    entry = _cache_lookup(cache, url, params)
+    if entry is not None and not entry.expirada:
+        _metricas.registrar_cache(url, "hit")
+        cached = _entry_json(entry)
+        if cached is not None:
+            return cached
+    request_headers = _headers_condicionais(entry, headers)
+    
+    last_error: Optional[Exception] = None
+    last_status: Optional[int] = None
+    
+    breaker = _breaker_for(url)
+    
+    for attempt in range(max_retries):
+        if attempt > 0:
+            _metricas.registrar_retry(url)
+        if not breaker.permitir():
+            _metricas.registrar_erro(url, ERRO_CIRCUITO)
+            stale = _entry_json(entry)
+            if stale is not None:
+                _metricas.registrar_cache(url, "stale")
+                return stale
+            return _erro_circuito(url)
+        
+        try:
+            await aguardar_rate_limit_async(url)
+            async with _host_semaphore(url):
+                resp = await _run_blocking(
+                    _enviar_get,
+                    session,
+                    url,
+                    hedge=hedge,
+                    params=params,
+                    timeout=timeout,
+                    verify=verify if verify else SSL_VERIFY,
+                    headers=request_headers,
+                )
+            
+            last_status = resp.status_code
+            
+            # 429 / 5xx - retry
+            if resp.status_code == 429 or (500 <= resp.status_code <= 599):
+                delay = _espera_apos_falha(url, resp, backoffs, attempt)
+                if delay is None:
+                    break
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(delay)
+                continue
+            
+            breaker.registrar_sucesso()
+            
+            if resp.status_code == 304 and entry is not None:
+                _metricas.registrar_cache(url, "revalidado")
+                cache.revalidar(entry, url, params, resp, ttl=cache_ttl)
+                return _entry_json(entry)
+            
+            if resp.status_code == 404:
+                return None
+            
+            resp.raise_for_status()
+            data = resp.json()
+            if cache is not None:
+                cache.put(url, params, resp, ttl=cache_ttl)
+            return data
+            
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            last_error = e
+            delay = _espera_apos_falha(url, None, backoffs, attempt)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(delay)
+            
+        except (requests.exceptions.HTTPError, ValueError) as e:
+            last_error = e
+            if isinstance(e, ValueError):
+                _metricas.registrar_erro(url, ERRO_JSON)
+            break
+            
+        except Exception as e:
+            last_error = e
+            break
+    
+    if last_error:
+        error_msg = str(last_error)
+    else:
+        error_msg = f"http_{last_status}" if last_status else "unknown_error"
+    return {"__error__": error_msg, "__url__": url, "__status__": last_status}
+
+
+@_coalescer_async(_raw_flight_async)
+async def safe_get_raw_async(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    verify: bool = True,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    hedge: Optional[bool] = None
+) -> Optional[requests.Response]:
+    """
+    Versão async de safe_get_raw().
+    
+    Returns:
+        Response object ou None em caso de erro
+    """
+    backoffs = DEFAULT_BACKOFFS
+    merged_headers = dict(SENADO_HEADERS)
+    if headers:
+        merged_headers.update(headers)
+    
+    cache = get_response_cache() if use_cache else None
+    entry = _cache_lookup(cache, url, params)
+    if entry is not None and not entry.expirada:
+        _metricas.registrar_cache(url, "hit")
+        return entry.to_response(url)
+    request_headers = _headers_condicionais(entry, merged_headers)
+    
+    breaker = _breaker_for(url)
+    
+    for attempt in range(max_retries):
+        if attempt > 0:
+            _metricas.registrar_retry(url)
+        if not breaker.permitir():
+            _metricas.registrar_erro(url, ERRO_CIRCUITO)
+            if entry is None:
+                return None
+            _metricas.registrar_cache(url, "stale")
+            return entry.to_response(url)
+        
+        try:
+            await aguardar_rate_limit_async(url)
+            async with _host_semaphore(url):
+                resp = await _run_blocking(
+                    _enviar_get,
+                    get_session_for(url),
+                    url,
+                    hedge=hedge,
+                    params=params,
+                    headers=request_headers,
+                    timeout=timeout,
+                    verify=SSL_VERIFY if verify else verify,
+                )
+            
+            if resp.status_code == 429 or (500 <= resp.status_code <= 599):
+                delay = _espera_apos_falha(url, resp, backoffs, attempt)
+                if delay is None:
+                    break
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(delay)
+                continue
+            
+            breaker.registrar_sucesso()
+            
+            if resp.status_code == 304 and entry is not None:
+                _metricas.registrar_cache(url, "revalidado")
+                cache.revalidar(entry, url, params, resp, ttl=cache_ttl)
+                return entry.to_response(url)
+            
+            if resp.status_code == 404:
+                return None
+            
+            if cache is not None:
+                cache.put(url, params, resp, ttl=cache_ttl)
+            return resp
+            
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            delay = _espera_apos_falha(url, None, backoffs, attempt)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(delay)
+            
+        except Exception:
+            break
+    
+    return None
+
+
+async def safe_get_all_pages_async(
+    base_url: str,
+    params: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
+    max_pages: int = 100,
+    items_per_page: int = 100,
+    timeout: int = DEFAULT_TIMEOUT,
+    paralelo: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Versão async de safe_get_all_pages().
+    
+    Com paralelo=True, as páginas 2..N (via rel="last") são buscadas
+    com asyncio.gather, limitadas pelo semáforo do host.
+    
+    Returns:
+        Lista com todos os itens de todas as páginas
+    """
+    if session is None:
+        session = get_camara_session()
+    
+    params = dict(params or {})
+    if "itens" not in params:
+        params["itens"] = items_per_page
+    
+    all_items: List[Dict[str, Any]] = []
+    current_url = base_url
+    current_params: Optional[Dict] = params
+    page = 0
+    
+    while page < max_pages:
+        data = await safe_get_async(
+            current_url,
+            params=current_params,
+            session=session,
+            timeout=timeout
+        )
+        
+        if data is None or "__error__" in data:
+            break
+        
+        items = data.get("dados", [])
+        if not items:
+            break
+        
+        if paralelo and page == 0 and _get_link(data, "next"):
+            urls = _page_urls_from_last(_get_link(data, "last") or "", max_pages)
+            if urls:
+                pages = await asyncio.gather(*(
+                    safe_get_async(u, session=session, timeout=timeout) for u in urls
+                ))
+                return _merge_pages(data, list(pages))
+        
+        all_items.extend(items)
+        
+        next_link = _get_link(data, "next")
+        
+        if not next_link:
+            break
+        
+        current_url = next_link
+        current_params = None
+        page += 1
+    
+    return all_items
+
+
+def run_async(coro):
+    """
+    Executa uma corrotina a partir de código síncrono.
+    
+    Usa asyncio.run() quando não há loop rodando na thread; caso
+    contrário (ex.: notebook), executa em uma thread separada.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
+
+
 # ============================================================
 # VALIDAÇÃO DE RESPOSTA
 # ============================================================
@@ -0,0 +1,320 @@
+"""
+Métricas HTTP por endpoint (requisições, latência, retries, erros,
+bytes e cache).
+
+REGRAS:
+- SEM Streamlit
+- Registrado pelo http_client em toda requisição
+- Lido pelo painel admin do app e despejado em JSON ao fim de cada
+  script de notificação
+- Observadores (ex.: controlador de concorrência) recebem cada
+  requisição/erro fora do lock; seções extras entram no snapshot
+
+Uso:
+    from core.services.http_metrics import get_http_metrics, salvar_metricas_http
+
+    metricas = get_http_metrics()
+    salvar_metricas_http("notificar_tramitacoes")
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable
+from urllib.parse import urlsplit
+
+
+# ============================================================
+# CONFIGURAÇÕES
+# ============================================================
+
+# Limites superiores (ms) dos baldes do histograma de latência
+HISTOGRAMA_LIMITES_MS: List[float] = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Classes de erro registradas
+ERRO_TIMEOUT = "timeout"
+ERRO_CONEXAO = "conexao"
+ERRO_HTTP_429 = "http_429"
+ERRO_HTTP_4XX = "http_4xx"
+ERRO_HTTP_5XX = "http_5xx"
+ERRO_JSON = "json_invalido"
+ERRO_CIRCUITO = "circuito_aberto"
+
+# Pasta do JSON dos notificadores (fora da raiz: o workflow de
+# tramitações faz git add *.json na raiz)
+METRICS_DIR = Path(
+    os.getenv("MONITOR_HTTP_METRICS_DIR")
+    or Path(__file__).resolve().parents[2] / ".cache"
+)
+
+_RE_DATA = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Endpoint da URL com partes variáveis normalizadas.
+
+    Ex: https://dadosabertos.camara.leg.br/api/v2/proposicoes/123/tramitacoes
+        -> dadosabertos.camara.leg.br/api/v2/proposicoes/{id}/tramitacoes
+    """
+    parts = urlsplit(url)
+    segmentos = []
+    for seg in parts.path.rstrip("/").split("/"):
+        if seg.isdigit():
+            seg = "{id}"
+        elif _RE_DATA.match(seg):
+            seg = "{data}"
+        segmentos.append(seg)
+    return f"{(parts.hostname or '').lower()}{'/'.join(segmentos)}"
+
+
+def _rotulo_balde(limite: Optional[float]) -> str:
+    return f"<={int(limite)}ms" if limite is not None else f">{int(HISTOGRAMA_LIMITES_MS[-1])}ms"
+
+
+# ============================================================
+# COLETOR
+# ============================================================
+
+class _EndpointStats:
+    """Contadores de um endpoint."""
+
+    __slots__ = (
+        "requisicoes", "retries", "bytes", "tempo_total",
+        "histograma", "erros", "cache",
+    )
+
+    def __init__(self):
+        self.requisicoes = 0
+        self.retries = 0
+        self.bytes = 0
+        self.tempo_total = 0.0
+        self.histograma = [0] * (len(HISTOGRAMA_LIMITES_MS) + 1)
+        self.erros: Dict[str, int] = {}
+        self.cache: Dict[str, int] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        n = self.requisicoes
+        limites: List[Optional[float]] = list(HISTOGRAMA_LIMITES_MS) + [None]
+        cache_hits = self.cache.get("hit", 0) + self.cache.get("revalidado", 0)
+        consultas = n + self.cache.get("hit", 0)
+        return {
+            "requisicoes": n,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "tempo_total_s": round(self.tempo_total, 3),
+            "latencia_media_ms": round(self.tempo_total / n * 1000, 1) if n else 0.0,
+            "histograma": {
+                _rotulo_balde(lim): qtd for lim, qtd in zip(limites, self.histograma)
+            },
+            "erros": dict(self.erros),
+            "cache": dict(self.cache),
+            "cache_hit_ratio": round(cache_hits / consultas, 3) if consultas else 0.0,
+        }
+
+
+class HttpMetrics:
+    """Coletor thread-safe de métricas HTTP por endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._inicio = time.time()
+        self._observadores: List[Callable[[str, Optional[float], Optional[str]], None]] = []
+        self._secoes: Dict[str, Callable[[], Any]] = {}
+
+    def observar(self, fn: Callable[[str, Optional[float], Optional[str]], None]) -> None:
+        """
+        Registra fn(url, segundos, classe_erro), chamada a cada ida à rede
+        (segundos=None quando não houve resposta) e a cada erro.
+        """
+        with self._lock:
+            if fn not in self._observadores:
+                self._observadores.append(fn)
+
+    def registrar_secao(self, nome: str, fn: Callable[[], Any]) -> None:
+        """Inclui fn() no snapshot sob a chave nome."""
+        with self._lock:
+            self._secoes[nome] = fn
+
+    def _notificar(self, url: str, segundos: Optional[float], classe: Optional[str]) -> None:
+        for fn in self._observadores:
+            try:
+                fn(url, segundos, classe)
+            except Exception:
+                pass
+
+    def _stats(self, url: str) -> _EndpointStats:
+        chave = endpoint_template(url)
+        stats = self._endpoints.get(chave)
+        if stats is None:
+            stats = _EndpointStats()
+            self._endpoints[chave] = stats
+        return stats
+
+    def registrar_requisicao(
+        self,
+        url: str,
+        segundos: float,
+        status: Optional[int] = None,
+        num_bytes: int = 0,
+        erro: Optional[str] = None
+    ) -> None:
+        """
+        Uma ida à rede (com ou sem resposta).
+
+        Args:
+            segundos: Duração da tentativa, inclusive as que falharam
+            status: Status HTTP (None sem resposta)
+            num_bytes: Tamanho do corpo
+            erro: Classe do erro sem resposta (ERRO_TIMEOUT, ERRO_CONEXAO)
+        """
+        ms = segundos * 1000
+        balde = len(HISTOGRAMA_LIMITES_MS)
+        for i, limite in enumerate(HISTOGRAMA_LIMITES_MS):
+            if ms <= limite:
+                balde = i
+                break
+
+        classe = erro
+        if status == 429:
+            classe = ERRO_HTTP_429
+        elif status is not None and 500 <= status <= 599:
+            classe = ERRO_HTTP_5XX
+        elif status is not None and 400 <= status <= 499 and status != 404:
+            classe = ERRO_HTTP_4XX
+
+        with self._lock:
+            stats = self._stats(url)
+            stats.requisicoes += 1
+            stats.tempo_total += segundos
+            stats.histograma[balde] += 1
+            stats.bytes += num_bytes
+            if classe:
+                stats.erros[classe] = stats.erros.get(classe, 0) + 1
+        # Sem resposta não há latência do servidor para os observadores
+        self._notificar(url, None if erro else segundos, classe)
+
+    def registrar_erro(self, url: str, classe: str) -> None:
+        """Erro sem ida à rede medida (JSON inválido, circuito aberto)."""
+        with self._lock:
+            stats = self._stats(url)
+            stats.erros[classe] = stats.erros.get(classe, 0) + 1
+        self._notificar(url, None, classe)
+
+    def registrar_retry(self, url: str) -> None:
+        with self._lock:
+            self._stats(url).retries += 1
+
+    def registrar_cache(self, url: str, tipo: str) -> None:
+        """tipo: "hit" (fresco), "revalidado" (304) ou "stale" (circuito aberto)."""
+        with self._lock:
+            stats = self._stats(url)
+            stats.cache[tipo] = stats.cache.get(tipo, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Métricas atuais, endpoints ordenados pelo tempo total gasto.
+
+        Returns:
+            Dict com "inicio", "duracao_s", "total" e "endpoints"
+        """
+        with self._lock:
+            endpoints = {ep: s.to_dict() for ep, s in self._endpoints.items()}
+            inicio = self._inicio
+            secoes = dict(self._secoes)
+
+        ordenados = dict(sorted(
+            endpoints.items(), key=lambda kv: kv[1]["tempo_total_s"], reverse=True
+        ))
+        total = {
+            "requisicoes": sum(e["requisicoes"] for e in endpoints.values()),
+            "retries": sum(e["retries"] for e in endpoints.values()),
+            "bytes": sum(e["bytes"] for e in endpoints.values()),
+            "tempo_total_s": round(sum(e["tempo_total_s"] for e in endpoints.values()), 3),
+            "erros": sum(sum(e["erros"].values()) for e in endpoints.values()),
+            "cache_hits": sum(e["cache"].get("hit", 0) for e in endpoints.values()),
+        }
+        snap = {
+            "inicio": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(inicio)),
+            "duracao_s": round(time.time() - inicio, 1),
+            "total": total,
+            "endpoints": ordenados,
+        }
+        for nome, fn in secoes.items():
+            try:
+                snap[nome] = fn()
+            except Exception:
+                pass
+        return snap
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._inicio = time.time()
+
+
+# ============================================================
+# API DO MÓDULO
+# ============================================================
+
+_metrics = HttpMetrics()
+
+
+def get_metrics_collector() -> HttpMetrics:
+    """Coletor global (usado pelo http_client)."""
+    return _metrics
+
+
+def get_http_metrics() -> Dict[str, Any]:
+    """Snapshot das métricas HTTP do processo."""
+    return _metrics.snapshot()
+
+
+def reset_http_metrics() -> None:
+    """Zera as métricas HTTP."""
+    _metrics.reset()
+
+
+def resumo_metricas_http(top: int = 10) -> str:
+    """Tabela em texto com os endpoints que mais consumiram tempo."""
+    snap = _metrics.snapshot()
+    total = snap["total"]
+    linhas = [
+        f"📈 HTTP: {total['requisicoes']} req, {total['retries']} retries, "
+        f"{total['erros']} erros, {total['cache_hits']} cache hits, "
+        f"{total['bytes'] / 1024:.0f} KB, {total['tempo_total_s']:.1f}s em rede"
+    ]
+    for ep, e in list(snap["endpoints"].items())[:top]:
+        linhas.append(
+            f"   {e['tempo_total_s']:7.1f}s  {e['requisicoes']:5d} req  "
+            f"{e['latencia_media_ms']:7.0f}ms méd  {ep}"
+        )
+    for nome, c in (snap.get("concorrencia") or {}).items():
+        linhas.append(
+            f"🔀 Concorrência {nome}: {c['limite']} (faixa {c['menor']}-{c['maior']}, "
+            f"{c['aumentos']} aumentos, {c['reducoes']} reduções)"
+        )
+    return "\n".join(linhas)
+
+
+def salvar_metricas_http(nome: str, pasta: Optional[Path] = None) -> Optional[Path]:
+    """
+    Grava o snapshot em <pasta>/metricas_http_<nome>.json.
+
+    Returns:
+        Caminho do arquivo ou None se não foi possível gravar
+    """
+    pasta = Path(pasta) if pasta else METRICS_DIR
+    try:
+        pasta.mkdir(parents=True, exist_ok=True)
+        caminho = pasta / f"metricas_http_{nome}.json"
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(_metrics.snapshot(), f, ensure_ascii=False, indent=2)
+        return caminho
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar métricas HTTP: {e}")
+        return None
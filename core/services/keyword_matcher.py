@@ -0,0 +1,181 @@
+"""
+Busca de palavras-chave em textos de pauta (Aho-Corasick, uma passada).
+
+Antes, pauta_item_palavras_chave montava e rodava um
+re.search(r'\\b' + kw + r'\\b') por palavra-chave por item, e o
+notificador fazia um "kw in texto" por par (palavra, categoria): custo
+proporcional a palavras x itens x tamanho do texto. Aqui as
+palavras-chave viram um autômato só, compilado uma vez, que percorre o
+texto normalizado uma vez e devolve todas as palavras (e categorias)
+encontradas, com qualquer quantidade de palavras.
+
+Uso:
+    from core.services.keyword_matcher import compilar_palavras_chave
+
+    matcher = compilar_palavras_chave({"Armas": ["arma", "porte"], "Saúde": ["vacina"]})
+    matcher.encontrar("Dispõe sobre o porte de arma")   # [("arma", "Armas"), ("porte", "Armas")]
+    matcher.palavras(texto)                              # {"arma", "porte"}
+    matcher.categorias(texto)                            # {"Armas"}
+
+    compilar_palavras_chave(["Vacina", "PIX"])           # lista simples: categoria ""
+
+REGRAS:
+- SEM HTTP, SEM Streamlit, SEM pandas (o notificador também usa)
+- Texto e palavras passam pela mesma normalização de normalize_text
+  (sem acento, minúsculo)
+- Palavra inteira, com a semântica de \\b do re: "arma" não casa com
+  "farmanguinhos" nem com "armas"
+- Resultado na ordem em que as palavras foram declaradas
+"""
+
+import functools
+import unicodedata
+from typing import Dict, Iterable, List, Mapping, Set, Tuple, Union
+
+PalavrasChave = Union[Mapping[str, Iterable[str]], Iterable[str]]
+
+
+def normalizar(texto: str) -> str:
+    """Sem acentos e minúsculo (mesma regra de core.utils.normalize_text)."""
+    if not isinstance(texto, str):
+        return ""
+    nfkd = unicodedata.normalize("NFD", texto)
+    return "".join(c for c in nfkd if not unicodedata.combining(c)).lower().strip()
+
+
+def _eh_palavra(c: str) -> bool:
+    """Caractere de palavra no sentido de \\w do re."""
+    return c.isalnum() or c == "_"
+
+
+# ============================================================
+# AUTÔMATO
+# ============================================================
+
+class MatcherPalavrasChave:
+    """Autômato de Aho-Corasick sobre as palavras-chave normalizadas."""
+
+    def __init__(self, palavras: PalavrasChave):
+        itens = palavras.items() if isinstance(palavras, Mapping) else [("", palavras)]
+
+        # (palavra original, categoria), na ordem declarada, sem repetição
+        self.entradas: List[Tuple[str, str]] = []
+        normalizadas: List[str] = []
+        vistas: Set[Tuple[str, str]] = set()
+        for categoria, lista in itens:
+            for palavra in lista:
+                norm = normalizar(palavra)
+                if norm and (palavra, categoria) not in vistas:
+                    vistas.add((palavra, categoria))
+                    self.entradas.append((palavra, categoria))
+                    normalizadas.append(norm)
+
+        # Trie: _goto[estado][char] -> estado; _saida[estado] -> índices
+        self._goto: List[Dict[str, int]] = [{}]
+        self._saida: List[List[int]] = [[]]
+        self._tamanho: List[int] = []
+        self._borda: List[Tuple[bool, bool]] = []
+        for indice, norm in enumerate(normalizadas):
+            estado = 0
+            for c in norm:
+                proximo = self._goto[estado].get(c)
+                if proximo is None:
+                    proximo = len(self._goto)
+                    self._goto[estado][c] = proximo
+                    self._goto.append({})
+                    self._saida.append([])
+                estado = proximo
+            self._saida[estado].append(indice)
+            self._tamanho.append(len(norm))
+            self._borda.append((_eh_palavra(norm[0]), _eh_palavra(norm[-1])))
+
+        # Links de falha (BFS); saídas herdadas do sufixo mais longo
+        self._falha = [0] * len(self._goto)
+        fila = list(self._goto[0].values())
+        for estado in fila:
+            for c, filho in self._goto[estado].items():
+                fila.append(filho)
+                f = self._falha[estado]
+                while f and c not in self._goto[f]:
+                    f = self._falha[f]
+                destino = self._goto[f].get(c, 0)
+                self._falha[filho] = destino if destino != filho else 0
+                self._saida[filho] = self._saida[filho] + self._saida[self._falha[filho]]
+
+    def __len__(self) -> int:
+        return len(self.entradas)
+
+    # --------------------------------------------------------
+    # Busca
+    # --------------------------------------------------------
+
+    def _indices(self, norm: str) -> Set[int]:
+        """Índices das entradas presentes no texto já normalizado."""
+        achados: Set[int] = set()
+        goto, falha, saida = self._goto, self._falha, self._saida
+        n = len(norm)
+        estado = 0
+        for fim, c in enumerate(norm):
+            while estado and c not in goto[estado]:
+                estado = falha[estado]
+            estado = goto[estado].get(c, 0)
+            if not saida[estado]:
+                continue
+            for indice in saida[estado]:
+                if indice in achados:
+                    continue
+                inicio = fim - self._tamanho[indice] + 1
+                borda_ini, borda_fim = self._borda[indice]
+                antes = inicio > 0 and _eh_palavra(norm[inicio - 1])
+                depois = fim + 1 < n and _eh_palavra(norm[fim + 1])
+                if antes != borda_ini and depois != borda_fim:
+                    achados.add(indice)
+        return achados
+
+    def encontrar(self, texto: str, normalizado: bool = False) -> List[Tuple[str, str]]:
+        """
+        Palavras-chave presentes no texto.
+
+        Args:
+            texto: Texto livre (ementa, título...)
+            normalizado: True se o texto já passou por normalizar()
+
+        Returns:
+            Lista de (palavra original, categoria), na ordem declarada
+        """
+        if not self.entradas or not texto:
+            return []
+        achados = self._indices(texto if normalizado else normalizar(texto))
+        return [self.entradas[i] for i in sorted(achados)]
+
+    def palavras(self, texto: str, normalizado: bool = False) -> Set[str]:
+        """Palavras originais encontradas."""
+        return {p for p, _ in self.encontrar(texto, normalizado)}
+
+    def categorias(self, texto: str, normalizado: bool = False) -> Set[str]:
+        """Categorias com alguma palavra encontrada."""
+        return {c for _, c in self.encontrar(texto, normalizado)}
+
+
+# ============================================================
+# COMPILAÇÃO (com cache)
+# ============================================================
+
+@functools.lru_cache(maxsize=32)
+def _compilar(chave: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> MatcherPalavrasChave:
+    return MatcherPalavrasChave({categoria: lista for categoria, lista in chave})
+
+
+def compilar_palavras_chave(palavras: PalavrasChave) -> MatcherPalavrasChave:
+    """
+    Matcher das palavras-chave, reaproveitado entre chamadas com a mesma
+    lista (as abas varrem a pauta a cada rerun).
+
+    Args:
+        palavras: {categoria: [palavras]} ou lista simples de palavras
+    """
+    if isinstance(palavras, Mapping):
+        chave = tuple((str(c), tuple(lista)) for c, lista in palavras.items())
+    else:
+        chave = (("", tuple(palavras)),)
+    return _compilar(chave)
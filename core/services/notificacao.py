@@ -18,7 +18,8 @@ import datetime
 from typing import Optional
 
 import streamlit as st
-import requests
+
+from core.services.http_client import aguardar_rate_limit, get_session_for
 
 
 # ============================================================
@@ -77,7 +78,7 @@ def cadastrar_email_github(novo_email: str) -> tuple[bool, str]:
         }
 
         # Buscar arquivo atual
-        response = requests.get(api_url, headers=headers, timeout=10)
+        response = get_session_for(api_url).get(api_url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             # Arquivo existe - atualizar
@@ -114,7 +115,7 @@ def cadastrar_email_github(novo_email: str) -> tuple[bool, str]:
         if sha:
             commit_data["sha"] = sha
 
-        response = requests.put(api_url, headers=headers, json=commit_data, timeout=10)
+        response = get_session_for(api_url).put(api_url, headers=headers, json=commit_data, timeout=10)
 
         if response.status_code in [200, 201]:
             return True, f"Email {novo_email} cadastrado com sucesso!"
@@ -144,7 +145,7 @@ def listar_emails_cadastrados() -> list:
             "Accept": "application/vnd.github.v3+json"
         }
 
-        response = requests.get(api_url, headers=headers, timeout=10)
+        response = get_session_for(api_url).get(api_url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -184,7 +185,8 @@ def enviar_telegram(mensagem: str) -> bool:
             "parse_mode": "HTML"
         }
         
-        response = requests.post(url, json=payload, timeout=10)
+        aguardar_rate_limit(url)
+        response = get_session_for(url).post(url, json=payload, timeout=10)
         return response.status_code == 200
     except Exception:
         return False
@@ -404,7 +406,8 @@ def telegram_enviar_mensagem(bot_token: str, chat_id: str, mensagem: str, parse_
             "parse_mode": parse_mode,
             "disable_web_page_preview": True
         }
-        resp = requests.post(url, json=payload, timeout=10)
+        aguardar_rate_limit(url)
+        resp = get_session_for(url).post(url, json=payload, timeout=10)
         data = resp.json()
         
         if data.get("ok"):
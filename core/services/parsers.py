@@ -11,6 +11,7 @@ REGRAS:
 import re
 import json
 import datetime
+import unicodedata
 import xml.etree.ElementTree as ET
 from typing import Optional, Dict, List, Any, Tuple
 
@@ -194,75 +195,31 @@ def get_next_page_url(data: Dict[str, Any]) -> Optional[str]:
 
 
 # ============================================================
-# EXTRAÇÃO DE RELATOR DAS TRAMITAÇÕES
+# NORMALIZAÇÃO E RELATOR
 # ============================================================
+# Relator a partir das tramitações: core/services/relator_extractor.py
 
-# Padrões para extrair relator do texto de tramitação
-RELATOR_PATTERNS = [
-    r'Designad[oa]\s+Relator[a]?,?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
-    r'Relator[a]?:?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
-    r'Parecer\s+(?:do|da)\s+Relator[a]?,?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
-]
+def normalizar_partido(sigla: str) -> str:
+    """
+    Normaliza sigla de partido (mesma regra de core.utils.text_utils.party_norm,
+    que não pode ser importado aqui: core.utils depende de pandas).
+    """
+    s = (sigla or "").strip().upper()
+    if s in {"PC DO B", "PCDOB", "PCD0B"}:
+        return "PCDOB"
+    return s
 
 
-def extrair_relator_de_tramitacoes(
-    tramitacoes: List[Dict[str, Any]],
-    orgao_atual: str = ""
-) -> Dict[str, Any]:
+def normalizar_nome(nome: str) -> str:
     """
-    Extrai informações do relator das tramitações.
-    
-    Args:
-        tramitacoes: Lista de tramitações
-        orgao_atual: Órgão atual para priorizar relator
-        
-    Returns:
-        Dict com nome, partido, uf do relator ou {}
+    Nome sem acentos, minúsculo e com espaços simples (mesma regra de
+    core.utils.text_utils.normalize_text) para comparar nomes de deputados.
     """
-    if not tramitacoes:
-        return {}
-    
-    relator_orgao_atual = None
-    relator_qualquer = None
-    
-    # Ordenar por data (mais recente primeiro)
-    tramitacoes_ordenadas = sorted(
-        tramitacoes,
-        key=lambda x: x.get("dataHora") or x.get("data") or "",
-        reverse=True
-    )
-    
-    for t in tramitacoes_ordenadas:
-        despacho = t.get("despacho") or ""
-        desc = t.get("descricaoTramitacao") or ""
-        orgao_tram = t.get("siglaOrgao") or ""
-        texto = f"{despacho} {desc}"
-        
-        for pattern in RELATOR_PATTERNS:
-            match = re.search(pattern, texto, re.IGNORECASE)
-            if match:
-                nome = match.group(1).strip()
-                partido = match.group(2).strip()
-                uf = match.group(3).strip() if match.lastindex >= 3 and match.group(3) else ""
-                
-                if nome and len(nome) > 3:
-                    candidato = {"nome": nome, "partido": partido, "uf": uf}
-                    
-                    # Priorizar relator do órgão atual
-                    if orgao_tram and orgao_atual and orgao_tram.upper() == orgao_atual.upper():
-                        if not relator_orgao_atual:
-                            relator_orgao_atual = candidato
-                            break
-                    
-                    if not relator_qualquer:
-                        relator_qualquer = candidato
-                    
-                    break
-        
-        if relator_orgao_atual:
-            break
-    
-    return relator_orgao_atual or relator_qualquer or {}
+    if not isinstance(nome, str):
+        return ""
+    nfkd = unicodedata.normalize("NFD", nome)
+    sem_acentos = "".join(c for c in nfkd if not unicodedata.combining(c))
+    return " ".join(sem_acentos.lower().split())
 
 
 def extrair_relator_de_relatores(relatores: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -280,7 +237,7 @@ def extrair_relator_de_relatores(relatores: List[Dict[str, Any]]) -> Dict[str, A
     
     r = relatores[0]
     nome = r.get("nome") or r.get("nomeRelator") or ""
-    partido = r.get("siglaPartido") or r.get("partido") or ""
+    partido = normalizar_partido(r.get("siglaPartido") or r.get("partido") or "")
     uf = r.get("siglaUf") or r.get("uf") or ""
     id_dep = r.get("id") or r.get("idDeputado") or ""
     
@@ -288,7 +245,7 @@ def extrair_relator_de_relatores(relatores: List[Dict[str, Any]]) -> Dict[str, A
     dep = r.get("deputado") or r.get("parlamentar") or {}
     if isinstance(dep, dict):
         nome = nome or dep.get("nome") or dep.get("nomeCivil") or ""
-        partido = partido or dep.get("siglaPartido") or dep.get("partido") or ""
+        partido = partido or normalizar_partido(dep.get("siglaPartido") or dep.get("partido") or "")
         uf = uf or dep.get("siglaUf") or dep.get("uf") or ""
         id_dep = id_dep or dep.get("id") or ""
     
@@ -0,0 +1,226 @@
+"""
+Arquivo permanente de pautas de eventos já realizados.
+
+A pauta de /eventos/{id}/pauta não traz data na URL, então o cache HTTP
+em disco a trata como "pautas" (TTL curto) e cada varredura das Abas
+2/3/4 e do notificador voltava a baixar todas. Mas a pauta de um evento
+de data passada não muda mais: o arquivo guarda a pauta por id de
+evento e, para eventos anteriores a hoje, nunca mais vai à API.
+Eventos de hoje e futuros continuam sendo buscados (e revalidados pelo
+cache HTTP) a cada chamada.
+
+Uso:
+    from core.services.pauta_archive import get_pauta_archive
+
+    itens = get_pauta_archive().get_pauta(ev["id"], ev.get("dataHoraInicio"))
+
+REGRAS:
+- SEM Streamlit e SEM pandas (o notificador também usa)
+- Um arquivo por processo (get_pauta_archive); thread-safe
+- Mesmo arquivo SQLite do cache HTTP (tabela própria); com o cache
+  desligado (MONITOR_HTTP_CACHE=0) o arquivo fica só em memória
+- Só congela resposta 200 vinda da rede, de evento com data anterior a
+  hoje; sem data conhecida, erro ou 404, nada é congelado. A busca de
+  evento passado não usa o cache HTTP: com o circuito aberto ele
+  devolveria a entrada vencida (talvez anterior à reunião) e ela viraria
+  o registro permanente. Nesse caso a entrada vencida é servida, mas
+  não congelada
+- O botão "Atualizar tudo" não apaga o arquivo (como clear_response_cache
+  mantém eventos/pautas de datas passadas); só limpar() apaga
+- Falha no SQLite nunca derruba a busca (vira download)
+"""
+
+import copy
+import datetime
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.config import BASE_URL
+
+from .http_client import get_camara_session, safe_get
+from .response_cache import cache_habilitado, cache_path
+
+
+# ============================================================
+# CONFIGURAÇÃO
+# ============================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pautas_arquivadas (
+    id_evento TEXT PRIMARY KEY,
+    data_evento TEXT NOT NULL,
+    itens TEXT NOT NULL,
+    gravado_em REAL NOT NULL
+)
+"""
+
+
+def _data_passada(data_evento: str) -> bool:
+    """True se a data (YYYY-MM-DD...) for anterior a hoje."""
+    try:
+        data = datetime.date.fromisoformat(str(data_evento or "")[:10])
+    except ValueError:
+        return False
+    return data < datetime.date.today()
+
+
+# ============================================================
+# ARQUIVO
+# ============================================================
+
+class PautaArchive:
+    """Pautas congeladas de eventos passados, por id de evento."""
+
+    def __init__(self, path: Optional[Path] = None, persistente: Optional[bool] = None):
+        self.persistente = cache_habilitado() if persistente is None else persistente
+        self.path = Path(path) if path else cache_path()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._session = get_camara_session()
+        self._memoria: Dict[str, List[Dict[str, Any]]] = {}
+        self._contagem = {"congeladas": 0, "baixadas": 0, "arquivadas": 0}
+
+    # --------------------------------------------------------
+    # SQLite
+    # --------------------------------------------------------
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        if not self.persistente:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._local.conn = conn
+        return conn
+
+    def _ler(self, id_evento: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            itens = self._memoria.get(id_evento)
+        if itens is not None:
+            return itens
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT itens FROM pautas_arquivadas WHERE id_evento = ?", (id_evento,)
+            ).fetchone() if conn else None
+        except (sqlite3.Error, OSError, ValueError):
+            row = None
+        if row is None:
+            return None
+        itens = json.loads(row[0])
+        with self._lock:
+            self._memoria[id_evento] = itens
+        return itens
+
+    def _gravar(self, id_evento: str, data_evento: str, itens: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._memoria[id_evento] = itens
+            self._contagem["arquivadas"] += 1
+        try:
+            conn = self._conn()
+            if conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO pautas_arquivadas VALUES (?, ?, ?, ?)",
+                    (id_evento, data_evento[:10], json.dumps(itens, ensure_ascii=False), time.time()),
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            pass
+
+    # --------------------------------------------------------
+    # Consulta
+    # --------------------------------------------------------
+
+    def get_pauta(self, id_evento: Any, data_evento: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Itens da pauta do evento.
+
+        Args:
+            id_evento: ID do evento
+            data_evento: dataHoraInicio do evento (ou YYYY-MM-DD); decide
+                se a pauta pode ser congelada
+
+        Returns:
+            Lista de itens da pauta ([] em erro ou 404)
+        """
+        eid = str(id_evento or "").strip()
+        if not eid:
+            return []
+        passada = _data_passada(data_evento or "")
+
+        if passada:
+            itens = self._ler(eid)
+            if itens is not None:
+                with self._lock:
+                    self._contagem["congeladas"] += 1
+                return copy.deepcopy(itens)
+
+        url = f"{BASE_URL}/eventos/{eid}/pauta"
+        data = safe_get(url, timeout=30, session=self._session, use_cache=not passada, hedge=True)
+        with self._lock:
+            self._contagem["baixadas"] += 1
+        if passada and isinstance(data, dict) and str(data.get("__error__", "")).startswith("circuit_open"):
+            # Circuito aberto: serve a cópia do cache HTTP, sem congelar
+            data = safe_get(url, timeout=30, session=self._session, hedge=True)
+            if isinstance(data, dict) and "__error__" not in data:
+                return data.get("dados") or []
+        if not isinstance(data, dict) or "__error__" in data:
+            if isinstance(data, dict):
+                print(f"[ERRO] pauta do evento {eid}: {data['__error__']}")
+            return []
+
+        itens = data.get("dados") or []
+        if passada:
+            self._gravar(eid, str(data_evento), itens)
+            return copy.deepcopy(itens)
+        return itens
+
+    # --------------------------------------------------------
+    # Manutenção
+    # --------------------------------------------------------
+
+    def limpar(self, apenas_memoria: bool = False) -> None:
+        """Esquece as pautas congeladas (em disco também, salvo apenas_memoria)."""
+        with self._lock:
+            self._memoria.clear()
+            for k in self._contagem:
+                self._contagem[k] = 0
+        if apenas_memoria:
+            return
+        try:
+            conn = self._conn()
+            if conn:
+                conn.execute("DELETE FROM pautas_arquivadas")
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"em_memoria": len(self._memoria), "persistente": self.persistente, **self._contagem}
+
+
+# ============================================================
+# SINGLETON
+# ============================================================
+
+_arquivo: Optional[PautaArchive] = None
+_arquivo_lock = threading.Lock()
+
+
+def get_pauta_archive() -> PautaArchive:
+    """Arquivo de pautas compartilhado do processo."""
+    global _arquivo
+    if _arquivo is None:
+        with _arquivo_lock:
+            if _arquivo is None:
+                _arquivo = PautaArchive()
+    return _arquivo
@@ -5,11 +5,9 @@ Funções auxiliares extraídas do monólito.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional, Set
-import re
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
 import pandas as pd
-import streamlit as st
-from functools import lru_cache
 
 from core.utils import (
     normalize_text,
@@ -18,7 +16,12 @@ from core.utils import (
     is_comissao_estrategica,
 )
 
-from core.config import BASE_URL
+from core.services.http_client import safe_get as _http_safe_get
+from core.services.proposicao_store import get_proposicao_store
+from core.services.deputados_index import get_deputados_index
+from core.services.concorrencia import get_controlador_concorrencia
+from core.services.pauta_archive import get_pauta_archive
+from core.services.keyword_matcher import MatcherPalavrasChave, compilar_palavras_chave
 
 
 def safe_get(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
@@ -30,42 +33,34 @@ def safe_get(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict
         params: Parâmetros da requisição
         
     Returns:
-        Dados da resposta ou None em caso de erro
+        Dados da resposta, None se 404 ou dict com "__error__"
         
     Nota:
-        - Esta função deve estar em core.utils ou core.services.camara_service
-        - Incluída aqui para referência
+        - Delegada ao http_client (cache, retry, circuit breaker e
+          hedging, já que escanear_eventos dispara centenas destas)
     """
-    import requests
-    try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"[ERRO] safe_get({url}): {e}")
-        return {"__error__": str(e)}
+    data = _http_safe_get(url, params=params, timeout=30, hedge=True)
+    if isinstance(data, dict) and "__error__" in data:
+        print(f"[ERRO] safe_get({url}): {data['__error__']}")
+    return data
 
 
-@st.cache_data(show_spinner=False, ttl=3600)
-def fetch_pauta_evento(event_id: str) -> List[Dict[str, Any]]:
+def fetch_pauta_evento(event_id: str, data_evento: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Busca a pauta de um evento específico da Câmara.
     
     Args:
         event_id: ID do evento
+        data_evento: dataHoraInicio do evento (opcional)
         
     Returns:
         Lista de itens da pauta (cada item é um dict)
         
     Endpoint: GET /api/v2/eventos/{event_id}/pauta
-    Cache: 1 hora
+    Cache: PautaArchive - evento de data passada é congelado e nunca
+    mais buscado; hoje/futuro revalida pelo cache HTTP
     """
-    data = safe_get(f"{BASE_URL}/eventos/{event_id}/pauta")
-    
-    if data is None or "__error__" in data:
-        return []
-    
-    return data.get("dados", [])
+    return get_pauta_archive().get_pauta(event_id, data_evento)
 
 
 def get_proposicao_id_from_item(item: Dict[str, Any]) -> Optional[str]:
@@ -154,12 +149,21 @@ def pauta_item_tem_relatoria_deputada(
         True se a deputada é relatora deste item
         
     Critérios:
-        - Nome deve conter o nome alvo (normalizado)
+        - Se o item traz o id do relator e a deputada está no índice de
+          deputados: compara os ids
+        - Senão, nome deve conter o nome alvo (normalizado)
         - Partido deve bater exatamente (se ambos presentes)
         - UF deve bater exatamente (se ambos presentes)
     """
     relator = item.get("relator") or {}
     
+    # Verificar por id (sem ambiguidade de nome)
+    id_relator = str(relator.get("id") or "") or extract_id_from_uri(relator.get("uri") or "")
+    if id_relator:
+        id_alvo = get_deputados_index().buscar_id(alvo_nome, alvo_partido, alvo_uf)
+        if id_alvo:
+            return str(id_relator) == id_alvo
+    
     nome = relator.get("nome") or ""
     partido = relator.get("siglaPartido") or ""
     uf = relator.get("siglaUf") or ""
@@ -183,7 +187,7 @@ def pauta_item_tem_relatoria_deputada(
 
 def pauta_item_palavras_chave(
     item: Dict[str, Any],
-    palavras_chave_normalizadas: List[tuple],
+    matcher: MatcherPalavrasChave,
     id_prop: Optional[str] = None
 ) -> Set[str]:
     """
@@ -191,7 +195,7 @@ def pauta_item_palavras_chave(
     
     Args:
         item: Item da pauta
-        palavras_chave_normalizadas: Lista de tuplas (palavra_normalizada, palavra_original)
+        matcher: Palavras-chave compiladas (compilar_palavras_chave)
         id_prop: ID da proposição (opcional) para buscar ementa completa
         
     Returns:
@@ -200,6 +204,9 @@ def pauta_item_palavras_chave(
     IMPORTANTE: Busca por PALAVRA INTEIRA para evitar falsos positivos
     (ex: "arma" não deve casar com "Farmanguinhos")
     """
+    if not len(matcher):
+        return set()
+    
     textos = []
     
     # Buscar nos campos do item da pauta
@@ -228,25 +235,10 @@ def pauta_item_palavras_chave(
         if info_prop and info_prop.get("ementa"):
             textos.append(info_prop["ementa"])
     
-    # Normalizar texto combinado
-    texto_norm = normalize_text(" ".join(textos))
-    encontradas = set()
-    
-    # Buscar cada palavra-chave usando regex para palavra inteira
-    for kw_norm, kw_original in palavras_chave_normalizadas:
-        if not kw_norm:
-            continue
-        
-        # Usar regex com word boundary para buscar palavra inteira
-        # Isso evita que "arma" case com "farmanguinhos"
-        pattern = r'\b' + re.escape(kw_norm) + r'\b'
-        if re.search(pattern, texto_norm):
-            encontradas.add(kw_original)
-    
-    return encontradas
+    # Uma passada pelo texto combinado (palavra inteira, como \b do re)
+    return matcher.palavras(" ".join(textos))
 
 
-@lru_cache(maxsize=4096)
 def fetch_proposicao_info_cached(id_proposicao: str) -> Dict[str, Any]:
     """
     Busca informações básicas de uma proposição pelo ID.
@@ -264,28 +256,33 @@ def fetch_proposicao_info_cached(id_proposicao: str) -> Dict[str, Any]:
             
     Em caso de erro, retorna dict com valores vazios.
     
-    Cache: LRU cache de 4096 itens
+    Cache: ProposicaoStore (identificação não muda; busca uma vez por processo)
     """
-    data = safe_get(f"{BASE_URL}/proposicoes/{id_proposicao}")
-    
-    if data is None or "__error__" in data:
-        return {
-            "id": str(id_proposicao),
-            "sigla": "",
-            "numero": "",
-            "ano": "",
-            "ementa": ""
-        }
-    
-    dados = data.get("dados", {})
-    
-    return {
-        "id": str(dados.get("id") or id_proposicao),
-        "sigla": (dados.get("siglaTipo") or "").strip(),
-        "numero": str(dados.get("numero") or "").strip(),
-        "ano": str(dados.get("ano") or "").strip(),
-        "ementa": (dados.get("ementa") or "").strip(),
-    }
+    return get_proposicao_store().get_info(id_proposicao)
+
+
+# Colunas de VarreduraPautas.ocorrencias (uma linha por evento x órgão x item)
+COLUNAS_OCORRENCIAS = [
+    "id_evento", "data", "orgao_sigla", "orgao_nome", "id_proposicao",
+    "materia", "palavras", "ementa", "link", "relator",
+]
+
+
+@dataclass
+class VarreduraPautas:
+    """
+    Resultado de escanear_eventos.
+    
+    eventos: uma linha por evento x órgão com as marcações (Abas 2/3/4)
+    ocorrencias: uma linha por item da pauta com palavra-chave, em
+        colunas tipadas (palavras é lista) - Aba 3 e PDF leem direto,
+        sem remontar texto
+    """
+    eventos: pd.DataFrame
+    ocorrencias: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.eventos)
 
 
 def escanear_eventos(
@@ -296,7 +293,7 @@ def escanear_eventos(
     comissoes_estrategicas: List[str],
     palavras_chave: Optional[List[str]] = None,
     ids_autoria_deputada: Optional[Set[str]] = None,
-) -> pd.DataFrame:
+) -> VarreduraPautas:
     """
     Escaneia eventos da Câmara buscando autoria, relatoria e/ou palavras-chave.
     
@@ -310,15 +307,26 @@ def escanear_eventos(
         ids_autoria_deputada: Set de IDs de proposições de autoria (opcional)
         
     Returns:
-        DataFrame com eventos filtrados contendo autoria, relatoria ou palavras-chave
+        VarreduraPautas: eventos filtrados contendo autoria, relatoria ou
+        palavras-chave, e as ocorrências de palavras-chave por item
+        
+    Busca em duas fases antes de casar (mesmo resultado da busca serial):
+        1. Pautas de todos os eventos, em paralelo
+        2. Identificação de cada proposição distinta das pautas, em paralelo
+           (o casamento de palavras-chave consulta a ementa de todo item
+           com id; depois da fase 2 isso sai do ProposicaoStore)
+        Paralelismo limitado pelo controlador de concorrência compartilhado.
         
-    Colunas do DataFrame:
+    Colunas de eventos:
         - data, hora, orgao_id, orgao_sigla, orgao_nome
         - id_evento, tipo_evento, descricao_evento
         - tem_relatoria_deputada, proposicoes_relatoria, ids_proposicoes_relatoria
         - tem_autoria_deputada, proposicoes_autoria, ids_proposicoes_autoria
-        - tem_palavras_chave, palavras_chave_encontradas, proposicoes_palavras_chave
+        - tem_palavras_chave, palavras_chave_encontradas
         - comissao_estrategica
+        
+    Colunas de ocorrencias: ver COLUNAS_OCORRENCIAS (data em YYYY-MM-DD,
+    relator "Nome (PART-UF)" ou "Sem relator designado")
     """
     if ids_autoria_deputada is None:
         ids_autoria_deputada = set()
@@ -326,10 +334,32 @@ def escanear_eventos(
     if palavras_chave is None:
         palavras_chave = []
     
-    # Normalizar palavras-chave
-    palavras_chave_norm = [(normalize_text(p), p) for p in palavras_chave if p.strip()]
+    # Compilar palavras-chave (autômato reaproveitado entre varreduras)
+    matcher = compilar_palavras_chave([p for p in palavras_chave if p.strip()])
     
     registros = []
+    ocorrencias: List[Tuple] = []
+    controlador = get_controlador_concorrencia()
+    
+    # Fase 1: pautas de todos os eventos (passados saem do PautaArchive)
+    datas_eventos = {
+        str(ev.get("id") or ev.get("codEvento")): ev.get("dataHoraInicio") or ""
+        for ev in eventos
+        if (ev.get("id") or ev.get("codEvento")) is not None
+    }
+    ids_eventos = list(datas_eventos)
+    pautas = dict(zip(ids_eventos, controlador.mapear(
+        lambda eid: fetch_pauta_evento(eid, datas_eventos[eid]), ids_eventos
+    )))
+    
+    # Fase 2: proposições distintas de todas as pautas
+    ids_proposicoes = list(dict.fromkeys(
+        id_prop
+        for pauta in pautas.values()
+        for id_prop in map(get_proposicao_id_from_item, pauta)
+        if id_prop
+    ))
+    controlador.mapear(fetch_proposicao_info_cached, ids_proposicoes)
     
     for ev in eventos:
         event_id = ev.get("id") or ev.get("codEvento")
@@ -349,8 +379,8 @@ def escanear_eventos(
         if not orgaos:
             orgaos = [{"sigla": "", "nome": "", "id": None}]
         
-        # Buscar pauta do evento
-        pauta = fetch_pauta_evento(str(event_id))
+        # Pauta do evento (fase 1)
+        pauta = pautas.get(str(event_id), [])
         
         # Sets para acumular proposições
         proposicoes_relatoria = set()
@@ -358,7 +388,7 @@ def escanear_eventos(
         ids_proposicoes_autoria = set()
         ids_proposicoes_relatoria = set()
         palavras_evento = set()
-        proposicoes_palavras_chave = set()
+        ocorrencias_evento: Set[Tuple] = set()
         
         # Processar cada item da pauta
         for item in pauta:
@@ -366,7 +396,7 @@ def escanear_eventos(
             id_prop = get_proposicao_id_from_item(item)
             
             # Verificar palavras-chave
-            kws_item = pauta_item_palavras_chave(item, palavras_chave_norm, id_prop)
+            kws_item = pauta_item_palavras_chave(item, matcher, id_prop)
             has_keywords = bool(kws_item)
             
             # Verificar relatoria
@@ -436,20 +466,27 @@ def escanear_eventos(
                     else ""
                 )
                 
-                # Armazenar com formato detalhado incluindo comissão e data
-                # formato: matéria|||palavras|||ementa|||link|||relator|||comissao|||nome_comissao|||data
+                # Uma ocorrência por órgão do evento (ordem de COLUNAS_OCORRENCIAS)
                 for org in orgaos:
-                    sigla_org_temp = org.get("siglaOrgao") or org.get("sigla") or ""
-                    nome_org_temp = org.get("nomeOrgao") or org.get("nome") or ""
-                    proposicoes_palavras_chave.add(
-                        f"{identificacao}|||{', '.join(kws_item)}|||{ementa_prop}|||"
-                        f"{link_tram}|||{relator_str}|||{sigla_org_temp}|||{nome_org_temp}|||{data_str}"
-                    )
+                    ocorrencias_evento.add((
+                        str(event_id),
+                        data_str,
+                        org.get("siglaOrgao") or org.get("sigla") or "",
+                        org.get("nomeOrgao") or org.get("nome") or "",
+                        str(id_prop or ""),
+                        identificacao,
+                        tuple(sorted(kws_item)),
+                        ementa_prop,
+                        link_tram,
+                        relator_str,
+                    ))
         
         # Se não achou nenhuma proposição relevante, pular evento
         if not (proposicoes_relatoria or proposicoes_autoria or palavras_evento):
             continue
         
+        ocorrencias.extend(sorted(ocorrencias_evento))
+        
         # Criar registro para cada órgão do evento
         for org in orgaos:
             sigla_org = org.get("siglaOrgao") or org.get("sigla") or ""
@@ -473,18 +510,23 @@ def escanear_eventos(
                 "ids_proposicoes_autoria": ";".join(sorted(ids_proposicoes_autoria)),
                 "tem_palavras_chave": bool(palavras_evento),
                 "palavras_chave_encontradas": "; ".join(sorted(palavras_evento)),
-                "proposicoes_palavras_chave": "; ".join(sorted(proposicoes_palavras_chave)),
                 "comissao_estrategica": is_comissao_estrategica(
                     sigla_org, 
                     comissoes_estrategicas
                 ),
             })
     
-    # Criar DataFrame
+    # Criar DataFrames
     df = pd.DataFrame(registros)
+    df_ocorrencias = pd.DataFrame(ocorrencias, columns=COLUNAS_OCORRENCIAS)
+    df_ocorrencias["palavras"] = df_ocorrencias["palavras"].map(list)
     
     # Ordenar
     if not df.empty:
         df = df.sort_values(["data", "hora", "orgao_sigla", "id_evento"])
+    if not df_ocorrencias.empty:
+        df_ocorrencias = df_ocorrencias.sort_values(
+            ["data", "orgao_sigla", "materia"], kind="stable"
+        ).reset_index(drop=True)
     
-    return df
+    return VarreduraPautas(eventos=df, ocorrencias=df_ocorrencias)
@@ -17,7 +17,6 @@ Funcionalidades:
 from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
-from functools import lru_cache
 import re
 import time
 import datetime
@@ -28,16 +27,19 @@ import requests
 import pandas as pd
 
 from core.utils.formatters import format_sigla_num_ano
-from core.utils.text_utils import canonical_situacao, party_norm
+from core.utils.text_utils import canonical_situacao
 from core.utils.links import extract_id_from_uri
 from core.utils.date_utils import parse_prazo_resposta_ric
+from core.config import BASE_URL
 from core.services.apensados import PROPOSICOES_FALTANTES_API
+from core.services.http_client import aguardar_rate_limit, get_camara_session
+from core.services.proposicao_store import get_proposicao_store
+from core.services.concorrencia import get_controlador_concorrencia
 
 
 # ============================================================
 # CONFIGURAÇÃO
 # ============================================================
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
 HEADERS = {"User-Agent": "MonitorZanatta/22.0 (gabinete-julia-zanatta)"}
 
 try:
@@ -46,8 +48,8 @@ try:
 except ImportError:
     _REQUESTS_VERIFY = True
 
-_SESSION = requests.Session()
-_SESSION.headers.update(HEADERS)
+# Sessão compartilhada da Câmara (pool de conexões do http_client)
+_SESSION = get_camara_session()
 
 
 # ============================================================
@@ -93,6 +95,7 @@ def _request_json(url: str, params=None, timeout=30, max_retries=3):
 
     for attempt in range(max_retries):
         try:
+            aguardar_rate_limit(url)
             resp = _SESSION.get(url, params=params, timeout=timeout)
             if resp.status_code == 404:
                 return None
@@ -122,14 +125,10 @@ def safe_get(url, params=None):
 # ============================================================
 # FUNÇÃO CENTRAL - BUSCA TUDO DE UMA VEZ
 # ============================================================
-
-@st.cache_data(show_spinner=False, ttl=1800)
-
-
-# ============================================================
-# APENSAÇÕES / TRAMITAÇÃO EM CONJUNTO — utilitários
-# ============================================================
-
+# Dados, tramitações e relator vêm do ProposicaoStore (core/services/
+# proposicao_store.py), compartilhado com CamaraService, DataProvider,
+# PDFs e notificadores. Sem st.cache_data aqui: o store já controla o
+# frescor de cada faceta.
 
 def fetch_proposicao_completa(id_proposicao: str) -> dict:
     """
@@ -139,175 +138,16 @@ def fetch_proposicao_completa(id_proposicao: str) -> dict:
     if not pid:
         return {}
     
-    resultado = {
-        "id": pid,
-        "sigla": "",
-        "numero": "",
-        "ano": "",
-        "ementa": "",
-        "urlInteiroTeor": "",
-        "status_dataHora": "",
-        "status_siglaOrgao": "",
-        "status_descricaoTramitacao": "",
-        "status_descricaoSituacao": "",
-        "status_despacho": "",
-        "tramitacoes": [],
-        "relator": {},
-    }
-    
-    # 1. DADOS BÁSICOS + STATUS
-    try:
-        data = safe_get(f"{BASE_URL}/proposicoes/{pid}")
-        if data and isinstance(data, dict) and data.get("dados"):
-            d = data.get("dados", {}) or {}
-            resultado.update({
-                "sigla": (d.get("siglaTipo") or "").strip(),
-                "numero": str(d.get("numero") or "").strip(),
-                "ano": str(d.get("ano") or "").strip(),
-                "ementa": (d.get("ementa") or "").strip(),
-                "urlInteiroTeor": d.get("urlInteiroTeor") or "",
-            })
-            
-            status = d.get("statusProposicao", {}) or {}
-            resultado.update({
-                "status_dataHora": status.get("dataHora") or "",
-                "status_siglaOrgao": status.get("siglaOrgao") or "",
-                "status_descricaoTramitacao": status.get("descricaoTramitacao") or "",
-                "status_descricaoSituacao": canonical_situacao(status.get("descricaoSituacao") or ""),
-                "status_despacho": status.get("despacho") or "",
-            })
-    except Exception:
-        pass
-    
-    # 2. TRAMITAÇÕES
-    try:
-        tramitacoes = []
-        tram_data = safe_get(f"{BASE_URL}/proposicoes/{pid}/tramitacoes")
-        
-        if tram_data and isinstance(tram_data, dict) and tram_data.get("dados"):
-            tramitacoes = tram_data.get("dados", [])
-        
-        if not tramitacoes:
-            pagina = 1
-            while pagina <= 10:
-                params = {"itens": 100, "ordem": "DESC", "ordenarPor": "dataHora", "pagina": pagina}
-                tram_data = safe_get(f"{BASE_URL}/proposicoes/{pid}/tramitacoes", params=params)
-                
-                if not tram_data or "__error__" in tram_data:
-                    break
-                
-                dados = tram_data.get("dados", [])
-                if not dados:
-                    break
-                
-                tramitacoes.extend(dados)
-                
-                has_next = any(link.get("rel") == "next" for link in tram_data.get("links", []))
-                if not has_next:
-                    break
-                
-                pagina += 1
-        
-        resultado["tramitacoes"] = tramitacoes
-        
-    except Exception:
-        pass
-    
-    # 3. EXTRAI RELATOR DAS TRAMITAÇÕES
-    try:
-        relator_info = {}
-        patterns = [
-            r'Designad[oa]\s+Relator[a]?,?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
-            r'Relator[a]?:?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
-            r'Parecer\s+(?:do|da)\s+Relator[a]?,?\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)',
-        ]
-        
-        orgao_atual = resultado.get("status_siglaOrgao", "")
-        relator_orgao_atual = None
-        relator_qualquer = None
-        
-        tramitacoes_ordenadas = sorted(
-            resultado["tramitacoes"],
-            key=lambda x: x.get("dataHora") or x.get("data") or "",
-            reverse=True
-        )
-        
-        for t in tramitacoes_ordenadas:
-            despacho = t.get("despacho") or ""
-            desc = t.get("descricaoTramitacao") or ""
-            orgao_tram = t.get("siglaOrgao") or ""
-            texto = f"{despacho} {desc}"
-            
-            for pattern in patterns:
-                match = re.search(pattern, texto, re.IGNORECASE)
-                if match:
-                    nome = match.group(1).strip()
-                    partido = party_norm(match.group(2).strip())
-                    uf = match.group(3).strip() if match.lastindex >= 3 and match.group(3) else ""
-                    
-                    if nome and len(nome) > 3:
-                        candidato = {"nome": nome, "partido": partido, "uf": uf}
-                        
-                        if orgao_tram and orgao_atual and orgao_tram.upper() == orgao_atual.upper():
-                            if not relator_orgao_atual:
-                                relator_orgao_atual = candidato
-                                break
-                        
-                        if not relator_qualquer:
-                            relator_qualquer = candidato
-                        
-                        break
-            
-            if relator_orgao_atual:
-                break
-        
-        relator_info = relator_orgao_atual or relator_qualquer
-        
-        if not relator_info:
-            rel_data = safe_get(f"{BASE_URL}/proposicoes/{pid}/relatores")
-            if isinstance(rel_data, dict) and rel_data.get("dados"):
-                candidatos = rel_data.get("dados", [])
-                if candidatos:
-                    r = candidatos[0]
-                    nome = r.get("nome") or r.get("nomeRelator") or ""
-                    partido = party_norm(r.get("siglaPartido") or r.get("partido") or "")
-                    uf = r.get("siglaUf") or r.get("uf") or ""
-                    id_dep = r.get("id") or r.get("idDeputado") or ""
-                    
-                    dep = r.get("deputado") or r.get("parlamentar") or {}
-                    if isinstance(dep, dict):
-                        nome = nome or dep.get("nome") or dep.get("nomeCivil") or ""
-                        partido = partido or party_norm(dep.get("siglaPartido") or dep.get("partido") or "")
-                        uf = uf or dep.get("siglaUf") or dep.get("uf") or ""
-                        id_dep = id_dep or dep.get("id") or ""
-                    
-                    if nome:
-                        relator_info = {"nome": nome, "partido": partido, "uf": uf, "id_deputado": str(id_dep)}
-        
-        if relator_info and not relator_info.get("id_deputado"):
-            nome_relator = relator_info.get("nome", "")
-            if nome_relator:
-                dep_data = safe_get(f"{BASE_URL}/deputados", params={"nome": nome_relator, "itens": 5})
-                if isinstance(dep_data, dict) and dep_data.get("dados"):
-                    deps = dep_data.get("dados", [])
-                    if deps:
-                        relator_info["id_deputado"] = str(deps[0].get("id", ""))
-        
-        resultado["relator"] = relator_info
-        
-    except Exception:
-        pass
-    
+    resultado = get_proposicao_store().get_proposicao_completa(pid)
+    resultado["status_descricaoSituacao"] = canonical_situacao(resultado.get("status_descricaoSituacao") or "")
     return resultado
 
 
 
-@st.cache_data(show_spinner=False, ttl=1800)
 def get_tramitacoes_ultimas10(id_prop):
     """Retorna as 10 últimas tramitações."""
     try:
-        dados_completos = fetch_proposicao_completa(id_prop)
-        tramitacoes = dados_completos.get("tramitacoes", [])
+        tramitacoes = get_proposicao_store().get_tramitacoes(id_prop) or []
         
         if not tramitacoes:
             return pd.DataFrame()
@@ -351,32 +191,17 @@ def get_tramitacoes_ultimas10(id_prop):
 
 
 
-@st.cache_data(show_spinner=False, ttl=1800)
 def fetch_relator_atual(id_proposicao: str) -> dict:
     """Retorna relator usando a função centralizada."""
     try:
-        dados_completos = fetch_proposicao_completa(id_proposicao)
-        relator = dados_completos.get("relator", {})
-        return relator
+        return get_proposicao_store().get_relator(id_proposicao)
     except Exception:
         return {}
 
 
 
-@lru_cache(maxsize=4096)
 def fetch_proposicao_info(id_proposicao):
-    data = safe_get(f"{BASE_URL}/proposicoes/{id_proposicao}")
-    if data is None or "__error__" in data:
-        return {"id": str(id_proposicao), "sigla": "", "numero": "", "ano": "", "ementa": ""}
-
-    d = data.get("dados", {}) or {}
-    return {
-        "id": str(d.get("id") or id_proposicao),
-        "sigla": (d.get("siglaTipo") or "").strip(),
-        "numero": str(d.get("numero") or "").strip(),
-        "ano": str(d.get("ano") or "").strip(),
-        "ementa": (d.get("ementa") or "").strip(),
-    }
+    return get_proposicao_store().get_info(id_proposicao)
 
 
 
@@ -463,7 +288,8 @@ def buscar_proposicao_direta(sigla_tipo: str, numero: str, ano: str) -> Optional
     }
     
     try:
-        resp = requests.get(url, params=params, timeout=15)
+        aguardar_rate_limit(url)
+        resp = _SESSION.get(url, params=params, timeout=15)
         if resp.status_code != 200:
             return None
         
@@ -676,10 +502,8 @@ def build_status_map(ids: list[str]) -> dict:
         
         return pid, resultado
 
-    max_workers = 10 if len(ids) >= 40 else 6
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-        for pid, payload in ex.map(_one, ids):
-            out[str(pid)] = payload
+    for pid, payload in get_controlador_concorrencia().mapear(_one, ids):
+        out[str(pid)] = payload
 
     return out
 
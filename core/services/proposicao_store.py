@@ -0,0 +1,626 @@
+"""
+Store de proposições: fonte única de "tudo sobre uma proposição".
+
+Antes havia três buscas completas independentes
+(proposicao.fetch_proposicao_completa, CamaraService.get_proposicao_completa
+e os wrappers do DataProvider), cada uma com seu cache e TTL (1800 s vs
+900 s). A mesma proposição era buscada e parseada até três vezes por
+sessão. Agora todas leem daqui.
+
+Facetas, cada uma com frescor próprio:
+    dados        /proposicoes/{id} (cabeçalho + statusProposicao)
+    tramitacoes  /proposicoes/{id}/tramitacoes
+                 (sincronização incremental a partir da marca d'água)
+    relator      extraído das tramitações, com /relatores como fallback e o
+                 id pelo índice de deputados (derivado: vence quando
+                 dados/tramitações mudam)
+    autores      /proposicoes/{id}/autores
+
+Uso:
+    from core.services.proposicao_store import get_proposicao_store
+
+    store = get_proposicao_store()
+    dados = store.get_proposicao_completa("2347150")
+    trams = store.get_tramitacoes("2347150")
+
+REGRAS:
+- SEM Streamlit e SEM pandas (os notificadores também usam)
+- Um store por processo (get_proposicao_store); thread-safe
+- Buscas simultâneas da mesma faceta/proposição são coalescidas
+- Falha de rede não apaga o que já existe: devolve o dado anterior
+- Devolve cópias rasas; não altere os dicts de tramitação
+- Tramitações são só-acréscimo: com histórico em memória, a atualização
+  pede apenas o que veio depois da marca d'água (dataHora/sequencia da
+  mais recente) e mescla
+- Status primeiro: tramitações e relator vencidos são revalidados pelo
+  cabeçalho. Se statusProposicao (dataHora/sequencia) não mudou desde a
+  busca deles, só renova o instante, sem ir a /tramitacoes, /relatores
+  e /deputados
+"""
+
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.config import BASE_URL
+
+from .concorrencia import em_tarefa_mapeada
+from .deputados_index import get_deputados_index
+from .http_client import get_camara_session, safe_get
+from .parsers import (
+    extrair_relator_de_relatores,
+    parse_proposicao_dados,
+    parse_relatores,
+    has_next_page,
+)
+from .relator_extractor import extrair_relator
+from .single_flight import SingleFlight
+
+
+# ============================================================
+# CONFIGURAÇÃO
+# ============================================================
+
+# Frescor máximo de cada faceta (segundos)
+TTL_FACETAS: Dict[str, float] = {
+    "dados": 900,
+    "tramitacoes": 900,
+    "relator": 1800,
+    "autores": 86400,   # coautoria praticamente não muda
+}
+
+# Facetas derivadas: ficam velhas quando qualquer base é atualizada depois delas
+DEPENDENCIAS: Dict[str, Tuple[str, ...]] = {
+    "relator": ("dados", "tramitacoes"),
+}
+
+# Facetas que mudam só quando o status muda (toda tramitação nova atualiza
+# statusProposicao): revalidadas pelo cabeçalho antes de buscar de novo
+VALIDADAS_PELO_STATUS: Tuple[str, ...] = ("tramitacoes", "relator")
+
+TRAMITACOES_MAX_PAGINAS = 10
+
+# Idade máxima do cabeçalho usado para revalidar uma faceta vencida: com
+# o cabeçalho do cache (até o TTL de "dados"), tramitações e relator
+# poderiam ficar até 2x TTL sem conferência
+REVALIDACAO_MAX_IDADE_S = 60.0
+
+# Threads para buscar tramitações junto do cabeçalho (painel de detalhes)
+FACETAS_MAX_WORKERS = 4
+
+
+def _erro(data: Any) -> bool:
+    return isinstance(data, dict) and "__error__" in data
+
+
+def _chave_tramitacao(t: Dict[str, Any]) -> Tuple[str, int]:
+    """(dataHora, sequencia): identifica e ordena as tramitações."""
+    try:
+        seq = int(t.get("sequencia") or 0)
+    except (TypeError, ValueError):
+        seq = 0
+    return (str(t.get("dataHora") or ""), seq)
+
+
+def _carimbo_status(dados: Optional[Dict[str, Any]]) -> Optional[Tuple[str, str]]:
+    """(dataHora, sequencia) do statusProposicao; None se não houver."""
+    status = (dados or {}).get("statusProposicao") or {}
+    if not status.get("dataHora"):
+        return None
+    return (str(status["dataHora"]), str(status.get("sequencia") or ""))
+
+
+_executor_facetas: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_vagas_facetas = threading.BoundedSemaphore(FACETAS_MAX_WORKERS)
+
+
+def _get_executor_facetas() -> concurrent.futures.ThreadPoolExecutor:
+    """Pool compartilhado da busca paralela de facetas."""
+    global _executor_facetas
+    if _executor_facetas is None:
+        with _executor_lock:
+            if _executor_facetas is None:
+                _executor_facetas = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=FACETAS_MAX_WORKERS,
+                    thread_name_prefix="proposicao-facetas",
+                )
+    return _executor_facetas
+
+
+def _submeter_faceta(fn: Callable[[str], Any], pid: str) -> Optional[concurrent.futures.Future]:
+    """
+    fn(pid) no pool de facetas, ou None se o pool estiver cheio: aí quem
+    chamou busca na própria thread (nunca espera numa fila, o que seria
+    mais lento que a busca sequencial).
+    """
+    if not _vagas_facetas.acquire(blocking=False):
+        return None
+    try:
+        fut = _get_executor_facetas().submit(fn, pid)
+    except RuntimeError:
+        _vagas_facetas.release()
+        return None
+    fut.add_done_callback(lambda _f: _vagas_facetas.release())
+    return fut
+
+
+# ============================================================
+# STORE
+# ============================================================
+
+class ProposicaoStore:
+    """
+    Entidades de proposição em memória, indexadas por id.
+
+    Cada faceta guarda (valor, instante da busca). Uma faceta é servida
+    do store enquanto tiver idade menor que o TTL (ou max_idade) e não
+    for mais antiga que as facetas de que depende.
+    """
+
+    def __init__(self, ttl: Optional[Dict[str, float]] = None):
+        self.ttl = dict(TTL_FACETAS, **(ttl or {}))
+        self._lock = threading.Lock()
+        self._entidades: Dict[str, Dict[str, Tuple[Any, float]]] = {}
+        # Marca d'água das tramitações: (dataHora, sequencia) da mais recente
+        self._marcas: Dict[str, Tuple[str, int]] = {}
+        # Carimbo do status vigente quando cada faceta validada foi buscada
+        self._carimbos: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._flight = SingleFlight()
+        self._session = get_camara_session()
+        self._contagem: Dict[str, Dict[str, int]] = {
+            f: {"hits": 0, "revalidadas": 0, "buscas": 0, "falhas": 0} for f in TTL_FACETAS
+        }
+        self._sync = {"completas": 0, "incrementais": 0}
+
+    # --------------------------------------------------------
+    # Núcleo
+    # --------------------------------------------------------
+
+    def _registro(self, pid: str, faceta: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            return self._entidades.get(pid, {}).get(faceta)
+
+    def _fresco(self, pid: str, faceta: str, registro: Tuple[Any, float], max_idade: Optional[float]) -> bool:
+        _, instante = registro
+        limite = self.ttl[faceta] if max_idade is None else max_idade
+        if time.monotonic() - instante >= limite:
+            return False
+        for base in DEPENDENCIAS.get(faceta, ()):
+            reg_base = self._registro(pid, base)
+            if reg_base and reg_base[1] > instante:
+                return False
+        return True
+
+    def _em_dia(self, pid: str, faceta: str) -> bool:
+        """Faceta guardada e dentro do TTL (sem contar hit)."""
+        registro = self._registro(pid, faceta)
+        return bool(registro) and self._fresco(pid, faceta, registro, None)
+
+    def _gravar(self, pid: str, faceta: str, valor: Any) -> None:
+        with self._lock:
+            self._entidades.setdefault(pid, {})[faceta] = (valor, time.monotonic())
+
+    def _atualizar(self, pid: str, faceta: str, buscar: Callable[[str], Any]) -> Any:
+        with self._lock:
+            self._contagem[faceta]["buscas"] += 1
+        # Carimbo ANTES da busca: se o status mudar no meio, a próxima
+        # revalidação vê a diferença e busca de novo (nunca o contrário)
+        carimbo = None
+        if faceta in VALIDADAS_PELO_STATUS:
+            reg_dados = self._registro(pid, "dados")
+            carimbo = _carimbo_status(reg_dados[0]) if reg_dados else None
+        valor = buscar(pid)
+        if valor is None:
+            with self._lock:
+                self._contagem[faceta]["falhas"] += 1
+            return None
+        self._gravar(pid, faceta, valor)
+        if faceta in VALIDADAS_PELO_STATUS:
+            with self._lock:
+                if carimbo:
+                    self._carimbos.setdefault(pid, {})[faceta] = carimbo
+                else:
+                    self._carimbos.get(pid, {}).pop(faceta, None)
+        return valor
+
+    def _revalidar(self, pid: str, faceta: str, registro: Tuple[Any, float]) -> bool:
+        """
+        Renova uma faceta vencida se o status da proposição não mudou.
+
+        Custa no máximo o GET do cabeçalho (que o mapa de status busca de
+        qualquer jeito); o cabeçalho conferido tem no máximo
+        REVALIDACAO_MAX_IDADE_S.
+        """
+        with self._lock:
+            carimbo = self._carimbos.get(pid, {}).get(faceta)
+        if carimbo is None:
+            return False
+        if _carimbo_status(self.get_dados(pid, max_idade=REVALIDACAO_MAX_IDADE_S)) != carimbo:
+            return False
+        self._gravar(pid, faceta, registro[0])
+        with self._lock:
+            self._contagem[faceta]["revalidadas"] += 1
+        return True
+
+    def _carimbar_tramitacoes(self, pid: str, dados: Optional[Dict[str, Any]]) -> None:
+        """
+        Carimbo das tramitações buscadas junto do cabeçalho (sem carimbo:
+        o cabeçalho ainda não existia quando a busca começou).
+
+        Só carimba se a tramitação mais recente for a do statusProposicao:
+        aí as duas respostas descrevem o mesmo estado, mesmo tendo vindo
+        em paralelo.
+        """
+        carimbo = _carimbo_status(dados)
+        if carimbo is None:
+            return
+        with self._lock:
+            if "tramitacoes" in self._carimbos.get(pid, {}):
+                return
+            marca = self._marcas.get(pid)
+            if marca and (marca[0], str(marca[1])) == carimbo:
+                self._carimbos.setdefault(pid, {})["tramitacoes"] = carimbo
+
+    def _obter(
+        self,
+        pid: Any,
+        faceta: str,
+        buscar: Callable[[str], Any],
+        max_idade: Optional[float] = None
+    ) -> Any:
+        """
+        Valor da faceta: do store se fresco, senão buscado (uma vez só
+        entre threads). Em falha, devolve o valor antigo, se houver.
+        """
+        pid = str(pid or "").strip()
+        if not pid:
+            return None
+
+        registro = self._registro(pid, faceta)
+        if registro and self._fresco(pid, faceta, registro, max_idade):
+            with self._lock:
+                self._contagem[faceta]["hits"] += 1
+            return registro[0]
+
+        if registro and max_idade is None and faceta in VALIDADAS_PELO_STATUS:
+            if self._revalidar(pid, faceta, registro):
+                return registro[0]
+
+        valor = self._flight.do((faceta, pid), self._atualizar, pid, faceta, buscar)
+        if valor is None and registro:
+            return registro[0]
+        return valor
+
+    # --------------------------------------------------------
+    # Buscas (uma por faceta; None = falha, não grava)
+    # --------------------------------------------------------
+
+    def _buscar_dados(self, pid: str) -> Optional[Dict[str, Any]]:
+        data = safe_get(f"{BASE_URL}/proposicoes/{pid}", session=self._session, hedge=True)
+        if _erro(data):
+            return None
+        return (data or {}).get("dados") or {}
+
+    def _buscar_tramitacoes(self, pid: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            marca = self._marcas.get(pid)
+        registro = self._registro(pid, "tramitacoes")
+        if marca and registro:
+            tramitacoes = self._sincronizar_tramitacoes(pid, registro[0], marca)
+        else:
+            tramitacoes = self._baixar_tramitacoes(pid)
+        if tramitacoes is None:
+            return None
+
+        tramitacoes = sorted(tramitacoes, key=_chave_tramitacao)
+        with self._lock:
+            if tramitacoes:
+                self._marcas[pid] = _chave_tramitacao(tramitacoes[-1])
+            else:
+                self._marcas.pop(pid, None)
+        return tramitacoes
+
+    def _sincronizar_tramitacoes(
+        self,
+        pid: str,
+        conhecidas: List[Dict[str, Any]],
+        marca: Tuple[str, int]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Busca só as tramitações novas e mescla com as conhecidas.
+
+        Pede do dia da marca em diante, mais recentes primeiro, e para de
+        paginar na primeira tramitação já conhecida. A API real devolve o
+        histórico inteiro sem paginar; nesse caso o filtro dataInicio já
+        reduz a resposta a uma página pequena.
+        """
+        url = f"{BASE_URL}/proposicoes/{pid}/tramitacoes"
+        chaves = {_chave_tramitacao(t) for t in conhecidas}
+        novas: List[Dict[str, Any]] = []
+
+        for pagina in range(1, TRAMITACOES_MAX_PAGINAS + 1):
+            params = {
+                "dataInicio": marca[0][:10],
+                "ordem": "DESC",
+                "ordenarPor": "dataHora",
+                "itens": 100,
+                "pagina": pagina,
+            }
+            data = safe_get(url, params=params, session=self._session, hedge=True)
+            if data is None:
+                break
+            if _erro(data):
+                return None
+            dados = data.get("dados") or []
+            achou_conhecida = False
+            for t in dados:
+                chave = _chave_tramitacao(t)
+                if chave in chaves or chave <= marca:
+                    achou_conhecida = True
+                    continue
+                chaves.add(chave)
+                novas.append(t)
+            if not dados or achou_conhecida or not has_next_page(data):
+                break
+        else:
+            # Nenhuma tramitação conhecida em todas as páginas: ressincroniza
+            return self._baixar_tramitacoes(pid)
+
+        with self._lock:
+            self._sync["incrementais"] += 1
+        return list(conhecidas) + novas
+
+    def _baixar_tramitacoes(self, pid: str) -> Optional[List[Dict[str, Any]]]:
+        """Histórico completo (primeira busca ou ressincronização)."""
+        with self._lock:
+            self._sync["completas"] += 1
+        url = f"{BASE_URL}/proposicoes/{pid}/tramitacoes"
+        data = safe_get(url, session=self._session, hedge=True)
+        if _erro(data):
+            return None
+        tramitacoes = (data or {}).get("dados") or []
+        if tramitacoes:
+            return tramitacoes
+
+        # Sem resultado na chamada simples: tenta paginado
+        for pagina in range(1, TRAMITACOES_MAX_PAGINAS + 1):
+            params = {"itens": 100, "ordem": "DESC", "ordenarPor": "dataHora", "pagina": pagina}
+            data = safe_get(url, params=params, session=self._session)
+            if not data or _erro(data):
+                break
+            dados = data.get("dados") or []
+            if not dados:
+                break
+            tramitacoes.extend(dados)
+            if not has_next_page(data):
+                break
+        return tramitacoes
+
+    def _buscar_relator(self, pid: str) -> Optional[Dict[str, Any]]:
+        dados = self.get_dados(pid) or {}
+        orgao_atual = (dados.get("statusProposicao") or {}).get("siglaOrgao") or ""
+        tramitacoes = self.get_tramitacoes(pid) or []
+
+        relator = extrair_relator(tramitacoes, orgao_atual)
+        if not relator:
+            data = safe_get(f"{BASE_URL}/proposicoes/{pid}/relatores", session=self._session, hedge=True)
+            if _erro(data):
+                return None
+            relator = extrair_relator_de_relatores(parse_relatores(data))
+
+        if relator and not relator.get("id_deputado"):
+            id_deputado = get_deputados_index().resolver_id(
+                relator["nome"], relator.get("partido", ""), relator.get("uf", "")
+            )
+            if id_deputado:
+                relator["id_deputado"] = id_deputado
+        return relator or {}
+
+    def _buscar_autores(self, pid: str) -> Optional[List[Dict[str, Any]]]:
+        data = safe_get(f"{BASE_URL}/proposicoes/{pid}/autores", session=self._session, hedge=True)
+        if _erro(data):
+            return None
+        return (data or {}).get("dados") or []
+
+    # --------------------------------------------------------
+    # Facetas
+    # --------------------------------------------------------
+
+    def get_dados(self, id_proposicao: Any, max_idade: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        "dados" da API /proposicoes/{id} (inclui statusProposicao).
+
+        Returns:
+            Dict (vazio se a proposição não existe) ou None se a API falhou
+            e não há cópia anterior
+        """
+        valor = self._obter(id_proposicao, "dados", self._buscar_dados, max_idade)
+        return dict(valor) if valor is not None else None
+
+    def get_info(self, id_proposicao: Any) -> Dict[str, str]:
+        """
+        Identificação da proposição (id, sigla, numero, ano, ementa).
+
+        Esses campos não mudam: qualquer cópia dos dados serve, então só
+        vai à API na primeira vez.
+        """
+        pid = str(id_proposicao or "").strip()
+        d = self.get_dados(pid, max_idade=float("inf")) or {}
+        return {
+            "id": str(d.get("id") or pid),
+            "sigla": (d.get("siglaTipo") or "").strip(),
+            "numero": str(d.get("numero") or "").strip(),
+            "ano": str(d.get("ano") or "").strip(),
+            "ementa": (d.get("ementa") or "").strip(),
+        }
+
+    def get_tramitacoes(self, id_proposicao: Any, max_idade: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Histórico de tramitações em ordem cronológica (dataHora, sequencia).
+
+        Returns:
+            Lista ou None se a API falhou e não há cópia anterior
+        """
+        valor = self._obter(id_proposicao, "tramitacoes", self._buscar_tramitacoes, max_idade)
+        return list(valor) if valor is not None else None
+
+    def get_relator(self, id_proposicao: Any) -> Dict[str, Any]:
+        """Relator atual: {nome, partido, uf, id_deputado} ou {}."""
+        valor = self._obter(id_proposicao, "relator", self._buscar_relator)
+        return dict(valor) if valor else {}
+
+    def get_autores(self, id_proposicao: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Autores na ordem de assinatura da API.
+
+        Returns:
+            Lista ou None se a API falhou e não há cópia anterior
+        """
+        valor = self._obter(id_proposicao, "autores", self._buscar_autores)
+        return list(valor) if valor is not None else None
+
+    # --------------------------------------------------------
+    # Visão agregada (formato legado)
+    # --------------------------------------------------------
+
+    def get_proposicao_completa(self, id_proposicao: Any, paralelo: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Dados + status + tramitações + relator, no formato que as abas,
+        os PDFs e o mapa de status já usam.
+
+        A situação vem como a API devolve; canonical_situacao fica com
+        quem exibe (core.utils depende de pandas).
+
+        Args:
+            id_proposicao: ID da proposição
+            paralelo: Buscar cabeçalho e tramitações ao mesmo tempo (None =
+                sim, salvo dentro de tarefa do controlador AIMD; fan-outs
+                que já limitam a concorrência passam False)
+        """
+        pid = str(id_proposicao or "").strip()
+        if not pid:
+            return {}
+
+        resultado = {
+            "id": pid,
+            "sigla": "",
+            "numero": "",
+            "ano": "",
+            "ementa": "",
+            "urlInteiroTeor": "",
+            "status_dataHora": "",
+            "status_siglaOrgao": "",
+            "status_descricaoTramitacao": "",
+            "status_descricaoSituacao": "",
+            "status_despacho": "",
+            "tramitacoes": [],
+            "relator": {},
+        }
+
+        # Cabeçalho e tramitações são independentes: em paralelo, o painel
+        # de detalhes espera a mais lenta e não a soma. O relator vem
+        # depois porque depende dos dois (e a revalidação pelo status
+        # reaproveita o mesmo GET do cabeçalho via single-flight).
+        # Dentro de um mapa de status (tarefa do controlador AIMD) fica
+        # sequencial: o paralelismo ali já é o limite do controlador. Com
+        # o pool de facetas cheio também (sem fila atrás de outras sessões)
+        if paralelo is None:
+            paralelo = not em_tarefa_mapeada()
+        fut_tramitacoes = None
+        if paralelo and not self._em_dia(pid, "tramitacoes"):
+            fut_tramitacoes = _submeter_faceta(self.get_tramitacoes, pid)
+        dados = self.get_dados(pid)
+        if fut_tramitacoes is not None:
+            tramitacoes = fut_tramitacoes.result()
+            self._carimbar_tramitacoes(pid, dados)
+        else:
+            tramitacoes = self.get_tramitacoes(pid)
+
+        if dados:
+            parsed = parse_proposicao_dados({"dados": dados})
+            parsed["id"] = parsed.get("id") or pid
+            resultado.update(parsed)
+        resultado["tramitacoes"] = tramitacoes or []
+        resultado["relator"] = self.get_relator(pid)
+        return resultado
+
+    # --------------------------------------------------------
+    # Manutenção
+    # --------------------------------------------------------
+
+    def invalidar(self, id_proposicao: Any = None, facetas: Optional[List[str]] = None) -> None:
+        """Descarta facetas de uma proposição (ou de todas, sem id)."""
+        with self._lock:
+            if id_proposicao is None:
+                pids = list(self._entidades)
+            else:
+                pids = [str(id_proposicao).strip()]
+            for pid in pids:
+                ent = self._entidades.get(pid)
+                if ent is None:
+                    continue
+                for faceta in (facetas or list(ent)):
+                    ent.pop(faceta, None)
+                if "tramitacoes" not in ent:
+                    self._marcas.pop(pid, None)
+                carimbos = self._carimbos.get(pid, {})
+                for faceta in list(carimbos):
+                    if faceta not in ent:
+                        carimbos.pop(faceta)
+                if not ent:
+                    self._entidades.pop(pid, None)
+
+    def limpar(self) -> None:
+        """Esvazia o store (botão "Atualizar tudo", benchmarks)."""
+        with self._lock:
+            self._entidades.clear()
+            self._marcas.clear()
+            self._carimbos.clear()
+            for c in self._contagem.values():
+                c.update(hits=0, revalidadas=0, buscas=0, falhas=0)
+            self._sync.update(completas=0, incrementais=0)
+
+    def frescor(self, id_proposicao: Any) -> Dict[str, float]:
+        """Idade (segundos) de cada faceta guardada da proposição."""
+        agora = time.monotonic()
+        with self._lock:
+            ent = dict(self._entidades.get(str(id_proposicao).strip(), {}))
+        return {f: round(agora - inst, 1) for f, (_, inst) in ent.items()}
+
+    def completa_em_cache(self, id_proposicao: Any) -> bool:
+        """True se get_proposicao_completa sai sem ir à rede."""
+        pid = str(id_proposicao or "").strip()
+        return bool(pid) and all(self._em_dia(pid, f) for f in ("dados", "tramitacoes", "relator"))
+
+    def marca_tramitacoes(self, id_proposicao: Any) -> Optional[Tuple[str, int]]:
+        """(dataHora, sequencia) da tramitação mais recente conhecida."""
+        with self._lock:
+            return self._marcas.get(str(id_proposicao).strip())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "proposicoes": len(self._entidades),
+                "facetas": {f: dict(c) for f, c in self._contagem.items()},
+                "tramitacoes_sync": dict(self._sync),
+            }
+
+
+# ============================================================
+# SINGLETON
+# ============================================================
+
+_store: Optional[ProposicaoStore] = None
+_store_lock = threading.Lock()
+
+
+def get_proposicao_store() -> ProposicaoStore:
+    """Store compartilhado do processo."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ProposicaoStore()
+    return _store
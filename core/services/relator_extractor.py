@@ -0,0 +1,140 @@
+"""
+Extração de relator das tramitações (regex compilada, uma passada).
+
+Antes, cada tramitação passava por três re.search com padrões em
+string (recompilados via cache do módulo re a cada chamada) e havia
+uma cópia quase igual da rotina em proposicao.py. Agora os três padrões
+são compilados uma vez, só rodam em textos que citam "relator", e há
+uma passada pelas tramitações (mais recentes primeiro) que devolve ao
+mesmo tempo o relator do órgão atual e o relator mais recente de
+qualquer órgão.
+
+Uso:
+    from core.services.relator_extractor import extrair_relatores
+
+    r = extrair_relatores(tramitacoes, orgao_atual="CCJC")
+    r["orgao_atual"]    # {nome, partido, uf} ou {}
+    r["mais_recente"]   # {nome, partido, uf} ou {}
+
+    extrair_relatores_em_lote({"123": (trams_123, "CCJC"), ...})
+
+REGRAS:
+- Função pura: SEM HTTP, SEM Streamlit, SEM pandas
+- Mesmo resultado dos três padrões antigos (ver benchmarks/relator.py)
+"""
+
+import re
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .parsers import normalizar_partido
+
+
+# ============================================================
+# PADRÃO
+# ============================================================
+
+# Os três padrões antigos, na ordem de prioridade antiga (não dá para
+# uni-los numa alternância: ela devolveria a menção mais à esquerda, e o
+# texto pode citar mais de um relator):
+#   "Designado(a) Relator(a), Dep. X (PART-UF)"
+#   "Relator(a): Dep. X (PART-UF)"
+#   "Parecer do(a) Relator(a), Dep. X (PART-UF)"
+_SUFIXO = r'\s*Dep\.\s*([^(]+?)\s*\(([A-ZÀ-Ú][A-Za-zÀ-úà-ù]+)(?:-([A-Z]{2}))?\)'
+RELATOR_PATTERNS = tuple(
+    re.compile(prefixo + _SUFIXO, re.IGNORECASE)
+    for prefixo in (
+        r'Designad[oa]\s+Relator[a]?,?',
+        r'Relator[a]?:?',
+        r'Parecer\s+(?:do|da)\s+Relator[a]?,?',
+    )
+)
+
+# Filtro barato antes da regex: a maioria das tramitações nem cita relator
+_GATILHO = "relator"
+
+
+def _chave_data(t: Dict[str, Any]) -> str:
+    return t.get("dataHora") or t.get("data") or ""
+
+
+def relator_do_texto(texto: str) -> Optional[Dict[str, str]]:
+    """
+    Relator citado no texto de uma tramitação, ou None.
+
+    Primeiro padrão que casar com nome de mais de 3 caracteres, na ordem
+    de RELATOR_PATTERNS (nome curto demais passa para o padrão seguinte).
+    """
+    if not texto or _GATILHO not in texto.lower():
+        return None
+    for padrao in RELATOR_PATTERNS:
+        match = padrao.search(texto)
+        if not match:
+            continue
+        nome = match.group(1).strip()
+        if len(nome) <= 3:
+            continue
+        return {
+            "nome": nome,
+            "partido": normalizar_partido(match.group(2)),
+            "uf": (match.group(3) or "").strip(),
+        }
+    return None
+
+
+# ============================================================
+# EXTRAÇÃO
+# ============================================================
+
+def extrair_relatores(
+    tramitacoes: List[Dict[str, Any]],
+    orgao_atual: str = ""
+) -> Dict[str, Dict[str, str]]:
+    """
+    Percorre as tramitações da mais recente para a mais antiga, uma vez.
+
+    Args:
+        tramitacoes: Lista de tramitações (qualquer ordem)
+        orgao_atual: Sigla do órgão atual (statusProposicao.siglaOrgao)
+
+    Returns:
+        {"orgao_atual": {...} ou {}, "mais_recente": {...} ou {}}
+    """
+    resultado: Dict[str, Dict[str, str]] = {"orgao_atual": {}, "mais_recente": {}}
+    if not tramitacoes:
+        return resultado
+
+    orgao = (orgao_atual or "").upper()
+    for t in sorted(tramitacoes, key=_chave_data, reverse=True):
+        candidato = relator_do_texto(f"{t.get('despacho') or ''} {t.get('descricaoTramitacao') or ''}")
+        if not candidato:
+            continue
+        if not resultado["mais_recente"]:
+            resultado["mais_recente"] = candidato
+        if orgao and (t.get("siglaOrgao") or "").upper() == orgao:
+            resultado["orgao_atual"] = dict(candidato)
+            break
+    return resultado
+
+
+def extrair_relator(tramitacoes: List[Dict[str, Any]], orgao_atual: str = "") -> Dict[str, str]:
+    """Relator do órgão atual; sem ele, o mais recente de qualquer órgão."""
+    r = extrair_relatores(tramitacoes, orgao_atual)
+    return r["orgao_atual"] or r["mais_recente"]
+
+
+def extrair_relatores_em_lote(
+    por_proposicao: Mapping[str, Tuple[List[Dict[str, Any]], str]]
+) -> Dict[str, Dict[str, str]]:
+    """
+    Relator de várias proposições de uma vez.
+
+    Args:
+        por_proposicao: {id: (tramitacoes, orgao_atual)}
+
+    Returns:
+        {id: relator} no critério de extrair_relator ({} se não achou)
+    """
+    return {
+        str(pid): extrair_relator(tramitacoes, orgao_atual)
+        for pid, (tramitacoes, orgao_atual) in por_proposicao.items()
+    }
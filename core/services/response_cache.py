@@ -0,0 +1,534 @@
+"""
+Cache persistente (SQLite) de respostas HTTP da Câmara e do Senado.
+
+REGRAS:
+- SEM Streamlit
+- Compartilhado entre o app e os scripts de notificação (mesmo arquivo)
+- Chave = URL normalizada + params (ordem dos params não importa)
+- TTL por classe de endpoint (ver CACHE_TTLS / classificar_endpoint)
+- Falha no cache nunca derruba a requisição (vira miss)
+- Entradas expiradas são revalidadas com GET condicional
+  (ETag / Last-Modified); sem validadores, compara hash do corpo
+
+Configuração por ambiente:
+    MONITOR_HTTP_CACHE=0            desliga o cache
+    MONITOR_HTTP_CACHE_PATH=...     caminho do arquivo SQLite
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import datetime
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Optional, Dict, Any, Tuple
+
+import requests
+
+from core.config import SENADO_BASE_URL
+
+
+# ============================================================
+# CONFIGURAÇÃO
+# ============================================================
+
+# TTL em segundos por classe de endpoint.
+# None = nunca expira; 0 = não guarda.
+CACHE_TTLS: Dict[str, Optional[int]] = {
+    "eventos_passados": None,   # eventos de datas passadas não mudam
+    "pautas_passadas": None,    # idem pautas
+    "eventos": 900,
+    "pautas": 900,
+    "autoria": 3600,
+    "busca": 3600,
+    "proposicoes": 900,
+    "deputados": 86400,
+    "senado": 21600,
+    "outros": 0,
+}
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / ".cache" / "http_cache.sqlite3"
+
+_RE_PAUTA_DATA = re.compile(r"/pautas/orgaos/[^/]+/datas/(\d{4}-\d{2}-\d{2})")
+_RE_PROPOSICAO = re.compile(r"/proposicoes/\d+(/[a-z]+)?$")
+
+
+def cache_habilitado() -> bool:
+    """True se o cache em disco estiver ligado (MONITOR_HTTP_CACHE != 0)."""
+    return os.getenv("MONITOR_HTTP_CACHE", "1").strip().lower() not in ("0", "false", "no")
+
+
+def cache_path() -> Path:
+    """Caminho do arquivo SQLite do cache."""
+    return Path(os.getenv("MONITOR_HTTP_CACHE_PATH") or DEFAULT_CACHE_PATH)
+
+
+# ============================================================
+# NORMALIZAÇÃO E CLASSIFICAÇÃO
+# ============================================================
+
+def normalizar_chave(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Monta a chave do cache: URL normalizada com query ordenada.
+
+    Params passados à parte sobrescrevem os que já estão na URL. Chaves
+    repetidas (?siglaTipo=PL&siglaTipo=PEC) são mantidas todas.
+    """
+    parts = urlsplit(url)
+    pares = parse_qsl(parts.query, keep_blank_values=True)
+    extras = [(str(k), v) for k, v in (params or {}).items() if v is not None]
+    if extras:
+        sobrescritas = {k for k, _ in extras}
+        pares = [(k, v) for k, v in pares if k not in sobrescritas]
+        for k, v in extras:
+            valores = v if isinstance(v, (list, tuple)) else [v]
+            pares.extend((k, str(x)) for x in valores)
+
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        path,
+        urlencode(sorted(pares)),
+        "",
+    ))
+
+
+def _data_passada(data_str: str) -> bool:
+    """True se a data (YYYY-MM-DD) for anterior a hoje."""
+    try:
+        data = datetime.date.fromisoformat(str(data_str)[:10])
+    except ValueError:
+        return False
+    return data < datetime.date.today()
+
+
+def classificar_endpoint(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Optional[int]]:
+    """
+    Classifica a URL em uma classe de endpoint e retorna (classe, ttl).
+
+    Returns:
+        (classe, ttl) - ttl None = permanente, 0 = não guardar
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    path = parts.path.rstrip("/")
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update({str(k): str(v) for k, v in (params or {}).items() if v is not None})
+
+    if host.endswith("senado.leg.br") or url.startswith(SENADO_BASE_URL):
+        classe = "senado"
+    elif path.endswith("/eventos"):
+        # Sem dataFim a consulta é aberta (inclui hoje e o futuro)
+        fim = query.get("dataFim") or ""
+        classe = "eventos_passados" if fim and _data_passada(fim) else "eventos"
+    elif path.endswith("/pauta"):
+        classe = "pautas"
+    elif _RE_PAUTA_DATA.search(path):
+        data = _RE_PAUTA_DATA.search(path).group(1)
+        classe = "pautas_passadas" if _data_passada(data) else "pautas"
+    elif path.endswith("/proposicoes"):
+        classe = "autoria" if query.get("idDeputadoAutor") else "busca"
+    elif _RE_PROPOSICAO.search(path):
+        classe = "proposicoes"
+    elif "/deputados" in path:
+        classe = "deputados"
+    else:
+        classe = "outros"
+
+    return classe, CACHE_TTLS.get(classe, 0)
+
+
+# ============================================================
+# CACHE
+# ============================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS respostas (
+    chave TEXT PRIMARY KEY,
+    classe TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    content_type TEXT,
+    encoding TEXT,
+    corpo BLOB NOT NULL,
+    gravado_em REAL NOT NULL,
+    expira_em REAL,
+    etag TEXT,
+    last_modified TEXT,
+    corpo_hash TEXT
+)
+"""
+
+# Colunas acrescentadas depois da primeira versão (migração simples)
+_COLUNAS_VALIDADORES = ("etag", "last_modified", "corpo_hash")
+
+_COLUNAS = (
+    "chave, classe, status, content_type, encoding, corpo, gravado_em, expira_em, "
+    "etag, last_modified, corpo_hash"
+)
+
+
+def _hash_corpo(corpo: bytes) -> str:
+    """Hash do corpo, usado quando o servidor não manda validadores."""
+    return hashlib.sha1(corpo or b"").hexdigest()
+
+
+class CacheEntry:
+    """Resposta guardada no cache."""
+
+    __slots__ = (
+        "chave", "classe", "status", "content_type", "encoding", "corpo",
+        "gravado_em", "expira_em", "etag", "last_modified", "corpo_hash",
+    )
+
+    def __init__(
+        self, chave, classe, status, content_type, encoding, corpo,
+        gravado_em, expira_em, etag=None, last_modified=None, corpo_hash=None
+    ):
+        self.chave = chave
+        self.classe = classe
+        self.status = status
+        self.content_type = content_type or ""
+        self.encoding = encoding
+        self.corpo = bytes(corpo)
+        self.gravado_em = gravado_em
+        self.expira_em = expira_em
+        self.etag = etag or ""
+        self.last_modified = last_modified or ""
+        self.corpo_hash = corpo_hash or ""
+
+    @property
+    def expirada(self) -> bool:
+        return self.expira_em is not None and self.expira_em <= time.time()
+
+    def headers_condicionais(self) -> Dict[str, str]:
+        """Headers If-None-Match / If-Modified-Since para revalidar."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def json(self) -> Any:
+        return json.loads(self.corpo.decode(self.encoding or "utf-8"))
+
+    def to_response(self, url: str) -> requests.Response:
+        """Reconstrói um requests.Response (para safe_get_raw)."""
+        resp = requests.Response()
+        resp.status_code = self.status
+        resp._content = self.corpo
+        resp.encoding = self.encoding
+        resp.url = url
+        if self.content_type:
+            resp.headers["Content-Type"] = self.content_type
+        resp.headers["X-Monitor-Cache"] = "HIT"
+        return resp
+
+
+def _calcular_expiracao(ttl: Optional[float], agora: float) -> Optional[float]:
+    return None if ttl is None or ttl == float("inf") else agora + ttl
+
+
+class ResponseCache:
+    """
+    Cache SQLite de respostas HTTP com TTL por classe de endpoint.
+
+    Uma conexão por thread (sqlite3 não compartilha conexões entre
+    threads); o modo WAL permite leitores e um escritor simultâneos,
+    inclusive entre processos.
+
+    Entradas expiradas não são apagadas na leitura: seus validadores
+    (ETag / Last-Modified) são usados para um GET condicional, e um
+    304 apenas renova a validade (ver revalidar()).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else cache_path()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # ---------------- conexão ----------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            existentes = {row[1] for row in conn.execute("PRAGMA table_info(respostas)")}
+            for coluna in _COLUNAS_VALIDADORES:
+                if coluna not in existentes:
+                    conn.execute(f"ALTER TABLE respostas ADD COLUMN {coluna} TEXT")
+            conn.commit()
+            self._local.conn = conn
+        return conn
+
+    # ---------------- estatísticas ----------------
+
+    def _conta(self, classe: str, campo: str) -> None:
+        with self._lock:
+            por_classe = self._stats.setdefault(
+                classe, {"hits": 0, "misses": 0, "stores": 0, "revalidated": 0, "unchanged": 0}
+            )
+            por_classe[campo] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Estatísticas de hit/miss do processo atual.
+
+        revalidated = 304 recebidos; unchanged = corpo baixado de novo,
+        mas idêntico ao guardado (hash).
+
+        Returns:
+            Dict com hits, misses, stores, revalidated, unchanged,
+            hit_rate e por_classe
+        """
+        with self._lock:
+            por_classe = {k: dict(v) for k, v in self._stats.items()}
+        totais = {
+            campo: sum(v[campo] for v in por_classe.values())
+            for campo in ("hits", "misses", "stores", "revalidated", "unchanged")
+        }
+        total = totais["hits"] + totais["misses"]
+        return {
+            **totais,
+            "hit_rate": round(totais["hits"] / total, 3) if total else 0.0,
+            "por_classe": por_classe,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    # ---------------- leitura / escrita ----------------
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
+        """
+        Busca a entrada no cache, mesmo expirada.
+
+        Conta hit se estiver válida e miss caso contrário; o chamador
+        decide se usa direto ou revalida (entry.expirada).
+
+        Returns:
+            CacheEntry ou None (sem entrada ou endpoint não cacheável)
+        """
+        classe, ttl = classificar_endpoint(url, params)
+        if ttl == 0:
+            return None
+
+        chave = normalizar_chave(url, params)
+        try:
+            row = self._conn().execute(
+                f"SELECT {_COLUNAS} FROM respostas WHERE chave = ?",
+                (chave,),
+            ).fetchone()
+        except (sqlite3.Error, OSError):
+            row = None
+
+        entry = CacheEntry(*row) if row else None
+        self._conta(classe, "misses" if entry is None or entry.expirada else "hits")
+        return entry
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
+        """
+        Busca resposta válida (não expirada) no cache.
+
+        Returns:
+            CacheEntry ou None (miss, expirada ou endpoint não cacheável)
+        """
+        entry = self.lookup(url, params)
+        if entry is None or entry.expirada:
+            return None
+        return entry
+
+    def revalidar(
+        self,
+        entry: CacheEntry,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        resp: Optional[requests.Response] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        """
+        Renova a validade de uma entrada após um 304 Not Modified.
+
+        Args:
+            entry: Entrada expirada que foi revalidada
+            url: URL requisitada
+            params: Query parameters
+            resp: Response 304 (pode trazer validadores novos)
+            ttl: Sobrescreve o TTL da classe
+        """
+        classe, ttl_classe = classificar_endpoint(url, params)
+        ttl = ttl_classe if ttl is None else ttl
+        agora = time.time()
+        headers = resp.headers if resp is not None else {}
+        try:
+            conn = self._conn()
+            conn.execute(
+                "UPDATE respostas SET gravado_em = ?, expira_em = ?, etag = ?, last_modified = ? "
+                "WHERE chave = ?",
+                (
+                    agora,
+                    _calcular_expiracao(ttl, agora),
+                    headers.get("ETag") or entry.etag,
+                    headers.get("Last-Modified") or entry.last_modified,
+                    entry.chave,
+                ),
+            )
+            conn.commit()
+            entry.expira_em = _calcular_expiracao(ttl, agora)
+            self._conta(classe, "revalidated")
+        except (sqlite3.Error, OSError):
+            pass
+
+    def put(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        resp: requests.Response,
+        ttl: Optional[float] = None
+    ) -> bool:
+        """
+        Guarda a resposta (apenas status 200).
+
+        Se o corpo for idêntico ao já guardado (mesmo hash), só renova
+        a validade e os validadores, sem reescrever o corpo.
+
+        Args:
+            url: URL requisitada
+            params: Query parameters
+            resp: Response do requests
+            ttl: Sobrescreve o TTL da classe (None = usa o da classe,
+                 float("inf") = permanente)
+
+        Returns:
+            True se o corpo mudou (ou é novo); False se inalterado
+            ou não guardado
+        """
+        if resp is None or resp.status_code != 200:
+            return False
+
+        classe, ttl_classe = classificar_endpoint(url, params)
+        ttl = ttl_classe if ttl is None else ttl
+        if ttl == 0:
+            return False
+
+        chave = normalizar_chave(url, params)
+        corpo = resp.content or b""
+        corpo_hash = _hash_corpo(corpo)
+        agora = time.time()
+        expira = _calcular_expiracao(ttl, agora)
+        etag = resp.headers.get("ETag", "")
+        last_modified = resp.headers.get("Last-Modified", "")
+        try:
+            conn = self._conn()
+            cur = conn.execute(
+                "UPDATE respostas SET gravado_em = ?, expira_em = ?, etag = ?, last_modified = ? "
+                "WHERE chave = ? AND corpo_hash = ?",
+                (agora, expira, etag, last_modified, chave, corpo_hash),
+            )
+            if cur.rowcount:
+                conn.commit()
+                self._conta(classe, "unchanged")
+                return False
+
+            conn.execute(
+                f"INSERT OR REPLACE INTO respostas ({_COLUNAS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    chave,
+                    classe,
+                    resp.status_code,
+                    resp.headers.get("Content-Type", ""),
+                    resp.encoding,
+                    sqlite3.Binary(corpo),
+                    agora,
+                    expira,
+                    etag,
+                    last_modified,
+                    corpo_hash,
+                ),
+            )
+            conn.commit()
+            self._conta(classe, "stores")
+            return True
+        except (sqlite3.Error, OSError):
+            return False
+
+    def purge_expired(self) -> int:
+        """Remove entradas expiradas. Retorna quantas foram removidas."""
+        try:
+            conn = self._conn()
+            cur = conn.execute(
+                "DELETE FROM respostas WHERE expira_em IS NOT NULL AND expira_em <= ?",
+                (time.time(),),
+            )
+            conn.commit()
+            return cur.rowcount
+        except (sqlite3.Error, OSError):
+            return 0
+
+    def clear(self, apenas_expiraveis: bool = False) -> None:
+        """
+        Apaga o cache em disco.
+
+        Args:
+            apenas_expiraveis: Mantém as entradas permanentes
+                (eventos/pautas de datas passadas)
+        """
+        try:
+            conn = self._conn()
+            if apenas_expiraveis:
+                conn.execute("DELETE FROM respostas WHERE expira_em IS NOT NULL")
+            else:
+                conn.execute("DELETE FROM respostas")
+            conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+
+# ============================================================
+# INSTÂNCIA GLOBAL
+# ============================================================
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Retorna o cache global (None se desligado por ambiente)."""
+    global _cache
+    if not cache_habilitado():
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Estatísticas de hit/miss do cache global."""
+    cache = get_response_cache()
+    if cache is None:
+        return {
+            "hits": 0, "misses": 0, "stores": 0, "revalidated": 0, "unchanged": 0,
+            "hit_rate": 0.0, "por_classe": {},
+        }
+    return cache.stats()
+
+
+def clear_response_cache(apenas_expiraveis: bool = True) -> None:
+    """Limpa o cache global (por padrão mantém as entradas permanentes)."""
+    cache = get_response_cache()
+    if cache is not None:
+        cache.clear(apenas_expiraveis=apenas_expiraveis)
@@ -29,13 +29,14 @@ from typing import Dict, List, Optional, Tuple
 import re
 import json
 import datetime
-import time
 import xml.etree.ElementTree as ET
 
 import streamlit as st
-import requests
 import pandas as pd
 
+from core.config import SENADO_BASE_URL
+from core.services.http_client import safe_get_response
+
 # Importar configuração de SSL
 try:
     import certifi
@@ -181,7 +182,7 @@ def buscar_tramitacao_senado_mesmo_numero(
 
     # Endpoint correto (Swagger /processo)
     url = (
-        "https://legis.senado.leg.br/dadosabertos/processo"
+        f"{SENADO_BASE_URL}/processo"
         f"?sigla={tipo_norm}&numero={numero_norm}&ano={ano_norm}&v=1"
     )
 
@@ -196,14 +197,13 @@ def buscar_tramitacao_senado_mesmo_numero(
         st.write(f"URL: {url}")
 
     try:
-        resp = requests.get(
+        resp = safe_get_response(
             url,
             timeout=20,
             headers={
                 "User-Agent": "Monitor-Zanatta/1.0",
                 "Accept": "application/json",
             },
-            verify=_REQUESTS_VERIFY,
         )
 
         print(f"[SENADO] Status HTTP: {resp.status_code}")
@@ -311,11 +311,11 @@ def buscar_detalhes_senado(codigo_materia: str = "", id_processo: str = "", debu
 
     # Usar idProcesso quando disponível (mais confiável)
     if id_processo:
-        url = f"https://legis.senado.leg.br/dadosabertos/processo/relatoria?idProcesso={id_processo}"
+        url = f"{SENADO_BASE_URL}/processo/relatoria?idProcesso={id_processo}"
     else:
         data_ref = datetime.date.today().isoformat()
         url = (
-            f"https://legis.senado.leg.br/dadosabertos/processo/relatoria"
+            f"{SENADO_BASE_URL}/processo/relatoria"
             f"?codigoMateria={codigo_materia}&dataReferencia={data_ref}&v=1"
         )
 
@@ -324,11 +324,10 @@ def buscar_detalhes_senado(codigo_materia: str = "", id_processo: str = "", debu
         st.write(f"🔎 Buscando relatoria (Senado): {url}")
 
     try:
-        resp = requests.get(
+        resp = safe_get_response(
             url,
             timeout=20,
             headers={"User-Agent": "Monitor-Zanatta/1.0", "Accept": "application/json"},
-            verify=_REQUESTS_VERIFY,
         )
     except Exception as e:
         print(f"[SENADO-RELATORIA] ERRO request: {e}")
@@ -398,15 +397,14 @@ def buscar_detalhes_senado(codigo_materia: str = "", id_processo: str = "", debu
         # Confirmado retornando dados reais (ex: Izalci Lucas / PLP 223/2023)
         # ============================================================
         if codigo_materia:
-            url_fb = f"https://legis.senado.leg.br/dadosabertos/materia/relatorias/{codigo_materia}"
+            url_fb = f"{SENADO_BASE_URL}/materia/relatorias/{codigo_materia}"
             print(f"[SENADO-RELATORIA] Tentando fallback: {url_fb}")
             if debug:
                 st.write(f"🔎 Fallback relatoria: {url_fb}")
             try:
-                resp_fb = requests.get(
+                resp_fb = safe_get_response(
                     url_fb, timeout=20,
                     headers={"User-Agent": "Monitor-Zanatta/1.0", "Accept": "application/json"},
-                    verify=_REQUESTS_VERIFY,
                 )
                 if resp_fb.status_code == 200 and resp_fb.content:
                     # --- JSON ---
@@ -564,17 +562,16 @@ def buscar_movimentacoes_senado(
     if not id_processo_senado:
         return []
 
-    url = f"https://legis.senado.leg.br/dadosabertos/processo/{id_processo_senado}?v=1"
+    url = f"{SENADO_BASE_URL}/processo/{id_processo_senado}?v=1"
     print(f"[SENADO-PROCESSO] Buscando processo (movimentações): {url}")
     if debug:
         st.write(f"🔎 Buscando processo (Senado): {url}")
 
     try:
-        resp = requests.get(
+        resp = safe_get_response(
             url,
             timeout=25,
             headers={"User-Agent": "Monitor-Zanatta/1.0", "Accept": "application/json"},
-            verify=_REQUESTS_VERIFY,
         )
     except Exception as e:
         print(f"[SENADO-PROCESSO] ERRO request: {e}")
@@ -683,17 +680,16 @@ def buscar_status_senado_por_processo(
     if not id_processo_senado:
         return out
 
-    url = f"https://legis.senado.leg.br/dadosabertos/processo/{id_processo_senado}?v=1"
+    url = f"{SENADO_BASE_URL}/processo/{id_processo_senado}?v=1"
     print(f"[SENADO-PROCESSO] Buscando processo (status): {url}")
     if debug:
         st.write(f"🔎 Buscando processo (status Senado): {url}")
 
     try:
-        resp = requests.get(
+        resp = safe_get_response(
             url,
             timeout=25,
             headers={"User-Agent": "Monitor-Zanatta/1.0", "Accept": "application/json"},
-            verify=_REQUESTS_VERIFY,
         )
     except Exception as e:
         print(f"[SENADO-PROCESSO] ERRO request: {e}")
@@ -980,9 +976,6 @@ def processar_lista_com_senado(
             
             prop_enriquecida = enriquecer_proposicao_com_senado(prop, debug=debug)
             proposicoes_enriquecidas.append(prop_enriquecida)
-            
-            if i < total - 1:
-                time.sleep(0.1)  # Rate limiting
         except Exception as e:
             # LOG: Erro ao processar proposição específica
             print(f"[SENADO] ❌ Erro ao processar proposição {i+1}: {str(e)}")
@@ -1044,14 +1037,13 @@ def buscar_codigo_senador_por_nome(nome_senador: str) -> Optional[str]:
         if nome_busca.startswith(prefixo):
             nome_busca = nome_busca[len(prefixo):]
     
-    url = "https://legis.senado.leg.br/dadosabertos/senador/lista/atual"
+    url = f"{SENADO_BASE_URL}/senador/lista/atual"
     
     try:
-        resp = requests.get(
+        resp = safe_get_response(
             url,
             timeout=15,
             headers={"User-Agent": "Monitor-Zanatta/1.0", "Accept": "application/json"},
-            verify=_REQUESTS_VERIFY,
         )
         
         if resp.status_code != 200:
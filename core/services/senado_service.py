@@ -12,6 +12,8 @@ REGRAS:
 import datetime
 from typing import Optional, Dict, List, Any
 
+from core.config import SENADO_BASE_URL
+
 from .http_client import (
     safe_get,
     safe_get_raw,
@@ -37,13 +39,6 @@ from .parsers import (
 )
 
 
-# ============================================================
-# CONFIGURAÇÃO
-# ============================================================
-
-SENADO_BASE_URL = "https://legis.senado.leg.br/dadosabertos"
-
-
 class SenadoService:
     """
     Serviço para acesso à API do Senado Federal.
@@ -0,0 +1,154 @@
+"""
+Single-flight: coalescência de chamadas idênticas em andamento.
+
+Quando várias threads (ou tasks) pedem a mesma chave ao mesmo tempo,
+só a primeira ("líder") executa a função; as demais esperam e recebem
+o mesmo resultado (ou a mesma exceção). Não é cache: terminada a
+chamada, a chave sai do mapa e a próxima chamada executa de novo.
+
+REGRAS:
+- SEM Streamlit
+- Usado pelo http_client (safe_get / safe_get_raw) e pelo DataProvider
+- Seguidores recebem cópia do resultado quando `copiar` é informado
+  (evita que um chamador altere o dict de outro)
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Chamada:
+    """Chamada em andamento de uma chave."""
+
+    __slots__ = ("evento", "resultado", "erro", "seguidores")
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.resultado: Any = None
+        self.erro: Optional[BaseException] = None
+        self.seguidores = 0
+
+
+class SingleFlight:
+    """
+    Grupo de single-flight para chamadas síncronas (threads).
+
+    Uso:
+        grupo = SingleFlight()
+        dados = grupo.do(("eventos", inicio, fim), buscar_eventos, inicio, fim)
+    """
+
+    def __init__(self, copiar: Optional[Callable[[Any], Any]] = None):
+        self._copiar = copiar
+        self._lock = threading.Lock()
+        self._chamadas: Dict[Hashable, _Chamada] = {}
+        self._executadas = 0
+        self._coalescidas = 0
+
+    def do(self, chave: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Executa fn(*args, **kwargs) uma vez por chave em andamento.
+
+        Returns:
+            Resultado de fn (cópia para seguidores, se `copiar` foi informado)
+
+        Raises:
+            A mesma exceção levantada por fn, para líder e seguidores
+        """
+        with self._lock:
+            chamada = self._chamadas.get(chave)
+            if chamada is not None:
+                chamada.seguidores += 1
+                self._coalescidas += 1
+                lider = False
+            else:
+                chamada = _Chamada()
+                self._chamadas[chave] = chamada
+                self._executadas += 1
+                lider = True
+
+        if not lider:
+            chamada.evento.wait()
+            if chamada.erro is not None:
+                raise chamada.erro
+            return self._copiar(chamada.resultado) if self._copiar else chamada.resultado
+
+        try:
+            chamada.resultado = fn(*args, **kwargs)
+            return chamada.resultado
+        except BaseException as e:
+            chamada.erro = e
+            raise
+        finally:
+            with self._lock:
+                self._chamadas.pop(chave, None)
+            chamada.evento.set()
+
+    def em_andamento(self) -> int:
+        """Número de chaves sendo executadas agora."""
+        with self._lock:
+            return len(self._chamadas)
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores: chamadas executadas e chamadas coalescidas."""
+        with self._lock:
+            return {
+                "executadas": self._executadas,
+                "coalescidas": self._coalescidas,
+                "em_andamento": len(self._chamadas),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Grupo de single-flight para corrotinas.
+
+    Os futures ficam presos ao event loop, por isso o mapa de chamadas
+    é separado por loop (mesmo esquema dos semáforos do http_client).
+    """
+
+    def __init__(self, copiar: Optional[Callable[[Any], Any]] = None):
+        self._copiar = copiar
+        self._por_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._executadas = 0
+        self._coalescidas = 0
+
+    async def do(self, chave: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Versão async de SingleFlight.do(); fn deve ser uma corrotina."""
+        loop = asyncio.get_running_loop()
+        chamadas = self._por_loop.setdefault(loop, {})
+
+        futuro = chamadas.get(chave)
+        if futuro is not None:
+            self._coalescidas += 1
+            resultado = await asyncio.shield(futuro)
+            return self._copiar(resultado) if self._copiar else resultado
+
+        futuro = loop.create_future()
+        chamadas[chave] = futuro
+        self._executadas += 1
+        try:
+            resultado = await fn(*args, **kwargs)
+            futuro.set_result(resultado)
+            return resultado
+        except asyncio.CancelledError:
+            futuro.cancel()
+            raise
+        except BaseException as e:
+            futuro.set_exception(e)
+            # Sem seguidores, evita o aviso "exception was never retrieved"
+            futuro.exception()
+            raise
+        finally:
+            chamadas.pop(chave, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores: chamadas executadas e chamadas coalescidas."""
+        return {
+            "executadas": self._executadas,
+            "coalescidas": self._coalescidas,
+        }
@@ -84,6 +84,11 @@ STATE_KEYS: Dict[str, Dict[str, Any]] = {
         "type": "pd.DataFrame",
         "desc": "DataFrame com resultado do scan da Aba 3",
     },
+    "df_kw_tab3": {
+        "default_factory": "empty_dataframe",
+        "type": "pd.DataFrame",
+        "desc": "Ocorrências de palavras-chave do scan da Aba 3 (VarreduraPautas.ocorrencias)",
+    },
     "dt_range_tab3_saved": {
         "default": None,
         "type": "Optional[tuple]",
@@ -137,6 +142,11 @@ STATE_KEYS: Dict[str, Dict[str, Any]] = {
         "type": "pd.DataFrame",
         "desc": "DataFrame enriquecido com dados do Senado na Aba 5",
     },
+    "status_map_tab5": {
+        "default": None,
+        "type": "Optional[dict]",
+        "desc": "Status já carregados na Aba 5 ({em, mapa id -> status})",
+    },
     "df_status_last": {
         "default_factory": "empty_dataframe",
         "type": "pd.DataFrame",
@@ -267,9 +277,11 @@ def reset_cache_abas(st) -> None:
         "props_autoria_aba1_cache",
         "df_scan_tab2",
         "df_scan_tab3",
+        "df_kw_tab3",
         "df_scan_tab4",
         "props_aba5_cache",
         "df_todas_enriquecido_tab5",
+        "status_map_tab5",
         "df_status_last",
         "senado_cache_por_id",
         "df_aut6_cache",
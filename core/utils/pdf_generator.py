@@ -807,13 +807,15 @@ def to_pdf_autoria_relatoria(df: pd.DataFrame, fetch_proposicao_completa_func=No
                     ids.append(pid)
             return ids
         
+        if fetch_proposicao_completa_func is None:
+            from core.services.proposicao_store import get_proposicao_store
+            fetch_proposicao_completa_func = get_proposicao_store().get_proposicao_completa
+        
         def buscar_info_proposicao(pid):
-            if fetch_proposicao_completa_func:
-                try:
-                    return fetch_proposicao_completa_func(str(pid))
-                except:
-                    return {}
-            return {}
+            try:
+                return fetch_proposicao_completa_func(str(pid))
+            except:
+                return {}
         
         registros_autoria = []
         registros_relatoria = []
@@ -1239,7 +1241,11 @@ def to_pdf_comissoes_estrategicas(df: pd.DataFrame) -> Tuple[bytes, str, str]:
 
 
 def to_pdf_palavras_chave(df: pd.DataFrame) -> Tuple[bytes, str, str]:
-    """Gera PDF de palavras-chave na pauta, organizado por Comissão."""
+    """
+    Gera PDF de palavras-chave na pauta, organizado por Comissão.
+    
+    df: ocorrências de escanear_eventos (VarreduraPautas.ocorrencias)
+    """
     try:
         from fpdf import FPDF
         
@@ -1289,63 +1295,37 @@ def to_pdf_palavras_chave(df: pd.DataFrame) -> Tuple[bytes, str, str]:
         proposicoes_por_comissao = {}
         todas_proposicoes = set()
         
-        for _, row in df.iterrows():
-            props_str = row.get("proposicoes_palavras_chave", "") or ""
+        for oc in df.itertuples(index=False):
+            if not oc.materia:
+                continue
             
-            if not props_str or pd.isna(props_str):
+            comissao = oc.orgao_sigla or "Outras"
+            chave_unica = (oc.materia, comissao)
+            if chave_unica in todas_proposicoes:
                 continue
+            todas_proposicoes.add(chave_unica)
             
-            for prop_detail in str(props_str).split("; "):
-                if "|||" not in prop_detail:
-                    continue
-                    
-                partes = prop_detail.split("|||")
-                
-                materia = partes[0].strip() if len(partes) > 0 else ""
-                palavras = partes[1].strip() if len(partes) > 1 else ""
-                ementa = partes[2].strip() if len(partes) > 2 else ""
-                link = partes[3].strip() if len(partes) > 3 else ""
-                
-                relator_raw = partes[4].strip() if len(partes) > 4 else ""
-                if not relator_raw or len(relator_raw) < 5:
-                    relator = "Sem relator designado"
-                else:
-                    relator = relator_raw
-                
-                comissao = partes[5].strip() if len(partes) > 5 else row.get("orgao_sigla", "Outras")
-                nome_comissao = partes[6].strip() if len(partes) > 6 else ""
-                data_evento = partes[7].strip() if len(partes) > 7 else ""
-                
-                data_formatada = ""
-                if data_evento and len(data_evento) >= 10:
-                    try:
-                        dt = datetime.datetime.strptime(data_evento[:10], "%Y-%m-%d")
-                        data_formatada = dt.strftime("%d/%m/%Y")
-                    except:
-                        data_formatada = data_evento
-                
-                if not materia:
-                    continue
-                
-                chave_unica = f"{materia}_{comissao}"
-                if chave_unica in todas_proposicoes:
-                    continue
-                todas_proposicoes.add(chave_unica)
-                
-                if comissao not in proposicoes_por_comissao:
-                    proposicoes_por_comissao[comissao] = {
-                        "nome": nome_comissao,
-                        "proposicoes": []
-                    }
-                
-                proposicoes_por_comissao[comissao]["proposicoes"].append({
-                    "materia": materia,
-                    "palavras": palavras,
-                    "ementa": ementa,
-                    "link": link,
-                    "relator": relator,
-                    "data": data_formatada
-                })
+            data_formatada = ""
+            if oc.data and len(oc.data) >= 10:
+                try:
+                    data_formatada = datetime.datetime.strptime(oc.data[:10], "%Y-%m-%d").strftime("%d/%m/%Y")
+                except ValueError:
+                    data_formatada = oc.data
+            
+            if comissao not in proposicoes_por_comissao:
+                proposicoes_por_comissao[comissao] = {
+                    "nome": oc.orgao_nome,
+                    "proposicoes": []
+                }
+            
+            proposicoes_por_comissao[comissao]["proposicoes"].append({
+                "materia": oc.materia,
+                "palavras": ", ".join(oc.palavras),
+                "ementa": oc.ementa,
+                "link": oc.link,
+                "relator": oc.relator,
+                "data": data_formatada
+            })
         
         comissoes_ordenadas = sorted(proposicoes_por_comissao.keys())
         total_props = sum(len(c["proposicoes"]) for c in proposicoes_por_comissao.values())
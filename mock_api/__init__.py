@@ -0,0 +1,38 @@
+"""
+Mock local das APIs de dados abertos da Câmara e do Senado.
+
+Serve um dataset sintético determinístico (ou respostas gravadas em
+mock_api/fixtures/) com latência e falhas (429/5xx) configuráveis, para
+medir e testar o monitor sem depender da API real.
+
+REGRAS:
+- Só biblioteca padrão
+- NÃO importa core: suba o mock, exporte MONITOR_CAMARA_BASE_URL /
+  MONITOR_SENADO_BASE_URL e só então importe core.*
+
+Uso (linha de comando):
+    python -m mock_api --porta 8765 --carteira 300 --latencia lognormal:120,0.6
+    export MONITOR_CAMARA_BASE_URL=http://127.0.0.1:8765/api/v2
+    export MONITOR_SENADO_BASE_URL=http://127.0.0.1:8765/dadosabertos
+    python notificar_tramitacoes.py
+
+Uso (no mesmo processo):
+    from mock_api import MockApiServer, MockDataset, InjetorFalhas
+
+    with MockApiServer(MockDataset(carteira=1000), falhas=InjetorFalhas(taxa_429=0.02)) as mock:
+        os.environ.update(mock.env())
+        from core.services import CamaraService
+"""
+
+from .dataset import MockDataset
+from .faults import InjetorFalhas, parse_latencia
+from .fixtures import FixtureStore
+from .server import MockApiServer
+
+__all__ = [
+    "MockApiServer",
+    "MockDataset",
+    "InjetorFalhas",
+    "FixtureStore",
+    "parse_latencia",
+]
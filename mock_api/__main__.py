@@ -0,0 +1,87 @@
+"""
+Linha de comando do mock: python -m mock_api [opções]
+
+Exemplos:
+    python -m mock_api --porta 8765
+    python -m mock_api --carteira 1000 --eventos 120 --latencia lognormal:150,0.7
+    python -m mock_api --latencia fixo:50 --latencia-rota "/pauta=uniforme:200-800"
+    python -m mock_api --taxa-429 0.05 --retry-after 2 --taxa-5xx 0.02
+    python -m mock_api --fora-do-ar senado
+    python -m mock_api --gravar      # repassa à API real e grava fixtures
+"""
+
+import sys
+import json
+import argparse
+import datetime
+
+from .dataset import MockDataset
+from .faults import InjetorFalhas
+from .fixtures import FixtureStore, FIXTURES_DIR
+from .server import MockApiServer
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m mock_api", description="Mock das APIs da Câmara e do Senado")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--carteira", type=int, default=300, help="proposições de autoria da deputada")
+    parser.add_argument("--eventos", type=int, default=40, help="eventos entre hoje-7 e hoje+7")
+    parser.add_argument("--hoje", help="data de referência AAAA-MM-DD (padrão: hoje)")
+    parser.add_argument("--latencia", default="0", help='ex: "fixo:80", "uniforme:20-200", "lognormal:120,0.6"')
+    parser.add_argument("--latencia-rota", action="append", default=[], help='ex: "/pauta=lognormal:400,0.8" (repetível)')
+    parser.add_argument("--taxa-429", type=float, default=0.0)
+    parser.add_argument("--taxa-5xx", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1, help="segundos no Retry-After das respostas 429")
+    parser.add_argument("--fora-do-ar", action="append", default=[], choices=["camara", "senado"])
+    parser.add_argument("--fixtures", default=str(FIXTURES_DIR), help="pasta de respostas gravadas")
+    parser.add_argument("--sem-fixtures", action="store_true", help="servir só o dataset sintético")
+    parser.add_argument("--gravar", action="store_true", help="repassar à API real o que não tiver fixture e gravar")
+    parser.add_argument("--materia-xml", action="store_true", help="/materia e /senador sempre em XML")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        falhas = InjetorFalhas(
+            latencia=args.latencia,
+            latencia_por_rota=args.latencia_rota,
+            taxa_429=args.taxa_429,
+            taxa_5xx=args.taxa_5xx,
+            retry_after=args.retry_after,
+            fora_do_ar=args.fora_do_ar,
+            seed=args.seed,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    hoje = datetime.date.fromisoformat(args.hoje) if args.hoje else None
+    dataset = MockDataset(carteira=args.carteira, eventos=args.eventos, seed=args.seed, hoje=hoje)
+    fixtures = None if args.sem_fixtures else FixtureStore(args.fixtures, gravar=args.gravar)
+
+    mock = MockApiServer(
+        dataset,
+        host=args.host,
+        porta=args.porta,
+        falhas=falhas,
+        fixtures=fixtures,
+        materia_xml=args.materia_xml,
+        verbose=args.verbose,
+    )
+    print(f"🧪 Mock API em {mock.url}")
+    print(json.dumps(dataset.resumo(), ensure_ascii=False))
+    for k, v in mock.env().items():
+        print(f"export {k}={v}")
+    sys.stdout.flush()
+
+    try:
+        mock.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(mock.stats()["rotas"], ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
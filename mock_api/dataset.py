@@ -0,0 +1,652 @@
+"""
+Dataset sintético e determinístico para o mock das APIs da Câmara e do
+Senado.
+
+REGRAS:
+- SEM Streamlit e SEM importar core (o core lê as URLs base do ambiente
+  na importação; o mock precisa subir antes)
+- Mesma semente + mesmo tamanho + mesma data de referência = mesmos dados
+- Formato dos payloads igual ao da API real (campos que o monitor lê)
+
+Uso:
+    from mock_api.dataset import MockDataset
+
+    ds = MockDataset(carteira=300, eventos=40, seed=42)
+    ds.proposicoes[ds.ids_carteira[0]]["statusProposicao"]
+"""
+
+import random
+import datetime
+from typing import Optional, Dict, List, Any, Tuple
+
+
+# ============================================================
+# CONSTANTES
+# ============================================================
+
+DEPUTADA_ID = 220559
+DEPUTADA = {
+    "id": DEPUTADA_ID,
+    "nome": "Júlia Zanatta",
+    "siglaPartido": "PL",
+    "siglaUf": "SC",
+}
+
+# Base usada nos campos "uri" dos payloads; o servidor troca pela sua
+# própria URL na hora de responder
+URI_CAMARA = "https://dadosabertos.camara.leg.br/api/v2"
+
+ORGAOS: Dict[str, Tuple[int, str]] = {
+    "PLEN": (180, "Plenário"),
+    "MESA": (4, "Mesa Diretora da Câmara dos Deputados"),
+    "CCJC": (2003, "Comissão de Constituição e Justiça e de Cidadania"),
+    "CSAUDE": (2014, "Comissão de Saúde"),
+    "CDC": (2006, "Comissão de Defesa do Consumidor"),
+    "CFT": (2004, "Comissão de Finanças e Tributação"),
+    "CSPCCO": (5503, "Comissão de Segurança Pública e Combate ao Crime Organizado"),
+    "CE": (2009, "Comissão de Educação"),
+    "CAPADR": (2001, "Comissão de Agricultura, Pecuária, Abastecimento e Desenvolvimento Rural"),
+}
+COMISSOES = [s for s in ORGAOS if s not in ("PLEN", "MESA")]
+
+# (sigla, codTipo, peso) da carteira
+TIPOS_CARTEIRA = [
+    ("PL", 139, 60), ("PLP", 141, 5), ("PDL", 550, 10), ("PEC", 136, 2),
+    ("PRC", 142, 2), ("RIC", 146, 15), ("REQ", 390, 6),
+]
+
+TEMAS = [
+    "a vacinação obrigatória de crianças", "o porte de armas de fogo por agentes",
+    "o registro de armamento de colecionadores", "a proibição do aborto após 22 semanas",
+    "a composição do Conanda", "a violência contra a mulher no ambiente digital",
+    "a cobrança de tarifas sobre o PIX", "a implantação do DREX",
+    "a isenção do Imposto de Renda para aposentados", "a dedução de despesas no IRPF",
+    "a logística reversa de embalagens", "a cobertura mínima dos planos de saude",
+    "a educação domiciliar", "o seguro rural", "a segurança das escolas",
+    "o transporte rodoviário de cargas", "a proteção de dados pessoais",
+    "o uso de drones na agricultura", "a liberdade de expressão nas redes sociais",
+    "o marco temporal das terras indígenas", "a fiscalização de ONGs estrangeiras",
+    "a redução da maioridade penal", "o regime de previdência dos militares",
+]
+
+MINISTERIOS = [
+    "da Saúde", "da Justiça e Segurança Pública", "da Fazenda", "da Educação",
+    "dos Direitos Humanos e da Cidadania", "das Relações Exteriores",
+    "do Meio Ambiente e Mudança do Clima", "da Defesa",
+]
+
+SITUACOES = [
+    ("Aguardando Designação de Relator(a)", 1120, 18),
+    ("Aguardando Parecer do Relator(a)", 1140, 30),
+    ("Pronta para Pauta", 924, 8),
+    ("Aguardando Deliberação", 1130, 8),
+    ("Tramitando em Conjunto", 1150, 14),
+    ("Apreciação pelo Senado Federal", 1270, 6),
+    ("Arquivada", 923, 8),
+    ("Aguardando Remessa ao Senado Federal", 1285, 2),
+]
+SITUACOES_RIC = [
+    ("Aguardando Despacho do Presidente da Câmara dos Deputados", 1010, 20),
+    ("Aguardando Remessa", 1230, 20),
+    ("Aguardando Resposta", 1231, 50),
+    ("Arquivada", 923, 10),
+]
+
+NOMES = [
+    "Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Henrique",
+    "Isabela", "João", "Karina", "Leonardo", "Mariana", "Nelson", "Otávio", "Paula",
+    "Rafael", "Sabrina", "Tiago", "Vanessa",
+]
+SOBRENOMES = [
+    "Silva", "Souza", "Oliveira", "Pereira", "Costa", "Rodrigues", "Almeida",
+    "Nascimento", "Lima", "Araújo", "Fernandes", "Carvalho", "Gomes", "Martins",
+    "Rocha", "Ribeiro",
+]
+PARTIDOS = ["PL", "PT", "UNIÃO", "PP", "PSD", "MDB", "REPUBLICANOS", "PSOL", "NOVO", "PDT"]
+UFS = ["SC", "SP", "RJ", "MG", "PR", "RS", "BA", "GO", "DF", "PE", "CE", "AM"]
+
+COLEGIADOS_SENADO = [
+    ("CCJ", "Comissão de Constituição, Justiça e Cidadania"),
+    ("CAE", "Comissão de Assuntos Econômicos"),
+    ("CAS", "Comissão de Assuntos Sociais"),
+    ("CE", "Comissão de Educação e Cultura"),
+    ("PLEN", "Plenário do Senado Federal"),
+]
+
+
+def _iso(dt: datetime.datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M")
+
+
+def _escolher_peso(rng: random.Random, opcoes: List[tuple]) -> tuple:
+    return rng.choices(opcoes, weights=[o[-1] for o in opcoes], k=1)[0]
+
+
+# ============================================================
+# DATASET
+# ============================================================
+
+class MockDataset:
+    """
+    Universo de dados servido pelo mock.
+
+    Args:
+        carteira: Número de proposições de autoria da deputada
+        eventos: Número de eventos entre hoje-7 e hoje+7 dias
+        seed: Semente do gerador
+        hoje: Data de referência (padrão: hoje); datas "recentes" são
+              relativas a ela, então os notificadores sempre acham novidades
+    """
+
+    def __init__(
+        self,
+        carteira: int = 300,
+        eventos: int = 40,
+        seed: int = 42,
+        hoje: Optional[datetime.date] = None
+    ):
+        self.carteira = carteira
+        self.num_eventos = eventos
+        self.seed = seed
+        self.hoje = hoje or datetime.date.today()
+        self._rng = random.Random(f"{seed}:{carteira}:{eventos}:{self.hoje.isoformat()}")
+
+        self.deputados: List[Dict[str, Any]] = []
+        self.proposicoes: Dict[int, Dict[str, Any]] = {}
+        self.tramitacoes: Dict[int, List[Dict[str, Any]]] = {}
+        self.relatores: Dict[int, List[Dict[str, Any]]] = {}
+        self.autores: Dict[int, List[Dict[str, Any]]] = {}
+        self.relacionadas: Dict[int, List[Dict[str, Any]]] = {}
+        self.ids_carteira: List[int] = []
+        self.ids_outras: List[int] = []
+        self.ids_por_autor: Dict[int, List[int]] = {}
+        self._por_numero: Dict[Tuple[str, str, str], int] = {}
+
+        self.eventos: List[Dict[str, Any]] = []
+        self.pautas: Dict[int, List[Dict[str, Any]]] = {}
+        self.pautas_plenario: Dict[str, List[Dict[str, Any]]] = {}
+
+        self.processos_senado: Dict[int, Dict[str, Any]] = {}
+        self._senado_por_numero: Dict[Tuple[str, str, str], int] = {}
+        self._senado_por_codigo: Dict[int, int] = {}
+        self.senadores: List[Dict[str, Any]] = []
+
+        self._gerar_deputados()
+        self._gerar_proposicoes()
+        self._gerar_eventos()
+        self._gerar_senado()
+
+    # --------------------------------------------------------
+    # Geração
+    # --------------------------------------------------------
+
+    def _nome(self) -> str:
+        return f"{self._rng.choice(NOMES)} {self._rng.choice(SOBRENOMES)}"
+
+    def _gerar_deputados(self) -> None:
+        rng = self._rng
+        self.deputados.append({
+            "id": DEPUTADA_ID,
+            "uri": f"{URI_CAMARA}/deputados/{DEPUTADA_ID}",
+            "nome": DEPUTADA["nome"],
+            "siglaPartido": DEPUTADA["siglaPartido"],
+            "uriPartido": f"{URI_CAMARA}/partidos/37906",
+            "siglaUf": DEPUTADA["siglaUf"],
+            "idLegislatura": 57,
+            "urlFoto": f"https://www.camara.leg.br/internet/deputado/bandep/{DEPUTADA_ID}.jpg",
+            "email": "dep.juliazanatta@camara.leg.br",
+        })
+        usados = {DEPUTADA["nome"]}
+        while len(self.deputados) < 120:
+            nome = self._nome()
+            if nome in usados:
+                continue
+            usados.add(nome)
+            dep_id = 200000 + len(self.deputados)
+            self.deputados.append({
+                "id": dep_id,
+                "uri": f"{URI_CAMARA}/deputados/{dep_id}",
+                "nome": nome,
+                "siglaPartido": rng.choice(PARTIDOS),
+                "uriPartido": f"{URI_CAMARA}/partidos/{36000 + rng.randint(1, 999)}",
+                "siglaUf": rng.choice(UFS),
+                "idLegislatura": 57,
+                "urlFoto": f"https://www.camara.leg.br/internet/deputado/bandep/{dep_id}.jpg",
+                "email": f"dep.{nome.lower().replace(' ', '')}@camara.leg.br",
+            })
+
+    def _data_apresentacao(self, ano: int) -> datetime.datetime:
+        fim = min(datetime.date(ano, 12, 31), self.hoje - datetime.timedelta(days=3))
+        inicio = datetime.date(ano, 2, 1)
+        dias = max((fim - inicio).days, 1)
+        dia = inicio + datetime.timedelta(days=self._rng.randint(0, dias))
+        return datetime.datetime.combine(dia, datetime.time(self._rng.randint(9, 18), self._rng.choice([0, 15, 30, 45])))
+
+    def _novo_numero(self, sigla: str, ano: int) -> str:
+        while True:
+            numero = str(self._rng.randint(1, 5999))
+            if (sigla, numero, str(ano)) not in self._por_numero:
+                return numero
+
+    def _ementa(self, sigla: str) -> str:
+        rng = self._rng
+        tema = rng.choice(TEMAS)
+        if sigla == "RIC":
+            return f"Requer informações ao Ministro de Estado {rng.choice(MINISTERIOS)} sobre {tema}."
+        if sigla == "REQ":
+            return f"Requer a realização de audiência pública para debater {tema}."
+        if sigla == "PDL":
+            return f"Susta os efeitos do Decreto nº {rng.randint(10000, 12999)}, que dispõe sobre {tema}."
+        if sigla == "PEC":
+            return f"Altera a Constituição Federal para dispor sobre {tema}."
+        return (
+            f"Dispõe sobre {tema} e altera a Lei nº {rng.randint(5000, 14999)}, "
+            f"de {rng.randint(1990, 2022)}."
+        )
+
+    def _registrar_proposicao(
+        self,
+        prop_id: int,
+        sigla: str,
+        cod_tipo: int,
+        ano: int,
+        autor: Dict[str, Any],
+        situacao: Tuple[str, int],
+        principal: Optional[int] = None
+    ) -> None:
+        rng = self._rng
+        numero = self._novo_numero(sigla, ano)
+        apresentacao = self._data_apresentacao(ano)
+        ementa = self._ementa(sigla)
+        self._por_numero[(sigla, numero, str(ano))] = prop_id
+
+        tramitacoes, relator = self._gerar_tramitacoes(sigla, apresentacao, situacao, principal)
+        ultima = tramitacoes[-1]
+
+        self.proposicoes[prop_id] = {
+            "id": prop_id,
+            "uri": f"{URI_CAMARA}/proposicoes/{prop_id}",
+            "siglaTipo": sigla,
+            "codTipo": cod_tipo,
+            "numero": int(numero),
+            "ano": ano,
+            "ementa": ementa,
+            "dataApresentacao": _iso(apresentacao),
+            "uriOrgaoNumerador": f"{URI_CAMARA}/orgaos/{ORGAOS['PLEN'][0]}",
+            "statusProposicao": dict(ultima),
+            "uriAutores": f"{URI_CAMARA}/proposicoes/{prop_id}/autores",
+            "descricaoTipo": sigla,
+            "ementaDetalhada": "",
+            "keywords": "",
+            "uriPropPrincipal": f"{URI_CAMARA}/proposicoes/{principal}" if principal else None,
+            "uriPropAnterior": None,
+            "uriPropPosterior": None,
+            "urlInteiroTeor": f"https://www.camara.leg.br/proposicoesWeb/prop_mostrarintegra?codteor={prop_id + 1000000}",
+            "urnFinal": None,
+            "texto": None,
+            "justificativa": None,
+        }
+        self.tramitacoes[prop_id] = tramitacoes
+        self.autores[prop_id] = [{
+            "uri": f"{URI_CAMARA}/deputados/{autor['id']}",
+            "nome": autor["nome"],
+            "codTipo": 10000,
+            "tipo": "Deputado(a)",
+            "ordemAssinatura": 1,
+            "proponente": 1,
+        }]
+        self.ids_por_autor.setdefault(autor["id"], []).append(prop_id)
+        for ordem, co in enumerate(rng.sample(self.deputados[1:], rng.randint(0, 3)), start=2):
+            self.ids_por_autor.setdefault(co["id"], []).append(prop_id)
+            self.autores[prop_id].append({
+                "uri": f"{URI_CAMARA}/deputados/{co['id']}",
+                "nome": co["nome"],
+                "codTipo": 10000,
+                "tipo": "Deputado(a)",
+                "ordemAssinatura": ordem,
+                "proponente": 1,
+            })
+        if relator:
+            self.relatores[prop_id] = [{
+                "id": relator["id"],
+                "uri": relator["uri"],
+                "nome": relator["nome"],
+                "siglaPartido": relator["siglaPartido"],
+                "siglaUf": relator["siglaUf"],
+                "idLegislatura": 57,
+                "urlFoto": relator["urlFoto"],
+                "codTipoRelator": 1,
+                "descricaoTipoRelator": "Relator",
+                "siglaOrgao": ultima["siglaOrgao"],
+            }]
+        self.relacionadas.setdefault(prop_id, [])
+
+    def _gerar_tramitacoes(
+        self,
+        sigla: str,
+        apresentacao: datetime.datetime,
+        situacao: Tuple[str, int],
+        principal: Optional[int]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        rng = self._rng
+        desc_situacao, cod_situacao = situacao
+        orgao = rng.choice(COMISSOES)
+        relator = None
+
+        # Última movimentação: ~10% nas últimas 48h (novidades para os
+        # notificadores), o resto espalhado desde a apresentação
+        agora = datetime.datetime.combine(self.hoje, datetime.time(12, 0))
+        if rng.random() < 0.10:
+            ultima = agora - datetime.timedelta(hours=rng.randint(1, 47))
+        else:
+            dias = max((agora - apresentacao).days, 4)
+            ultima = apresentacao + datetime.timedelta(days=rng.randint(3, dias))
+        ultima = max(ultima, apresentacao + datetime.timedelta(hours=1))
+
+        n = rng.randint(3, 25)
+        passo = (ultima - apresentacao) / max(n - 1, 1)
+        tramitacoes = []
+        for seq in range(n):
+            data = apresentacao + passo * seq
+            if seq == 0:
+                sigla_orgao, desc, cod, despacho = "PLEN", "Apresentação de Proposição", 100, f"Apresentação do {sigla}."
+            elif seq == 1:
+                sigla_orgao, desc, cod = "MESA", "Despacho", 180
+                despacho = f"Às Comissões de {ORGAOS[orgao][1].replace('Comissão de ', '')} (Mérito).\nProposição Sujeita à Apreciação Conclusiva pelas Comissões - Art. 24 II."
+            elif seq == n - 1:
+                sigla_orgao, desc, cod = orgao, "Recebimento", 500
+                despacho = f"Recebimento pela {orgao}."
+            else:
+                sigla_orgao = orgao
+                escolha = rng.random()
+                if escolha < 0.3 and relator is None and sigla not in ("RIC", "REQ"):
+                    relator = rng.choice(self.deputados)
+                    desc, cod = "Designação de Relator", 320
+                    despacho = f"Designado Relator, Dep. {relator['nome']} ({relator['siglaPartido']}-{relator['siglaUf']})"
+                elif escolha < 0.5 and relator is not None:
+                    desc, cod = "Apresentação do Parecer do Relator", 322
+                    despacho = f"Parecer do Relator, Dep. {relator['nome']} ({relator['siglaPartido']}-{relator['siglaUf']}), pela aprovação."
+                else:
+                    desc, cod = "Encaminhamento", 502
+                    despacho = "Encaminhada à publicação."
+            tramitacoes.append({
+                "dataHora": _iso(data),
+                "sequencia": seq + 1,
+                "siglaOrgao": sigla_orgao,
+                "uriOrgao": f"{URI_CAMARA}/orgaos/{ORGAOS[sigla_orgao][0]}",
+                "uriUltimoRelator": relator["uri"] if relator else None,
+                "regime": "Ordinário (Art. 151, III, RICD)",
+                "descricaoTramitacao": desc,
+                "codTipoTramitacao": str(cod),
+                "descricaoSituacao": None,
+                "codSituacao": None,
+                "despacho": despacho,
+                "url": None,
+                "ambito": "Regimental",
+                "apreciacao": "Proposição Sujeita à Apreciação Conclusiva pelas Comissões - Art. 24 II",
+            })
+
+        ultima_tram = tramitacoes[-1]
+        if principal:
+            p = self.proposicoes[principal]
+            ultima_tram["descricaoTramitacao"] = "Apensação"
+            ultima_tram["codTipoTramitacao"] = "1014"
+            ultima_tram["despacho"] = f"Apense-se à(ao) {p['siglaTipo']}-{p['numero']}/{p['ano']}."
+        elif desc_situacao == "Apreciação pelo Senado Federal":
+            ultima_tram["siglaOrgao"] = "PLEN"
+            ultima_tram["uriOrgao"] = f"{URI_CAMARA}/orgaos/{ORGAOS['PLEN'][0]}"
+            ultima_tram["descricaoTramitacao"] = "Remessa ao Senado Federal"
+            ultima_tram["despacho"] = "Remessa ao Senado Federal por meio do Of. nº 123/2025/SGM-P."
+        elif sigla == "RIC" and desc_situacao == "Aguardando Resposta":
+            ultima_tram["siglaOrgao"] = "MESA"
+            ultima_tram["uriOrgao"] = f"{URI_CAMARA}/orgaos/{ORGAOS['MESA'][0]}"
+            ultima_tram["descricaoTramitacao"] = "Remessa"
+            ultima_tram["despacho"] = (
+                f"Encaminhado Ofício 1ªSec/RI/E nº {rng.randint(100, 999)} "
+                f"ao Ministério {rng.choice(MINISTERIOS)}."
+            )
+        ultima_tram["descricaoSituacao"] = desc_situacao
+        ultima_tram["codSituacao"] = cod_situacao
+        return tramitacoes, relator
+
+    def _gerar_proposicoes(self) -> None:
+        rng = self._rng
+        deputada = self.deputados[0]
+        outros = self.deputados[1:]
+
+        # Proposições de terceiros: alvos de apensação e itens de pauta
+        n_outras = max(self.carteira, 50)
+        for i in range(n_outras):
+            prop_id = 2300000 + i
+            principal = None
+            situacao = _escolher_peso(rng, SITUACOES)[:2]
+            # Cadeias: parte das outras também está apensada a outra mais antiga
+            if i > 10 and rng.random() < 0.2:
+                principal = self.ids_outras[rng.randrange(0, i // 2)]
+                situacao = ("Tramitando em Conjunto", 1150)
+            ano = rng.randint(2015, 2022) if i < n_outras // 2 else rng.randint(2019, self.hoje.year)
+            self._registrar_proposicao(prop_id, "PL", 139, ano, rng.choice(outros), situacao, principal)
+            self.ids_outras.append(prop_id)
+            if principal:
+                self._relacionar(principal, prop_id)
+
+        for i in range(self.carteira):
+            prop_id = 2400000 + i
+            sigla, cod_tipo, _ = _escolher_peso(rng, TIPOS_CARTEIRA)
+            situacao = _escolher_peso(rng, SITUACOES_RIC if sigla == "RIC" else SITUACOES)[:2]
+            principal = None
+            if situacao[0] == "Tramitando em Conjunto":
+                principal = rng.choice(self.ids_outras[: n_outras // 2])
+            ano = rng.randint(2023, self.hoje.year)
+            self._registrar_proposicao(prop_id, sigla, cod_tipo, ano, deputada, situacao, principal)
+            self.ids_carteira.append(prop_id)
+            if principal:
+                self._relacionar(principal, prop_id)
+
+    def _relacionar(self, principal: int, apensada: int) -> None:
+        for origem, destino in ((principal, apensada), (apensada, principal)):
+            p = self.proposicoes[destino]
+            self.relacionadas.setdefault(origem, []).append({
+                "id": p["id"],
+                "uri": p["uri"],
+                "siglaTipo": p["siglaTipo"],
+                "codTipo": p["codTipo"],
+                "numero": p["numero"],
+                "ano": p["ano"],
+                "ementa": p["ementa"],
+            })
+
+    def _item_pauta(self, ordem: int, prop_id: int) -> Dict[str, Any]:
+        rng = self._rng
+        p = self.proposicoes[prop_id]
+        relator = DEPUTADA if rng.random() < 0.1 else rng.choice(self.deputados)
+        return {
+            "cabecalho": "MATÉRIA SOBRE A MESA",
+            "codRegime": 21,
+            "ordem": ordem,
+            "proposicao_": {
+                "id": p["id"],
+                "uri": p["uri"],
+                "siglaTipo": p["siglaTipo"],
+                "codTipo": p["codTipo"],
+                "numero": p["numero"],
+                "ano": p["ano"],
+                "ementa": p["ementa"],
+            },
+            "relator": {
+                "id": relator["id"],
+                "uri": f"{URI_CAMARA}/deputados/{relator['id']}",
+                "nome": relator["nome"],
+                "siglaPartido": relator["siglaPartido"],
+                "siglaUf": relator["siglaUf"],
+                "idLegislatura": 57,
+            },
+            "proposicaoRelacionada_": None,
+            "regime": "Ordinário (Art. 151, III, RICD)",
+            "situacaoItem": "Não apreciado",
+            "textoParecer": f"Parecer do Relator, Dep. {relator['nome']}, pela aprovação.",
+            "titulo": f"{p['siglaTipo']} {p['numero']}/{p['ano']}",
+            "topico": "Proposições Sujeitas à Apreciação Conclusiva",
+            "uriProposicaoRelacionada": None,
+            "uriVotacao": None,
+        }
+
+    def _itens_pauta(self, n: int) -> List[Dict[str, Any]]:
+        rng = self._rng
+        itens = []
+        for ordem in range(1, n + 1):
+            fonte = self.ids_carteira if self.ids_carteira and rng.random() < 0.3 else self.ids_outras
+            itens.append(self._item_pauta(ordem, rng.choice(fonte)))
+        return itens
+
+    def _gerar_eventos(self) -> None:
+        rng = self._rng
+        for i in range(self.num_eventos):
+            ev_id = 70000 + i
+            dia = self.hoje + datetime.timedelta(days=rng.randint(-7, 7))
+            inicio = datetime.datetime.combine(dia, datetime.time(rng.choice([9, 10, 14, 16]), 0))
+            sigla = rng.choice(COMISSOES + ["PLEN"])
+            id_orgao, nome_orgao = ORGAOS[sigla]
+            deliberativa = rng.random() < 0.7
+            tipo = (
+                "Sessão Deliberativa" if sigla == "PLEN" else "Reunião Deliberativa"
+            ) if deliberativa else "Audiência Pública"
+            self.eventos.append({
+                "id": ev_id,
+                "uri": f"{URI_CAMARA}/eventos/{ev_id}",
+                "dataHoraInicio": _iso(inicio),
+                "dataHoraFim": _iso(inicio + datetime.timedelta(hours=3)) if dia < self.hoje else None,
+                "situacao": "Encerrada" if dia < self.hoje else "Convocada",
+                "descricaoTipo": tipo,
+                "descricao": f"{tipo} - {rng.choice(TEMAS)}",
+                "localExterno": None,
+                "orgaos": [{
+                    "id": id_orgao,
+                    "uri": f"{URI_CAMARA}/orgaos/{id_orgao}",
+                    "sigla": sigla,
+                    "nome": nome_orgao,
+                    "apelido": nome_orgao,
+                    "codTipoOrgao": 2 if sigla != "PLEN" else 26,
+                    "tipoOrgao": "Comissão Permanente" if sigla != "PLEN" else "Plenário Virtual",
+                    "nomePublicacao": nome_orgao,
+                    "nomeResumido": sigla,
+                }],
+                "localCamara": {"nome": f"Anexo II, Plenário {rng.randint(1, 16)}", "predio": None, "sala": None, "andar": None},
+                "urlRegistro": None,
+            })
+            self.pautas[ev_id] = self._itens_pauta(rng.randint(3, 20)) if deliberativa else []
+        self.eventos.sort(key=lambda e: e["dataHoraInicio"])
+
+        for d in range(0, 7):
+            dia = self.hoje + datetime.timedelta(days=d)
+            if dia.weekday() < 5 and rng.random() < 0.5:
+                self.pautas_plenario[dia.isoformat()] = self._itens_pauta(rng.randint(5, 25))
+
+    def _gerar_senado(self) -> None:
+        rng = self._rng
+        for i in range(81):
+            self.senadores.append({
+                "IdentificacaoParlamentar": {
+                    "CodigoParlamentar": str(5000 + i),
+                    "CodigoPublicoNaLegAtual": str(800 + i),
+                    "NomeParlamentar": self._nome(),
+                    "NomeCompletoParlamentar": f"{self._nome()} {rng.choice(SOBRENOMES)}",
+                    "SexoParlamentar": rng.choice(["Masculino", "Feminino"]),
+                    "SiglaPartidoParlamentar": rng.choice(PARTIDOS),
+                    "UfParlamentar": rng.choice(UFS),
+                }
+            })
+
+        no_senado = [
+            pid for pid in self.ids_carteira + self.ids_outras
+            if self.proposicoes[pid]["statusProposicao"]["descricaoSituacao"] == "Apreciação pelo Senado Federal"
+        ]
+        agora = datetime.datetime.combine(self.hoje, datetime.time(12, 0))
+        for i, pid in enumerate(no_senado):
+            p = self.proposicoes[pid]
+            id_proc = 8000000 + i
+            codigo = 160000 + i
+            sigla_col, nome_col = rng.choice(COLEGIADOS_SENADO)
+            chegada = datetime.datetime.fromisoformat(p["statusProposicao"]["dataHora"])
+            n_mov = rng.randint(1, 8)
+            passo = max((agora - chegada) / (n_mov + 1), datetime.timedelta(hours=1))
+            movs = []
+            for k in range(n_mov):
+                data = chegada + passo * (k + 1)
+                movs.append({
+                    "id": id_proc * 100 + k,
+                    "data": data.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "descricao": rng.choice([
+                        "Recebido o Projeto na Secretaria Legislativa do Senado.",
+                        f"Distribuído à {sigla_col}.",
+                        f"Aguardando designação do relator na {sigla_col}.",
+                        "Matéria com a relatoria.",
+                    ]),
+                    "colegiado": {"sigla": sigla_col, "nome": nome_col},
+                })
+            senador = rng.choice(self.senadores)["IdentificacaoParlamentar"]
+            self.processos_senado[id_proc] = {
+                "id": id_proc,
+                "codigoMateria": codigo,
+                "identificacao": f"{p['siglaTipo']} {p['numero']}/{p['ano']}",
+                "ementa": p["ementa"],
+                "tramitando": "Sim",
+                "situacao": "EM TRAMITAÇÃO",
+                "autuacoes": [{
+                    "siglaColegiadoControleAtual": sigla_col,
+                    "nomeColegiadoControleAtual": nome_col,
+                    "situacoes": [
+                        {"descricao": "AGUARDANDO DESIGNAÇÃO DO RELATOR", "inicio": movs[0]["data"][:10], "fim": movs[-1]["data"][:10]},
+                        {"descricao": "MATÉRIA COM A RELATORIA", "inicio": movs[-1]["data"][:10], "fim": None},
+                    ],
+                    "informesLegislativos": [
+                        {"data": m["data"], "descricao": m["descricao"], "colegiado": m["colegiado"]}
+                        for m in movs
+                    ],
+                }],
+                "movimentacoes": movs,
+                "relatorias": [{
+                    "codigoParlamentar": senador["CodigoParlamentar"],
+                    "nomeParlamentar": senador["NomeParlamentar"],
+                    "siglaPartidoParlamentar": senador["SiglaPartidoParlamentar"],
+                    "ufParlamentar": senador["UfParlamentar"],
+                    "siglaColegiado": sigla_col,
+                    "nomeColegiado": nome_col,
+                    "descricaoTipoRelator": "Relator",
+                    "dataDesignacao": movs[-1]["data"][:10],
+                    "dataDestituicao": None,
+                }],
+            }
+            self._senado_por_numero[(p["siglaTipo"], str(p["numero"]), str(p["ano"]))] = id_proc
+            self._senado_por_codigo[codigo] = id_proc
+
+    # --------------------------------------------------------
+    # Consultas usadas pelo servidor
+    # --------------------------------------------------------
+
+    def buscar_por_numero(self, sigla: str, numero: str, ano: str) -> Optional[int]:
+        return self._por_numero.get((sigla.upper(), str(int(numero)) if numero.isdigit() else numero, str(ano)))
+
+    def processo_senado_por_numero(self, sigla: str, numero: str, ano: str) -> Optional[Dict[str, Any]]:
+        numero = str(int(numero)) if numero.isdigit() else numero
+        id_proc = self._senado_por_numero.get((sigla.upper(), numero, str(ano)))
+        return self.processos_senado.get(id_proc) if id_proc else None
+
+    def processo_senado_por_codigo(self, codigo: int) -> Optional[Dict[str, Any]]:
+        id_proc = self._senado_por_codigo.get(codigo)
+        return self.processos_senado.get(id_proc) if id_proc else None
+
+    def resumo(self) -> Dict[str, Any]:
+        """Contagens do dataset (útil para conferir o tamanho do cenário)."""
+        return {
+            "seed": self.seed,
+            "hoje": self.hoje.isoformat(),
+            "carteira": len(self.ids_carteira),
+            "outras_proposicoes": len(self.ids_outras),
+            "tramitacoes": sum(len(t) for t in self.tramitacoes.values()),
+            "eventos": len(self.eventos),
+            "itens_pauta": sum(len(p) for p in self.pautas.values()),
+            "pautas_plenario": len(self.pautas_plenario),
+            "processos_senado": len(self.processos_senado),
+            "deputados": len(self.deputados),
+        }
@@ -0,0 +1,122 @@
+"""
+Injeção de latência e de falhas do mock.
+
+Especificação de latência (ms):
+    "0"                      sem atraso
+    "fixo:80"                sempre 80 ms
+    "uniforme:20-200"        uniforme entre 20 e 200 ms
+    "lognormal:120,0.6"      log-normal com mediana 120 ms e sigma 0.6
+                             (cauda longa, parecida com a API real)
+
+Por rota: "trecho=spec", onde trecho é procurado no path. A primeira
+regra que casar vence; sem regra, vale a latência padrão.
+    "/pauta=lognormal:400,0.8"
+"""
+
+import math
+import random
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def parse_latencia(spec: str) -> Callable[[random.Random], float]:
+    """
+    Converte a especificação em um sorteador de atraso (segundos).
+
+    Raises:
+        ValueError: Especificação inválida
+    """
+    spec = (spec or "0").strip().lower()
+    if spec in ("0", "nenhuma", "none"):
+        return lambda rng: 0.0
+
+    tipo, _, args = spec.partition(":")
+    try:
+        if tipo in ("fixo", "fixed"):
+            ms = float(args)
+            return lambda rng: ms / 1000
+        if tipo in ("uniforme", "uniform"):
+            lo, hi = (float(x) for x in args.split("-", 1))
+            return lambda rng: rng.uniform(lo, hi) / 1000
+        if tipo == "lognormal":
+            mediana, sigma = (float(x) for x in args.split(",", 1))
+            mu = math.log(max(mediana, 0.001))
+            return lambda rng: rng.lognormvariate(mu, sigma) / 1000
+    except ValueError:
+        pass
+    raise ValueError(f"Latência inválida: {spec!r}")
+
+
+class InjetorFalhas:
+    """
+    Sorteia atraso e falha de cada requisição.
+
+    Args:
+        latencia: Especificação da latência padrão
+        latencia_por_rota: Lista de "trecho=spec"
+        taxa_429: Probabilidade de responder 429 (com Retry-After)
+        taxa_5xx: Probabilidade de responder 500/502/503
+        retry_after: Valor do Retry-After (segundos) nas respostas 429
+        fora_do_ar: APIs que respondem sempre 503 ("camara", "senado")
+        seed: Semente (separada da do dataset)
+    """
+
+    def __init__(
+        self,
+        latencia: str = "0",
+        latencia_por_rota: Optional[List[str]] = None,
+        taxa_429: float = 0.0,
+        taxa_5xx: float = 0.0,
+        retry_after: int = 1,
+        fora_do_ar: Optional[List[str]] = None,
+        seed: int = 42
+    ):
+        self._padrao = parse_latencia(latencia)
+        self._rotas: List[Tuple[str, Callable[[random.Random], float]]] = []
+        for regra in latencia_por_rota or []:
+            trecho, _, spec = regra.partition("=")
+            if not spec:
+                raise ValueError(f"Regra de latência inválida: {regra!r} (use trecho=spec)")
+            self._rotas.append((trecho, parse_latencia(spec)))
+        self.taxa_429 = taxa_429
+        self.taxa_5xx = taxa_5xx
+        self.retry_after = retry_after
+        self.fora_do_ar = {a.lower() for a in (fora_do_ar or [])}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._contagem: Dict[str, int] = {"429": 0, "5xx": 0, "fora_do_ar": 0}
+
+    def atraso(self, path: str) -> float:
+        """Atraso (segundos) da requisição."""
+        sorteio = self._padrao
+        for trecho, fn in self._rotas:
+            if trecho in path:
+                sorteio = fn
+                break
+        with self._lock:
+            return sorteio(self._rng)
+
+    def falha(self, api: str) -> Optional[Tuple[int, Dict[str, str]]]:
+        """
+        Falha sorteada para a requisição.
+
+        Returns:
+            (status, headers) ou None se a requisição deve seguir normal
+        """
+        if api in self.fora_do_ar:
+            with self._lock:
+                self._contagem["fora_do_ar"] += 1
+            return 503, {}
+        with self._lock:
+            sorteio = self._rng.random()
+            if sorteio < self.taxa_429:
+                self._contagem["429"] += 1
+                return 429, {"Retry-After": str(self.retry_after)}
+            if sorteio < self.taxa_429 + self.taxa_5xx:
+                self._contagem["5xx"] += 1
+                return self._rng.choice([500, 502, 503]), {}
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._contagem)
@@ -0,0 +1,156 @@
+"""
+Respostas gravadas (fixtures) do mock: replay e gravação.
+
+Cada arquivo mock_api/fixtures/*.json tem o formato:
+
+    {
+      "respostas": [
+        {
+          "path": "/api/v2/proposicoes/2570510",
+          "query": {},
+          "status": 200,
+          "content_type": "application/json",
+          "body": {...}            # ou "body_text": "<xml...>"
+        }
+      ]
+    }
+
+Os paths usam o prefixo do mock (/api/v2 para a Câmara, /dadosabertos
+para o Senado). Na hora de responder, as URLs da API real dentro do
+corpo (links de paginação, uris) são trocadas pela URL do mock.
+
+Com gravação ligada, requisições sem fixture são repassadas à API real
+e a resposta é salva em fixtures/gravado_<data>.json.
+"""
+
+import json
+import datetime
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+PREFIXO_CAMARA = "/api/v2"
+PREFIXO_SENADO = "/dadosabertos"
+URL_REAL_CAMARA = "https://dadosabertos.camara.leg.br/api/v2"
+URL_REAL_SENADO = "https://legis.senado.leg.br/dadosabertos"
+
+
+def _chave(path: str, query: Dict[str, str]) -> Tuple[str, str]:
+    return path.rstrip("/"), urlencode(sorted(query.items()))
+
+
+class FixtureStore:
+    """Fixtures carregadas em memória, indexadas por path + query."""
+
+    def __init__(self, pasta: Optional[Path] = None, gravar: bool = False):
+        self.pasta = Path(pasta) if pasta else FIXTURES_DIR
+        self.gravar = gravar
+        self._lock = threading.Lock()
+        self._respostas: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._gravadas: List[Dict[str, Any]] = []
+        self._arquivo_gravacao = self.pasta / f"gravado_{datetime.date.today():%Y%m%d}.json"
+        self.carregar()
+        if gravar and self._arquivo_gravacao.exists():
+            with open(self._arquivo_gravacao, encoding="utf-8") as f:
+                self._gravadas = json.load(f).get("respostas", [])
+
+    def carregar(self) -> int:
+        """(Re)carrega os arquivos da pasta; retorna o número de respostas."""
+        respostas = {}
+        if self.pasta.is_dir():
+            for arquivo in sorted(self.pasta.glob("*.json")):
+                try:
+                    with open(arquivo, encoding="utf-8") as f:
+                        conteudo = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"[MOCK] Fixture ignorada ({arquivo.name}): {e}")
+                    continue
+                for r in conteudo.get("respostas", []):
+                    query = {str(k): str(v) for k, v in (r.get("query") or {}).items()}
+                    respostas[_chave(r["path"], query)] = r
+        with self._lock:
+            self._respostas = respostas
+        return len(respostas)
+
+    def __len__(self) -> int:
+        return len(self._respostas)
+
+    def buscar(
+        self,
+        path: str,
+        query: Dict[str, str],
+        url_mock: str
+    ) -> Optional[Tuple[int, str, bytes]]:
+        """
+        Resposta gravada para path + query.
+
+        Returns:
+            (status, content_type, corpo) ou None
+        """
+        r = self._respostas.get(_chave(path, query))
+        if r is None:
+            return None
+        if "body_text" in r:
+            texto = r["body_text"]
+        else:
+            texto = json.dumps(r.get("body"), ensure_ascii=False)
+        texto = (
+            texto.replace(URL_REAL_CAMARA, url_mock + PREFIXO_CAMARA)
+                 .replace(URL_REAL_SENADO, url_mock + PREFIXO_SENADO)
+        )
+        return r.get("status", 200), r.get("content_type", "application/json"), texto.encode("utf-8")
+
+    def gravar_da_api_real(
+        self,
+        path: str,
+        query: Dict[str, str],
+        accept: str,
+        url_mock: str
+    ) -> Optional[Tuple[int, str, bytes]]:
+        """Busca path + query na API real, salva como fixture e devolve."""
+        if path.startswith(PREFIXO_CAMARA):
+            url = URL_REAL_CAMARA + path[len(PREFIXO_CAMARA):]
+        elif path.startswith(PREFIXO_SENADO):
+            url = URL_REAL_SENADO + path[len(PREFIXO_SENADO):]
+        else:
+            return None
+        if query:
+            url += "?" + urlencode(query)
+
+        req = urllib.request.Request(url, headers={
+            "User-Agent": "MonitorZanatta-mock/1.0 (gravacao de fixtures)",
+            "Accept": accept or "application/json",
+        })
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                status, content_type, corpo = resp.status, resp.headers.get("Content-Type", ""), resp.read()
+        except urllib.error.HTTPError as e:
+            status, content_type, corpo = e.code, e.headers.get("Content-Type", ""), e.read()
+        except (urllib.error.URLError, OSError) as e:
+            print(f"[MOCK] Falha ao gravar {url}: {e}")
+            return None
+
+        texto = corpo.decode("utf-8", errors="replace")
+        registro: Dict[str, Any] = {
+            "path": path.rstrip("/"),
+            "query": query,
+            "status": status,
+            "content_type": content_type.split(";")[0] or "application/json",
+        }
+        try:
+            registro["body"] = json.loads(texto)
+        except ValueError:
+            registro["body_text"] = texto
+
+        with self._lock:
+            self._respostas[_chave(path, query)] = registro
+            self._gravadas.append(registro)
+            self.pasta.mkdir(parents=True, exist_ok=True)
+            with open(self._arquivo_gravacao, "w", encoding="utf-8") as f:
+                json.dump({"respostas": self._gravadas}, f, ensure_ascii=False, indent=1)
+        return self.buscar(path, query, url_mock)
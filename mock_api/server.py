@@ -0,0 +1,569 @@
+"""
+Servidor HTTP local que imita as APIs da Câmara e do Senado.
+
+REGRAS:
+- Só biblioteca padrão (roda no runner do GitHub sem dependências)
+- SEM importar core: o core lê MONITOR_CAMARA_BASE_URL /
+  MONITOR_SENADO_BASE_URL na importação, então o mock sobe antes
+- Ordem de resposta: falha injetada > fixture gravada > dataset sintético
+
+Rotas (prefixo /api/v2 = Câmara, /dadosabertos = Senado):
+    /api/v2/proposicoes                        (paginado: itens/pagina)
+    /api/v2/proposicoes/{id}
+    /api/v2/proposicoes/{id}/tramitacoes|relatores|autores|relacionadas
+    /api/v2/eventos                            (paginado)
+    /api/v2/eventos/{id}/pauta
+    /api/v2/pautas/orgaos/180/datas/{AAAA-MM-DD}
+    /api/v2/deputados                          (paginado)
+    /dadosabertos/processo?sigla=&numero=&ano=
+    /dadosabertos/processo/{id}
+    /dadosabertos/processo/{id}/movimentacoes
+    /dadosabertos/processo/relatoria?idProcesso=|codigoMateria=
+    /dadosabertos/materia/relatorias/{codigo}  (XML, ou JSON com Accept)
+    /dadosabertos/materia/pesquisa/lista       (XML, ou JSON com Accept/formato)
+    /dadosabertos/senador/lista/atual          (XML, ou JSON com Accept)
+    /__mock__/stats                            (contadores do mock)
+
+Uso:
+    with MockApiServer(MockDataset(carteira=300)) as mock:
+        os.environ.update(mock.env())
+        ...  # importar core.* depois daqui
+"""
+
+import re
+import json
+import math
+import time
+import hashlib
+import threading
+import unicodedata
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from .dataset import MockDataset, URI_CAMARA
+from .faults import InjetorFalhas
+from .fixtures import FixtureStore, PREFIXO_CAMARA, PREFIXO_SENADO
+
+
+# ============================================================
+# CONFIGURAÇÕES
+# ============================================================
+
+ITENS_PADRAO = 15
+ITENS_MAXIMO = 100
+
+# Listas que viram <plural><singular/>...</plural> no XML do Senado
+_XML_SINGULAR = {
+    "autuacoes": "autuacao",
+    "situacoes": "situacao",
+    "informesLegislativos": "informeLegislativo",
+}
+
+
+def _norm(texto: str) -> str:
+    texto = unicodedata.normalize("NFD", texto or "")
+    return "".join(c for c in texto if unicodedata.category(c) != "Mn").lower()
+
+
+def _csv(valor: Optional[str]) -> List[str]:
+    return [v.strip() for v in (valor or "").split(",") if v.strip()]
+
+
+def _para_xml(pai: ET.Element, chave: str, valor: Any) -> None:
+    if isinstance(valor, dict):
+        el = ET.SubElement(pai, chave)
+        for k, v in valor.items():
+            _para_xml(el, k, v)
+    elif isinstance(valor, list):
+        if chave in _XML_SINGULAR:
+            el = ET.SubElement(pai, chave)
+            for v in valor:
+                _para_xml(el, _XML_SINGULAR[chave], v)
+        else:
+            for v in valor:
+                _para_xml(pai, chave, v)
+    else:
+        el = ET.SubElement(pai, chave)
+        if valor is not None:
+            el.text = str(valor)
+
+
+def xml_bytes(raiz: str, conteudo: Dict[str, Any]) -> bytes:
+    """Serializa um dict no formato XML dos serviços legados do Senado."""
+    el = ET.Element(raiz)
+    for k, v in conteudo.items():
+        _para_xml(el, k, v)
+    return b'<?xml version="1.0" encoding="UTF-8"?>' + ET.tostring(el, encoding="utf-8")
+
+
+class _Resposta:
+    """Resposta montada por uma rota."""
+
+    __slots__ = ("status", "corpo", "headers")
+
+    def __init__(self, status: int, corpo: Any = None, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.corpo = corpo          # dict/list (JSON) ou bytes (XML)
+        self.headers = headers or {}
+
+
+def _nao_encontrado(detalhe: str = "Recurso não encontrado") -> _Resposta:
+    return _Resposta(404, {"status": 404, "title": "Not Found", "detail": detalhe})
+
+
+# ============================================================
+# ROTAS
+# ============================================================
+
+class _Rotas:
+    """Resolve path + query contra o dataset."""
+
+    def __init__(self, dataset: MockDataset, materia_xml: bool = False):
+        self.ds = dataset
+        self.materia_xml = materia_xml
+        self._tabela = [
+            (re.compile(r"^/api/v2/proposicoes$"), self.proposicoes),
+            (re.compile(r"^/api/v2/proposicoes/(\d+)$"), self.proposicao),
+            (re.compile(r"^/api/v2/proposicoes/(\d+)/(tramitacoes|relatores|autores|relacionadas)$"), self.sub_proposicao),
+            (re.compile(r"^/api/v2/eventos$"), self.eventos),
+            (re.compile(r"^/api/v2/eventos/(\d+)/pauta$"), self.pauta_evento),
+            (re.compile(r"^/api/v2/pautas/orgaos/(\d+)/datas/(\d{4}-\d{2}-\d{2})$"), self.pauta_orgao),
+            (re.compile(r"^/api/v2/deputados$"), self.deputados),
+            (re.compile(r"^/dadosabertos/processo$"), self.processo_busca),
+            (re.compile(r"^/dadosabertos/processo/relatoria$"), self.processo_relatoria),
+            (re.compile(r"^/dadosabertos/processo/(\d+)$"), self.processo),
+            (re.compile(r"^/dadosabertos/processo/(\d+)/movimentacoes$"), self.processo_movimentacoes),
+            (re.compile(r"^/dadosabertos/materia/relatorias/(\d+)$"), self.materia_relatorias),
+            (re.compile(r"^/dadosabertos/materia/pesquisa/lista$"), self.materia_pesquisa),
+            (re.compile(r"^/dadosabertos/senador/lista/atual$"), self.senadores),
+        ]
+
+    def resolver(self, path: str, query: Dict[str, str], accept: str, base: str) -> Tuple[str, _Resposta]:
+        """
+        Returns:
+            (nome da rota, resposta)
+        """
+        # Serviços legados do Senado aceitam sufixo .json/.xml
+        if path.startswith(PREFIXO_SENADO) and path.endswith((".json", ".xml")):
+            accept = "application/json" if path.endswith(".json") else "application/xml"
+            path = path.rsplit(".", 1)[0]
+        for regex, fn in self._tabela:
+            m = regex.match(path)
+            if m:
+                return fn.__name__, fn(*m.groups(), query=query, accept=accept, base=base, path=path)
+        return "desconhecida", _nao_encontrado(f"Rota não implementada no mock: {path}")
+
+    # --------------------------------------------------------
+    # Câmara
+    # --------------------------------------------------------
+
+    def _paginar(self, itens: List[Any], query: Dict[str, str], base: str, path: str) -> _Resposta:
+        try:
+            por_pagina = min(max(int(query.get("itens") or ITENS_PADRAO), 1), ITENS_MAXIMO)
+            pagina = max(int(query.get("pagina") or 1), 1)
+        except ValueError:
+            return _Resposta(400, {"status": 400, "title": "Bad Request", "detail": "itens/pagina inválidos"})
+        ultima = max(math.ceil(len(itens) / por_pagina), 1)
+
+        def link(rel: str, n: int) -> Dict[str, str]:
+            q = dict(query, pagina=str(n), itens=str(por_pagina))
+            return {"rel": rel, "href": f"{base}{path}?{urlencode(q)}"}
+
+        links = [link("self", pagina), link("first", 1)]
+        if pagina > 1:
+            links.append(link("prev", pagina - 1))
+        if pagina < ultima:
+            links.append(link("next", pagina + 1))
+        links.append(link("last", ultima))
+        inicio = (pagina - 1) * por_pagina
+        return _Resposta(200, {"dados": itens[inicio:inicio + por_pagina], "links": links})
+
+    @staticmethod
+    def _ordenar(itens: List[Dict[str, Any]], query: Dict[str, str], padrao: str) -> List[Dict[str, Any]]:
+        campo = query.get("ordenarPor") or padrao
+        reverso = (query.get("ordem") or "ASC").upper() == "DESC"
+        return sorted(itens, key=lambda x: (x.get(campo) is None, str(x.get(campo) or "").zfill(12)), reverse=reverso)
+
+    @staticmethod
+    def _item_lista(p: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: p[k] for k in ("id", "uri", "siglaTipo", "codTipo", "numero", "ano", "ementa")}
+
+    def proposicoes(self, query, base, path, **_):
+        ds = self.ds
+        if query.get("id"):
+            ids = [int(i) for i in _csv(query["id"]) if i.isdigit()]
+        elif query.get("idDeputadoAutor"):
+            ids = []
+            for autor in _csv(query["idDeputadoAutor"]):
+                ids.extend(ds.ids_por_autor.get(int(autor), []) if autor.isdigit() else [])
+        else:
+            ids = ds.ids_outras + ds.ids_carteira
+
+        tipos = {t.upper() for t in _csv(query.get("siglaTipo"))}
+        anos = set(_csv(query.get("ano")))
+        numeros = {n.lstrip("0") for n in _csv(query.get("numero"))}
+        desde = query.get("dataApresentacaoInicio") or ""
+        ate = query.get("dataApresentacaoFim") or ""
+        termo = _norm(query.get("keywords") or "")
+
+        itens = []
+        for pid in dict.fromkeys(ids):
+            p = ds.proposicoes.get(pid)
+            if p is None:
+                continue
+            if tipos and p["siglaTipo"] not in tipos:
+                continue
+            if anos and str(p["ano"]) not in anos:
+                continue
+            if numeros and str(p["numero"]) not in numeros:
+                continue
+            if desde and p["dataApresentacao"][:10] < desde[:10]:
+                continue
+            if ate and p["dataApresentacao"][:10] > ate[:10]:
+                continue
+            if termo and termo not in _norm(p["ementa"]):
+                continue
+            itens.append(self._item_lista(p))
+        return self._paginar(self._ordenar(itens, query, "id"), query, base, path)
+
+    def proposicao(self, prop_id, **_):
+        p = self.ds.proposicoes.get(int(prop_id))
+        if p is None:
+            return _nao_encontrado(f"Proposição {prop_id} não encontrada")
+        return _Resposta(200, {"dados": p, "links": [{"rel": "self", "href": p["uri"]}]})
+
+    def sub_proposicao(self, prop_id, recurso, query, **_):
+        pid = int(prop_id)
+        if pid not in self.ds.proposicoes:
+            return _nao_encontrado(f"Proposição {prop_id} não encontrada")
+        dados = getattr(self.ds, recurso).get(pid, [])
+        if recurso == "tramitacoes":
+            # Como na API real: lista completa em ordem cronológica,
+            # filtrável por dataInicio/dataFim (itens/ordem são ignorados)
+            desde = query.get("dataInicio") or ""
+            ate = query.get("dataFim") or ""
+            dados = [
+                t for t in dados
+                if (not desde or t["dataHora"][:10] >= desde[:10])
+                and (not ate or t["dataHora"][:10] <= ate[:10])
+            ]
+        return _Resposta(200, {"dados": dados, "links": []})
+
+    def eventos(self, query, base, path, **_):
+        desde = query.get("dataInicio") or ""
+        ate = query.get("dataFim") or ""
+        orgaos = set(_csv(query.get("idOrgao")))
+        itens = [
+            e for e in self.ds.eventos
+            if (not desde or e["dataHoraInicio"][:10] >= desde[:10])
+            and (not ate or e["dataHoraInicio"][:10] <= ate[:10])
+            and (not orgaos or any(str(o["id"]) in orgaos for o in e["orgaos"]))
+        ]
+        return self._paginar(self._ordenar(itens, query, "dataHoraInicio"), query, base, path)
+
+    def pauta_evento(self, ev_id, **_):
+        pauta = self.ds.pautas.get(int(ev_id))
+        if pauta is None:
+            return _nao_encontrado(f"Evento {ev_id} não encontrado")
+        return _Resposta(200, {"dados": pauta, "links": []})
+
+    def pauta_orgao(self, id_orgao, data, **_):
+        itens = self.ds.pautas_plenario.get(data) if id_orgao == "180" else None
+        if not itens:
+            return _nao_encontrado(f"Sem pauta para o órgão {id_orgao} em {data}")
+        return _Resposta(200, {"dados": {"data": data, "proposicoes": itens}, "links": []})
+
+    def deputados(self, query, base, path, **_):
+        nome = _norm(query.get("nome") or "")
+        ufs = {u.upper() for u in _csv(query.get("siglaUf"))}
+        partidos = {p.upper() for p in _csv(query.get("siglaPartido"))}
+        ids = set(_csv(query.get("id")))
+        itens = [
+            d for d in self.ds.deputados
+            if (not nome or nome in _norm(d["nome"]))
+            and (not ufs or d["siglaUf"] in ufs)
+            and (not partidos or d["siglaPartido"] in partidos)
+            and (not ids or str(d["id"]) in ids)
+        ]
+        return self._paginar(self._ordenar(itens, query, "nome"), query, base, path)
+
+    # --------------------------------------------------------
+    # Senado
+    # --------------------------------------------------------
+
+    def _quer_json(self, accept: str, query: Dict[str, str], legado: bool) -> bool:
+        if (query.get("formato") or "").lower() == "json":
+            return not (legado and self.materia_xml)
+        if legado:
+            return "json" in accept and not self.materia_xml
+        return "xml" not in accept or "json" in accept
+
+    @staticmethod
+    def _processo_publico(proc: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in proc.items() if k not in ("movimentacoes", "relatorias")}
+
+    def processo_busca(self, query, **_):
+        proc = self.ds.processo_senado_por_numero(
+            query.get("sigla") or "", query.get("numero") or "", query.get("ano") or ""
+        )
+        if proc is None:
+            return _Resposta(200, [])
+        return _Resposta(200, [{
+            k: proc[k] for k in ("id", "codigoMateria", "identificacao", "ementa", "tramitando", "situacao")
+        }])
+
+    def processo(self, id_proc, query, accept, **_):
+        proc = self.ds.processos_senado.get(int(id_proc))
+        if proc is None:
+            return _nao_encontrado(f"Processo {id_proc} não encontrado")
+        publico = self._processo_publico(proc)
+        if self._quer_json(accept, query, legado=False):
+            return _Resposta(200, publico)
+        return _Resposta(200, xml_bytes("processo", publico))
+
+    def processo_movimentacoes(self, id_proc, **_):
+        proc = self.ds.processos_senado.get(int(id_proc))
+        if proc is None:
+            return _nao_encontrado(f"Processo {id_proc} não encontrado")
+        return _Resposta(200, proc["movimentacoes"])
+
+    def processo_relatoria(self, query, **_):
+        proc = None
+        if (query.get("idProcesso") or "").isdigit():
+            proc = self.ds.processos_senado.get(int(query["idProcesso"]))
+        elif (query.get("codigoMateria") or "").isdigit():
+            proc = self.ds.processo_senado_por_codigo(int(query["codigoMateria"]))
+        return _Resposta(200, proc["relatorias"] if proc else [])
+
+    def materia_relatorias(self, codigo, query, accept, **_):
+        proc = self.ds.processo_senado_por_codigo(int(codigo))
+        if proc is None:
+            return _nao_encontrado(f"Matéria {codigo} não encontrada")
+        conteudo = {
+            "Materia": {"Codigo": proc["codigoMateria"], "Identificacao": proc["identificacao"]},
+            "Relatorias": {"Relatoria": [{
+                "IdentificacaoParlamentar": {
+                    "CodigoParlamentar": r["codigoParlamentar"],
+                    "NomeParlamentar": r["nomeParlamentar"],
+                    "SiglaPartidoParlamentar": r["siglaPartidoParlamentar"],
+                    "UfParlamentar": r["ufParlamentar"],
+                },
+                "DescricaoTipoRelator": r["descricaoTipoRelator"],
+                "DataDesignacao": r["dataDesignacao"],
+                "DataDestituicao": r["dataDestituicao"],
+                "SiglaColegiado": r["siglaColegiado"],
+                "NomeColegiado": r["nomeColegiado"],
+            } for r in proc["relatorias"]]},
+        }
+        if self._quer_json(accept, query, legado=True):
+            return _Resposta(200, {"MateriaRelatorias": conteudo})
+        return _Resposta(200, xml_bytes("MateriaRelatorias", conteudo))
+
+    def materia_pesquisa(self, query, accept, **_):
+        termo = _norm(query.get("texto") or "")
+        materias = []
+        for proc in self.ds.processos_senado.values():
+            if termo and termo not in _norm(proc["ementa"]):
+                continue
+            sigla, _, resto = proc["identificacao"].partition(" ")
+            numero, _, ano = resto.partition("/")
+            materias.append({
+                "IdentificacaoMateria": {
+                    "CodigoMateria": proc["codigoMateria"],
+                    "SiglaSubtipoMateria": sigla,
+                    "NumeroMateria": numero,
+                    "AnoMateria": ano,
+                    "IdentificacaoProcesso": proc["id"],
+                },
+                "EmentaMateria": proc["ementa"],
+            })
+        conteudo = {"Materias": {"Materia": materias}}
+        if self._quer_json(accept, query, legado=True):
+            return _Resposta(200, {"PesquisaBasicaMateria": conteudo})
+        return _Resposta(200, xml_bytes("PesquisaBasicaMateria", conteudo))
+
+    def senadores(self, query, accept, **_):
+        conteudo = {"Parlamentares": {"Parlamentar": self.ds.senadores}}
+        if self._quer_json(accept, query, legado=True):
+            return _Resposta(200, {"ListaParlamentarEmExercicio": conteudo})
+        return _Resposta(200, xml_bytes("ListaParlamentarEmExercicio", conteudo))
+
+
+# ============================================================
+# SERVIDOR
+# ============================================================
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "MonitorZanattaMock/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        if self.server.mock.verbose:
+            super().log_message(fmt, *args)
+
+    def do_GET(self):
+        mock: MockApiServer = self.server.mock
+        partes = urlsplit(self.path)
+        path = partes.path.rstrip("/") or "/"
+        query = dict(parse_qsl(partes.query, keep_blank_values=True))
+        accept = (self.headers.get("Accept") or "").lower()
+
+        if path == "/__mock__/stats":
+            self._enviar(200, "application/json", json.dumps(mock.stats(), ensure_ascii=False).encode("utf-8"))
+            return
+
+        api = "camara" if path.startswith(PREFIXO_CAMARA) else "senado" if path.startswith(PREFIXO_SENADO) else ""
+        atraso = mock.falhas.atraso(path)
+        if atraso > 0:
+            time.sleep(atraso)
+
+        falha = mock.falhas.falha(api) if api else None
+        if falha:
+            status, headers = falha
+            mock._contar("falha_injetada", status)
+            corpo = json.dumps({"status": status, "title": "Erro injetado pelo mock"}).encode("utf-8")
+            self._enviar(status, "application/json", corpo, headers)
+            return
+
+        gravada = mock.fixtures.buscar(path, query, mock.url) if mock.fixtures else None
+        if gravada is None and mock.fixtures and mock.fixtures.gravar:
+            gravada = mock.fixtures.gravar_da_api_real(path, query, accept, mock.url)
+        if gravada is not None:
+            status, content_type, corpo = gravada
+            mock._contar("fixture", status)
+            self._enviar(status, content_type, corpo)
+            return
+
+        rota, resp = mock.rotas.resolver(path, query, accept, mock.url)
+        mock._contar(rota, resp.status)
+        if isinstance(resp.corpo, bytes):
+            content_type, corpo = "application/xml", resp.corpo
+        else:
+            texto = json.dumps(resp.corpo, ensure_ascii=False)
+            corpo = texto.replace(URI_CAMARA, mock.camara_base_url).encode("utf-8")
+            content_type = "application/json"
+        self._enviar(resp.status, content_type, corpo, resp.headers)
+
+    def _enviar(self, status: int, content_type: str, corpo: bytes, headers: Optional[Dict[str, str]] = None):
+        # ETag permite exercitar a revalidação (304) do cache HTTP em disco
+        etag = '"' + hashlib.md5(corpo).hexdigest() + '"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+
+class MockApiServer:
+    """
+    Mock das APIs da Câmara e do Senado rodando em uma thread.
+
+    Args:
+        dataset: Dados servidos (padrão: MockDataset())
+        host: Interface de escuta
+        porta: Porta (0 = escolhida pelo sistema)
+        falhas: Injetor de latência/falhas (padrão: sem atraso nem falha)
+        fixtures: Respostas gravadas (têm prioridade sobre o dataset)
+        materia_xml: Serviços /materia e /senador sempre em XML
+        verbose: Logar cada requisição
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[MockDataset] = None,
+        host: str = "127.0.0.1",
+        porta: int = 0,
+        falhas: Optional[InjetorFalhas] = None,
+        fixtures: Optional[FixtureStore] = None,
+        materia_xml: bool = False,
+        verbose: bool = False
+    ):
+        self.dataset = dataset or MockDataset()
+        self.falhas = falhas or InjetorFalhas()
+        self.fixtures = fixtures
+        self.materia_xml = materia_xml
+        self.rotas = _Rotas(self.dataset, materia_xml=materia_xml)
+        self.verbose = verbose
+        self._lock = threading.Lock()
+        self._contagem: Dict[str, Dict[str, int]] = {}
+        self._httpd = ThreadingHTTPServer((host, porta), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, porta = self._httpd.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    @property
+    def camara_base_url(self) -> str:
+        return self.url + PREFIXO_CAMARA
+
+    @property
+    def senado_base_url(self) -> str:
+        return self.url + PREFIXO_SENADO
+
+    def env(self) -> Dict[str, str]:
+        """Variáveis de ambiente que apontam o monitor para este mock."""
+        return {
+            "MONITOR_CAMARA_BASE_URL": self.camara_base_url,
+            "MONITOR_SENADO_BASE_URL": self.senado_base_url,
+        }
+
+    def usar_dataset(self, dataset: MockDataset) -> None:
+        """
+        Troca o dataset servido sem trocar a porta (o core lê as URLs base
+        uma vez só, na importação).
+        """
+        self.dataset = dataset
+        self.rotas = _Rotas(dataset, materia_xml=self.materia_xml)
+
+    def _contar(self, rota: str, status: int) -> None:
+        with self._lock:
+            por_status = self._contagem.setdefault(rota, {})
+            por_status[str(status)] = por_status.get(str(status), 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Requisições por rota/status, falhas injetadas e tamanho do dataset."""
+        with self._lock:
+            rotas = {r: dict(s) for r, s in self._contagem.items()}
+        return {
+            "requisicoes": sum(sum(s.values()) for s in rotas.values()),
+            "rotas": rotas,
+            "falhas": self.falhas.stats(),
+            "fixtures": len(self.fixtures) if self.fixtures else 0,
+            "dataset": self.dataset.resumo(),
+        }
+
+    def start(self) -> "MockApiServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-api", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread = None
+
+    def __enter__(self) -> "MockApiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
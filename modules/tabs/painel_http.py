@@ -0,0 +1,111 @@
+# modules/tabs/painel_http.py
+"""
+Painel de diagnóstico HTTP (apenas admin)
+
+Funcionalidades:
+- Totais do processo (requisições, retries, erros, bytes, cache)
+- Tabela por endpoint, ordenada pelo tempo gasto em rede
+- Histograma de latência do endpoint selecionado
+- Estado dos circuit breakers, hedging e single-flight
+- Concorrência escolhida pelo controlador AIMD dos mapas de status
+- Download do snapshot em JSON
+
+Desenvolvido por Lucas Pinheiro para o Gabinete da Dep. Júlia Zanatta
+"""
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import streamlit as st
+
+from core.services.http_metrics import get_http_metrics, reset_http_metrics
+from core.services.http_client import (
+    get_circuit_breaker_state,
+    get_latency_stats,
+    get_single_flight_stats,
+)
+from core.services.response_cache import get_cache_stats
+
+
+def render_painel_http() -> None:
+    """Painel de métricas HTTP do processo do Streamlit."""
+    snap = get_http_metrics()
+    total = snap["total"]
+
+    st.caption(f"Coletado desde {snap['inicio']} ({snap['duracao_s']:.0f}s)")
+
+    c1, c2, c3, c4, c5 = st.columns(5)
+    c1.metric("Requisições", total["requisicoes"])
+    c2.metric("Retries", total["retries"])
+    c3.metric("Erros", total["erros"])
+    c4.metric("Tempo em rede", f"{total['tempo_total_s']:.1f}s")
+    c5.metric("Recebido", f"{total['bytes'] / 1024:.0f} KB")
+
+    latencias = get_latency_stats()
+    endpoints = snap["endpoints"]
+    if endpoints:
+        linhas = []
+        for ep, e in endpoints.items():
+            pct = latencias["endpoints"].get(ep, {})
+            linhas.append({
+                "Endpoint": ep,
+                "Req": e["requisicoes"],
+                "Tempo (s)": e["tempo_total_s"],
+                "Média (ms)": e["latencia_media_ms"],
+                "p95 (ms)": pct.get("p95_ms"),
+                "p99 (ms)": pct.get("p99_ms"),
+                "Retries": e["retries"],
+                "Erros": sum(e["erros"].values()),
+                "KB": round(e["bytes"] / 1024, 1),
+                "Cache hit": e["cache_hit_ratio"],
+            })
+        st.dataframe(pd.DataFrame(linhas), use_container_width=True, hide_index=True)
+
+        ep_sel = st.selectbox("Histograma de latência", list(endpoints.keys()), key="painel_http_ep")
+        if ep_sel:
+            hist = endpoints[ep_sel]["histograma"]
+            st.bar_chart(pd.DataFrame({"Requisições": list(hist.values())}, index=list(hist.keys())))
+            if endpoints[ep_sel]["erros"]:
+                st.write("Erros por classe:", endpoints[ep_sel]["erros"])
+    else:
+        st.info("Nenhuma requisição registrada ainda.")
+
+    col_cb, col_cache = st.columns(2)
+    with col_cb:
+        st.markdown("**Circuit breakers**")
+        breakers = get_circuit_breaker_state()
+        if breakers:
+            st.dataframe(
+                pd.DataFrame.from_dict(breakers, orient="index"),
+                use_container_width=True,
+            )
+        else:
+            st.caption("Nenhum host acessado.")
+        st.markdown("**Hedging / single-flight**")
+        st.json({"hedge": latencias["hedge"], "single_flight": get_single_flight_stats()}, expanded=False)
+        st.markdown("**Concorrência (AIMD)**")
+        concorrencia = snap.get("concorrencia") or {}
+        if concorrencia:
+            st.dataframe(
+                pd.DataFrame.from_dict(concorrencia, orient="index"),
+                use_container_width=True,
+            )
+        else:
+            st.caption("Nenhum mapa de status construído ainda.")
+    with col_cache:
+        st.markdown("**Cache HTTP em disco**")
+        st.json(get_cache_stats(), expanded=False)
+
+    col_dl, col_reset = st.columns(2)
+    with col_dl:
+        st.download_button(
+            "⬇️ Baixar métricas (JSON)",
+            data=json.dumps(snap, ensure_ascii=False, indent=2),
+            file_name="metricas_http.json",
+            mime="application/json",
+        )
+    with col_reset:
+        if st.button("🧹 Zerar métricas", key="painel_http_reset"):
+            reset_http_metrics()
+            st.rerun()
@@ -0,0 +1,129 @@
+# modules/tabs/status_progressivo.py
+"""
+Carregamento progressivo do mapa de status (Abas 5, 6 e 7)
+
+Funcionalidades:
+- Consome os iteradores do DataProvider (iter_proposicoes_status_map /
+  iter_status_map_rics), que entregam (id, status) à medida que ficam prontos
+- Tabela prévia com todas as linhas: as que o store já tinha aparecem
+  na hora, as demais mostram "⏳" até chegarem
+- Barra de progresso no lugar do spinner
+- A prévia é leve (sem enrich): o enriquecimento completo roda uma vez
+  só no fim, na aba
+- status_map_sessao guarda os status prontos no session_state (TTL de
+  15 min): reruns e filtros reaproveitam e só ids novos vão ao fluxo
+
+Desenvolvido por Lucas Pinheiro para o Gabinete da Dep. Júlia Zanatta
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import pandas as pd
+import streamlit as st
+
+# Redesenhar a prévia no máximo a cada INTERVALO_S (cada redesenho
+# reenvia a tabela inteira ao navegador)
+INTERVALO_S = 0.4
+PENDENTE = "⏳"
+
+# Validade dos status guardados no session_state (mesmo TTL do cache antigo)
+TTL_SESSAO_S = 900
+
+
+def _previa(df_base: pd.DataFrame, status_map: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    ids = df_base["id"].astype(str)
+
+    def campo(nome: str):
+        return ids.map(lambda x: status_map[x].get(nome) or "—" if x in status_map else PENDENTE)
+
+    col_prop = "Proposicao" if "Proposicao" in df_base.columns else "id"
+    return pd.DataFrame({
+        "Proposição": df_base[col_prop].values,
+        "Situação atual": campo("situacao").values,
+        "Órgão (sigla)": campo("siglaOrgao").values,
+        "Relator(a)": campo("relator").values,
+        "Andamento (status)": campo("andamento").values,
+    })
+
+
+def carregar_status_progressivo(
+    eventos: Iterable[Tuple[str, Dict[str, Any]]],
+    df_base: pd.DataFrame,
+    rotulo: str = "Carregando status",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Consome (id, status) mostrando progresso e tabela parcial.
+
+    Args:
+        eventos: Iterador de (id, status) do DataProvider (FluxoStatus:
+            o atributo em_cache diz quantos chegam sem ir à rede)
+        df_base: Linhas a exibir (precisa da coluna "id")
+        rotulo: Texto da barra de progresso
+
+    Returns:
+        Mapa id -> status completo (mesmo formato de build_*_status_map)
+    """
+    total = max(len(df_base), 1)
+    em_cache = getattr(eventos, "em_cache", 0)
+    barra = st.progress(0.0, text=f"{rotulo}…")
+    area = st.empty()
+    status_map: Dict[str, Dict[str, Any]] = {}
+    ultimo = 0.0
+
+    try:
+        for pid, status in eventos:
+            status_map[str(pid)] = status
+            agora = time.monotonic()
+            # Fim do lote do cache: desenha antes de esperar pela rede
+            if agora - ultimo < INTERVALO_S and len(status_map) != em_cache:
+                continue
+            ultimo = agora
+            n = len(status_map)
+            barra.progress(min(n / total, 1.0), text=f"{rotulo}: {n}/{total}")
+            area.dataframe(_previa(df_base, status_map), use_container_width=True, hide_index=True)
+    finally:
+        barra.empty()
+        area.empty()
+
+    return status_map
+
+
+def status_map_sessao(
+    chave: str,
+    ids: List[str],
+    iterar: Callable[[List[str]], Iterable[Tuple[str, Dict[str, Any]]]],
+    df_base: pd.DataFrame,
+    rotulo: str = "Carregando status",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Mapa de status dos ids, guardado em st.session_state[chave].
+
+    Ids já carregados na sessão (há menos de TTL_SESSAO_S) voltam na
+    hora, sem barra nem prévia; só os que faltam passam por
+    carregar_status_progressivo.
+
+    Args:
+        chave: Chave do session_state
+        ids: IDs das proposições
+        iterar: Iterador do DataProvider (ex: provider.iter_proposicoes_status_map)
+        df_base: Linhas a exibir na prévia (coluna "id")
+        rotulo: Texto da barra de progresso
+
+    Returns:
+        Mapa id -> status dos ids pedidos
+    """
+    ids = [str(x) for x in ids if str(x).strip()]
+    salvo = st.session_state.get(chave)
+    if not salvo or time.time() - salvo["em"] >= TTL_SESSAO_S:
+        salvo = {"em": time.time(), "mapa": {}}
+        st.session_state[chave] = salvo
+    mapa = salvo["mapa"]
+
+    faltam = [pid for pid in ids if pid not in mapa]
+    if faltam:
+        df_faltam = df_base[df_base["id"].astype(str).isin(set(faltam))]
+        mapa.update(carregar_status_progressivo(iterar(faltam), df_faltam, rotulo))
+
+    return {pid: mapa[pid] for pid in ids if pid in mapa}
@@ -83,20 +83,17 @@ def render_tab2(provider, exibir_detalhes_proposicao_func, id_deputada) -> None:
         partido_deputada = perfil.get("partido", "PL")
         uf_deputada = perfil.get("uf", "SC")
         
-        with st.spinner("🔄 Carregando eventos da Câmara..."):
-            eventos = provider.get_eventos(dt_inicio_t2, dt_fim_t2)
-        
-        with st.spinner("🔄 Carregando proposições de autoria..."):
-            ids_autoria = provider.get_ids_autoria_deputada(int(id_deputada))
-        
+        # Varredura compartilhada com as Abas 3 e 4 (mesma janela = sem nova varredura)
         with st.spinner("🔍 Escaneando pautas..."):
-            df = provider.escanear_eventos_pauta(
-                eventos=eventos,
+            varredura = provider.escanear_pautas(
+                dt_inicio_t2,
+                dt_fim_t2,
+                id_deputada=int(id_deputada),
                 nome_deputada=nome_deputada,
                 partido_deputada=partido_deputada,
                 uf_deputada=uf_deputada,
-                ids_autoria_deputada=ids_autoria,
             )
+        df = varredura.eventos
         
         # Salvar no session_state
         st.session_state["df_scan_tab2"] = df
@@ -128,9 +125,7 @@ def render_tab2(provider, exibir_detalhes_proposicao_func, id_deputada) -> None:
     # ============================================================
     # FILTRAR APENAS AUTORIA E RELATORIA
     # ============================================================
-    df_autoria_relatoria = df[
-        df["tem_autoria_deputada"] | df["tem_relatoria_deputada"]
-    ].copy()
+    df_autoria_relatoria = provider.filtrar_autoria_relatoria(df)
     
     if df_autoria_relatoria.empty:
         st.warning("⚠️ Nenhuma proposição de autoria ou relatoria encontrada no período selecionado.")
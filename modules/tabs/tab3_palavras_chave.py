@@ -109,27 +109,25 @@ def render_tab3(provider, id_deputada) -> None:
         partido_deputada = perfil.get("partido", "PL")
         uf_deputada = perfil.get("uf", "SC")
         
-        with st.spinner("🔄 Carregando eventos..."):
-            eventos = provider.get_eventos(dt_inicio_t3, dt_fim_t3)
-        
-        with st.spinner("🔄 Carregando proposições de autoria..."):
-            ids_autoria = provider.get_ids_autoria_deputada(int(id_deputada))
-        
+        # Varredura compartilhada com as Abas 2 e 4 (com as palavras padrão,
+        # a mesma entrada de cache)
         with st.spinner("🔍 Escaneando pautas com palavras-chave..."):
-            df = provider.escanear_eventos_palavras_chave(
-                eventos=eventos,
+            varredura = provider.escanear_pautas(
+                dt_inicio_t3,
+                dt_fim_t3,
+                id_deputada=int(id_deputada),
                 nome_deputada=nome_deputada,
                 partido_deputada=partido_deputada,
                 uf_deputada=uf_deputada,
                 palavras_chave=palavras_chave_t3,
-                ids_autoria_deputada=ids_autoria,
             )
         
         # Salvar no session_state
-        st.session_state["df_scan_tab3"] = df
+        st.session_state["df_scan_tab3"] = varredura.eventos
+        st.session_state["df_kw_tab3"] = varredura.ocorrencias
         st.session_state["dt_range_tab3_saved"] = (dt_inicio_t3, dt_fim_t3)
         
-        st.success(f"✅ {len(df)} eventos carregados com sucesso!")
+        st.success(f"✅ {len(varredura.eventos)} eventos carregados com sucesso!")
         st.rerun()
     
     # ============================================================
@@ -152,64 +150,29 @@ def render_tab3(provider, id_deputada) -> None:
         return
     
     # ============================================================
-    # FILTRAR APENAS PALAVRAS-CHAVE
+    # OCORRÊNCIAS DE PALAVRAS-CHAVE (uma linha por item da pauta)
     # ============================================================
-    df_kw = df[df["tem_palavras_chave"]].copy()
+    df_kw = st.session_state.get("df_kw_tab3", pd.DataFrame())
     
     if df_kw.empty:
         st.warning("⚠️ Nenhuma proposição com as palavras-chave foi encontrada no período.")
         return
     
-    # ============================================================
-    # PROCESSAR PROPOSIÇÕES COM PALAVRAS-CHAVE
-    # ============================================================
-    lista_proposicoes = []
-    
-    for _, row in df_kw.iterrows():
-        props_str = row.get("proposicoes_palavras_chave", "")
-        if not props_str or pd.isna(props_str):
-            continue
-        
-        # Formato: matéria|||palavras|||ementa|||link|||relator|||comissao|||nome_comissao|||data
-        for prop_detail in str(props_str).split("; "):
-            if "|||" not in prop_detail:
-                continue
-            
-            partes = prop_detail.split("|||")
-            materia = partes[0].strip() if len(partes) > 0 else ""
-            palavras = partes[1].strip() if len(partes) > 1 else ""
-            ementa = partes[2].strip() if len(partes) > 2 else ""
-            link = partes[3].strip() if len(partes) > 3 else ""
-            relator = partes[4].strip() if len(partes) > 4 else ""
-            comissao = partes[5].strip() if len(partes) > 5 else row.get("orgao_sigla", "")
-            nome_comissao = partes[6].strip() if len(partes) > 6 else row.get("orgao_nome", "")
-            data_evento = partes[7].strip() if len(partes) > 7 else row.get("data", "")
-            
-            # Formatar data
-            data_formatada = ""
-            if data_evento and len(data_evento) >= 10:
-                try:
-                    dt = datetime.datetime.strptime(data_evento[:10], "%Y-%m-%d")
-                    data_formatada = dt.strftime("%d/%m/%Y")
-                except:
-                    data_formatada = data_evento
-            
-            if materia:
-                lista_proposicoes.append({
-                    "Data": data_formatada,
-                    "Matéria": materia,
-                    "Palavras-chave": palavras,
-                    "Comissão": comissao,
-                    "Nome Comissão": nome_comissao,
-                    "Relator": relator if relator and "(-)" not in relator else "Sem relator",
-                    "Ementa": ementa[:100] + "..." if len(ementa) > 100 else ementa,
-                    "Link": link
-                })
-    
     # ============================================================
     # CRIAR DATAFRAME DE PROPOSIÇÕES
     # ============================================================
-    df_props = pd.DataFrame(lista_proposicoes)
+    df_props = pd.DataFrame({
+        "Data": pd.to_datetime(df_kw["data"], errors="coerce").dt.strftime("%d/%m/%Y").fillna(df_kw["data"]),
+        "Matéria": df_kw["materia"],
+        "Palavras-chave": df_kw["palavras"].map(", ".join),
+        "Comissão": df_kw["orgao_sigla"],
+        "Nome Comissão": df_kw["orgao_nome"],
+        "Relator": df_kw["relator"],
+        "Ementa": df_kw["ementa"].where(
+            df_kw["ementa"].str.len() <= 100, df_kw["ementa"].str[:100] + "..."
+        ),
+        "Link": df_kw["link"],
+    })
     
     if df_props.empty:
         st.info("ℹ️ Nenhuma matéria com palavras-chave encontrada.")
@@ -108,21 +108,17 @@ def render_tab4(provider, id_deputada) -> None:
         partido_deputada = perfil.get("partido", "PL")
         uf_deputada = perfil.get("uf", "SC")
         
-        with st.spinner("🔄 Carregando eventos..."):
-            eventos = provider.get_eventos(dt_inicio_t4, dt_fim_t4)
-        
-        with st.spinner("🔄 Carregando proposições de autoria..."):
-            ids_autoria = provider.get_ids_autoria_deputada(int(id_deputada))
-        
+        # Varredura compartilhada com as Abas 2 e 3; as comissões só filtram
         with st.spinner("🔍 Escaneando pautas das comissões..."):
-            df = provider.escanear_eventos_comissoes(
-                eventos=eventos,
+            varredura = provider.escanear_pautas(
+                dt_inicio_t4,
+                dt_fim_t4,
+                id_deputada=int(id_deputada),
                 nome_deputada=nome_deputada,
                 partido_deputada=partido_deputada,
                 uf_deputada=uf_deputada,
-                comissoes_estrategicas=comissoes_t4,
-                ids_autoria_deputada=ids_autoria,
             )
+        df = varredura.eventos
         
         # Salvar no session_state
         st.session_state["df_scan_tab4"] = df
@@ -153,7 +149,7 @@ def render_tab4(provider, id_deputada) -> None:
     # ============================================================
     # FILTRAR APENAS COMISSÕES ESTRATÉGICAS
     # ============================================================
-    df_com = df[df["comissao_estrategica"]].copy()
+    df_com = provider.filtrar_comissoes_estrategicas(df, comissoes_t4)
     
     if df_com.empty:
         st.warning("⚠️ Nenhum evento encontrado nas comissões estratégicas configuradas no período.")
@@ -43,6 +43,8 @@ from core.utils import (
 # Serviço do Senado
 from core.services.senado_integration import processar_lista_com_senado
 
+from modules.tabs.status_progressivo import status_map_sessao
+
 
 def render_tab5(
     provider,
@@ -80,6 +82,7 @@ def render_tab5(
             provider.clear_proposicoes_cache()
             st.session_state.pop("df_status_last", None)
             st.session_state.pop("df_todas_enriquecido_tab5", None)
+            st.session_state.pop("status_map_tab5", None)
             st.session_state.pop("props_aba5_cache", None)
             st.session_state.pop("senado_cache_por_id", None)
             st.success("✅ Cache limpo! Recarregando...")
@@ -110,6 +113,7 @@ def render_tab5(
             df_aut = provider.fetch_proposicoes_autoria(id_deputada)
             st.session_state["props_aba5_cache"] = df_aut
             if btn_refresh_aba5:
+                st.session_state.pop("status_map_tab5", None)
                 st.success("✅ Dados atualizados!")
     else:
         # Usar cache existente
@@ -292,10 +296,16 @@ def render_tab5(
     # Limitar a 400 resultados para performance
     df_rast_lim = df_rast.head(400).copy()
     
-    with st.spinner("Carregando status das proposições..."):
-        ids_r = df_rast_lim["id"].astype(str).tolist()
-        status_map_r = provider.build_proposicoes_status_map(ids_r)
-        
+    ids_r = df_rast_lim["id"].astype(str).tolist()
+    status_map_r = status_map_sessao(
+        "status_map_tab5",
+        ids_r,
+        provider.iter_proposicoes_status_map,
+        df_rast_lim,
+        "Carregando status das proposições",
+    )
+    
+    with st.spinner("Montando tabela..."):
         # DEBUG: Verificar se status_map tem dados
         ids_com_situacao = sum(1 for k, v in status_map_r.items() if v.get("situacao"))
         ids_com_orgao = sum(1 for k, v in status_map_r.items() if v.get("siglaOrgao"))
@@ -693,11 +703,17 @@ def render_tab5(
     )
     
     if precisa_recriar:
-        with st.spinner("Preparando base completa (primeira vez)..."):
-            df_aut_completo = df_aut.copy()
-            ids_todas = df_aut_completo["id"].astype(str).tolist()
-            
-            status_map_todas = provider.build_proposicoes_status_map(ids_todas)
+        df_aut_completo = df_aut.copy()
+        ids_todas = df_aut_completo["id"].astype(str).tolist()
+        status_map_todas = status_map_sessao(
+            "status_map_tab5",
+            ids_todas,
+            provider.iter_proposicoes_status_map,
+            df_aut_completo,
+            "Preparando base completa (primeira vez)",
+        )
+        
+        with st.spinner("Montando base completa..."):
             df_aut_enriquecido = provider.enrich_proposicoes_with_status(
                 df_aut_completo,
                 status_map_todas
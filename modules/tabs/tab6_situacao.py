@@ -20,7 +20,6 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, List, Optional
 import datetime
-import requests
 
 import streamlit as st
 import pandas as pd
@@ -34,14 +33,13 @@ from core.utils import (
     normalize_text,
     camara_link_tramitacao,
 )
+from core.services.proposicao_store import get_proposicao_store
+from modules.tabs.status_progressivo import carregar_status_progressivo
 
 # ============================================================
 # CONSTANTES
 # ============================================================
 
-_BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
-_HEADERS  = {"User-Agent": "MonitorZanatta/22.0 (gabinete-julia-zanatta)"}
-
 # Tipos relevantes para a aba 6
 TIPOS_TAB6 = {"PDL", "PEC", "PL", "PLP", "PRC", "RIC"}
 
@@ -192,17 +190,14 @@ def _verificar_primeira_signataria_pec(
     Dada uma tupla de IDs de PECs, retorna o subconjunto onde a deputada
     é a **primeira signatária** (proponente / ordemAssinatura == 1).
 
-    Chama ``/proposicoes/{id}/autores`` para cada PEC.
+    Lê os autores de cada PEC do ProposicaoStore (``/proposicoes/{id}/autores``).
     Cache de 1 h para evitar chamadas repetidas.
     """
+    store = get_proposicao_store()
     ids_ok: set = set()
     for pid in ids_pec:
         try:
-            url = f"{_BASE_URL}/proposicoes/{pid}/autores"
-            resp = requests.get(url, headers=_HEADERS, timeout=12)
-            if resp.status_code != 200:
-                continue
-            autores = resp.json().get("dados", [])
+            autores = store.get_autores(pid)
             if not autores:
                 continue
             # O primeiro autor da lista é o proponente / 1ª assinatura
@@ -629,9 +624,13 @@ def render_tab6(
 
     if df_status.empty:
         n_props = min(LIMITE_PROPOSICOES, len(df_base))
-        with st.spinner(f"Carregando status de {n_props} proposições…"):
-            ids_list = df_base["id"].astype(str).head(n_props).tolist()
-            status_map = provider.build_proposicoes_status_map(ids_list)
+        ids_list = df_base["id"].astype(str).head(n_props).tolist()
+        status_map = carregar_status_progressivo(
+            provider.iter_proposicoes_status_map(ids_list),
+            df_base.head(n_props),
+            f"Carregando status de {n_props} proposições",
+        )
+        with st.spinner("Montando tabela…"):
             df_status = provider.enrich_proposicoes_with_status(
                 df_base.head(n_props), status_map
             )
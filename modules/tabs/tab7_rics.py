@@ -27,6 +27,7 @@ from core.utils.date_utils import (
     parse_prazo_resposta_ric,
 )
 from core.config import DEPUTADA_ID_PADRAO
+from modules.tabs.status_progressivo import carregar_status_progressivo
 
 
 # ============================================================
@@ -232,7 +233,11 @@ def render_tab7(provider, id_deputada: int = None) -> None:
             else:
                 # Buscar status completo de cada RIC
                 ids_rics = df_rics_base["id"].astype(str).tolist()
-                status_map_rics = provider.build_status_map_rics(ids_rics)
+                status_map_rics = carregar_status_progressivo(
+                    provider.iter_status_map_rics(ids_rics),
+                    df_rics_base,
+                    "Carregando status dos RICs",
+                )
                 
                 # Enriquecer com status
                 df_rics_enriquecido = provider.enrich_rics_with_status(df_rics_base, status_map_rics)
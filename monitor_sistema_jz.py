@@ -243,6 +243,14 @@ from core.utils import (
 
 from core.services.camara_service import CamaraService
 from core.services.senado_service import SenadoService
+from core.services.response_cache import clear_response_cache
+from core.services.proposicao_store import get_proposicao_store
+from core.services.deputados_index import get_deputados_index
+from core.services.http_client import (
+    get_camara_session,
+    get_circuit_breaker_state,
+    reset_circuit_breakers,
+)
 
 from modules.tabs.tab1_dashboard import render_tab1
 from modules.tabs.tab7_rics import render_tab7
@@ -279,7 +287,6 @@ init_state(st)
 import pandas as pd
 import datetime
 from datetime import timezone
-import requests
 import time
 import json
 import concurrent.futures
@@ -545,8 +552,6 @@ if not st.session_state.autenticado:
 TZ_BRASILIA = ZoneInfo("America/Sao_Paulo")
 
 
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
-
 DEPUTADA_NOME_PADRAO = "Júlia Zanatta"
 DEPUTADA_PARTIDO_PADRAO = "PL"
 DEPUTADA_UF_PADRAO = "SC"
@@ -937,8 +942,7 @@ def calcular_prioridade(row: pd.Series) -> int:
     return score
 
 
-_SESSION = requests.Session()
-_SESSION.headers.update(HEADERS)
+_SESSION = get_camara_session()
 
 def relator_adversario_alert(relator_info: dict) -> str:
     if not relator_info:
@@ -1211,7 +1215,7 @@ def exibir_detalhes_proposicao(selected_id: str, key_prefix: str = "", senado_da
         rel_nome = relator.get('nome','—')
         rel_partido = relator.get('partido','')
         rel_uf = relator.get('uf','')
-        rel_id = relator.get('id_deputado','')
+        rel_id = relator.get('id_deputado','') or get_deputados_index().buscar_id(rel_nome, rel_partido, rel_uf) or ''
         
         rel_txt = f"{rel_nome}"
         if rel_partido or rel_uf:
@@ -1507,6 +1511,15 @@ def main():
     st.title("📡 Monitor Legislativo – Dep. Júlia Zanatta")
     st.caption("v50 ⚠️ - SISTEMA EM INTEGRAÇÃO E MANUTENÇÃO - PODE FICAR INSTÁVEL")
 
+    # Aviso de API fora do ar (circuit breaker aberto): as abas mostram
+    # dados em cache ou vazios em vez de travar esperando timeouts
+    for host, estado in get_circuit_breaker_state().items():
+        if estado.get("estado") == "aberto":
+            st.warning(
+                f"⚠️ API {host} instável - requisições suspensas por "
+                f"{estado.get('reabre_em', 0):.0f}s. Dados podem estar incompletos."
+            )
+
     if "status_click_sel" not in st.session_state:
         st.session_state["status_click_sel"] = None
 
@@ -1532,12 +1545,17 @@ def main():
             st.markdown(f"[🔗 Perfil na Câmara](https://www.camara.leg.br/deputados/{id_deputada})")
         with col_dep_acoes:
             if st.button("🔄 Atualizar tudo", use_container_width=True, help="Limpa cache e recarrega todos os dados"):
-                # Limpar todos os caches
+                # Limpar todos os caches (pautas de eventos passados ficam
+                # no arquivo de pautas: não mudam mais)
                 st.cache_data.clear()
+                clear_response_cache()
+                get_proposicao_store().limpar()
+                get_deputados_index().limpar()
+                reset_circuit_breakers()
                 # Limpar session state de dados
                 keys_to_clear = [
                     "df_pauta", "df_comissoes", "df_rics_completo", 
-                    "df_autoria_status", "props_autoria_api"
+                    "df_autoria_status", "props_autoria_api", "status_map_tab5"
                 ]
                 for k in keys_to_clear:
                     if k in st.session_state:
@@ -1564,6 +1582,12 @@ Júlia Zanatta também se destaca pela postura crítica ao aumento de impostos,
 e a políticas que, em sua visão, ampliam a intervenção governamental na economia e na vida dos cidadãos.
         """)
     
+    # Diagnóstico HTTP (apenas admin)
+    if st.session_state.get("usuario_logado") == "admin":
+        with st.expander("🛠️ Diagnóstico HTTP (Admin)"):
+            from modules.tabs.painel_http import render_painel_http
+            render_painel_http()
+    
     st.markdown("---")
 
     # ============================================================
@@ -26,17 +26,20 @@ import sys
 import json
 import html
 import re
-import requests
-import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from core.config import BASE_URL
+from core.services.http_client import safe_get_response, aguardar_rate_limit, get_session_for
+from core.services.http_metrics import resumo_metricas_http, salvar_metricas_http
+from core.services.proposicao_store import get_proposicao_store
+
 # ============================================================
 # CONFIGURAÇÕES
 # ============================================================
 
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
 HEADERS = {"User-Agent": "MonitorApensadosZanatta/3.0 (gabinete-julia-zanatta)"}
+_STORE = get_proposicao_store()
 
 DEPUTADA_ID = 220559  # Júlia Zanatta
 
@@ -136,7 +139,7 @@ def buscar_id_proposicao(sigla_tipo: str, numero: str, ano: str) -> str:
             "ano": ano,
             "itens": 1
         }
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        resp = safe_get_response(url, params=params, headers=HEADERS, timeout=10)
         
         if resp.status_code == 200:
             dados = resp.json().get("dados", [])
@@ -151,13 +154,10 @@ def buscar_id_proposicao(sigla_tipo: str, numero: str, ano: str) -> str:
 def buscar_pl_principal_nas_tramitacoes(prop_id: str) -> str:
     """Busca o PL principal nas tramitações de uma proposição"""
     try:
-        url = f"{BASE_URL}/proposicoes/{prop_id}/tramitacoes"
-        params = {"itens": 30, "ordem": "DESC"}
-        
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+        tramitacoes = _STORE.get_tramitacoes(prop_id)
         
-        if resp.status_code == 200:
-            tramitacoes = resp.json().get("dados", [])
+        if tramitacoes:
+            tramitacoes = sorted(tramitacoes, key=lambda t: t.get("dataHora") or "", reverse=True)[:30]
             
             for tram in tramitacoes:
                 texto = " ".join([
@@ -204,14 +204,12 @@ def buscar_cadeia_apensamentos(id_proposicao: str, max_niveis: int = 10) -> list
         
         try:
             # Buscar dados da proposição
-            url = f"{BASE_URL}/proposicoes/{id_atual}"
-            resp = requests.get(url, headers=HEADERS, timeout=10)
+            dados = _STORE.get_dados(id_atual)
             
-            if resp.status_code != 200:
+            if not dados:
                 break
             
-            dados = resp.json().get("dados", {})
-            status = dados.get("statusProposicao", {})
+            status = dados.get("statusProposicao") or {}
             situacao = status.get("descricaoSituacao", "")
             
             sigla = dados.get("siglaTipo", "")
@@ -256,8 +254,6 @@ def buscar_cadeia_apensamentos(id_proposicao: str, max_niveis: int = 10) -> list
             else:
                 break
             
-            time.sleep(0.1)
-            
         except Exception as e:
             print(f"[CADEIA] Erro ao buscar nível {nivel}: {e}")
             break
@@ -283,12 +279,10 @@ def buscar_dados_pl_raiz(id_raiz: str) -> dict:
     
     try:
         # Buscar dados básicos
-        url = f"{BASE_URL}/proposicoes/{id_raiz}"
-        resp = requests.get(url, headers=HEADERS, timeout=10)
+        prop = _STORE.get_dados(id_raiz)
         
-        if resp.status_code == 200:
-            prop = resp.json().get("dados", {})
-            status = prop.get("statusProposicao", {})
+        if prop:
+            status = prop.get("statusProposicao") or {}
             dados["situacao"] = status.get("descricaoSituacao", "—")
             dados["orgao"] = status.get("siglaOrgao", "—")
             dados["ementa"] = prop.get("ementa", "—")
@@ -299,25 +293,22 @@ def buscar_dados_pl_raiz(id_raiz: str) -> dict:
                 dados["relator"] = relator_nome
         
         # Buscar última tramitação
-        url_tram = f"{BASE_URL}/proposicoes/{id_raiz}/tramitacoes"
-        resp_tram = requests.get(url_tram, params={"itens": 1, "ordem": "DESC"}, headers=HEADERS, timeout=10)
-        
-        if resp_tram.status_code == 200:
-            tramitacoes = resp_tram.json().get("dados", [])
-            if tramitacoes:
-                data_hora = tramitacoes[0].get("dataHora", "")
-                if data_hora:
-                    try:
-                        if "T" in data_hora:
-                            dt = datetime.fromisoformat(data_hora.replace("Z", "+00:00"))
-                        else:
-                            dt = datetime.strptime(data_hora[:10], "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                        
-                        dados["data_ultima_mov"] = dt.strftime("%d/%m/%Y")
-                        agora = datetime.now(timezone.utc)
-                        dados["dias_parado"] = (agora - dt).days
-                    except:
-                        dados["data_ultima_mov"] = data_hora[:10] if data_hora else "—"
+        tramitacoes = _STORE.get_tramitacoes(id_raiz)
+        
+        if tramitacoes:
+            data_hora = max(t.get("dataHora") or "" for t in tramitacoes)
+            if data_hora:
+                try:
+                    if "T" in data_hora:
+                        dt = datetime.fromisoformat(data_hora.replace("Z", "+00:00"))
+                    else:
+                        dt = datetime.strptime(data_hora[:10], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+                    
+                    dados["data_ultima_mov"] = dt.strftime("%d/%m/%Y")
+                    agora = datetime.now(timezone.utc)
+                    dados["dias_parado"] = (agora - dt).days
+                except:
+                    dados["data_ultima_mov"] = data_hora[:10] if data_hora else "—"
     
     except Exception as e:
         print(f"[PL_RAIZ] Erro ao buscar dados: {e}")
@@ -359,14 +350,12 @@ def buscar_projetos_apensados_automatico() -> list:
             }
             
             try:
-                resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+                resp = safe_get_response(url, params=params, headers=HEADERS, timeout=15)
                 if resp.status_code == 200:
                     dados = resp.json().get("dados", [])
                     todas_props.extend(dados)
             except Exception as e:
                 print(f"[APENSADOS] Erro ao buscar {tipo}: {e}")
-            
-            time.sleep(0.2)
         
         # Adicionar proposições faltantes
         id_str = str(DEPUTADA_ID)
@@ -412,8 +401,6 @@ def buscar_projetos_apensados_automatico() -> list:
                         "pl_principal": pl_principal,
                         "cadeia": cadeia,
                     })
-            
-            time.sleep(0.1)
         
         # Remover duplicatas (PLs Zanatta diferentes podem ter mesmo PL raiz)
         pls_raiz_unicos = {}
@@ -506,7 +493,7 @@ def buscar_ultima_tramitacao(prop_id: str) -> dict:
         url = f"{BASE_URL}/proposicoes/{prop_id}/tramitacoes"
         params = {"itens": 1, "ordem": "DESC", "ordenarPor": "dataHora"}
         
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+        resp = safe_get_response(url, params=params, headers=HEADERS, timeout=15)
         
         if resp.status_code == 200:
             dados = resp.json().get("dados", [])
@@ -522,7 +509,7 @@ def buscar_dados_proposicao(prop_id: str) -> dict:
     """Busca dados básicos de uma proposição"""
     try:
         url = f"{BASE_URL}/proposicoes/{prop_id}"
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = safe_get_response(url, headers=HEADERS, timeout=15)
         
         if resp.status_code == 200:
             return resp.json().get("dados", {})
@@ -551,7 +538,8 @@ def enviar_telegram(mensagem: str, parse_mode: str = "HTML") -> bool:
             "disable_web_page_preview": True
         }
         
-        resp = requests.post(url, json=payload, timeout=30)
+        aguardar_rate_limit(url)
+        resp = get_session_for(url).post(url, json=payload, timeout=30)
         
         if resp.status_code == 200:
             print("[TELEGRAM] ✅ Mensagem enviada com sucesso")
@@ -726,8 +714,6 @@ def main():
         if enviar_telegram(mensagem):
             notificados.add(hash_tram)
             novidades.append(pl)
-        
-        time.sleep(1)  # Rate limit
     
     # Salvar histórico
     historico["notificados"] = list(notificados)
@@ -749,4 +735,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Métricas HTTP da execução (log + .cache/metricas_http_*.json)
+        print()
+        print(resumo_metricas_http())
+        salvar_metricas_http("monitorar_apensados")
@@ -41,13 +41,21 @@ from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from core.config import BASE_URL, SENADO_BASE_URL
+from core.services.http_client import safe_get_all_pages, safe_get_response, aguardar_rate_limit, get_session_for, create_session, host_disponivel
+from core.services.http_metrics import resumo_metricas_http, salvar_metricas_http
+from core.services.proposicao_store import get_proposicao_store
+from core.services.pauta_archive import get_pauta_archive
+from core.services.keyword_matcher import compilar_palavras_chave
+
 # ============================================================
 # CONFIGURAÇÕES
 # ============================================================
 
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
 HEADERS = {"User-Agent": "MonitorPalavrasChave/2.0 (gabinete-julia-zanatta)"}
-SENADO_BASE_URL = "https://legis.senado.leg.br/dadosabertos"
+_SESSION = create_session(HEADERS)
+_STORE = get_proposicao_store()
+_PAUTAS = get_pauta_archive()
 HEADERS_SENADO = {"User-Agent": "MonitorPalavrasChave/2.0", "Accept": "application/json"}
 
 
@@ -345,7 +353,7 @@ def salvar_pauta_plenario(data_pauta, num_proposicoes):
 
 def safe_get(url, params=None, timeout=30):
     try:
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=timeout)
+        resp = safe_get_response(url, headers=HEADERS, params=params, timeout=timeout)
         resp.raise_for_status()
         return resp.json()
     except:
@@ -353,30 +361,15 @@ def safe_get(url, params=None, timeout=30):
 
 
 def fetch_eventos(start_date, end_date):
-    eventos = []
-    pagina = 1
-    while True:
-        params = {
-            "dataInicio": start_date.strftime("%Y-%m-%d"),
-            "dataFim": end_date.strftime("%Y-%m-%d"),
-            "pagina": pagina,
-            "itens": 100,
-            "ordem": "ASC",
-            "ordenarPor": "dataHoraInicio",
-        }
-        data = safe_get(f"{BASE_URL}/eventos", params=params)
-        if not data:
-            break
-        dados = data.get("dados", [])
-        if not dados:
-            break
-        eventos.extend(dados)
-        links = data.get("links", [])
-        if not any(link.get("rel") == "next" for link in links):
-            break
-        pagina += 1
-        time.sleep(0.1)
-    return eventos
+    # Páginas 2..N buscadas em paralelo a partir do link rel="last"
+    params = {
+        "dataInicio": start_date.strftime("%Y-%m-%d"),
+        "dataFim": end_date.strftime("%Y-%m-%d"),
+        "itens": 100,
+        "ordem": "ASC",
+        "ordenarPor": "dataHoraInicio",
+    }
+    return safe_get_all_pages(f"{BASE_URL}/eventos", params=params, session=_SESSION, paralelo=True)
 
 
 def fetch_pauta_dia_plenario(data):
@@ -389,7 +382,7 @@ def fetch_pauta_dia_plenario(data):
         data_str = data.strftime("%Y-%m-%d")
         url = f"{BASE_URL}/pautas/orgaos/180/datas/{data_str}"
         
-        resp = requests.get(url, headers=HEADERS, timeout=30)
+        resp = safe_get_response(url, headers=HEADERS, timeout=30)
         
         # Se retornar 404, não há pauta para esse dia
         if resp.status_code == 404:
@@ -443,11 +436,9 @@ def verificar_pauta_plenario_disponivel():
     return False, None, None
 
 
-def fetch_pauta_evento(event_id):
-    data = safe_get(f"{BASE_URL}/eventos/{event_id}/pauta")
-    if not data:
-        return []
-    return data.get("dados", [])
+def fetch_pauta_evento(event_id, data_evento=None):
+    # Eventos de data passada: pauta congelada no PautaArchive (sem API)
+    return _PAUTAS.get_pauta(event_id, data_evento)
 
 
 def get_proposicao_id_from_item(item):
@@ -471,10 +462,7 @@ def get_proposicao_id_from_item(item):
 
 
 def fetch_proposicao_info(prop_id):
-    data = safe_get(f"{BASE_URL}/proposicoes/{prop_id}")
-    if not data:
-        return None
-    return data.get("dados", {})
+    return _STORE.get_dados(prop_id) or None
 
 
 def fetch_ids_autoria_deputada(id_deputada):
@@ -498,7 +486,6 @@ def fetch_ids_autoria_deputada(id_deputada):
             break
         url = next_link
         params = {}
-        time.sleep(0.1)
     print(f"   ✅ {len(ids)} proposições de autoria")
     return ids
 
@@ -518,26 +505,18 @@ def verificar_relatoria_deputada(item):
 
 
 def preparar_palavras_chave():
-    palavras_norm = []
-    for categoria, palavras in PALAVRAS_CHAVE.items():
-        for palavra in palavras:
-            if palavra.strip():
-                palavras_norm.append((normalize_text(palavra), palavra, categoria))
-    return palavras_norm
+    # Autômato único (Aho-Corasick) com todas as categorias
+    return compilar_palavras_chave(PALAVRAS_CHAVE)
 
 
-def buscar_palavras_no_item(item, palavras_normalizadas, prop_info=None):
+def buscar_palavras_no_item(item, matcher, prop_info=None):
     textos_busca = []
     textos_busca.append(item.get("titulo") or "")
     textos_busca.append(item.get("descricao") or "")
     if prop_info:
         textos_busca.append(prop_info.get("ementa") or "")
-    texto_completo = normalize_text(" ".join(textos_busca))
-    encontradas = []
-    for palavra_norm, palavra_original, categoria in palavras_normalizadas:
-        if palavra_norm in texto_completo:
-            encontradas.append((palavra_original, categoria))
-    return encontradas
+    # Palavra inteira: "arma" não casa mais com "farmanguinhos"
+    return matcher.encontrar(" ".join(textos_busca))
 
 
 # ============================================================
@@ -580,13 +559,9 @@ def verificar_se_foi_para_senado(situacao_atual: str, despacho: str = "") -> boo
 
 def buscar_situacao_camara(proposicao_id):
     """Busca a situação atual da proposição na Câmara."""
-    url = f"{BASE_URL}/proposicoes/{proposicao_id}"
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        dados = data.get("dados", {})
-        status = dados.get("statusProposicao", {})
+        dados = _STORE.get_dados(proposicao_id) or {}
+        status = dados.get("statusProposicao") or {}
         return {
             "situacao": status.get("descricaoSituacao", ""),
             "despacho": status.get("despacho", ""),
@@ -611,7 +586,7 @@ def buscar_dados_senado(tipo: str, numero: str, ano: str):
     url = f"{SENADO_BASE_URL}/processo?sigla={tipo_norm}&numero={numero_norm}&ano={ano_norm}&v=1"
     
     try:
-        resp = requests.get(url, headers=HEADERS_SENADO, timeout=20)
+        resp = safe_get_response(url, headers=HEADERS_SENADO, timeout=20)
         
         if resp.status_code == 404:
             return None
@@ -666,7 +641,7 @@ def buscar_movimentacoes_senado(id_processo: str, limite: int = 10):
     url = f"{SENADO_BASE_URL}/processo/{id_processo}/movimentacoes?v=1"
     
     try:
-        resp = requests.get(url, headers=HEADERS_SENADO, timeout=20)
+        resp = safe_get_response(url, headers=HEADERS_SENADO, timeout=20)
         
         if resp.status_code != 200:
             return []
@@ -778,8 +753,6 @@ def buscar_proposicoes_no_senado(ids_autoria):
                         "prop_info": prop_info
                     })
                     break  # Só adiciona a movimentação mais recente
-            
-            time.sleep(0.15)
         
         except Exception as e:
             print(f"   ⚠️ Erro ao processar proposição {prop_id}: {e}")
@@ -1196,7 +1169,8 @@ def enviar_telegram(mensagem):
     }
     
     try:
-        resp = requests.post(url, json=payload, timeout=10)
+        aguardar_rate_limit(url)
+        resp = get_session_for(url).post(url, json=payload, timeout=10)
         resp.raise_for_status()
         print("✅ Telegram: Mensagem enviada!")
         return True
@@ -1397,7 +1371,7 @@ def executar_varredura():
     print("\n🔍 Analisando pautas...")
     tempo_inicio_analise = time.time()
     
-    palavras_norm = preparar_palavras_chave()
+    matcher_palavras = preparar_palavras_chave()
     
     itens_palavras_chave = []
     itens_autoria = []
@@ -1412,7 +1386,12 @@ def executar_varredura():
         if i % 20 == 0 or i == 1:
             print(f"📊 Progresso: {i}/{len(eventos)} eventos...")
         
-        pauta = fetch_pauta_evento(evento_id)
+        # Circuit breaker aberto: a Câmara está fora, não adianta insistir
+        if not host_disponivel(BASE_URL):
+            print(f"   ⛔ API da Câmara indisponível - análise interrompida em {i}/{len(eventos)}")
+            break
+        
+        pauta = fetch_pauta_evento(evento_id, evento.get("dataHoraInicio"))
         if not pauta:
             continue
         
@@ -1426,7 +1405,7 @@ def executar_varredura():
             
             is_autoria = prop_id and prop_id in ids_autoria
             is_relatoria = verificar_relatoria_deputada(item)
-            palavras_encontradas = buscar_palavras_no_item(item, palavras_norm, prop_info)
+            palavras_encontradas = buscar_palavras_no_item(item, matcher_palavras, prop_info)
             
             if not (is_autoria or is_relatoria or palavras_encontradas):
                 continue
@@ -1473,8 +1452,6 @@ def executar_varredura():
                         "sigla": sigla, "categoria": categoria_principal,
                         "chave": chave_palavras
                     })
-        
-        time.sleep(0.1)
     
     tempo_analise = time.time() - tempo_inicio_analise
     print(f"\n⏱️ Análise de pautas concluída em {tempo_analise:.1f}s")
@@ -1527,7 +1504,6 @@ def executar_varredura():
                 historico = registrar_notificacao(historico, "autoria", item_data["chave"], item_data["sigla"], "Autoria")
                 resumo = adicionar_ao_resumo(resumo, item_data["sigla"], "Autoria")
                 enviadas += 1
-            time.sleep(1)
     
     # RELATORIA - Telegram + Email
     if itens_relatoria:
@@ -1538,7 +1514,6 @@ def executar_varredura():
                 historico = registrar_notificacao(historico, "relatoria", item_data["chave"], item_data["sigla"], "Relatoria")
                 resumo = adicionar_ao_resumo(resumo, item_data["sigla"], "Relatoria")
                 enviadas += 1
-            time.sleep(1)
     
     # PALAVRAS-CHAVE - Telegram + Email
     if itens_palavras_chave:
@@ -1549,7 +1524,6 @@ def executar_varredura():
                 historico = registrar_notificacao(historico, "palavras", item_data["chave"], item_data["sigla"], item_data["categoria"])
                 resumo = adicionar_ao_resumo(resumo, item_data["sigla"], item_data["categoria"])
                 enviadas += 1
-            time.sleep(1)
     
     # SENADO - Telegram + Email
     if itens_senado:
@@ -1560,7 +1534,6 @@ def executar_varredura():
                 historico = registrar_notificacao(historico, "senado", item_data["chave"], item_data["sigla"], "Senado")
                 resumo = adicionar_ao_resumo(resumo, item_data["sigla"], "Senado")
                 enviadas += 1
-            time.sleep(1)
     
     # Se não teve nenhuma novidade - APENAS Telegram
     if total_novos == 0:
@@ -1621,4 +1594,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Métricas HTTP da execução (log + .cache/metricas_http_*.json)
+        print()
+        print(resumo_metricas_http())
+        salvar_metricas_http("notificar_palavras_chave")
@@ -20,8 +20,6 @@ import os
 import sys
 import json
 import html
-import requests
-import time
 import smtplib
 import ssl
 from email.mime.text import MIMEText
@@ -29,17 +27,21 @@ from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from core.config import BASE_URL, SENADO_BASE_URL
+from core.services.http_client import safe_get_response, aguardar_rate_limit, get_session_for, host_disponivel
+from core.services.http_metrics import resumo_metricas_http, salvar_metricas_http
+from core.services.proposicao_store import get_proposicao_store
+
 # ============================================================
 # CONFIGURAÇÕES
 # ============================================================
 
-# APIs
-BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
-SENADO_BASE_URL = "https://legis.senado.leg.br/dadosabertos"
+# APIs (BASE_URL / SENADO_BASE_URL vêm de core.config)
 HEADERS = {"User-Agent": "MonitorZanatta/24.0 (gabinete-julia-zanatta)"}
 HEADERS_SENADO = {"User-Agent": "MonitorZanatta/24.0", "Accept": "application/json"}
 
 DEPUTADA_ID = 220559  # Júlia Zanatta
+_STORE = get_proposicao_store()
 
 # Link do painel
 LINK_PAINEL = "https://monitorzanatta.streamlit.app/"
@@ -286,13 +288,9 @@ def verificar_se_foi_para_senado(situacao_atual: str, despacho: str = "") -> boo
 
 def buscar_situacao_camara(proposicao_id):
     """Busca a situação atual da proposição na Câmara."""
-    url = f"{BASE_URL}/proposicoes/{proposicao_id}"
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        dados = data.get("dados", {})
-        status = dados.get("statusProposicao", {})
+        dados = _STORE.get_dados(proposicao_id) or {}
+        status = dados.get("statusProposicao") or {}
         return {
             "situacao": status.get("descricaoSituacao", ""),
             "despacho": status.get("despacho", ""),
@@ -321,7 +319,7 @@ def buscar_dados_senado(tipo: str, numero: str, ano: str):
     url = f"{SENADO_BASE_URL}/processo?sigla={tipo_norm}&numero={numero_norm}&ano={ano_norm}&v=1"
     
     try:
-        resp = requests.get(url, headers=HEADERS_SENADO, timeout=20)
+        resp = safe_get_response(url, headers=HEADERS_SENADO, timeout=20)
         
         if resp.status_code == 404:
             return None
@@ -376,7 +374,7 @@ def buscar_movimentacoes_senado(id_processo: str, limite: int = 10):
     url = f"{SENADO_BASE_URL}/processo/{id_processo}/movimentacoes?v=1"
     
     try:
-        resp = requests.get(url, headers=HEADERS_SENADO, timeout=20)
+        resp = safe_get_response(url, headers=HEADERS_SENADO, timeout=20)
         
         if resp.status_code != 200:
             return []
@@ -415,7 +413,7 @@ def buscar_status_senado(id_processo: str):
     url = f"{SENADO_BASE_URL}/processo/{id_processo}?v=1"
     
     try:
-        resp = requests.get(url, headers=HEADERS_SENADO, timeout=20)
+        resp = safe_get_response(url, headers=HEADERS_SENADO, timeout=20)
         
         if resp.status_code != 200:
             return {"situacao": "", "orgao": ""}
@@ -498,7 +496,7 @@ def buscar_proposicoes_por_tipo(deputado_id, sigla_tipo):
         }
         
         try:
-            resp = requests.get(url, headers=HEADERS, params=params, timeout=30)
+            resp = safe_get_response(url, headers=HEADERS, params=params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             
@@ -510,7 +508,6 @@ def buscar_proposicoes_por_tipo(deputado_id, sigla_tipo):
             if not any(link.get("rel") == "next" for link in links):
                 break
             pagina += 1
-            time.sleep(0.2)
         except Exception as e:
             print(f"   ⚠️ Erro ao buscar {sigla_tipo}: {e}")
             break
@@ -528,24 +525,15 @@ def buscar_todas_proposicoes(deputado_id):
         props = buscar_proposicoes_por_tipo(deputado_id, tipo)
         print(f"   {tipo}: {len(props)} proposições")
         todas_proposicoes.extend(props)
-        time.sleep(0.3)
     
     print(f"\n✅ Total: {len(todas_proposicoes)} proposições")
     return todas_proposicoes
 
 
 def buscar_ultima_tramitacao(proposicao_id):
-    url = f"{BASE_URL}/proposicoes/{proposicao_id}/tramitacoes"
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        tramitacoes = data.get("dados", [])
-        if tramitacoes:
-            tramitacoes_ordenadas = sorted(tramitacoes, key=lambda x: x.get("dataHora", ""), reverse=True)
-            return tramitacoes_ordenadas[0]
-    except Exception:
-        pass
+    tramitacoes = _STORE.get_tramitacoes(proposicao_id)
+    if tramitacoes:
+        return max(tramitacoes, key=lambda x: x.get("dataHora") or "")
     return None
 
 
@@ -683,6 +671,15 @@ def formatar_mensagem_sem_novidades_curta():
 ⏰ <i>{data_hora}</i>"""
 
 
+def formatar_mensagem_api_indisponivel(verificadas, total):
+    data_hora = obter_data_hora_brasilia()
+    return f"""⚠️ A API da Câmara está fora do ar. Varredura interrompida ({verificadas}/{total} matérias verificadas).
+
+Nova tentativa na próxima varredura.
+
+⏰ <i>{data_hora}</i>"""
+
+
 def formatar_mensagem_bom_dia():
     return """☀️ <b>Bom dia!</b>
 
@@ -808,7 +805,8 @@ def enviar_telegram(mensagem):
     }
     
     try:
-        resp = requests.post(url, json=payload, timeout=30)
+        aguardar_rate_limit(url)
+        resp = get_session_for(url).post(url, json=payload, timeout=30)
         if resp.status_code == 200:
             print("✅ Telegram: Enviado com sucesso")
             return True
@@ -963,6 +961,9 @@ def executar_varredura():
     props_ja_notificadas = 0
     erros = 0
     props_no_senado = 0
+    verificadas = 0
+    camara_indisponivel = False
+    senado_indisponivel = False
     
     for i, prop in enumerate(proposicoes, 1):
         sigla_prop = f"{prop['siglaTipo']} {prop['numero']}/{prop['ano']}"
@@ -970,6 +971,14 @@ def executar_varredura():
         if i % 25 == 0 or i == 1:
             print(f"📊 Progresso: {i}/{len(proposicoes)}...")
         
+        # Circuit breaker aberto: a Câmara está fora, não adianta insistir
+        if not host_disponivel(BASE_URL):
+            camara_indisponivel = True
+            erros += len(proposicoes) - verificadas
+            print(f"   ⛔ API da Câmara indisponível - varredura interrompida em {i}/{len(proposicoes)}")
+            break
+        verificadas += 1
+        
         # 1. Verificar tramitação na Câmara
         tramitacao = buscar_ultima_tramitacao(prop["id"])
         
@@ -993,6 +1002,10 @@ def executar_varredura():
         if verificar_se_foi_para_senado(situacao_camara.get("situacao", ""), situacao_camara.get("despacho", "")):
             props_no_senado += 1
             
+            if not host_disponivel(SENADO_BASE_URL):
+                senado_indisponivel = True
+                continue
+            
             # Buscar dados do Senado
             dados_senado = buscar_dados_senado(
                 prop["siglaTipo"],
@@ -1021,8 +1034,6 @@ def executar_varredura():
                                 "sigla": sigla_prop
                             })
                             break  # Só notifica a mais recente
-        
-        time.sleep(0.15)
     
     total_novidades = len(props_com_novidade_camara) + len(props_com_novidade_senado)
     
@@ -1034,6 +1045,10 @@ def executar_varredura():
     print(f"   Novidades Senado: {len(props_com_novidade_senado)}")
     print(f"   Já notificadas: {props_ja_notificadas}")
     print(f"   Erros API: {erros}")
+    if camara_indisponivel:
+        print(f"   ⚠️ Câmara indisponível (circuit breaker aberto)")
+    if senado_indisponivel:
+        print(f"   ⚠️ Senado indisponível (circuit breaker aberto)")
     print(f"{'=' * 60}")
     
     if total_novidades > 0:
@@ -1057,7 +1072,6 @@ def executar_varredura():
                 )
                 resumo = adicionar_ao_resumo(resumo, item["sigla"], no_senado=False)
                 enviadas += 1
-            time.sleep(1)
         
         # Enviar novidades do Senado
         for item in props_com_novidade_senado:
@@ -1080,13 +1094,20 @@ def executar_varredura():
                 )
                 resumo = adicionar_ao_resumo(resumo, item["sigla"], no_senado=True)
                 enviadas += 1
-            time.sleep(1)
         
         salvar_estado(True)
         salvar_historico(historico)
         salvar_resumo_dia(resumo)
         print(f"\n✅ Concluído! {enviadas} mensagens enviadas.")
     
+    elif camara_indisponivel:
+        # API FORA DO AR - não dá para afirmar "sem novidades"
+        print("\n📤 Avisando indisponibilidade (apenas Telegram)...")
+        notificar_telegram_apenas(formatar_mensagem_api_indisponivel(verificadas, len(proposicoes)))
+        salvar_historico(historico)
+        salvar_resumo_dia(resumo)
+        print("\n⚠️ Concluído com a API da Câmara indisponível.")
+    
     else:
         # SEM NOVIDADES - APENAS Telegram (email não recebe)
         print("\n📤 Enviando status (apenas Telegram)...")
@@ -1153,4 +1174,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    finally:
+        # Métricas HTTP da execução (log + .cache/metricas_http_*.json)
+        print()
+        print(resumo_metricas_http())
+        salvar_metricas_http("notificar_tramitacoes")
\ No newline at end of file